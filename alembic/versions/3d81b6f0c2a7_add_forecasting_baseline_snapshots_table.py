@@ -0,0 +1,37 @@
+"""Add forecasting_baseline_snapshots table
+
+Revision ID: 3d81b6f0c2a7
+Revises: 7c2e4a9d1b30
+Create Date: 2026-10-18 14:03:27.551904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d81b6f0c2a7"
+down_revision: Union[str, Sequence[str], None] = "7c2e4a9d1b30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "forecasting_baseline_snapshots",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("baselines", sa.JSON(), nullable=False),
+        sa.Column("lifecycle_percentages", sa.JSON(), nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("forecasting_baseline_snapshots")
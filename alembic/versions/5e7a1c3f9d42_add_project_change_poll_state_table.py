@@ -0,0 +1,35 @@
+"""Add project_change_poll_state table
+
+Revision ID: 5e7a1c3f9d42
+Revises: 9b4f2e7a6c15
+Create Date: 2026-10-18 17:12:44.208351
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e7a1c3f9d42"
+down_revision: Union[str, Sequence[str], None] = "9b4f2e7a6c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "project_change_poll_state",
+        sa.Column("project_key", sa.String(length=50), nullable=False),
+        sa.Column("last_polled_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("project_key"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("project_change_poll_state")
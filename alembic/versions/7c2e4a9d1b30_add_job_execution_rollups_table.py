@@ -0,0 +1,122 @@
+"""Add job_execution_rollups table
+
+Revision ID: 7c2e4a9d1b30
+Revises: f58f0acf1e11
+Create Date: 2026-10-18 10:12:44.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e4a9d1b30"
+down_revision: Union[str, Sequence[str], None] = "f58f0acf1e11"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_execution_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "job_name",
+            sa.String(length=255),
+            nullable=False,
+            comment="Celery Beat schedule name",
+        ),
+        sa.Column("job_category", sa.String(length=100), nullable=False),
+        sa.Column(
+            "hour_start",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="Start of the UTC hour the executions started in",
+        ),
+        sa.Column("execution_count", sa.Integer(), nullable=False),
+        sa.Column("success_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "failure_count",
+            sa.Integer(),
+            nullable=False,
+            comment="failed, timeout or cancelled",
+        ),
+        sa.Column("duration_count", sa.Integer(), nullable=False),
+        sa.Column("total_duration_seconds", sa.Integer(), nullable=False),
+        sa.Column("max_duration_seconds", sa.Integer(), nullable=True),
+        sa.Column("p50_duration_seconds", sa.Float(), nullable=True),
+        sa.Column("p95_duration_seconds", sa.Float(), nullable=True),
+        sa.Column(
+            "durations",
+            sa.JSON(),
+            nullable=True,
+            comment="Sorted successful durations in the hour (for percentiles)",
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_name", "hour_start", name="uq_job_rollup_job_hour"),
+    )
+    op.create_index(
+        op.f("ix_job_execution_rollups_job_category"),
+        "job_execution_rollups",
+        ["job_category"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_job_execution_rollups_hour_start"),
+        "job_execution_rollups",
+        ["hour_start"],
+        unique=False,
+    )
+
+    # Backfill rollups from the finished executions that are still on disk
+    op.execute(
+        """
+        INSERT INTO job_execution_rollups (
+            job_name, job_category, hour_start,
+            execution_count, success_count, failure_count,
+            duration_count, total_duration_seconds, max_duration_seconds,
+            p50_duration_seconds, p95_duration_seconds, durations, updated_at
+        )
+        SELECT
+            job_name,
+            MAX(job_category),
+            date_trunc('hour', started_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+            COUNT(*),
+            COUNT(*) FILTER (WHERE status = 'success'),
+            COUNT(*) FILTER (WHERE status IN ('failed', 'timeout', 'cancelled')),
+            COUNT(duration_seconds) FILTER (WHERE status = 'success'),
+            COALESCE(SUM(duration_seconds) FILTER (WHERE status = 'success'), 0),
+            MAX(duration_seconds) FILTER (WHERE status = 'success'),
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY duration_seconds)
+                FILTER (WHERE status = 'success'),
+            percentile_cont(0.95) WITHIN GROUP (ORDER BY duration_seconds)
+                FILTER (WHERE status = 'success'),
+            COALESCE(
+                json_agg(duration_seconds ORDER BY duration_seconds)
+                    FILTER (WHERE status = 'success' AND duration_seconds IS NOT NULL),
+                '[]'::json
+            ),
+            NOW()
+        FROM job_executions
+        WHERE status IN ('success', 'failed', 'timeout', 'cancelled')
+        GROUP BY job_name, date_trunc('hour', started_at AT TIME ZONE 'UTC')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_job_execution_rollups_hour_start"),
+        table_name="job_execution_rollups",
+    )
+    op.drop_index(
+        op.f("ix_job_execution_rollups_job_category"),
+        table_name="job_execution_rollups",
+    )
+    op.drop_table("job_execution_rollups")
@@ -0,0 +1,40 @@
+"""Add epic_name_categories table
+
+Revision ID: 9b4f2e7a6c15
+Revises: 3d81b6f0c2a7
+Create Date: 2026-10-18 16:21:05.730442
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4f2e7a6c15"
+down_revision: Union[str, Sequence[str], None] = "3d81b6f0c2a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "epic_name_categories",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("normalized_name", sa.String(length=500), nullable=False),
+        sa.Column("category", sa.String(length=100), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "normalized_name", name="uq_epic_name_categories_normalized_name"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("epic_name_categories")
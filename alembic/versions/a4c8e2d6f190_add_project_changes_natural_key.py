@@ -0,0 +1,55 @@
+"""Add unique natural key to project_changes
+
+Revision ID: a4c8e2d6f190
+Revises: 5e7a1c3f9d42
+Create Date: 2026-10-18 17:48:09.614027
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c8e2d6f190"
+down_revision: Union[str, Sequence[str], None] = "5e7a1c3f9d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the earliest copy of any change that was saved more than once
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM project_changes
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT
+                        id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY ticket_key, change_type, change_timestamp
+                            ORDER BY created_at, id
+                        ) AS row_number
+                    FROM project_changes
+                ) ranked
+                WHERE ranked.row_number > 1
+            )
+            """
+        )
+    )
+    op.create_unique_constraint(
+        "uq_project_changes_natural_key",
+        "project_changes",
+        ["ticket_key", "change_type", "change_timestamp"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "uq_project_changes_natural_key", "project_changes", type_="unique"
+    )
@@ -0,0 +1,36 @@
+"""Add composite index for proactive insight stats
+
+Revision ID: c7d3a9e1f524
+Revises: a4c8e2d6f190
+Create Date: 2026-10-18 19:05:12.481903
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d3a9e1f524"
+down_revision: Union[str, Sequence[str], None] = "a4c8e2d6f190"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_proactive_insights_user_dismissed_project",
+        "proactive_insights",
+        ["user_id", "dismissed_at", "project_key"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_proactive_insights_user_dismissed_project",
+        table_name="proactive_insights",
+    )
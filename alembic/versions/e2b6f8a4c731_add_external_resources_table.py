@@ -0,0 +1,68 @@
+"""Add external_resources table for resource typeahead
+
+Revision ID: e2b6f8a4c731
+Revises: c7d3a9e1f524
+Create Date: 2026-10-18 20:41:37.902215
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b6f8a4c731"
+down_revision: Union[str, Sequence[str], None] = "c7d3a9e1f524"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "external_resources",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("resource_id", sa.String(length=255), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("search_text", sa.Text(), nullable=False),
+        sa.Column("attributes", sa.JSON(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "provider", "resource_id", name="uq_external_resources_provider_resource"
+        ),
+    )
+    op.create_index(
+        "ix_external_resources_provider_search",
+        "external_resources",
+        ["provider", "search_text"],
+        unique=False,
+        postgresql_ops={"search_text": "text_pattern_ops"},
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        # Trigram index so substring (LIKE '%q%') typeahead is indexed too
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_external_resources_search_trgm",
+            "external_resources",
+            ["search_text"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index(
+            "ix_external_resources_search_trgm", table_name="external_resources"
+        )
+    op.drop_index(
+        "ix_external_resources_provider_search", table_name="external_resources"
+    )
+    op.drop_table("external_resources")
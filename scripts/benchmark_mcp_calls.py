@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark GoogleWorkspaceClient MCP call latency against the local stub server.
+
+Compares starting a server per tool call (the old subprocess-per-call
+behaviour) with the pooled long-lived session. ``--startup-delay`` stands in
+for npx package resolution and Node startup of the real Drive server.
+
+Usage:
+    python scripts/benchmark_mcp_calls.py
+    python scripts/benchmark_mcp_calls.py --calls 200 --startup-delay 2.0
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.integrations.google_workspace import GoogleWorkspaceClient
+from src.integrations.mcp_stdio import MCPStdioSession, get_mcp_session_pool
+
+STUB_SERVER = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "mcp_stub_server.py"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--startup-delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    command = [
+        sys.executable,
+        STUB_SERVER,
+        "--startup-delay",
+        str(args.startup_delay),
+    ]
+    token = {"access_token": "benchmark-token"}
+
+    started = time.perf_counter()
+    per_call_calls = max(1, min(args.calls, 10))
+    for _ in range(per_call_calls):
+        session = MCPStdioSession(command, env={"GOOGLE_ACCESS_TOKEN": "x"}).start()
+        session.call_tool("list_files", {"limit": 10})
+        session.close()
+    per_call = (time.perf_counter() - started) / per_call_calls
+
+    client = GoogleWorkspaceClient(token, server_command=command)
+    started = time.perf_counter()
+    client.list_files(limit=10)
+    first_call = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(args.calls):
+        client.list_files(limit=10)
+    pooled = (time.perf_counter() - started) / args.calls
+
+    get_mcp_session_pool().close_all()
+
+    print(f"Server per call:    {per_call * 1000:.1f} ms/call ({per_call_calls} calls)")
+    print(f"Pooled, first call: {first_call * 1000:.1f} ms (server start)")
+    print(f"Pooled, warm:       {pooled * 1000:.2f} ms/call ({args.calls} calls)")
+    print(f"Speedup:            {per_call / max(pooled, 1e-9):.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark fuzzy meeting deduplication on a synthetic meeting set.
+
+Compares MeetingDeduplicator (title/date blocking) against the original
+all-pairs comparison and checks that both keep exactly the same meetings.
+
+Usage:
+    python scripts/benchmark_meeting_dedup.py
+    python scripts/benchmark_meeting_dedup.py --count 20000 --seed 7
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Set
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.utils.meeting_deduplicator import MeetingDeduplicator
+
+TITLES = [
+    "Daily Standup",
+    "Sprint Planning",
+    "Client Sync",
+    "Design Review",
+    "Retro",
+    "1:1",
+    "QA Walkthrough",
+    "Launch Prep",
+]
+PROJECTS = ["SUBS", "BEAU", "SRLK", "BIGO", "BMBY", "RNWL", "ECSC", "CAR"]
+
+
+def generate_meetings(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate Fireflies-like meetings with ~10% near-duplicate recordings."""
+    rng = random.Random(seed)
+    start_ms = 1_704_067_200_000  # 2024-01-01
+    span_ms = 365 * 86_400_000
+
+    meetings = []
+    while len(meetings) < count:
+        title = f"{rng.choice(PROJECTS)} {rng.choice(TITLES)}"
+        meeting = {
+            "id": f"ff-{len(meetings)}",
+            "title": title,
+            # Recurring meetings start on the quarter hour
+            "date": start_ms + rng.randrange(span_ms // 900_000) * 900_000,
+            "duration": rng.choice([15, 30, 45, 60]) * 60.0,
+            "participants": ["pm@example.com"] * rng.randint(1, 6),
+            "sentences": [{}] * rng.randint(0, 40),
+        }
+        meetings.append(meeting)
+
+        if rng.random() < 0.1 and len(meetings) < count:
+            # Second recorder joined the same call
+            duplicate = dict(meeting)
+            duplicate["id"] = f"ff-{len(meetings)}"
+            duplicate["title"] = f"  {title.upper()} "
+            duplicate["date"] = meeting["date"] + rng.randint(-120, 120) * 1000
+            duplicate["duration"] = meeting["duration"] * rng.uniform(0.95, 1.05)
+            duplicate["sentences"] = [{}] * rng.randint(0, 40)
+            meetings.append(duplicate)
+
+    rng.shuffle(meetings)
+    return meetings
+
+
+def pairwise_fuzzy_duplicates(
+    deduplicator: MeetingDeduplicator, meetings: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Original O(n²) fuzzy pass, kept here as the reference implementation."""
+    processed: Set[int] = set()
+    final_meetings = []
+    for i, meeting in enumerate(meetings):
+        if i in processed:
+            continue
+        group = [meeting]
+        processed.add(i)
+        for j in range(i + 1, len(meetings)):
+            if j not in processed and deduplicator._are_meetings_similar(
+                meeting, meetings[j]
+            ):
+                group.append(meetings[j])
+                processed.add(j)
+        final_meetings.append(deduplicator._select_best_meeting(group))
+    return final_meetings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    meetings = generate_meetings(args.count, args.seed)
+    deduplicator = MeetingDeduplicator()
+
+    started = time.perf_counter()
+    blocked = deduplicator._remove_fuzzy_duplicates(meetings)
+    blocked_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    pairwise = pairwise_fuzzy_duplicates(deduplicator, meetings)
+    pairwise_seconds = time.perf_counter() - started
+
+    identical = [m["id"] for m in blocked] == [m["id"] for m in pairwise]
+
+    print(f"Meetings:           {len(meetings)}")
+    print(
+        f"Kept:               {len(blocked)} ({len(meetings) - len(blocked)} removed)"
+    )
+    print(f"All pairs:          {pairwise_seconds:.2f}s")
+    print(f"Title/date blocks:  {blocked_seconds:.3f}s")
+    print(f"Speedup:            {pairwise_seconds / max(blocked_seconds, 1e-9):.0f}x")
+    print(f"Identical output:   {'yes' if identical else 'NO'}")
+
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
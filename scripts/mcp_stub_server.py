@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Local stub MCP server (stdio transport) for offline tests and benchmarks.
+
+Speaks just enough MCP to stand in for the Google Drive server used by
+GoogleWorkspaceClient: initialize, ping, tools/list and tools/call with a
+few canned Drive-like tools. ``--startup-delay`` simulates the time npx and
+Node need before a real server answers.
+
+Usage:
+    python scripts/mcp_stub_server.py
+    python scripts/mcp_stub_server.py --startup-delay 2.5 --latency 0.01
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Optional
+
+TOOLS = ["list_files", "read_document", "read_sheet", "whoami", "fail", "crash"]
+
+
+def call_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a stub tool and wrap its output as an MCP tool result."""
+    if name == "crash":
+        sys.exit(1)
+    if name == "fail":
+        return {"content": [{"type": "text", "text": "stub failure"}], "isError": True}
+
+    if name == "list_files":
+        limit = int(arguments.get("limit", 10))
+        payload = {
+            "files": [
+                {
+                    "id": f"file-{n}",
+                    "name": f"{arguments.get('query') or 'Document'} {n}",
+                    "mimeType": arguments.get(
+                        "mimeType", "application/vnd.google-apps.document"
+                    ),
+                }
+                for n in range(limit)
+            ]
+        }
+    elif name == "read_document":
+        document_id = arguments.get("document_id")
+        payload = {"id": document_id, "title": f"Doc {document_id}", "content": ""}
+    elif name == "read_sheet":
+        payload = {"id": arguments.get("spreadsheet_id"), "values": [["a", "b"]]}
+    elif name == "whoami":
+        payload = {"pid": os.getpid(), "token": os.environ.get("GOOGLE_ACCESS_TOKEN")}
+    else:
+        return {
+            "content": [{"type": "text", "text": f"Unknown tool: {name}"}],
+            "isError": True,
+        }
+
+    return {"content": [{"type": "text", "text": json.dumps(payload)}]}
+
+
+def handle(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Answer one JSON-RPC message (None for notifications)."""
+    method = message.get("method")
+    if "id" not in message:
+        return None
+
+    if method == "initialize":
+        result = {
+            "protocolVersion": message["params"]["protocolVersion"],
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "mcp-stub", "version": "1.0"},
+        }
+    elif method == "ping":
+        result = {}
+    elif method == "tools/list":
+        result = {
+            "tools": [
+                {"name": name, "inputSchema": {"type": "object"}} for name in TOOLS
+            ]
+        }
+    elif method == "tools/call":
+        params = message.get("params", {})
+        result = call_tool(params.get("name"), params.get("arguments", {}))
+    else:
+        return {
+            "jsonrpc": "2.0",
+            "id": message["id"],
+            "error": {"code": -32601, "message": f"Method not found: {method}"},
+        }
+
+    return {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--startup-delay", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    time.sleep(args.startup_delay)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response = handle(json.loads(line))
+        if response is None:
+            continue
+        time.sleep(args.latency)
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
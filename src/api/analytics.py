@@ -718,6 +718,14 @@ def rebuild_forecasting_models(user):
 
         logger.info(f"Forecasting models rebuild completed in {duration:.2f} seconds")
 
+        # Forecasts read materialized baselines and a cached similar-project
+        # index; refresh both from the rebuilt data
+        from src.services.forecasting_baselines import rebuild_baseline_snapshot
+        from src.services.similar_project_index import invalidate_similar_project_index
+
+        baseline_snapshot = rebuild_baseline_snapshot()
+        invalidate_similar_project_index()
+
         return jsonify(
             {
                 "success": all_success,
@@ -727,6 +735,7 @@ def rebuild_forecasting_models(user):
                     else "Some analysis scripts failed"
                 ),
                 "results": results,
+                "baseline_snapshot": baseline_snapshot,
                 "total_duration_seconds": round(duration, 2),
             }
         ), (200 if all_success else 500)
@@ -3,11 +3,14 @@ API endpoints for epic budget management.
 """
 
 from flask import Blueprint, request, jsonify
-from src.models import EpicBudget, EpicHours, Project
+from src.models import EpicBudget, Project
 from src.models.epic_category_mapping import EpicCategoryMapping
 from src.utils.database import get_session
 from src.services.epic_mapping_service import EpicMappingService
-from sqlalchemy import func
+from src.services.epic_budget_summary import (
+    get_project_budget_summary,
+    invalidate_project_budget_summary,
+)
 from decimal import Decimal
 from datetime import datetime, timezone
 import logging
@@ -17,6 +20,22 @@ logger = logging.getLogger(__name__)
 epic_budgets_bp = Blueprint("epic_budgets", __name__, url_prefix="/api/epic-budgets")
 
 
+# POST endpoints that don't modify budgets
+READ_ONLY_ENDPOINTS = {"epic_budgets.preview_import"}
+
+
+@epic_budgets_bp.after_request
+def invalidate_budget_summaries(response):
+    """Drop cached budget summaries after any successful write in this blueprint."""
+    if (
+        request.method != "GET"
+        and request.endpoint not in READ_ONLY_ENDPOINTS
+        and 200 <= response.status_code < 300
+    ):
+        invalidate_project_budget_summary()
+    return response
+
+
 @epic_budgets_bp.route("/<project_key>", methods=["GET"])
 def get_project_budgets(project_key):
     """
@@ -31,107 +50,12 @@ def get_project_budgets(project_key):
     - Or both
 
     This ensures actual hours show up even if epic has no budget estimate set.
+    Responses are cached per project until budgets or epic hours change.
     """
+    session = get_session()
     try:
-        session = get_session()
-
-        # Get all budgets for this project
-        budgets = session.query(EpicBudget).filter_by(project_key=project_key).all()
-        budgets_by_epic = {b.epic_key: b for b in budgets}
-
-        # Get actual hours by epic and month
-        actual_hours_query = (
-            session.query(
-                EpicHours.epic_key,
-                func.date_trunc("month", EpicHours.month).label("month"),
-                func.sum(EpicHours.hours).label("total_hours"),
-            )
-            .filter(EpicHours.project_key == project_key)
-            .group_by(EpicHours.epic_key, func.date_trunc("month", EpicHours.month))
-            .all()
-        )
-
-        # Get epic categories (one per epic - they should all be the same)
-        categories_query = (
-            session.query(EpicHours.epic_key, EpicHours.epic_category)
-            .filter(
-                EpicHours.project_key == project_key,
-                EpicHours.epic_category.isnot(None),
-            )
-            .distinct(EpicHours.epic_key)
-            .all()
-        )
-
-        categories_by_epic = {
-            epic_key: category for epic_key, category in categories_query
-        }
-
-        # Organize actuals by epic and month
-        actuals_by_epic = {}
-        all_epic_keys = set(budgets_by_epic.keys())  # Start with budgeted epics
-
-        for epic_key, month, hours in actual_hours_query:
-            all_epic_keys.add(epic_key)  # Add epics with actuals (even if not budgeted)
-            if epic_key not in actuals_by_epic:
-                actuals_by_epic[epic_key] = {}
-            month_str = month.strftime("%Y-%m") if month else None
-            if month_str:
-                actuals_by_epic[epic_key][month_str] = float(hours)
-
-        # Build response for ALL epics (budgeted OR with actuals OR both)
-        result = []
-        for epic_key in all_epic_keys:
-            budget = budgets_by_epic.get(epic_key)
-            actuals = actuals_by_epic.get(epic_key, {})
-            total_actual = sum(actuals.values())
-            estimated = (
-                float(budget.estimated_hours)
-                if budget and budget.estimated_hours
-                else 0.0
-            )
-            remaining = estimated - total_actual
-
-            # Calculate % complete:
-            # - If estimate > 0: standard calculation
-            # - If estimate = 0 but has actuals: show 100% (over budget)
-            # - If estimate = 0 and no actuals: show 0%
-            if estimated > 0:
-                pct_complete = total_actual / estimated * 100
-            elif total_actual > 0:
-                pct_complete = 100.0  # Has actuals but no estimate = over budget
-            else:
-                pct_complete = 0.0
-
-            result.append(
-                {
-                    "id": budget.id if budget else None,
-                    "project_key": project_key,
-                    "epic_key": epic_key,
-                    "epic_summary": budget.epic_summary if budget else epic_key,
-                    "epic_category": categories_by_epic.get(
-                        epic_key
-                    ),  # Category from epic_hours table
-                    "estimated_hours": estimated,
-                    "total_actual": total_actual,
-                    "remaining": remaining,
-                    "pct_complete": round(pct_complete, 1),
-                    "actuals_by_month": actuals,
-                    "is_budgeted": budget
-                    is not None,  # Flag to indicate if budget exists
-                    "created_at": (
-                        budget.created_at.isoformat()
-                        if budget and budget.created_at
-                        else None
-                    ),
-                    "updated_at": (
-                        budget.updated_at.isoformat()
-                        if budget and budget.updated_at
-                        else None
-                    ),
-                }
-            )
-
-        return jsonify({"budgets": result}), 200
+        budgets = get_project_budget_summary(session, project_key)
+        return jsonify({"budgets": budgets}), 200
 
     except Exception as e:
         logger.error(f"Error getting project budgets: {e}", exc_info=True)
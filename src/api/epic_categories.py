@@ -665,7 +665,16 @@ def set_mapping(epic_key):
 
         # Also update epic_category in epic_hours table for all rows with this epic_key
         from src.models import EpicHours
+        from src.services.epic_budget_summary import (
+            invalidate_project_budget_summary,
+        )
 
+        project_keys = [
+            row.project_key
+            for row in session.query(EpicHours.project_key)
+            .filter(EpicHours.epic_key == epic_key)
+            .distinct()
+        ]
         updated_count = (
             session.query(EpicHours)
             .filter(EpicHours.epic_key == epic_key)
@@ -675,6 +684,10 @@ def set_mapping(epic_key):
 
         session.close()
 
+        # Budget summaries group hours by epic category
+        for project_key in project_keys:
+            invalidate_project_budget_summary(project_key)
+
         logger.info(
             f"Epic category mapping {action}: {epic_key} → {category} "
             f"(updated {updated_count} epic_hours rows)"
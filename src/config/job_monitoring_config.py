@@ -280,7 +280,18 @@ JOBS: Dict[str, JobConfig] = {
         alert_on_failure=False,  # Digest only
     ),
     # ========================================================================
-    # 8. CLEANUP TASKS (2 Tasks) - LOW
+    # 8. RESOURCE DIRECTORY (1 Task) - LOW
+    # ========================================================================
+    "refresh-resource-directory": JobConfig(
+        job_name="refresh-resource-directory",
+        category=DATA_SYNC,
+        priority=LOW,
+        expected_duration_seconds=300,  # 5 minutes
+        description="Refresh Slack/Notion/GitHub/Jira typeahead directory (every 4 hours)",
+        alert_on_failure=False,  # Digest only; typeahead keeps the previous copy
+    ),
+    # ========================================================================
+    # 9. CLEANUP TASKS (2 Tasks) - LOW
     # ========================================================================
     "cleanup-stuck-jobs": JobConfig(
         job_name="cleanup-stuck-jobs",
@@ -1,13 +1,76 @@
 """GitHub API client for searching PRs and commits."""
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import httpx
 import time
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool shared by every GitHubClient in the process
+HTTP_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+
+# Seconds to reuse the accessible-repo list before asking GitHub again
+REPO_LIST_TTL = 900
+
+# Max responses kept for ETag / If-None-Match revalidation
+ETAG_CACHE_MAX_ENTRIES = 512
+
+# Pooled client shared across asyncio.run() calls. An AsyncClient's
+# connections belong to the loop that opened them, so we use a sync client and
+# send requests from worker threads; concurrent queries still overlap.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+_etag_cache: "OrderedDict[Tuple, Tuple[str, Any]]" = OrderedDict()
+_etag_cache_lock = threading.Lock()
+
+_repo_list_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+
+def _create_http_client() -> httpx.Client:
+    """Create the pooled (HTTP/2 when available) client."""
+    return httpx.Client(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=15.0)
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide pooled httpx client."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = _create_http_client()
+        return _http_client
+
+
+def close_http_client() -> None:
+    """Close the pooled client (e.g. on shutdown); it is recreated on next use."""
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
+
+def clear_response_caches() -> None:
+    """Forget cached ETag responses and accessible-repo lists."""
+    with _etag_cache_lock:
+        _etag_cache.clear()
+    _repo_list_cache.clear()
+
 
 class GitHubClient:
     """Client for GitHub API v3 REST API with GitHub App support."""
@@ -110,39 +173,39 @@ class GitHubClient:
         jwt_token = jwt.encode(payload, self.private_key, algorithm="RS256")
 
         # Exchange JWT for installation access token
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/app/installations/{self.installation_id}/access_tokens",
-                    headers={
-                        "Authorization": f"Bearer {jwt_token}",
-                        "Accept": "application/vnd.github.v3+json",
-                        "X-GitHub-Api-Version": "2022-11-28",
-                    },
-                    timeout=10.0,
-                )
+        try:
+            response = await asyncio.to_thread(
+                get_http_client().post,
+                f"{self.base_url}/app/installations/{self.installation_id}/access_tokens",
+                headers={
+                    "Authorization": f"Bearer {jwt_token}",
+                    "Accept": "application/vnd.github.v3+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                timeout=10.0,
+            )
 
-                if response.status_code == 201:
-                    data = response.json()
-                    self.installation_token = data["token"]
-                    # Tokens expire in 1 hour
-                    expires_at = datetime.fromisoformat(
-                        data["expires_at"].replace("Z", "+00:00")
-                    )
-                    self.token_expires_at = expires_at.timestamp()
-                    logger.info("Successfully obtained GitHub App installation token")
-                    return self.installation_token
-                else:
-                    logger.error(
-                        f"Failed to get installation token: {response.status_code} - {response.text}"
-                    )
-                    raise Exception(
-                        f"GitHub App authentication failed: {response.status_code}"
-                    )
+            if response.status_code == 201:
+                data = response.json()
+                self.installation_token = data["token"]
+                # Tokens expire in 1 hour
+                expires_at = datetime.fromisoformat(
+                    data["expires_at"].replace("Z", "+00:00")
+                )
+                self.token_expires_at = expires_at.timestamp()
+                logger.info("Successfully obtained GitHub App installation token")
+                return self.installation_token
+            else:
+                logger.error(
+                    f"Failed to get installation token: {response.status_code} - {response.text}"
+                )
+                raise Exception(
+                    f"GitHub App authentication failed: {response.status_code}"
+                )
 
-            except Exception as e:
-                logger.error(f"Error getting GitHub App installation token: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Error getting GitHub App installation token: {e}")
+            raise
 
     async def _get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers based on auth mode.
@@ -160,6 +223,70 @@ class GitHubClient:
 
         return headers
 
+    @property
+    def _cache_identity(self) -> str:
+        """Stable identity of these credentials for keying shared caches.
+
+        Installation tokens rotate hourly, so App auth is keyed by the
+        installation rather than the token itself.
+        """
+        if self.auth_mode == "app":
+            return f"app:{self.installation_id}"
+        return "token:" + hashlib.sha256(self.api_token.encode()).hexdigest()[:12]
+
+    async def _get_json(
+        self, path: str, params: Dict[str, Any], timeout: float = 10.0
+    ) -> Tuple[int, Optional[Any]]:
+        """GET a GitHub API path on the shared client with ETag revalidation.
+
+        Responses that carry an ETag are remembered; the next identical request
+        sends ``If-None-Match`` and a 304 reply (which GitHub does not count
+        against the rate limit) is answered from the remembered body.
+
+        Args:
+            path: API path (e.g. "/search/issues")
+            params: Query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (status code, parsed JSON body or None if not 200)
+        """
+        headers = await self._get_auth_headers()
+        url = f"{self.base_url}{path}"
+        cache_key = (
+            self._cache_identity,
+            url,
+            tuple(sorted((k, str(v)) for k, v in params.items())),
+        )
+
+        with _etag_cache_lock:
+            cached = _etag_cache.get(cache_key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        response = await asyncio.to_thread(
+            get_http_client().get, url, headers=headers, params=params, timeout=timeout
+        )
+
+        if response.status_code == 304 and cached:
+            with _etag_cache_lock:
+                if cache_key in _etag_cache:
+                    _etag_cache.move_to_end(cache_key)
+            return 200, cached[1]
+
+        if response.status_code != 200:
+            return response.status_code, None
+
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            with _etag_cache_lock:
+                _etag_cache[cache_key] = (etag, data)
+                _etag_cache.move_to_end(cache_key)
+                while len(_etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                    _etag_cache.popitem(last=False)
+        return 200, data
+
     async def search_prs_and_commits(
         self,
         query_keywords: List[str],
@@ -197,12 +324,14 @@ class GitHubClient:
         results = {"prs": [], "commits": []}
 
         try:
-            # Search for PRs
-            prs = await self._search_pull_requests(query_keywords, repo_name, since_iso)
-            results["prs"] = prs
+            await self._get_auth_headers()
 
-            # Search for commits
-            commits = await self._search_commits(query_keywords, repo_name, since_iso)
+            # Search for PRs and commits concurrently
+            prs, commits = await asyncio.gather(
+                self._search_pull_requests(query_keywords, repo_name, since_iso),
+                self._search_commits(query_keywords, repo_name, since_iso),
+            )
+            results["prs"] = prs
             results["commits"] = commits
 
             logger.info(f"Found {len(prs)} PRs and {len(commits)} commits from GitHub")
@@ -239,58 +368,50 @@ class GitHubClient:
 
         search_query = " ".join(query_parts)
 
-        # Get auth headers (handles both token and GitHub App)
-        headers = await self._get_auth_headers()
+        try:
+            status_code, data = await self._get_json(
+                "/search/issues",
+                params={
+                    "q": search_query,
+                    "sort": "updated",
+                    "order": "desc",
+                    "per_page": 30,
+                },
+                timeout=10.0,
+            )
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/search/issues",
-                    headers=headers,
-                    params={
-                        "q": search_query,
-                        "sort": "updated",
-                        "order": "desc",
-                        "per_page": 30,
-                    },
-                    timeout=10.0,
-                )
+            if status_code == 200:
+                items = data.get("items", [])
 
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    prs = []
-                    for item in items:
-                        prs.append(
-                            {
-                                "number": item.get("number"),
-                                "title": item.get("title"),
-                                "body": item.get("body", ""),
-                                "state": item.get("state"),
-                                "url": item.get("html_url"),
-                                "created_at": item.get("created_at"),
-                                "updated_at": item.get("updated_at"),
-                                "user": item.get("user", {}).get("login"),
-                                "repo": (
-                                    item.get("repository_url", "").split("/")[-1]
-                                    if item.get("repository_url")
-                                    else ""
-                                ),
-                            }
-                        )
-
-                    return prs
-                else:
-                    logger.warning(
-                        f"GitHub PR search returned status {response.status_code}"
+                prs = []
+                for item in items:
+                    prs.append(
+                        {
+                            "number": item.get("number"),
+                            "title": item.get("title"),
+                            "body": item.get("body", ""),
+                            "state": item.get("state"),
+                            "url": item.get("html_url"),
+                            "created_at": item.get("created_at"),
+                            "updated_at": item.get("updated_at"),
+                            "user": item.get("user", {}).get("login"),
+                            "repo": (
+                                item.get("repository_url", "").split("/")[-1]
+                                if item.get("repository_url")
+                                else ""
+                            ),
+                        }
                     )
-                    return []
 
-            except Exception as e:
-                logger.error(f"Error searching GitHub PRs: {e}")
+                return prs
+            else:
+                logger.warning(f"GitHub PR search returned status {status_code}")
                 return []
 
+        except Exception as e:
+            logger.error(f"Error searching GitHub PRs: {e}")
+            return []
+
     async def _search_commits(
         self, query_keywords: List[str], repo_name: Optional[str], since_date: str
     ) -> List[Dict[str, Any]]:
@@ -317,52 +438,44 @@ class GitHubClient:
 
         search_query = " ".join(query_parts)
 
-        # Get auth headers (handles both token and GitHub App)
-        headers = await self._get_auth_headers()
-
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/search/commits",
-                    headers=headers,
-                    params={
-                        "q": search_query,
-                        "sort": "committer-date",
-                        "order": "desc",
-                        "per_page": 30,
-                    },
-                    timeout=10.0,
-                )
+        try:
+            status_code, data = await self._get_json(
+                "/search/commits",
+                params={
+                    "q": search_query,
+                    "sort": "committer-date",
+                    "order": "desc",
+                    "per_page": 30,
+                },
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    commits = []
-                    for item in items:
-                        commit_data = item.get("commit", {})
-                        commits.append(
-                            {
-                                "sha": item.get("sha"),
-                                "message": commit_data.get("message", ""),
-                                "author": commit_data.get("author", {}).get("name"),
-                                "date": commit_data.get("author", {}).get("date"),
-                                "url": item.get("html_url"),
-                                "repo": item.get("repository", {}).get("name", ""),
-                            }
-                        )
-
-                    return commits
-                else:
-                    logger.warning(
-                        f"GitHub commit search returned status {response.status_code}"
+            if status_code == 200:
+                items = data.get("items", [])
+
+                commits = []
+                for item in items:
+                    commit_data = item.get("commit", {})
+                    commits.append(
+                        {
+                            "sha": item.get("sha"),
+                            "message": commit_data.get("message", ""),
+                            "author": commit_data.get("author", {}).get("name"),
+                            "date": commit_data.get("author", {}).get("date"),
+                            "url": item.get("html_url"),
+                            "repo": item.get("repository", {}).get("name", ""),
+                        }
                     )
-                    return []
 
-            except Exception as e:
-                logger.error(f"Error searching GitHub commits: {e}")
+                return commits
+            else:
+                logger.warning(f"GitHub commit search returned status {status_code}")
                 return []
 
+        except Exception as e:
+            logger.error(f"Error searching GitHub commits: {e}")
+            return []
+
     def detect_repo_name(
         self, project_key: str, project_keywords: List[str]
     ) -> Optional[str]:
@@ -418,54 +531,64 @@ class GitHubClient:
     async def list_accessible_repos(self) -> List[str]:
         """List all repositories accessible by the GitHub App with pagination.
 
+        The list is cached per installation for ``REPO_LIST_TTL`` seconds.
+
         Returns:
             List of repository names (without org prefix)
         """
-        headers = await self._get_auth_headers()
+        cached = _repo_list_cache.get(self._cache_identity)
+        if cached and time.monotonic() < cached[0]:
+            return list(cached[1])
+
         all_repos = []
         page = 1
         per_page = 100  # Max allowed by GitHub API
+        complete = False
 
-        async with httpx.AsyncClient() as client:
-            try:
-                while True:
-                    response = await client.get(
-                        f"{self.base_url}/installation/repositories",
-                        headers=headers,
-                        params={"per_page": per_page, "page": page},
-                        timeout=10.0,
-                    )
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        repos = data.get("repositories", [])
+        try:
+            while True:
+                status_code, data = await self._get_json(
+                    "/installation/repositories",
+                    params={"per_page": per_page, "page": page},
+                    timeout=10.0,
+                )
 
-                        if not repos:
-                            # No more repos, we're done
-                            break
+                if status_code == 200:
+                    repos = data.get("repositories", [])
 
-                        repo_names = [repo["name"] for repo in repos]
-                        all_repos.extend(repo_names)
+                    if not repos:
+                        # No more repos, we're done
+                        complete = True
+                        break
 
-                        # Check if there are more pages
-                        total_count = data.get("total_count", 0)
-                        if len(all_repos) >= total_count:
-                            break
+                    repo_names = [repo["name"] for repo in repos]
+                    all_repos.extend(repo_names)
 
-                        page += 1
-                    else:
-                        logger.warning(
-                            f"Failed to list accessible repos: {response.status_code}"
-                        )
+                    # Check if there are more pages
+                    total_count = data.get("total_count", 0)
+                    if len(all_repos) >= total_count:
+                        complete = True
                         break
 
-                logger.info(f"GitHub App has access to {len(all_repos)} repositories")
-                logger.info(f"All accessible repos: {sorted(all_repos)}")
-                return all_repos
+                    page += 1
+                else:
+                    logger.warning(f"Failed to list accessible repos: {status_code}")
+                    break
 
-            except Exception as e:
-                logger.error(f"Error listing accessible repos: {e}")
-                return []
+            logger.info(f"GitHub App has access to {len(all_repos)} repositories")
+            logger.debug(f"All accessible repos: {sorted(all_repos)}")
+
+            # Only cache full listings so a failed page is retried next time
+            if complete:
+                _repo_list_cache[self._cache_identity] = (
+                    time.monotonic() + REPO_LIST_TTL,
+                    list(all_repos),
+                )
+            return all_repos
+
+        except Exception as e:
+            logger.error(f"Error listing accessible repos: {e}")
+            return []
 
     async def get_prs_by_date_and_state(
         self,
@@ -516,25 +639,29 @@ class GitHubClient:
             since_date = datetime.now() - timedelta(days=days_back)
             since_iso = since_date.strftime("%Y-%m-%d")
 
-            # Fetch PRs by state
-            merged_prs = await self._fetch_prs_by_query(
-                repo_name=repo_name,
-                since_date=since_iso,
-                additional_filters="is:pr is:merged",
-            )
-
-            # In review: open PRs with review activity
-            in_review_prs = await self._fetch_prs_by_query(
-                repo_name=repo_name,
-                since_date=since_iso,
-                additional_filters="is:pr is:open review:approved,review:changes_requested",
-            )
-
-            # Open PRs without review activity
-            open_prs = await self._fetch_prs_by_query(
-                repo_name=repo_name,
-                since_date=since_iso,
-                additional_filters="is:pr is:open -review:approved -review:changes_requested",
+            # Make sure an App installation token exists before the three
+            # queries run concurrently, so they don't each request one
+            await self._get_auth_headers()
+
+            # Fetch PRs by state concurrently over the shared connection pool
+            merged_prs, in_review_prs, open_prs = await asyncio.gather(
+                self._fetch_prs_by_query(
+                    repo_name=repo_name,
+                    since_date=since_iso,
+                    additional_filters="is:pr is:merged",
+                ),
+                # In review: open PRs with review activity
+                self._fetch_prs_by_query(
+                    repo_name=repo_name,
+                    since_date=since_iso,
+                    additional_filters="is:pr is:open review:approved,review:changes_requested",
+                ),
+                # Open PRs without review activity
+                self._fetch_prs_by_query(
+                    repo_name=repo_name,
+                    since_date=since_iso,
+                    additional_filters="is:pr is:open -review:approved -review:changes_requested",
+                ),
             )
 
             logger.info(
@@ -581,69 +708,63 @@ class GitHubClient:
 
         search_query = " ".join(query_parts)
 
-        # Get auth headers
-        headers = await self._get_auth_headers()
+        try:
+            status_code, data = await self._get_json(
+                "/search/issues",
+                params={
+                    "q": search_query,
+                    "sort": "updated",
+                    "order": "desc",
+                    "per_page": 50,  # Get more results for weekly recap
+                },
+                timeout=15.0,
+            )
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/search/issues",
-                    headers=headers,
-                    params={
-                        "q": search_query,
-                        "sort": "updated",
-                        "order": "desc",
-                        "per_page": 50,  # Get more results for weekly recap
-                    },
-                    timeout=15.0,
+            if status_code == 200:
+                items = data.get("items", [])
+
+                prs = []
+                for item in items:
+                    pr_data = {
+                        "number": item.get("number"),
+                        "title": item.get("title"),
+                        "body": (
+                            item.get("body", "")[:200] if item.get("body") else ""
+                        ),  # Truncate body
+                        "state": item.get("state"),
+                        "url": item.get("html_url"),
+                        "created_at": item.get("created_at"),
+                        "updated_at": item.get("updated_at"),
+                        "author": (
+                            item.get("user", {}).get("login")
+                            if item.get("user")
+                            else None
+                        ),
+                        "repo": (
+                            item.get("repository_url", "").split("/")[-1]
+                            if item.get("repository_url")
+                            else ""
+                        ),
+                    }
+
+                    # Add merged_at if available - check if pull_request exists and has merged_at
+                    pull_request = item.get("pull_request")
+                    if pull_request and pull_request.get("merged_at"):
+                        pr_data["merged_at"] = pull_request["merged_at"]
+
+                    prs.append(pr_data)
+
+                return prs
+            else:
+                logger.warning(
+                    f"GitHub PR query returned status {status_code}: {search_query}"
                 )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    prs = []
-                    for item in items:
-                        pr_data = {
-                            "number": item.get("number"),
-                            "title": item.get("title"),
-                            "body": (
-                                item.get("body", "")[:200] if item.get("body") else ""
-                            ),  # Truncate body
-                            "state": item.get("state"),
-                            "url": item.get("html_url"),
-                            "created_at": item.get("created_at"),
-                            "updated_at": item.get("updated_at"),
-                            "author": (
-                                item.get("user", {}).get("login")
-                                if item.get("user")
-                                else None
-                            ),
-                            "repo": (
-                                item.get("repository_url", "").split("/")[-1]
-                                if item.get("repository_url")
-                                else ""
-                            ),
-                        }
-
-                        # Add merged_at if available - check if pull_request exists and has merged_at
-                        pull_request = item.get("pull_request")
-                        if pull_request and pull_request.get("merged_at"):
-                            pr_data["merged_at"] = pull_request["merged_at"]
-
-                        prs.append(pr_data)
-
-                    return prs
-                else:
-                    logger.warning(
-                        f"GitHub PR query returned status {response.status_code}: {search_query}"
-                    )
-                    return []
-
-            except Exception as e:
-                logger.error(f"Error querying GitHub PRs: {e}", exc_info=True)
                 return []
 
+        except Exception as e:
+            logger.error(f"Error querying GitHub PRs: {e}", exc_info=True)
+            return []
+
     async def get_prs_by_date_range(
         self, repo_name: str, start_date: str, end_date: str, state: str = "all"
     ) -> List[Dict[str, Any]]:
@@ -679,59 +800,53 @@ class GitHubClient:
 
         search_query = " ".join(query_parts)
 
-        # Get auth headers
-        headers = await self._get_auth_headers()
+        try:
+            status_code, data = await self._get_json(
+                "/search/issues",
+                params={
+                    "q": search_query,
+                    "sort": "created",
+                    "order": "desc",
+                    "per_page": 100,  # Max allowed
+                },
+                timeout=15.0,
+            )
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/search/issues",
-                    headers=headers,
-                    params={
-                        "q": search_query,
-                        "sort": "created",
-                        "order": "desc",
-                        "per_page": 100,  # Max allowed
-                    },
-                    timeout=15.0,
+            if status_code == 200:
+                items = data.get("items", [])
+
+                prs = []
+                for item in items:
+                    pr_data = {
+                        "number": item.get("number"),
+                        "title": item.get("title"),
+                        "body": item.get("body", ""),
+                        "state": item.get("state"),
+                        "url": item.get("html_url"),
+                        "created_at": item.get("created_at"),
+                        "updated_at": item.get("updated_at"),
+                        "author": (
+                            item.get("user", {}).get("login")
+                            if item.get("user")
+                            else None
+                        ),
+                        "repo": repo_name,
+                    }
+
+                    # Add merged_at if available
+                    pull_request = item.get("pull_request")
+                    if pull_request and pull_request.get("merged_at"):
+                        pr_data["merged_at"] = pull_request["merged_at"]
+
+                    prs.append(pr_data)
+
+                return prs
+            else:
+                logger.warning(
+                    f"GitHub PR search returned status {status_code}: {search_query}"
                 )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    prs = []
-                    for item in items:
-                        pr_data = {
-                            "number": item.get("number"),
-                            "title": item.get("title"),
-                            "body": item.get("body", ""),
-                            "state": item.get("state"),
-                            "url": item.get("html_url"),
-                            "created_at": item.get("created_at"),
-                            "updated_at": item.get("updated_at"),
-                            "author": (
-                                item.get("user", {}).get("login")
-                                if item.get("user")
-                                else None
-                            ),
-                            "repo": repo_name,
-                        }
-
-                        # Add merged_at if available
-                        pull_request = item.get("pull_request")
-                        if pull_request and pull_request.get("merged_at"):
-                            pr_data["merged_at"] = pull_request["merged_at"]
-
-                        prs.append(pr_data)
-
-                    return prs
-                else:
-                    logger.warning(
-                        f"GitHub PR search returned status {response.status_code}: {search_query}"
-                    )
-                    return []
-
-            except Exception as e:
-                logger.error(f"Error searching GitHub PRs: {e}", exc_info=True)
                 return []
+
+        except Exception as e:
+            logger.error(f"Error searching GitHub PRs: {e}", exc_info=True)
+            return []
@@ -1,58 +1,78 @@
 """Google Workspace MCP integration for Docs and Sheets access."""
 
+import hashlib
 import logging
-import json
-import subprocess
-import tempfile
-import os
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from src.integrations.mcp_stdio import (
+    MCPStdioSession,
+    get_mcp_session_pool,
+    tool_result_to_dict,
+)
+
 logger = logging.getLogger(__name__)
 
+# Google Drive MCP server, started once per credential set and then reused
+MCP_SERVER_COMMAND = ["npx", "-y", "@modelcontextprotocol/server-gdrive"]
+
 
 class GoogleWorkspaceClient:
     """Client for interacting with Google Workspace via MCP server."""
 
-    def __init__(self, oauth_token: Dict[str, Any]):
+    def __init__(
+        self, oauth_token: Dict[str, Any], server_command: Optional[List[str]] = None
+    ):
         """
         Initialize Google Workspace client with user's OAuth token.
 
         Args:
             oauth_token: Dictionary containing access_token, refresh_token, and token_uri
+            server_command: MCP server command line (defaults to the Google
+                Drive server; tests and benchmarks pass a local stub)
         """
         self.oauth_token = oauth_token
         self.access_token = oauth_token.get("access_token")
         self.refresh_token = oauth_token.get("refresh_token")
         self.token_expiry = oauth_token.get("expiry")
+        self.server_command = server_command or MCP_SERVER_COMMAND
 
         if not self.access_token:
             raise ValueError("OAuth token must contain 'access_token'")
 
-    def _create_mcp_config(self) -> str:
-        """Create temporary MCP config file with user credentials."""
-        config = {
-            "mcpServers": {
-                "google-drive": {
-                    "command": "npx",
-                    "args": ["-y", "@modelcontextprotocol/server-gdrive"],
-                    "env": {
-                        "GOOGLE_ACCESS_TOKEN": self.access_token,
-                        "GOOGLE_REFRESH_TOKEN": self.refresh_token or "",
-                    },
-                }
-            }
-        }
+    def _session_key(self) -> str:
+        """Pool key for this server and user.
 
-        # Create temp file
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            json.dump(config, f)
-            return f.name
+        Keyed on the refresh token, which outlives access-token refreshes, so
+        a refreshed token replaces the user's running server instead of
+        starting another one. Tokens are only ever hashed.
+        """
+        identity = self.refresh_token or self.access_token
+        digest = hashlib.sha256(identity.encode()).hexdigest()
+        return f"google-drive:{' '.join(self.server_command)}:{digest}"
+
+    def _credentials_version(self) -> str:
+        """Hash of the credentials the server is started with."""
+        credentials = f"{self.access_token}\0{self.refresh_token or ''}"
+        return hashlib.sha256(credentials.encode()).hexdigest()
+
+    def _create_mcp_session(self) -> MCPStdioSession:
+        """Build an (unstarted) MCP session with this user's credentials."""
+        return MCPStdioSession(
+            self.server_command,
+            env={
+                "GOOGLE_ACCESS_TOKEN": self.access_token,
+                "GOOGLE_REFRESH_TOKEN": self.refresh_token or "",
+            },
+        )
 
     def _call_mcp_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call an MCP tool with the given parameters.
 
+        Uses a long-lived server session shared by every client with the same
+        credentials, so only the first call pays the server's startup time.
+
         Args:
             tool_name: Name of the MCP tool to call
             params: Parameters to pass to the tool
@@ -60,39 +80,14 @@ class GoogleWorkspaceClient:
         Returns:
             Response from the MCP tool
         """
-        config_file = self._create_mcp_config()
-
-        try:
-            # Create command to call MCP tool
-            # Note: This is a simplified example. In production, you'd use the MCP SDK
-            # to properly interact with the MCP server
-            cmd = [
-                "npx",
-                "-y",
-                "@modelcontextprotocol/inspector",
-                "--config",
-                config_file,
-                "--server",
-                "google-drive",
-                "--tool",
-                tool_name,
-                "--params",
-                json.dumps(params),
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                logger.error(f"MCP tool call failed: {result.stderr}")
-                raise RuntimeError(f"MCP tool call failed: {result.stderr}")
-
-            return json.loads(result.stdout)
-        finally:
-            # Clean up temp config file
-            try:
-                os.unlink(config_file)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp config file: {e}")
+        result = get_mcp_session_pool().call_tool(
+            self._session_key(),
+            self._create_mcp_session,
+            tool_name,
+            params,
+            version=self._credentials_version(),
+        )
+        return tool_result_to_dict(result)
 
     def list_files(
         self, query: str = None, mime_type: str = None, limit: int = 10
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 import asyncio
 import httpx
@@ -11,6 +11,23 @@ from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
+# Jira Cloud accepts at most 50 issues per bulk-create request
+BULK_CREATE_MAX_ISSUES = 50
+
+# Backoff for 429 responses that don't carry a Retry-After header
+RATE_LIMIT_BASE_DELAY = 1.0
+RATE_LIMIT_MAX_DELAY = 30.0
+RATE_LIMIT_MAX_RETRIES = 5
+
+# Jira Cloud pages /search/jql results at 100 issues when fields are requested
+SEARCH_PAGE_MAX = 100
+
+# Histories per /issue/{key}/changelog page (Jira Cloud's maximum)
+CHANGELOG_PAGE_MAX = 100
+
+# Truncated changelogs fetched in parallel per search
+CHANGELOG_FETCH_CONCURRENCY = 5
+
 
 def convert_jira_wiki_to_adf(text: str) -> Dict[str, Any]:
     """
@@ -108,6 +125,11 @@ def convert_jira_wiki_to_adf(text: str) -> Dict[str, Any]:
     return {"type": "doc", "version": 1, "content": content}
 
 
+def _parse_jira_time(timestamp: str) -> datetime:
+    """Parse a Jira timestamp ("2025-06-01T09:00:00.000+0000") to a naive datetime."""
+    return datetime.strptime(timestamp[:19], "%Y-%m-%dT%H:%M:%S")
+
+
 @dataclass
 class JiraTicket:
     """Jira ticket structure."""
@@ -374,13 +396,9 @@ class JiraMCPClient:
             # Epic Name is stored in customfield (need to query for the field ID)
             # For now, we'll use summary as epic name
             payload = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": summary or epic_name,
-                    "description": convert_jira_wiki_to_adf(description or ""),
-                    "issuetype": {"name": "Epic"},
-                    "assignee": None,  # Explicitly set to unassigned
-                }
+                "fields": self.build_issue_fields(
+                    project_key, "Epic", summary or epic_name, description
+                )
             }
 
             # Create the epic
@@ -451,19 +469,11 @@ class JiraMCPClient:
 
             # Build issue creation payload
             payload = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": summary,
-                    "description": convert_jira_wiki_to_adf(description or ""),
-                    "issuetype": {"name": issue_type},
-                    "assignee": None,  # Explicitly set to unassigned
-                }
+                "fields": self.build_issue_fields(
+                    project_key, issue_type, summary, description, epic_key
+                )
             }
 
-            # Add epic link if provided
-            if epic_key:
-                payload["fields"]["parent"] = {"key": epic_key}
-
             # Create the issue
             response = await self.client.post(
                 f"{self.jira_url}/rest/api/3/issue",
@@ -498,6 +508,196 @@ class JiraMCPClient:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def build_issue_fields(
+        project_key: str,
+        issue_type: str,
+        summary: str,
+        description: str = "",
+        epic_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the ``fields`` payload for creating an unassigned issue.
+
+        Args:
+            project_key: Project key (e.g., "SUBS")
+            issue_type: Issue type (e.g., "Epic", "Task", "Story")
+            summary: Issue summary
+            description: Issue description in Jira wiki markup
+            epic_key: Optional parent epic key
+
+        Returns:
+            Fields dict for the create-issue APIs
+        """
+        fields = {
+            "project": {"key": project_key},
+            "summary": summary,
+            "description": convert_jira_wiki_to_adf(description or ""),
+            "issuetype": {"name": issue_type},
+            "assignee": None,  # Explicitly set to unassigned
+        }
+        if epic_key:
+            fields["parent"] = {"key": epic_key}
+        return fields
+
+    async def bulk_create_issues(
+        self,
+        issues: List[Dict[str, Any]],
+        chunk_size: int = BULK_CREATE_MAX_ISSUES,
+        on_chunk: Optional[Callable[[List[Dict[str, Any]], int], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Create issues through Jira's bulk-create endpoint in chunks.
+
+        429 responses are retried after the server's ``Retry-After`` delay
+        (or an exponential backoff when the header is missing), so no fixed
+        sleeps are needed between chunks.
+
+        Args:
+            issues: Issue ``fields`` dicts (see ``build_issue_fields``)
+            chunk_size: Issues per request (capped at BULK_CREATE_MAX_ISSUES)
+            on_chunk: Optional callback(results so far, total) after each chunk
+
+        Returns:
+            One result per input issue, in order: ``{"success": True, "key",
+            "id", "self"}`` or ``{"success": False, "error"}``
+        """
+        if not self.jira_url or not self.username or not self.api_token:
+            return [
+                {
+                    "success": False,
+                    "error": "Jira credentials not configured for direct API",
+                }
+                for _ in issues
+            ]
+
+        import base64
+
+        auth_string = base64.b64encode(
+            f"{self.username}:{self.api_token}".encode()
+        ).decode()
+        headers = {
+            "Authorization": f"Basic {auth_string}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+        chunk_size = max(1, min(chunk_size, BULK_CREATE_MAX_ISSUES))
+        results: List[Dict[str, Any]] = []
+
+        for start in range(0, len(issues), chunk_size):
+            chunk = issues[start : start + chunk_size]
+            try:
+                response = await self._post_with_rate_limit(
+                    f"{self.jira_url}/rest/api/3/issue/bulk",
+                    {"issueUpdates": [{"fields": fields} for fields in chunk]},
+                    headers,
+                )
+                # Jira answers 400 when every issue in the request failed
+                if response.status_code not in (200, 201, 400):
+                    response.raise_for_status()
+                results.extend(self._parse_bulk_create_response(response, len(chunk)))
+
+            except Exception as e:
+                logger.error(
+                    f"Error bulk creating Jira issues {start + 1}-{start + len(chunk)}: {e}"
+                )
+                results.extend({"success": False, "error": str(e)} for _ in chunk)
+
+            if on_chunk:
+                on_chunk(results, len(issues))
+
+        created = sum(1 for r in results if r["success"])
+        logger.info(f"Bulk created {created}/{len(issues)} Jira issues")
+        return results
+
+    async def _post_with_rate_limit(
+        self, url: str, payload: Dict[str, Any], headers: Dict[str, str]
+    ) -> httpx.Response:
+        """POST, waiting out 429 responses with adaptive backoff.
+
+        Returns:
+            The first non-429 response (or the last 429 once retries run out)
+        """
+        return await self._request_with_rate_limit(
+            "POST", url, json=payload, headers=headers
+        )
+
+    async def _request_with_rate_limit(
+        self, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request, waiting out 429 responses with adaptive backoff.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to ``httpx.AsyncClient.request``
+
+        Returns:
+            The first non-429 response (or the last 429 once retries run out)
+        """
+        delay = RATE_LIMIT_BASE_DELAY
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            response = await self.client.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == RATE_LIMIT_MAX_RETRIES:
+                return response
+
+            retry_after = response.headers.get("Retry-After")
+            try:
+                wait = float(retry_after) if retry_after is not None else delay
+            except ValueError:
+                wait = delay
+            wait = min(wait, RATE_LIMIT_MAX_DELAY)
+            logger.warning(
+                f"Jira rate limited request (attempt {attempt + 1}), "
+                f"retrying in {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, RATE_LIMIT_MAX_DELAY)
+        return response
+
+    @staticmethod
+    def _parse_bulk_create_response(
+        response: httpx.Response, count: int
+    ) -> List[Dict[str, Any]]:
+        """Map a bulk-create response back onto the submitted issues.
+
+        Jira lists created issues in submission order and reports failures by
+        their ``failedElementNumber`` (0-based index into the request).
+        """
+        data = response.json()
+        failures: Dict[int, str] = {}
+        for error in data.get("errors", []):
+            index = error.get("failedElementNumber")
+            element_errors = error.get("elementErrors", {})
+            messages = list(element_errors.get("errorMessages", []))
+            messages.extend(
+                f"{field}: {message}"
+                for field, message in element_errors.get("errors", {}).items()
+            )
+            if index is not None:
+                failures[index] = "; ".join(messages) or f"HTTP {error.get('status')}"
+
+        created = iter(data.get("issues", []))
+        results = []
+        for index in range(count):
+            if index in failures:
+                results.append({"success": False, "error": failures[index]})
+                continue
+            issue = next(created, None)
+            if issue is None:
+                results.append(
+                    {"success": False, "error": "Issue missing from bulk response"}
+                )
+            else:
+                results.append(
+                    {
+                        "success": True,
+                        "key": issue.get("key"),
+                        "id": issue.get("id"),
+                        "self": issue.get("self"),
+                    }
+                )
+        return results
+
     async def update_ticket(
         self, ticket_key: str, updates: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -1315,6 +1515,165 @@ class JiraMCPClient:
             logger.error(f"Error fetching ticket {ticket_key} with changelog: {e}")
             return None
 
+    async def _get_changelog_since(
+        self,
+        ticket_key: str,
+        total: int,
+        headers: Dict[str, str],
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Page a ticket's changelog from newest to oldest.
+
+        ``/issue/{key}/changelog`` lists histories oldest first, so pages are
+        requested backwards from ``total`` and paging stops at the first page
+        that reaches back past ``since``.
+
+        Args:
+            ticket_key: Issue key
+            total: Number of histories Jira reported for the issue
+            headers: Request headers (auth)
+            since: Oldest change the caller needs (None for the full history)
+
+        Returns:
+            Histories in Jira's (oldest first) order
+        """
+        histories: List[Dict[str, Any]] = []
+        start = max(0, total - CHANGELOG_PAGE_MAX)
+        while True:
+            response = await self._request_with_rate_limit(
+                "GET",
+                f"{self.jira_url}/rest/api/3/issue/{ticket_key}/changelog",
+                params={"startAt": start, "maxResults": CHANGELOG_PAGE_MAX},
+                headers=headers,
+            )
+            response.raise_for_status()
+            values = response.json().get("values", [])
+            histories[:0] = values
+
+            if start == 0 or not values:
+                break
+            if since is not None and _parse_jira_time(values[0]["created"]) < since:
+                break
+            start = max(0, start - CHANGELOG_PAGE_MAX)
+
+        return histories
+
+    async def search_tickets_with_changelog(
+        self,
+        jql: str,
+        fields: str = "*navigable",
+        page_size: int = SEARCH_PAGE_MAX,
+        since: Optional[datetime] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Search tickets with their change history, following every page.
+
+        Uses ``/search/jql`` with ``expand=changelog`` and ``nextPageToken``
+        pagination, so callers get all matching issues and their histories
+        without a per-issue request. Issues whose embedded changelog was
+        truncated by Jira have the rest paged from ``/issue/{key}/changelog``
+        (back to ``since``); if that fails the truncated changelog is kept and
+        the failure logged.
+
+        Args:
+            jql: JQL query string
+            fields: Comma-separated issue fields to return
+            page_size: Issues per page (capped at SEARCH_PAGE_MAX)
+            since: Oldest change the caller needs from truncated changelogs
+                (None for the full history)
+
+        Returns:
+            List of issue dictionaries with a ``changelog`` key, or None if
+            the search failed part-way (so callers don't mistake it for
+            "no changes")
+        """
+        try:
+            if self.jira_url and self.username and self.api_token:
+                import base64
+
+                auth_string = base64.b64encode(
+                    f"{self.username}:{self.api_token}".encode()
+                ).decode()
+                headers = {
+                    "Authorization": f"Basic {auth_string}",
+                    "Accept": "application/json",
+                }
+
+                issues: List[Dict[str, Any]] = []
+                params = {
+                    "jql": jql,
+                    "fields": fields,
+                    "expand": "changelog",
+                    "maxResults": max(1, min(page_size, SEARCH_PAGE_MAX)),
+                }
+                while True:
+                    response = await self._request_with_rate_limit(
+                        "GET",
+                        f"{self.jira_url}/rest/api/3/search/jql",
+                        params=params,
+                        headers=headers,
+                    )
+                    response.raise_for_status()
+                    page = response.json()
+                    issues.extend(page.get("issues", []))
+
+                    next_token = page.get("nextPageToken")
+                    if page.get("isLast", True) or not next_token:
+                        break
+                    params["nextPageToken"] = next_token
+
+                truncated = [
+                    issue
+                    for issue in issues
+                    if (issue.get("changelog") or {}).get("total", 0)
+                    > len((issue.get("changelog") or {}).get("histories", []))
+                ]
+                semaphore = asyncio.Semaphore(CHANGELOG_FETCH_CONCURRENCY)
+
+                async def complete_changelog(issue: Dict[str, Any]) -> None:
+                    changelog = issue["changelog"]
+                    try:
+                        async with semaphore:
+                            histories = await self._get_changelog_since(
+                                issue["key"], changelog["total"], headers, since
+                            )
+                        changelog["histories"] = histories
+                        changelog["maxResults"] = len(histories)
+                    except Exception as e:
+                        logger.warning(
+                            f"Keeping truncated changelog for {issue['key']} "
+                            f"({len(changelog.get('histories', []))}/"
+                            f"{changelog['total']} histories): {e}"
+                        )
+
+                await asyncio.gather(*(complete_changelog(i) for i in truncated))
+
+                logger.info(
+                    f"Retrieved {len(issues)} tickets with changelog for JQL: {jql}"
+                )
+                return issues
+
+            # Fallback to MCP
+            mcp_request = {
+                "method": "jira/searchIssues",
+                "params": {
+                    "jql": jql,
+                    "maxResults": 1000,
+                    "expand": ["changelog"],
+                },
+            }
+
+            response = await self.client.post(
+                f"{self.mcp_server_url}/mcp",
+                json=mcp_request,
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+            return response.json().get("issues", [])
+
+        except Exception as e:
+            logger.error(f"Error searching tickets with changelog: {e}")
+            return None
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
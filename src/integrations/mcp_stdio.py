@@ -0,0 +1,529 @@
+"""Long-lived MCP client sessions over the stdio transport.
+
+An MCP server started with stdio transport speaks newline-delimited
+JSON-RPC 2.0 on its stdin/stdout. Starting one (``npx`` resolving the
+package, then Node booting) takes seconds, so sessions are kept open and
+reused: ``MCPSessionPool`` holds at most ``max_sessions`` running servers,
+one per user/server, health-checks or restarts them as needed and stops
+servers that have been idle for ``IDLE_SESSION_TTL``.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = "2024-11-05"
+
+# Seconds to wait for a response before treating the server as hung
+REQUEST_TIMEOUT = 30.0
+
+# Sessions idle longer than this are pinged before reuse
+HEALTH_CHECK_INTERVAL = 60.0
+
+# Running MCP servers kept across all credential sets
+MAX_SESSIONS = 8
+
+# Servers unused for this many seconds are stopped
+IDLE_SESSION_TTL = 15 * 60
+
+
+class MCPError(RuntimeError):
+    """Raised when an MCP request fails or the server misbehaves."""
+
+
+class MCPConnectionError(MCPError):
+    """Raised when a request couldn't be sent because the server is gone."""
+
+
+class MCPStdioSession:
+    """One MCP server subprocess and its initialized client session."""
+
+    def __init__(
+        self,
+        command: List[str],
+        env: Optional[Dict[str, str]] = None,
+        timeout: float = REQUEST_TIMEOUT,
+        client_name: str = "pm-dashboard",
+    ):
+        """
+        Initialize the session (the server is started by ``start``).
+
+        Args:
+            command: Server command line (e.g. ["npx", "-y", "<package>"])
+            env: Extra environment variables for the server
+            timeout: Seconds to wait for each response
+            client_name: Name reported to the server during initialize
+        """
+        self.command = command
+        self.env = env or {}
+        self.timeout = timeout
+        self.client_name = client_name
+        self.server_info: Dict[str, Any] = {}
+        self.last_used = 0.0
+
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> Optional[int]:
+        """PID of the server process, if started."""
+        return self._process.pid if self._process else None
+
+    def is_alive(self) -> bool:
+        """Check whether the server process is still running."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> "MCPStdioSession":
+        """Start the server and perform the MCP initialize handshake."""
+        # Fresh queue so a previous process's exit marker isn't read
+        self._responses = queue.Queue()
+        self._process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env={**os.environ, **self.env},
+            text=True,
+            bufsize=1,
+        )
+        threading.Thread(
+            target=self._read_stdout,
+            args=(self._process, self._responses),
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=self._read_stderr, args=(self._process,), daemon=True
+        ).start()
+
+        try:
+            result = self.request(
+                "initialize",
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": self.client_name, "version": "1.0"},
+                },
+            )
+            self.server_info = result.get("serverInfo", {})
+            self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except Exception:
+            self.close()
+            raise
+
+        logger.info(
+            f"Started MCP server {self.server_info.get('name', self.command[0])} "
+            f"(pid {self.pid})"
+        )
+        return self
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a JSON-RPC request and wait for its response.
+
+        Args:
+            method: JSON-RPC method (e.g. "tools/call")
+            params: Method parameters
+
+        Returns:
+            The response ``result``
+
+        Raises:
+            MCPError: On error responses, timeouts or a dead server
+        """
+        with self._lock:
+            request_id = next(self._ids)
+            message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+            if params is not None:
+                message["params"] = params
+            self._send(message)
+            responses = self._responses
+
+            deadline = time.monotonic() + self.timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # A late answer would be read as the next call's response
+                    self.close()
+                    raise MCPError(f"MCP request {method} timed out")
+                try:
+                    response = responses.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+
+                if response is None:
+                    # stdout closed; reap the process so it isn't reused
+                    self.close()
+                    raise MCPError(f"MCP server exited during {method}")
+                if response.get("id") != request_id:
+                    # Server notifications and requests aren't used here
+                    continue
+
+                self.last_used = time.monotonic()
+                if "error" in response:
+                    error = response["error"]
+                    raise MCPError(
+                        f"MCP {method} failed: {error.get('message', error)}"
+                    )
+                return response.get("result", {})
+
+    def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a tool on the server.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            The tool result (``content``, optional ``structuredContent``)
+
+        Raises:
+            MCPError: If the call fails or the tool reports an error
+        """
+        result = self.request("tools/call", {"name": name, "arguments": arguments})
+        if result.get("isError"):
+            raise MCPError(f"MCP tool {name} failed: {tool_result_text(result)}")
+        return result
+
+    def ping(self) -> bool:
+        """Health check: True if the server answers a ping."""
+        if not self.is_alive():
+            return False
+        try:
+            self.request("ping")
+            return True
+        except MCPError as e:
+            logger.warning(f"MCP server (pid {self.pid}) failed health check: {e}")
+            return False
+
+    def close(self):
+        """Stop the server process."""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            process.stdin.close()
+            process.terminate()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+            process.wait()
+
+    def _send(self, message: Dict[str, Any]):
+        if not self.is_alive():
+            raise MCPConnectionError("MCP server is not running")
+        try:
+            self._process.stdin.write(json.dumps(message) + "\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise MCPConnectionError(f"MCP server pipe closed: {e}")
+
+    @staticmethod
+    def _read_stdout(process: subprocess.Popen, responses: queue.Queue):
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                logger.debug(f"Ignoring non-JSON MCP output: {line[:200]}")
+        # Wake up any waiting request
+        responses.put(None)
+
+    @staticmethod
+    def _read_stderr(process: subprocess.Popen):
+        for line in process.stderr:
+            logger.debug(f"MCP server (pid {process.pid}): {line.rstrip()}")
+
+
+def tool_result_text(result: Dict[str, Any]) -> str:
+    """Join the text content blocks of a tool result."""
+    return "\n".join(
+        block.get("text", "")
+        for block in result.get("content", [])
+        if block.get("type") == "text"
+    )
+
+
+def tool_result_to_dict(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a tool result into a plain dictionary.
+
+    Prefers ``structuredContent``; otherwise parses the text content as a JSON
+    object, falling back to ``{"content": ..., "text": ...}``.
+    """
+    if isinstance(result.get("structuredContent"), dict):
+        return result["structuredContent"]
+
+    text = tool_result_text(result)
+    try:
+        parsed = json.loads(text)
+        if isinstance(parsed, dict):
+            return parsed
+    except (TypeError, ValueError):
+        pass
+    return {"content": result.get("content", []), "text": text}
+
+
+class MCPSessionPool:
+    """Reusable MCP sessions keyed by server/user identity, LRU-capped."""
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+        idle_ttl: float = IDLE_SESSION_TTL,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_sessions: Running servers kept; the least recently used is
+                stopped when a new one is needed
+            health_check_interval: Idle seconds after which a session is
+                pinged before reuse
+            idle_ttl: Idle seconds after which a session is stopped
+        """
+        self.max_sessions = max(1, max_sessions)
+        self.health_check_interval = health_check_interval
+        self.idle_ttl = idle_ttl
+        self._sessions: "OrderedDict[str, MCPStdioSession]" = OrderedDict()
+        self._versions: Dict[str, Optional[str]] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        # Calls in progress per session (by id), and sessions dropped from the
+        # pool while busy; those are closed when their last call finishes
+        self._in_use: Dict[int, int] = {}
+        self._retired: Dict[int, MCPStdioSession] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _retire(self, session: MCPStdioSession) -> bool:
+        """Drop a session that left the pool; call with ``self._lock`` held.
+
+        Returns:
+            True if the caller should close it now, False if a call is still
+            running on it (it is closed when that call finishes)
+        """
+        if self._in_use.get(id(session)):
+            self._retired[id(session)] = session
+            return False
+        return True
+
+    def _release(self, session: MCPStdioSession):
+        """Mark one call on a session finished, closing it if it was retired."""
+        with self._lock:
+            remaining = self._in_use.get(id(session), 0) - 1
+            if remaining > 0:
+                self._in_use[id(session)] = remaining
+                return
+            self._in_use.pop(id(session), None)
+            retired = self._retired.pop(id(session), None)
+        if retired is not None:
+            retired.close()
+
+    def get_session(
+        self,
+        key: str,
+        factory: Callable[[], MCPStdioSession],
+        version: Optional[str] = None,
+    ) -> MCPStdioSession:
+        """
+        Get a healthy, started session for ``key``, creating it if needed.
+
+        Checking and restarting a session happens under a per-key lock, so
+        concurrent callers never start two servers for the same key.
+        Sessions evicted or replaced while a call is running on them are
+        stopped once that call finishes.
+
+        Args:
+            key: Stable identity of the server and user (never a raw token,
+                and not something that changes when a token is refreshed)
+            factory: Builds an unstarted session for this key
+            version: Identifies the credentials the session was built with;
+                a different version replaces the running server
+
+        Returns:
+            A started session
+        """
+        return self._get_session(key, factory, version, checkout=False)
+
+    def _get_session(
+        self,
+        key: str,
+        factory: Callable[[], MCPStdioSession],
+        version: Optional[str],
+        checkout: bool,
+    ) -> MCPStdioSession:
+        """
+        Implement get_session; with ``checkout`` the caller also counts as
+        using the session until it calls ``_release``.
+        """
+        with self._key_lock(key):
+            stale = []
+            with self._lock:
+                session = self._sessions.pop(key, None)
+                if session is not None and self._versions.get(key) != version:
+                    stale.append(session)
+                    session = None
+                if session is None:
+                    while len(self._sessions) >= self.max_sessions:
+                        evicted_key, evicted = self._sessions.popitem(last=False)
+                        self._versions.pop(evicted_key, None)
+                        stale.append(evicted)
+                    session = factory()
+                    self._versions[key] = version
+                self._sessions[key] = session
+                if checkout:
+                    self._in_use[id(session)] = self._in_use.get(id(session), 0) + 1
+                stale = [old for old in stale if self._retire(old)]
+
+            for old in stale:
+                old.close()
+            self._start_reaper()
+
+            idle = time.monotonic() - session.last_used
+            if not session.is_alive() or (
+                idle > self.health_check_interval and not session.ping()
+            ):
+                session.close()
+                session.start()
+            return session
+
+    def reap_idle(self) -> int:
+        """
+        Stop sessions that have been idle longer than ``idle_ttl``.
+
+        Sessions that are being checked or started right now are skipped.
+
+        Returns:
+            Number of sessions stopped
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                (key, session)
+                for key, session in self._sessions.items()
+                if now - session.last_used > self.idle_ttl
+            ]
+
+        reaped = 0
+        for key, session in candidates:
+            key_lock = self._key_lock(key)
+            if not key_lock.acquire(blocking=False):
+                continue
+            try:
+                with self._lock:
+                    if self._sessions.get(key) is not session:
+                        continue
+                    if time.monotonic() - session.last_used <= self.idle_ttl:
+                        continue
+                    if self._in_use.get(id(session)):
+                        continue  # a long call is still running
+                    del self._sessions[key]
+                    self._versions.pop(key, None)
+                session.close()
+                reaped += 1
+            finally:
+                key_lock.release()
+
+        if reaped:
+            logger.info(f"Stopped {reaped} idle MCP server(s)")
+        return reaped
+
+    def _start_reaper(self):
+        """Start the background thread that stops idle sessions (once)."""
+        with self._lock:
+            if self._reaper is not None or self.idle_ttl <= 0:
+                return
+            self._reaper = threading.Thread(target=self._reap_forever, daemon=True)
+        self._reaper.start()
+
+    def _reap_forever(self):
+        while True:
+            time.sleep(max(1.0, self.idle_ttl / 2))
+            try:
+                self.reap_idle()
+            except Exception as e:
+                logger.warning(f"Error stopping idle MCP servers: {e}")
+
+    def call_tool(
+        self,
+        key: str,
+        factory: Callable[[], MCPStdioSession],
+        name: str,
+        arguments: Dict[str, Any],
+        version: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call a tool on the pooled session.
+
+        If the server turns out to be gone before the request was sent, it
+        is restarted and the call retried once. Failures after sending are
+        not retried, since the tool may already have run; the broken
+        session is restarted on the next call instead.
+
+        Args:
+            key: Session key (see ``get_session``)
+            factory: Builds an unstarted session for this key
+            name: Tool name
+            arguments: Tool arguments
+            version: Credentials version (see ``get_session``)
+
+        Returns:
+            The tool result
+        """
+        session = self._get_session(key, factory, version, checkout=True)
+        try:
+            return session.call_tool(name, arguments)
+        except MCPConnectionError:
+            logger.warning(f"MCP server for {name} is gone, restarting")
+            session.close()
+            retry = self._get_session(key, factory, version, checkout=True)
+            try:
+                return retry.call_tool(name, arguments)
+            finally:
+                self._release(retry)
+        finally:
+            self._release(session)
+
+    def close_all(self):
+        """Stop every pooled server."""
+        with self._lock:
+            sessions = list(self._sessions.values()) + list(self._retired.values())
+            self._sessions.clear()
+            self._versions.clear()
+            self._retired.clear()
+        for session in sessions:
+            session.close()
+
+
+_pool: Optional[MCPSessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Get the process-wide MCP session pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MCPSessionPool()
+            atexit.register(_pool.close_all)
+        return _pool
@@ -1,13 +1,94 @@
 """Simple Notion API client for vector ingestion (no MCP dependency)."""
 
 import logging
+import threading
+import time
 import requests
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from datetime import datetime, timedelta
 from src.utils.retry_logic import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# Notion allows an average of 3 requests per second per integration
+RATE_LIMIT_PER_SECOND = 3.0
+RATE_LIMIT_BURST = 3
+
+# Block-children requests in flight at once while walking page trees
+MAX_CONCURRENT_REQUESTS = 4
+
+REQUEST_TIMEOUT = 30
+
+# Child pages/databases are ingested as pages of their own
+NON_DESCENDING_BLOCK_TYPES = {"child_page", "child_database"}
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_http_session: Optional[requests.Session] = None
+_rate_limiters: Dict[str, TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get the pooled HTTP session shared by every NotionAPIClient."""
+    global _http_session
+    with _shared_lock:
+        if _http_session is None:
+            _http_session = requests.Session()
+            _http_session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS * 2
+                ),
+            )
+        return _http_session
+
+
+def get_rate_limiter(api_key: str) -> TokenBucket:
+    """Get the token bucket for an integration (Notion limits per token)."""
+    with _shared_lock:
+        bucket = _rate_limiters.get(api_key)
+        if bucket is None:
+            bucket = _rate_limiters[api_key] = TokenBucket(
+                RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST
+            )
+        return bucket
+
 
 class NotionAPIClient:
     """Direct Notion API client for fetching pages and databases."""
@@ -28,19 +109,34 @@ class NotionAPIClient:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28",
         }
-
-    @retry_with_backoff(max_retries=3, base_delay=1.0)
+        self.session = get_http_session()
+        self.rate_limiter = get_rate_limiter(self.api_key)
+
+    @retry_with_backoff(
+        max_retries=3,
+        base_delay=1.0,
+        retriable_exceptions=(Timeout, ConnectionError, HTTPError),
+    )
     def _make_request(
         self, method: str, endpoint: str, data: Dict = None
     ) -> Dict[str, Any]:
-        """Make HTTP request to Notion API with automatic retries."""
+        """Make rate-limited HTTP request to Notion API with automatic retries.
+
+        429 and 5xx responses are retried with backoff; every attempt waits
+        for a token from the integration's rate limiter first.
+        """
         url = f"{self.base_url}/{endpoint}"
 
         try:
+            self.rate_limiter.acquire()
             if method == "GET":
-                response = requests.get(url, headers=self.headers, params=data)
+                response = self.session.get(
+                    url, headers=self.headers, params=data, timeout=REQUEST_TIMEOUT
+                )
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
+                response = self.session.post(
+                    url, headers=self.headers, json=data, timeout=REQUEST_TIMEOUT
+                )
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
@@ -151,32 +247,128 @@ class NotionAPIClient:
 
         return self._make_request("GET", f"blocks/{page_id}/children", params)
 
-    def get_full_page_content(self, page_id: str) -> str:
-        """Get full page content as text.
+    def get_all_page_blocks(self, block_id: str) -> List[Dict[str, Any]]:
+        """Get all direct children of a page or block, following pagination.
 
         Args:
-            page_id: Page ID
+            block_id: Page or block ID
 
         Returns:
-            Page content as plain text
+            Child blocks in document order
         """
-        content_parts = []
+        blocks = []
         has_more = True
         start_cursor = None
 
         while has_more:
-            result = self.get_page_blocks(page_id, start_cursor=start_cursor)
-            blocks = result.get("results", [])
-
-            for block in blocks:
-                block_text = self._extract_block_text(block)
-                if block_text:
-                    content_parts.append(block_text)
+            result = self.get_page_blocks(block_id, start_cursor=start_cursor)
+            blocks.extend(result.get("results", []))
 
             has_more = result.get("has_more", False)
             start_cursor = result.get("next_cursor")
 
-        return "\n\n".join(content_parts)
+        return blocks
+
+    def get_full_page_content(self, page_id: str) -> str:
+        """Get full page content as text, including nested blocks.
+
+        Args:
+            page_id: Page ID
+
+        Returns:
+            Page content as plain text
+        """
+        contents, errors = self._fetch_page_contents([page_id])
+        if page_id in errors:
+            raise errors[page_id]
+        return contents[page_id]
+
+    def get_full_pages_content(
+        self, page_ids: Iterable[str], max_workers: int = MAX_CONCURRENT_REQUESTS
+    ) -> Dict[str, str]:
+        """Get full content for many pages at once.
+
+        Block trees of all pages are walked together, breadth-first, with
+        up to ``max_workers`` requests in flight (throttled by the rate
+        limiter), so throughput is bound by Notion's rate limit rather than
+        by one page's round trips at a time.
+
+        Args:
+            page_ids: Page IDs
+            max_workers: Concurrent block-children requests
+
+        Returns:
+            Dictionary mapping page ID to content; pages whose blocks could
+            not be fetched are left out (and logged)
+        """
+        contents, errors = self._fetch_page_contents(list(page_ids), max_workers)
+        for page_id, error in errors.items():
+            logger.error(f"Error fetching content for Notion page {page_id}: {error}")
+        return contents
+
+    def _fetch_page_contents(
+        self, page_ids: List[str], max_workers: int = MAX_CONCURRENT_REQUESTS
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Walk page block trees breadth-first and render them as text.
+
+        Returns:
+            Tuple of (page ID -> content, page ID -> error for failed pages)
+        """
+        children: Dict[str, List[Dict[str, Any]]] = {}
+        errors: Dict[str, Exception] = {}
+        level = [(page_id, page_id) for page_id in dict.fromkeys(page_ids)]
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while level:
+                futures = [
+                    (
+                        block_id,
+                        root,
+                        executor.submit(self.get_all_page_blocks, block_id),
+                    )
+                    for block_id, root in level
+                    if root not in errors
+                ]
+
+                level = []
+                for block_id, root, future in futures:
+                    try:
+                        blocks = future.result()
+                    except Exception as e:
+                        errors.setdefault(root, e)
+                        continue
+
+                    children[block_id] = blocks
+                    level.extend(
+                        (block["id"], root)
+                        for block in blocks
+                        if block.get("has_children")
+                        and block.get("type") not in NON_DESCENDING_BLOCK_TYPES
+                    )
+
+        contents = {}
+        for page_id in dict.fromkeys(page_ids):
+            if page_id in errors:
+                continue
+            content_parts: List[str] = []
+            self._collect_block_text(page_id, children, content_parts)
+            contents[page_id] = "\n\n".join(content_parts)
+
+        return contents, errors
+
+    def _collect_block_text(
+        self,
+        block_id: str,
+        children: Dict[str, List[Dict[str, Any]]],
+        content_parts: List[str],
+    ):
+        """Append text of a block's descendants in document order."""
+        for block in children.get(block_id, []):
+            block_text = self._extract_block_text(block)
+            if block_text:
+                content_parts.append(block_text)
+            if block.get("id") in children:
+                self._collect_block_text(block["id"], children, content_parts)
 
     def _extract_block_text(self, block: Dict[str, Any]) -> str:
         """Extract text from a Notion block."""
@@ -21,6 +21,11 @@ from src.processors.transcript_analyzer import TranscriptAnalyzer
 from src.managers.notifications import NotificationManager
 from src.models import User
 from src.services.notification_preference_checker import NotificationPreferenceChecker
+from src.services.project_keyword_matcher import (
+    KEYWORD_BLACKLIST,
+    ProjectKeywordMatcher,
+    get_project_keyword_matcher,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,15 +75,10 @@ class MeetingAnalysisSyncJob:
             )
             projects = [{"key": row[0], "name": row[1]} for row in result]
 
-            # Get keywords for each project
+            # Attach keywords from the shared project keyword matcher
+            matcher = get_project_keyword_matcher()
             for project in projects:
-                keyword_result = session.execute(
-                    text(
-                        "SELECT keyword FROM project_keywords WHERE project_key = :project_key"
-                    ),
-                    {"project_key": project["key"]},
-                )
-                project["keywords"] = [row[0].lower() for row in keyword_result]
+                project["keywords"] = matcher.keywords_for(project["key"])
 
             logger.info(f"Found {len(projects)} active projects")
             return projects
@@ -133,8 +133,8 @@ class MeetingAnalysisSyncJob:
 
         Uses the same sophisticated matching logic as the web app:
         - Blacklists common terms (e.g., 'syatt') to prevent over-matching
-        - Uses word boundary regex matching to prevent false positives
-        - Checks both title AND summary for keywords
+        - Uses word boundary matching to prevent false positives
+        - Checks both title AND summary for keywords in a single automaton pass
 
         Args:
             meetings: List of meeting dictionaries
@@ -143,12 +143,6 @@ class MeetingAnalysisSyncJob:
         Returns:
             List of tuples: (meeting, matched_project)
         """
-        import re
-
-        # Blacklist of common company terms that should be ignored for project matching
-        # These terms appear in too many meetings to be useful discriminators
-        KEYWORD_BLACKLIST = {"syatt"}
-
         matched_meetings = []
 
         # Log what we're working with for debugging
@@ -159,6 +153,10 @@ class MeetingAnalysisSyncJob:
             f"Sample meeting titles: {[m.get('title', 'Untitled')[:50] for m in meetings[:3]]}"
         )
 
+        # Compile every project's keywords into one automaton, so each meeting is
+        # scanned once instead of once per keyword
+        matcher = ProjectKeywordMatcher.from_projects(projects)
+
         for meeting in meetings:
             title_lower = meeting.get("title", "").lower()
             summary_lower = meeting.get("summary", "").lower()
@@ -167,56 +165,21 @@ class MeetingAnalysisSyncJob:
             logger.info(f"  Title: '{title_lower[:100]}'")
             logger.info(f"  Summary preview: '{summary_lower[:100]}'")
 
-            # Try to match against project keywords
-            for project in projects:
-                if not project.get("keywords"):
-                    continue
-
-                # Filter out blacklisted keywords
-                filtered_keywords = [
-                    kw
-                    for kw in project["keywords"]
-                    if kw.lower() not in KEYWORD_BLACKLIST
-                ]
+            # Word-boundary matching prevents false positives
+            # e.g., "project" won't match "projections"
+            project, matched_keyword = matcher.first_match(
+                f"{title_lower}\n{summary_lower}",
+                projects,
+                ignore_keywords=KEYWORD_BLACKLIST,
+            )
 
+            if project:
+                matched_meetings.append((meeting, project))
                 logger.info(
-                    f"  Project {project['key']}: keywords={project.get('keywords', [])} -> filtered={filtered_keywords}"
+                    f"Matched meeting '{meeting.get('title')}' to project {project['key']} "
+                    f"via keyword '{matched_keyword}'"
                 )
 
-                if not filtered_keywords:
-                    logger.info(
-                        f"  Project {project['key']}: Skipped (no keywords after blacklist filter)"
-                    )
-                    continue
-
-                # Use word boundary regex matching to prevent false positives
-                # e.g., "project" won't match "projections"
-                def matches_keyword(text, keyword):
-                    # Escape special regex characters in the keyword
-                    escaped_keyword = re.escape(keyword)
-                    # Match whole words only using word boundaries
-                    pattern = r"\b" + escaped_keyword + r"\b"
-                    return bool(re.search(pattern, text, re.IGNORECASE))
-
-                # Check if any keyword appears in title or summary
-                matched = False
-                matched_keyword = None
-                for keyword in filtered_keywords:
-                    if matches_keyword(title_lower, keyword) or matches_keyword(
-                        summary_lower, keyword
-                    ):
-                        matched = True
-                        matched_keyword = keyword
-                        break
-
-                if matched:
-                    matched_meetings.append((meeting, project))
-                    logger.info(
-                        f"Matched meeting '{meeting.get('title')}' to project {project['key']} "
-                        f"via keyword '{matched_keyword}'"
-                    )
-                    break  # Only match to first project found
-
         logger.info(f"Matched {len(matched_meetings)} meetings to active projects")
         return matched_meetings
 
@@ -14,7 +14,7 @@ import os
 import asyncio
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
@@ -125,38 +125,22 @@ class MonthlyEpicReconciliationJob:
                 f"(filtered to {len(project_keys)} project-based projects)"
             )
 
+            # Fetch every candidate forecast in one query, keyed by
+            # (project_key, epic_name), instead of one lookup per row
+            forecasts = self._fetch_forecasts(session, actual_hours)
+
             # Build epic data with forecast integration
             epic_data = []
 
             for hours in actual_hours:
-                # Lookup forecast for this epic
-                # EpicForecast.forecast_data contains monthly breakdown in JSON
                 forecast_hours = 0.0
-
-                # Try to find matching forecast
-                forecast = (
-                    session.query(EpicForecast)
-                    .filter(
-                        EpicForecast.project_key == hours.project_key,
-                        EpicForecast.epic_name == hours.epic_summary,
-                    )
-                    .first()
-                )
+                forecast = forecasts.get((hours.project_key, hours.epic_summary))
 
                 if forecast and forecast.forecast_data:
-                    # Extract forecast hours for this month from forecast_data JSON
-                    # Format: {"FE Devs": {"monthly_breakdown": [{"month": 1, "hours": 18.3}, ...]}, ...}
                     try:
-                        forecast_data = forecast.forecast_data
-                        team_forecast = forecast_data.get(hours.team, {})
-                        monthly_breakdown = team_forecast.get("monthly_breakdown", [])
-
-                        # Find matching month (month field in forecast_data is integer, need to match to calendar month)
-                        # This is simplified - actual implementation would need proper month mapping
-                        for month_entry in monthly_breakdown:
-                            # Sum all months for now as simplified approach
-                            forecast_hours += month_entry.get("hours", 0.0)
-
+                        forecast_hours = self.project_forecast_hours(
+                            forecast, hours.team, month_date
+                        )
                     except Exception as e:
                         logger.warning(
                             f"Error extracting forecast for {hours.epic_key}: {e}"
@@ -192,6 +176,99 @@ class MonthlyEpicReconciliationJob:
         finally:
             session.close()
 
+    def _fetch_forecasts(
+        self, session, actual_hours: List[EpicHours]
+    ) -> Dict[Tuple[str, str], EpicForecast]:
+        """
+        Load the forecasts matching a month's epic hours in a single query.
+
+        Args:
+            session: Database session
+            actual_hours: EpicHours rows for the month
+
+        Returns:
+            Dict mapping (project_key, epic_name) to the first (lowest id)
+            matching EpicForecast
+        """
+        epic_names = {h.epic_summary for h in actual_hours if h.epic_summary}
+        if not epic_names:
+            return {}
+
+        project_keys = {h.project_key for h in actual_hours}
+        rows = (
+            session.query(EpicForecast)
+            .filter(
+                EpicForecast.project_key.in_(project_keys),
+                EpicForecast.epic_name.in_(epic_names),
+            )
+            .order_by(EpicForecast.id)
+            .all()
+        )
+
+        forecasts: Dict[Tuple[str, str], EpicForecast] = {}
+        for forecast in rows:
+            forecasts.setdefault((forecast.project_key, forecast.epic_name), forecast)
+        return forecasts
+
+    @staticmethod
+    def forecast_start_month(forecast: EpicForecast) -> Optional[date]:
+        """
+        Get the calendar month that a forecast's "month 1" refers to.
+
+        Uses an explicit ``start_date`` in the forecast data when present,
+        otherwise the month the forecast was created.
+
+        Args:
+            forecast: EpicForecast record
+
+        Returns:
+            First day of the forecast's first month, or None if unknown
+        """
+        start_date = (forecast.forecast_data or {}).get("start_date")
+        if isinstance(start_date, str):
+            try:
+                parsed = datetime.strptime(start_date[:10], "%Y-%m-%d").date()
+                return date(parsed.year, parsed.month, 1)
+            except ValueError:
+                pass
+
+        if forecast.created_at:
+            return date(forecast.created_at.year, forecast.created_at.month, 1)
+        return None
+
+    @classmethod
+    def project_forecast_hours(
+        cls, forecast: EpicForecast, team: str, month_date: date
+    ) -> float:
+        """
+        Get a team's forecast hours for one calendar month.
+
+        forecast_data stores relative months, e.g.
+        {"FE Devs": {"monthly_breakdown": [{"month": 1, "hours": 18.3}, ...]}},
+        which are mapped onto the calendar from ``forecast_start_month``.
+
+        Args:
+            forecast: EpicForecast record
+            team: Team name (key in forecast_data)
+            month_date: First day of the target month
+
+        Returns:
+            Forecast hours for the month (0.0 outside the forecast window)
+        """
+        start_month = cls.forecast_start_month(forecast)
+        team_forecast = (forecast.forecast_data or {}).get(team)
+        if start_month is None or not isinstance(team_forecast, dict):
+            return 0.0
+
+        delta = relativedelta(month_date, start_month)
+        month_number = delta.years * 12 + delta.months + 1
+
+        return sum(
+            month_entry.get("hours", 0.0)
+            for month_entry in team_forecast.get("monthly_breakdown", [])
+            if month_entry.get("month") == month_number
+        )
+
     def calculate_summary(self, epic_data: List[Dict]) -> Dict:
         """
         Calculate summary statistics for executive overview.
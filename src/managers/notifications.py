@@ -15,13 +15,13 @@ import httpx
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+from src.services.slack_directory import get_slack_directory
 from src.utils.timezone import (
     format_est_datetime,
     format_est_date,
     format_est_time_only,
 )
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -162,21 +162,11 @@ class NotificationManager:
                 # Convert channel name to ID if it starts with # (channel name)
                 # Slack API requires channel IDs, not names
                 if channel_name.startswith("#"):
-                    # Try to resolve channel name to ID using conversations.list
+                    # Resolve through the shared directory cache (no API call on hit)
                     try:
-                        response = self.slack_client.conversations_list(
-                            types="public_channel,private_channel",
-                            exclude_archived=True,
-                        )
-                        clean_name = channel_name.lstrip("#")
-                        for ch in response.get("channels", []):
-                            if ch["name"] == clean_name:
-                                channel = ch["id"]
-                                logger.info(
-                                    f"Resolved Slack channel '{channel_name}' to ID '{channel}'"
-                                )
-                                break
-                        else:
+                        directory = get_slack_directory(client=self.slack_client)
+                        channel = directory.resolve_channel(channel_name)
+                        if not channel:
                             # Channel not found, use name as-is (will likely fail but with clear error)
                             channel = channel_name
                             logger.warning(
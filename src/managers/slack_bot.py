@@ -18,12 +18,115 @@ from config.settings import settings
 from src.managers.todo_manager import TodoManager
 from src.managers.learning_manager import LearningManager
 from src.managers.notifications import NotificationContent
+from src.services.slack_directory import get_slack_directory
 from src.utils.db_session import get_db_session_manager
 from src.services.jira_user_tickets_service import JiraUserTicketsService
 
-
 logger = logging.getLogger(__name__)
 
+# Seconds between edits while a /find-context summary streams in
+# (chat.update allows roughly one call per second per channel)
+FIND_CONTEXT_STREAM_INTERVAL = 1.5
+
+# Streamed previews are cut to fit a single Slack text block
+FIND_CONTEXT_PREVIEW_CHARS = 2900
+
+
+class FindContextStream:
+    """Shows a /find-context summary in Slack while it is being generated.
+
+    The first summary token posts the search header to the channel and a
+    placeholder reply in its thread; later tokens edit that reply at most
+    every FIND_CONTEXT_STREAM_INTERVAL seconds. ``finish`` replaces the
+    preview with the final result blocks. If a Slack call fails, the preview
+    stops (later tokens are ignored) rather than posting the header again.
+    """
+
+    def __init__(
+        self,
+        client: WebClient,
+        channel_id: str,
+        header_block: Dict[str, Any],
+        format_text=lambda text: text,
+    ):
+        self.client = client
+        self.channel_id = channel_id
+        self.header_block = header_block
+        self.format_text = format_text
+        self.text = ""
+        self.header_ts: Optional[str] = None
+        self.reply_ts: Optional[str] = None
+        self.disabled = False
+        self._last_update = 0.0
+
+    def on_token(self, text: str):
+        """Append a summary chunk and refresh the preview if it's due."""
+        self.text += text
+        if self.disabled:
+            return
+
+        try:
+            if self.header_ts is None:
+                header = self.client.chat_postMessage(
+                    channel=self.channel_id,
+                    blocks=[self.header_block],
+                    text=self.header_block["text"]["text"],
+                )
+                self.header_ts = header["ts"]
+            if self.reply_ts is None:
+                reply = self.client.chat_postMessage(
+                    channel=self.channel_id,
+                    thread_ts=self.header_ts,
+                    text="_Generating summary..._",
+                )
+                self.reply_ts = reply["ts"]
+
+            now = time.monotonic()
+            if now - self._last_update < FIND_CONTEXT_STREAM_INTERVAL:
+                return
+            self._last_update = now
+
+            preview = self.format_text(self.text)
+            if len(preview) > FIND_CONTEXT_PREVIEW_CHARS:
+                preview = preview[:FIND_CONTEXT_PREVIEW_CHARS] + "…"
+            self.client.chat_update(
+                channel=self.channel_id,
+                ts=self.reply_ts,
+                text=preview + "\n\n_Generating..._",
+            )
+        except Exception as e:
+            logger.warning(f"Stopped streaming /find-context preview: {e}")
+            self.disabled = True
+
+    def finish(self, result: Dict[str, Any]) -> bool:
+        """Replace the streamed preview with the final result.
+
+        Args:
+            result: Response from ``SlackTodoBot._find_context``
+
+        Returns:
+            False if the header was never posted (the caller posts the result
+            itself)
+        """
+        if self.header_ts is None:
+            return False
+
+        body_blocks = (result.get("blocks") or [])[1:]
+        message = {"text": result.get("text", "Context search summary")}
+        if body_blocks:
+            message["blocks"] = body_blocks
+
+        if self.reply_ts is None:
+            # The placeholder reply never made it; answer in the header's thread
+            self.client.chat_postMessage(
+                channel=self.channel_id, thread_ts=self.header_ts, **message
+            )
+        else:
+            self.client.chat_update(
+                channel=self.channel_id, ts=self.reply_ts, **message
+            )
+        return True
+
 
 class SlackTodoBot:
     """Slack bot for managing TODOs via commands."""
@@ -49,6 +152,7 @@ class SlackTodoBot:
             authorize=authorize_with_static_token,
         )
         self.client = WebClient(token=bot_token)
+        self.directory = get_slack_directory(bot_token, client=self.client)
         self.todo_manager = TodoManager()
         self.learning_manager = LearningManager()
         self.jira_tickets_service = JiraUserTicketsService()
@@ -419,9 +523,22 @@ class SlackTodoBot:
 
                 def run_search():
                     try:
+                        # Stream the AI summary into a thread reply as it's generated
+                        stream = FindContextStream(
+                            self.app.client,
+                            channel_id,
+                            self._build_find_context_header(query, days, project),
+                            format_text=self._format_summary_for_slack,
+                        )
                         result = self._find_context(
-                            user_id, query, days, project=project
+                            user_id,
+                            query,
+                            days,
+                            project=project,
+                            on_summary_token=stream.on_token,
                         )
+                        if stream.finish(result):
+                            return
 
                         # Split blocks into header and body for threading
                         blocks = result.get("blocks", [])
@@ -913,12 +1030,14 @@ class SlackTodoBot:
             """Handle new channel creation."""
             channel = event["channel"]
             logger.info(f"New channel created: {channel['name']} ({channel['id']})")
+            self.directory.add_channel(channel)
 
         @self.app.event("channel_deleted")
         def handle_channel_deleted(event):
             """Handle channel deletion."""
             channel = event["channel"]
             logger.info(f"Channel deleted: {channel} ")
+            self.directory.remove_channel(channel)
 
         # Slack chat feature handlers (DMs and @mentions)
         if settings.slack_chat.enabled:
@@ -1501,25 +1620,16 @@ class SlackTodoBot:
             return {"text": f"❌ Error listing channels: {str(e)}"}
 
     def _get_user_display_name(self, user_id: str) -> str:
-        """Get user's display name from Slack."""
+        """Get user's display name from the shared Slack user directory."""
         try:
-            response = self.client.users_info(user=user_id)
-            user = response["user"]
-            return (
-                user.get("display_name")
-                or user.get("real_name")
-                or user.get("name", user_id)
-            )
+            return self.directory.users.get_display_name(user_id)
         except SlackApiError:
             return user_id
 
     def _get_user_email(self, user_id: str) -> Optional[str]:
-        """Get user's email from Slack."""
+        """Get user's email from the shared Slack user directory."""
         try:
-            response = self.client.users_info(user=user_id)
-            user = response["user"]
-            profile = user.get("profile", {})
-            return profile.get("email")
+            return self.directory.users.get_email(user_id)
         except SlackApiError as e:
             logger.warning(f"Failed to get email for Slack user {user_id}: {e}")
             return None
@@ -1692,45 +1802,9 @@ class SlackTodoBot:
             # For now, just log it
 
     async def list_channels(self) -> List[Dict[str, Any]]:
-        """List all channels the bot has access to."""
+        """List all channels the bot has access to (from the shared directory cache)."""
         try:
-            channels = []
-
-            # Get public channels
-            response = await self.client.conversations_list(
-                types="public_channel", exclude_archived=True
-            )
-
-            for channel in response.get("channels", []):
-                channels.append(
-                    {
-                        "id": channel["id"],
-                        "name": channel["name"],
-                        "type": "public_channel",
-                        "is_member": channel.get("is_member", False),
-                        "num_members": channel.get("num_members", 0),
-                    }
-                )
-
-            # Get private channels bot is member of
-            response = await self.client.conversations_list(
-                types="private_channel", exclude_archived=True
-            )
-
-            for channel in response.get("channels", []):
-                if channel.get("is_member"):
-                    channels.append(
-                        {
-                            "id": channel["id"],
-                            "name": channel["name"],
-                            "type": "private_channel",
-                            "is_member": True,
-                            "num_members": channel.get("num_members", 0),
-                        }
-                    )
-
-            return channels
-
+            return await asyncio.to_thread(self.directory.list_channels)
         except SlackApiError as e:
             logger.error(f"Error listing channels: {e}")
             return []
@@ -1740,29 +1814,18 @@ class SlackTodoBot:
         # Strip # prefix if present
         clean_name = channel_name.lstrip("#")
 
-        # If it looks like a channel ID (starts with C and is alphanumeric), return as-is
-        if (
-            clean_name.startswith("C")
-            and clean_name.replace("C", "").isalnum()
-            and len(clean_name) >= 9
-        ):
-            logger.info(f"'{channel_name}' appears to be a channel ID, using as-is")
-            return clean_name
-
         try:
-            # Get all channels and find the one matching the name
-            channels = await self.list_channels()
-            for channel in channels:
-                if channel["name"] == clean_name:
-                    logger.info(
-                        f"Resolved channel name '{clean_name}' to ID '{channel['id']}'"
-                    )
-                    return channel["id"]
+            channel_id = await asyncio.to_thread(
+                self.directory.resolve_channel, clean_name
+            )
+            if channel_id:
+                logger.info(
+                    f"Resolved channel name '{clean_name}' to ID '{channel_id}'"
+                )
+                return channel_id
 
             # If not found, log warning and return the original name
-            logger.warning(
-                f"Could not resolve channel name '{clean_name}' to ID. Available channels: {[c['name'] for c in channels[:5]]}"
-            )
+            logger.warning(f"Could not resolve channel name '{clean_name}' to ID")
             return clean_name
 
         except Exception as e:
@@ -2557,10 +2620,40 @@ class SlackTodoBot:
 
         return {"blocks": blocks}
 
+    def _build_find_context_header(
+        self, query: str, days: int, project: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the header block for /find-context results."""
+        # Format header with query, project (if specified), and date range
+        header_parts = [f"🔍 Context Search: {query}"]
+        if project:
+            header_parts.append(f"(Project: {project})")
+        header_parts.append(f"[Last {days} days]")
+        header_text = " ".join(header_parts)
+
+        return {"type": "header", "text": {"type": "plain_text", "text": header_text}}
+
     def _find_context(
-        self, user_id: str, query: str, days: int, project: Optional[str] = None
+        self,
+        user_id: str,
+        query: str,
+        days: int,
+        project: Optional[str] = None,
+        on_summary_token=None,
     ) -> Dict[str, Any]:
-        """Execute context search and format results."""
+        """Execute context search and format results.
+
+        Args:
+            user_id: Slack user ID
+            query: Search topic
+            days: Days back to search
+            project: Optional project key filter
+            on_summary_token: Optional callback receiving the AI summary text
+                chunk by chunk while it is generated
+
+        Returns:
+            Slack message payload ({"blocks": [...]} or {"text": ...})
+        """
         try:
             import asyncio
             from src.services.context_search import ContextSearchService
@@ -2579,6 +2672,7 @@ class SlackTodoBot:
                     user_id=app_user_id,
                     detail_level="slack",
                     project=project,
+                    on_summary_token=on_summary_token,
                 )
             )
 
@@ -2600,16 +2694,7 @@ class SlackTodoBot:
                 }
 
             # Build response blocks
-            # Format header with query, project (if specified), and date range
-            header_parts = [f"🔍 Context Search: {query}"]
-            if project:
-                header_parts.append(f"(Project: {project})")
-            header_parts.append(f"[Last {days} days]")
-            header_text = " ".join(header_parts)
-
-            blocks = [
-                {"type": "header", "text": {"type": "plain_text", "text": header_text}}
-            ]
+            blocks = [self._build_find_context_header(query, days, project)]
 
             # Add AI summary (flexible format - AI decides structure)
             if results.summary:
@@ -2839,30 +2924,10 @@ class SlackTodoBot:
         Returns:
             Text with user IDs replaced by names
         """
-        import re
-
-        # Find all Slack user mentions: <@U12345>
-        user_id_pattern = r"<@(U[A-Z0-9]+)>"
-        matches = re.findall(user_id_pattern, text)
-
-        if not matches:
+        try:
+            # All mentions resolved in one batched directory lookup
+            return self.directory.users.replace_mentions(text, prefix="")
+        except Exception as e:
+            logger.warning(f"Failed to resolve Slack user mentions: {e}")
+            # Leave the user IDs as-is if we can't fetch the names
             return text
-
-        # Fetch user info for each ID and replace
-        for user_id in set(matches):  # Use set to avoid duplicate API calls
-            try:
-                response = self.client.users_info(user=user_id)
-                if response.get("ok") and response.get("user"):
-                    user = response["user"]
-                    display_name = (
-                        user.get("profile", {}).get("display_name")
-                        or user.get("real_name")
-                        or user.get("name")
-                        or user_id
-                    )
-                    text = text.replace(f"<@{user_id}>", display_name)
-            except Exception as e:
-                logger.warning(f"Failed to fetch user info for {user_id}: {e}")
-                # Leave the user ID as-is if we can't fetch the name
-
-        return text
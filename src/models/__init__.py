@@ -18,16 +18,23 @@ from .epic_budget import EpicBudget
 from .epic_category_mapping import EpicCategoryMapping
 from .epic_baseline_mapping import EpicBaselineMapping
 from .epic_category import EpicCategory
+from .epic_name_category import EpicNameCategory
 from .tempo_worklog import TempoWorklog
 from .forecast import EpicForecast
 from .time_tracking_compliance import TimeTrackingCompliance
 from .monthly_reconciliation import MonthlyReconciliationReport
-from .project import Project, ProjectCharacteristics, ProjectChange
+from .project import (
+    Project,
+    ProjectCharacteristics,
+    ProjectChange,
+    ProjectChangePollState,
+)
 from .project_keyword import ProjectKeyword
 from .project_resource_mapping import ProjectResourceMapping
 from .project_monthly_forecast import ProjectMonthlyForecast
 from .project_forecasting_config import ProjectForecastingConfig
-from .job_execution import JobExecution
+from .job_execution import JobExecution, JobExecutionRollup
+from .forecasting_baseline_snapshot import ForecastingBaselineSnapshot
 from .temporal_pattern_baseline import TemporalPatternBaseline
 from .characteristic_impact_baseline import CharacteristicImpactBaseline
 from .epic_allocation_baseline import EpicAllocationBaseline
@@ -36,6 +43,7 @@ from .template_ticket import TemplateTicket
 from .scheduled_job_lock import ScheduledJobLock
 from .slack_installation import SlackInstallation
 from .meeting_connection import MeetingProjectConnection
+from .external_resource import ExternalResource
 
 # TODO models - create simple Todo models for basic functionality
 from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
@@ -192,17 +200,21 @@ __all__ = [
     "EpicCategoryMapping",
     "EpicBaselineMapping",
     "EpicCategory",
+    "EpicNameCategory",
     "TempoWorklog",
     "EpicForecast",
     "TimeTrackingCompliance",
     "MonthlyReconciliationReport",
     "Project",
     "ProjectCharacteristics",
+    "ProjectChangePollState",
     "ProjectKeyword",
     "ProjectResourceMapping",
     "ProjectMonthlyForecast",
     "ProjectForecastingConfig",
     "JobExecution",
+    "JobExecutionRollup",
+    "ForecastingBaselineSnapshot",
     "TemporalPatternBaseline",
     "CharacteristicImpactBaseline",
     "EpicAllocationBaseline",
@@ -210,6 +222,7 @@ __all__ = [
     "TemplateTicket",
     "ScheduledJobLock",
     "SlackInstallation",
+    "ExternalResource",
     "Base",
     # DTOs
     "ProcessedMeetingDTO",
@@ -0,0 +1,46 @@
+"""Epic name → category memo model."""
+
+from sqlalchemy import Column, String, Integer, DateTime, UniqueConstraint
+from datetime import datetime, timezone
+from .base import Base
+
+
+class EpicNameCategory(Base):
+    """
+    Remembers the category assigned to a normalized epic name.
+
+    Epic names repeat heavily across projects ("Header", "UAT | PLP",
+    "Cart"). Once the AI has categorized a name, EpicCategorizer reuses
+    the answer for any epic with the same normalized name instead of
+    asking the LLM again.
+    """
+
+    __tablename__ = "epic_name_categories"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    normalized_name = Column(
+        String(500), nullable=False
+    )  # Lowercased, whitespace-collapsed epic summary
+    category = Column(String(100), nullable=False)  # Category name
+
+    # Metadata
+    created_at = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "normalized_name", name="uq_epic_name_categories_normalized_name"
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<EpicNameCategory(name={self.normalized_name}, category={self.category})>"
+        )
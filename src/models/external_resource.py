@@ -0,0 +1,62 @@
+"""External resource directory model (typeahead index)."""
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from datetime import datetime, timezone
+from .base import Base
+
+
+class ExternalResource(Base):
+    """
+    Local copy of searchable external resources (Slack channels, Notion
+    pages, GitHub repos, Jira projects).
+
+    Refreshed periodically from each provider so resource typeahead is a
+    database lookup instead of a live API call. On PostgreSQL a pg_trgm GIN
+    index on ``search_text`` also covers substring matches.
+    """
+
+    __tablename__ = "external_resources"
+    __table_args__ = (
+        UniqueConstraint(
+            "provider", "resource_id", name="uq_external_resources_provider_resource"
+        ),
+        # Prefix matches (LIKE 'q%') within a provider
+        Index(
+            "ix_external_resources_provider_search",
+            "provider",
+            "search_text",
+            postgresql_ops={"search_text": "text_pattern_ops"},
+        ),
+        # Substring matches (LIKE '%q%'); needs the pg_trgm extension, so it
+        # is only created on PostgreSQL
+        Index(
+            "ix_external_resources_search_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    provider = Column(String(20), nullable=False)  # slack, notion, github, jira
+    resource_id = Column(String(255), nullable=False)  # Provider's ID or key
+    name = Column(Text, nullable=False)
+    search_text = Column(Text, nullable=False)  # Lowercased text matched by search
+    attributes = Column(JSON, nullable=False, default=dict)  # Provider extras
+    refreshed_at = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self):
+        return (
+            f"<ExternalResource({self.provider}:{self.resource_id}, name={self.name})>"
+        )
@@ -0,0 +1,40 @@
+"""Materialized forecasting baseline snapshots."""
+
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, DateTime, JSON
+from .base import Base
+
+
+class ForecastingBaselineSnapshot(Base):
+    """Versioned snapshot of the team baselines used by ForecastingService.
+
+    Each row is an immutable version written after baselines are rebuilt
+    (monthly baseline regeneration, Analytics → Rebuild Models). Forecast
+    requests read the latest version from a per-process cache instead of
+    re-aggregating epic_hours.
+
+    Example baselines:
+        {"no_integration": {"FE Devs": 856.0, ...},
+         "with_integration": {"BE Devs": 733.0, ...}}
+    """
+
+    __tablename__ = "forecasting_baseline_snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # Snapshot version
+    baselines = Column(JSON, nullable=False)  # Avg hours per team, per baseline set
+    lifecycle_percentages = Column(JSON, nullable=False)  # Ramp up/busy/ramp down
+    project_count = Column(Integer, nullable=False, default=0)  # Contributing projects
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return (
+            f"<ForecastingBaselineSnapshot("
+            f"version={self.id}, "
+            f"project_count={self.project_count}, "
+            f"created_at={self.created_at}"
+            f")>"
+        )
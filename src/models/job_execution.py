@@ -1,6 +1,17 @@
 """Job execution tracking model for monitoring scheduled tasks."""
 
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Boolean, Index, JSON
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    String,
+    Text,
+    TIMESTAMP,
+    Boolean,
+    Index,
+    JSON,
+    UniqueConstraint,
+)
 from datetime import datetime, timezone
 from src.models.base import Base
 
@@ -165,3 +176,62 @@ class JobExecution(Base):
     def is_running(self) -> bool:
         """Check if execution is still running."""
         return self.status == "running"
+
+
+class JobExecutionRollup(Base):
+    """Per-job, per-hour aggregates of finished job executions.
+
+    Maintained incrementally as executions finish (see
+    ``src.services.job_execution_tracker.record_execution_rollup``) so that
+    digests and success-rate queries don't scan raw job_executions rows,
+    which can then be pruned on a retention policy.
+    """
+
+    __tablename__ = "job_execution_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    job_name = Column(String(255), nullable=False, comment="Celery Beat schedule name")
+    job_category = Column(String(100), nullable=False, index=True)
+    hour_start = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        index=True,
+        comment="Start of the UTC hour the executions started in",
+    )
+
+    # Counts by outcome
+    execution_count = Column(Integer, nullable=False, default=0)
+    success_count = Column(Integer, nullable=False, default=0)
+    failure_count = Column(
+        Integer, nullable=False, default=0, comment="failed, timeout or cancelled"
+    )
+
+    # Durations of successful executions
+    duration_count = Column(Integer, nullable=False, default=0)
+    total_duration_seconds = Column(Integer, nullable=False, default=0)
+    max_duration_seconds = Column(Integer, nullable=True)
+    p50_duration_seconds = Column(Float, nullable=True)
+    p95_duration_seconds = Column(Float, nullable=True)
+    durations = Column(
+        JSON,
+        nullable=True,
+        comment="Sorted successful durations in the hour (for percentiles)",
+    )
+
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint("job_name", "hour_start", name="uq_job_rollup_job_hour"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<JobExecutionRollup(job_name='{self.job_name}', "
+            f"hour_start={self.hour_start}, executions={self.execution_count})>"
+        )
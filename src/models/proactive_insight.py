@@ -1,6 +1,15 @@
 """Proactive insight model for tracking AI-generated insights and alerts."""
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Text,
+    ForeignKey,
+    JSON,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
@@ -11,6 +20,15 @@ class ProactiveInsight(Base):
     """Model for storing proactive insights generated by the system."""
 
     __tablename__ = "proactive_insights"
+    __table_args__ = (
+        # Covers the per-user stats aggregate (active vs. dismissed, by project)
+        Index(
+            "ix_proactive_insights_user_dismissed_project",
+            "user_id",
+            "dismissed_at",
+            "project_key",
+        ),
+    )
 
     id = Column(String(36), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -11,6 +11,7 @@ from sqlalchemy import (
     Text,
     Date,
     JSON,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -193,6 +194,15 @@ class ProjectChange(Base):
     """Jira project change tracking - migrated from main.py."""
 
     __tablename__ = "project_changes"
+    __table_args__ = (
+        # Natural key: the same change detected by two polls is stored once
+        UniqueConstraint(
+            "ticket_key",
+            "change_type",
+            "change_timestamp",
+            name="uq_project_changes_natural_key",
+        ),
+    )
 
     id = Column(String(36), primary_key=True)
     project_key = Column(String(50), nullable=False, index=True)
@@ -210,3 +220,22 @@ class ProjectChange(Base):
     change_details = Column(JSON)  # Additional metadata as JSON
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     # NOTE: Uses JSON type instead of Text for proper JSON handling
+
+
+class ProjectChangePollState(Base):
+    """Per-project high-water mark for Jira change polling."""
+
+    __tablename__ = "project_change_poll_state"
+
+    project_key = Column(String(50), primary_key=True)
+    # Start time of the last poll whose changes were saved
+    last_polled_at = Column(DateTime, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"<ProjectChangePollState(project={self.project_key}, last_polled_at={self.last_polled_at})>"
@@ -3,7 +3,9 @@
 import re
 import logging
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
@@ -18,9 +20,16 @@ from src.utils.prompt_manager import get_prompt_manager
 from src.utils.retry_logic import retry_with_backoff
 from config.settings import settings
 
-
 logger = logging.getLogger(__name__)
 
+# Lines that start a new speaker turn ("Jane Doe:") or carry a timestamp
+# ("[00:12:34]", "12:34 -") - safe places to split a transcript into chunks
+SPEAKER_LINE_PATTERN = re.compile(r"^[^\s].{0,80}:\s*$")
+TIMESTAMP_LINE_PATTERN = re.compile(r"^\s*\[?\(?\d{1,2}:\d{2}(?::\d{2})?\]?\)?")
+
+# Similarity (0-100) above which two action item titles are considered the same
+ACTION_ITEM_SIMILARITY_THRESHOLD = 85
+
 
 class ActionItem(BaseModel):
     """Structured action item extracted from meeting."""
@@ -140,7 +149,13 @@ class TranscriptAnalyzer:
                 f"Unsupported AI provider: {ai_config.provider}. Supported providers: openai, anthropic, google"
             )
 
-    def _invoke_llm_with_retry(self, messages: List, max_retries: int = 3):
+    def _invoke_llm_with_retry(
+        self,
+        messages: List,
+        max_retries: int = 3,
+        validate: Optional[Callable[[str], Any]] = None,
+        cache_ttl: Optional[int] = None,
+    ):
         """Invoke LLM with retry logic for handling transient failures.
 
         Wraps LLM invocations with exponential backoff retry logic to handle:
@@ -148,19 +163,32 @@ class TranscriptAnalyzer:
         - Temporary service unavailability (503 errors)
         - Network timeouts and connection issues
 
+        Identical requests are answered from the shared LLM response cache.
+
         Args:
             messages: List of messages to send to LLM
             max_retries: Maximum number of retry attempts (default 3)
+            validate: Parser for the response text; responses it rejects are
+                not cached
+            cache_ttl: Response cache TTL override (0 skips the shared cache)
 
         Returns:
             LLM response object
         """
+        from src.services.llm_gateway import invoke_chat_model
 
         @retry_with_backoff(max_retries=max_retries, base_delay=1.0)
         def invoke():
             return self.llm.invoke(messages)
 
-        return invoke()
+        return invoke_chat_model(
+            "transcript_analysis",
+            self.llm,
+            messages,
+            invoke,
+            ttl=cache_ttl,
+            validate=validate,
+        )
 
     def analyze_transcript(
         self, transcript: str, meeting_title: str = None, meeting_date: datetime = None
@@ -197,6 +225,14 @@ class TranscriptAnalyzer:
         # Get transcript max chars from settings
         max_chars = self.prompt_manager.get_setting("transcript_max_chars", 8000)
 
+        # Long transcripts are analyzed in chunks instead of being truncated
+        if len(transcript) > max_chars and self.prompt_manager.get_setting(
+            "transcript_chunking_enabled", True
+        ):
+            return self.analyze_transcript_chunked(
+                transcript, meeting_title, meeting_date, max_chars=max_chars
+            )
+
         # Format the human prompt
         human_prompt = human_prompt_template.format(
             meeting_title=meeting_title or "Team Meeting",
@@ -214,7 +250,7 @@ class TranscriptAnalyzer:
         ]
 
         try:
-            response = self._invoke_llm_with_retry(messages)
+            response = self._invoke_llm_with_retry(messages, validate=self.parser.parse)
             analysis = self.parser.parse(response.content)
 
             # Post-process dates to ensure proper format
@@ -229,6 +265,299 @@ class TranscriptAnalyzer:
             # Return minimal analysis on error
             return MeetingAnalysis(topics=[], action_items=[])
 
+    def analyze_transcript_chunked(
+        self,
+        transcript: str,
+        meeting_title: str = None,
+        meeting_date: datetime = None,
+        max_chars: int = None,
+    ) -> MeetingAnalysis:
+        """Analyze a long transcript with a map-reduce over speaker-aligned chunks.
+
+        The transcript is split on speaker/timestamp boundaries into chunks of at
+        most ``max_chars``, each chunk is analyzed concurrently (map), and the
+        per-chunk results are merged and deduplicated (reduce). Chunk results are
+        cached by content hash, so re-running the analysis only recomputes chunks
+        whose text, model or chunk prompt changed.
+
+        Args:
+            transcript: Full meeting transcript
+            meeting_title: Meeting title for prompt context
+            meeting_date: Meeting date (used for relative due date normalization)
+            max_chars: Maximum characters per chunk (defaults to transcript_max_chars)
+
+        Returns:
+            Merged MeetingAnalysis covering the whole transcript
+        """
+        if not self.llm:
+            logger.error("Cannot analyze transcript: AI configuration not available")
+            return MeetingAnalysis(topics=[], action_items=[])
+
+        max_chars = max_chars or self.prompt_manager.get_setting(
+            "transcript_max_chars", 8000
+        )
+        chunks = self.split_transcript(transcript, max_chars)
+        concurrency = max(
+            1, int(self.prompt_manager.get_setting("transcript_chunk_concurrency", 4))
+        )
+
+        logger.info(
+            f"Analyzing transcript in {len(chunks)} chunks "
+            f"({len(transcript)} chars, concurrency={concurrency})"
+        )
+
+        def analyze(indexed_chunk: Tuple[int, str]) -> Optional[MeetingAnalysis]:
+            index, chunk = indexed_chunk
+            try:
+                return self._analyze_chunk(
+                    chunk, index + 1, len(chunks), meeting_title, meeting_date
+                )
+            except Exception as e:
+                logger.error(f"Error analyzing transcript chunk {index + 1}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as pool:
+            chunk_analyses = list(pool.map(analyze, enumerate(chunks)))
+
+        analysis = self.merge_analyses([a for a in chunk_analyses if a is not None])
+
+        for item in analysis.action_items:
+            if item.due_date:
+                item.due_date = self._normalize_date(item.due_date, meeting_date)
+
+        return analysis
+
+    @staticmethod
+    def split_transcript(transcript: str, max_chars: int) -> List[str]:
+        """Split a transcript into chunks of at most ``max_chars`` characters.
+
+        Splits happen at speaker turns or timestamped lines whenever possible.
+        A single turn longer than ``max_chars`` is split on line boundaries, and
+        as a last resort a single overlong line is hard-wrapped.
+        """
+        if len(transcript) <= max_chars:
+            return [transcript]
+
+        # Group lines into speaker turns
+        turns: List[str] = []
+        current: List[str] = []
+        for line in transcript.split("\n"):
+            is_boundary = SPEAKER_LINE_PATTERN.match(
+                line
+            ) or TIMESTAMP_LINE_PATTERN.match(line)
+            if is_boundary and any(l.strip() for l in current):
+                turns.append("\n".join(current))
+                current = []
+            current.append(line)
+        if current:
+            turns.append("\n".join(current))
+
+        # Break up turns that are too long on their own
+        pieces: List[str] = []
+        for turn in turns:
+            if len(turn) <= max_chars:
+                pieces.append(turn)
+                continue
+            for line in turn.split("\n"):
+                while len(line) > max_chars:
+                    pieces.append(line[:max_chars])
+                    line = line[max_chars:]
+                pieces.append(line)
+
+        # Greedily pack pieces into chunks
+        chunks: List[str] = []
+        buffer = ""
+        for piece in pieces:
+            candidate = f"{buffer}\n{piece}" if buffer else piece
+            if len(candidate) > max_chars and buffer:
+                chunks.append(buffer)
+                buffer = piece
+            else:
+                buffer = candidate
+        if buffer.strip():
+            chunks.append(buffer)
+
+        return [chunk.strip("\n") for chunk in chunks if chunk.strip()]
+
+    def _analyze_chunk(
+        self,
+        chunk: str,
+        chunk_index: int,
+        chunk_count: int,
+        meeting_title: str = None,
+        meeting_date: datetime = None,
+    ) -> MeetingAnalysis:
+        """Analyze a single transcript chunk, using the chunk cache when possible."""
+        system_prompt_base = self.prompt_manager.get_prompt(
+            "meeting_analysis",
+            "chunk_system_prompt",
+            default="""You are an expert meeting analyst. Extract the topics and action items discussed in this segment of a longer meeting transcript.""",
+        )
+        human_prompt_template = self.prompt_manager.get_prompt(
+            "meeting_analysis",
+            "chunk_prompt_template",
+            default="""Meeting: {meeting_title}\nDate: {meeting_date}\nSegment: {chunk_index} of {chunk_count}\n\nTranscript segment:\n{transcript}\n\nExtract the topics and action items discussed in this segment.""",
+        )
+
+        cache_key = self._chunk_cache_key(
+            chunk, system_prompt_base, human_prompt_template, meeting_title
+        )
+        cached = self._get_cached_chunk(cache_key)
+        if cached is not None:
+            return cached
+
+        system_prompt = f"{system_prompt_base}\n\n{{format_instructions}}"
+        human_prompt = human_prompt_template.format(
+            meeting_title=meeting_title or "Team Meeting",
+            meeting_date=meeting_date.strftime("%Y-%m-%d") if meeting_date else "Today",
+            chunk_index=chunk_index,
+            chunk_count=chunk_count,
+            transcript=chunk,
+        )
+
+        messages = [
+            SystemMessage(
+                content=system_prompt.format(
+                    format_instructions=self.parser.get_format_instructions()
+                )
+            ),
+            HumanMessage(content=human_prompt),
+        ]
+
+        # Chunks have their own position-independent cache (the prompt names
+        # the segment number), so skip the shared response cache here
+        response = self._invoke_llm_with_retry(messages, cache_ttl=0)
+        analysis = self.parser.parse(response.content)
+        self._set_cached_chunk(cache_key, analysis)
+        return analysis
+
+    def _chunk_cache_key(
+        self,
+        chunk: str,
+        system_prompt: str,
+        human_prompt_template: str,
+        meeting_title: Optional[str],
+    ) -> str:
+        """Build a content hash identifying a chunk analysis.
+
+        The key covers everything that affects the map output (model, chunk
+        prompts, meeting title and chunk text) but not the chunk position, so
+        identical chunks are reused even when neighbouring chunks change.
+        """
+        model = getattr(self.llm, "model_name", None) or getattr(self.llm, "model", "")
+        digest = hashlib.sha256()
+        for part in (
+            type(self.llm).__name__,
+            str(model),
+            system_prompt,
+            human_prompt_template,
+            meeting_title or "",
+            chunk,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _get_cached_chunk(self, cache_key: str) -> Optional[MeetingAnalysis]:
+        """Return a cached chunk analysis, or None on miss/cache unavailable."""
+        try:
+            from src.utils.cache_manager import get_cache_manager
+
+            # The full hash goes in the key itself: keyword params would be
+            # folded into CacheManager's short parameter hash
+            cached = get_cache_manager().get(f"transcript_chunk:{cache_key}")
+            if cached is not None:
+                return MeetingAnalysis(**cached["data"])
+        except Exception as e:
+            logger.debug(f"Transcript chunk cache lookup failed: {e}")
+        return None
+
+    def _set_cached_chunk(self, cache_key: str, analysis: MeetingAnalysis) -> None:
+        """Store a chunk analysis in the cache (best effort)."""
+        try:
+            from src.utils.cache_manager import get_cache_manager
+
+            ttl = int(
+                self.prompt_manager.get_setting("transcript_chunk_cache_ttl", 604800)
+            )
+            get_cache_manager().set(
+                analysis.model_dump(), f"transcript_chunk:{cache_key}", ttl
+            )
+        except Exception as e:
+            logger.debug(f"Transcript chunk cache store failed: {e}")
+
+    @staticmethod
+    def merge_analyses(analyses: List[MeetingAnalysis]) -> MeetingAnalysis:
+        """Merge per-chunk analyses into one, deduplicating topics and action items.
+
+        Topics with the same normalized title are combined (keeping first-seen
+        order and dropping repeated bullet points). Action items are considered
+        duplicates when their titles are near-identical and their assignees do
+        not conflict; the duplicate's missing fields are filled from the other.
+        """
+        from fuzzywuzzy import fuzz
+
+        def normalize(text: str) -> str:
+            return re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).strip()
+
+        topics: Dict[str, TopicSection] = {}
+        seen_items: Dict[str, set] = {}
+        for analysis in analyses:
+            for topic in analysis.topics:
+                key = normalize(topic.title)
+                if key not in topics:
+                    topics[key] = TopicSection(title=topic.title, content_items=[])
+                    seen_items[key] = set()
+                for item in topic.content_items:
+                    item_key = normalize(item)
+                    if item_key and item_key not in seen_items[key]:
+                        seen_items[key].add(item_key)
+                        topics[key].content_items.append(item)
+
+        action_items: List[ActionItem] = []
+        for analysis in analyses:
+            for item in analysis.action_items:
+                duplicate = None
+                for existing in action_items:
+                    same_owner = (
+                        not item.assignee
+                        or not existing.assignee
+                        or normalize(item.assignee) == normalize(existing.assignee)
+                    )
+                    # Titles that differ only by a number ("ticket 12" vs
+                    # "ticket 13") are distinct tasks
+                    same_numbers = re.findall(r"\d+", item.title) == re.findall(
+                        r"\d+", existing.title
+                    )
+                    if (
+                        same_owner
+                        and same_numbers
+                        and fuzz.token_sort_ratio(
+                            normalize(item.title), normalize(existing.title)
+                        )
+                        >= ACTION_ITEM_SIMILARITY_THRESHOLD
+                    ):
+                        duplicate = existing
+                        break
+
+                if duplicate is None:
+                    action_items.append(item.model_copy())
+                    continue
+
+                if len(item.description or "") > len(duplicate.description or ""):
+                    duplicate.description = item.description
+                duplicate.assignee = duplicate.assignee or item.assignee
+                duplicate.due_date = duplicate.due_date or item.due_date
+                duplicate.priority = duplicate.priority or item.priority
+                if item.dependencies:
+                    duplicate.dependencies = list(
+                        dict.fromkeys(
+                            (duplicate.dependencies or []) + item.dependencies
+                        )
+                    )
+
+        return MeetingAnalysis(topics=list(topics.values()), action_items=action_items)
+
     def extract_action_items(self, transcript: str) -> List[ActionItem]:
         """Extract just action items from a transcript."""
 
@@ -250,14 +579,19 @@ class TranscriptAnalyzer:
         ]
 
         try:
-            response = self._invoke_llm_with_retry(messages)
-            # Parse the response as JSON
-            items_data = json.loads(response.content)
-            return [ActionItem(**item) for item in items_data]
+            response = self._invoke_llm_with_retry(
+                messages, validate=self._parse_action_items
+            )
+            return self._parse_action_items(response.content)
         except Exception as e:
             logger.error(f"Error extracting action items: {e}")
             return []
 
+    @staticmethod
+    def _parse_action_items(text: str) -> List[ActionItem]:
+        """Parse a JSON list of action items."""
+        return [ActionItem(**item) for item in json.loads(text)]
+
     def prioritize_action_items(self, items: List[ActionItem]) -> List[ActionItem]:
         """Prioritize action items based on urgency and importance."""
 
@@ -296,7 +630,7 @@ class TranscriptAnalyzer:
         ]
 
         try:
-            response = self._invoke_llm_with_retry(messages)
+            response = self._invoke_llm_with_retry(messages, validate=json.loads)
             return json.loads(response.content)
         except Exception as e:
             logger.error(f"Error identifying blockers: {e}")
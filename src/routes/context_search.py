@@ -0,0 +1,139 @@
+"""API routes for context search with a streamed AI summary."""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+
+from flask import Blueprint, Response, jsonify, request
+
+from src.services.auth import auth_required
+
+logger = logging.getLogger(__name__)
+
+context_search_bp = Blueprint(
+    "context_search", __name__, url_prefix="/api/context-search"
+)
+
+# Seconds between SSE comments while the search itself (before the summary
+# starts streaming) is still running, so proxies don't close the connection
+KEEPALIVE_INTERVAL = 15
+
+DETAIL_LEVELS = ("brief", "normal", "detailed")
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _results_to_dict(results) -> Dict[str, Any]:
+    """Serialize ContextSearchResults for the final SSE event."""
+    return {
+        "query": results.query,
+        "summary": results.summary,
+        "tldr": results.tldr,
+        "project_context": results.project_context,
+        "key_people": results.key_people or [],
+        "timeline": results.timeline or [],
+        "open_questions": results.open_questions or [],
+        "action_items": results.action_items or [],
+        "confidence": results.confidence,
+        "citations": [asdict(citation) for citation in results.citations or []],
+        "results": [
+            {
+                "source": result.source,
+                "title": result.title,
+                "url": result.url,
+                "date": result.date.isoformat() if result.date else None,
+                "author": result.author,
+                "content": result.content,
+            }
+            for result in results.results
+        ],
+    }
+
+
+@context_search_bp.route("/stream", methods=["GET"])
+@auth_required
+def stream_context_search(user):
+    """Search all sources and stream the AI summary as server-sent events.
+
+    Query parameters:
+    - q: Search query (required)
+    - days: Days back to search (default: 90)
+    - project: Optional project key filter
+    - detail_level: brief, normal or detailed (default: normal)
+
+    Events:
+    - token: {"text": "..."} for each chunk of the summary as it is generated
+    - result: the complete structured result (same as a non-streamed search)
+    - error: {"error": "..."} if the search failed
+
+    Returns:
+        text/event-stream response
+    """
+    query = request.args.get("q", "").strip()
+    if not query:
+        return jsonify({"error": "Query parameter 'q' is required"}), 400
+
+    try:
+        days = int(request.args.get("days", 90))
+    except ValueError:
+        return jsonify({"error": "days must be an integer"}), 400
+
+    project: Optional[str] = request.args.get("project") or None
+    detail_level = request.args.get("detail_level", "normal")
+    if detail_level not in DETAIL_LEVELS:
+        return jsonify({"error": f"detail_level must be one of {DETAIL_LEVELS}"}), 400
+
+    events: "queue.Queue[Optional[str]]" = queue.Queue()
+    user_id = user.id
+
+    def run_search():
+        from src.services.context_search import ContextSearchService
+
+        try:
+            results = asyncio.run(
+                ContextSearchService().search(
+                    query=query,
+                    days_back=days,
+                    user_id=user_id,
+                    detail_level=detail_level,
+                    project=project.upper() if project else None,
+                    on_summary_token=lambda text: events.put(
+                        _sse("token", {"text": text})
+                    ),
+                )
+            )
+            events.put(_sse("result", _results_to_dict(results)))
+        except Exception as e:
+            logger.error(f"Error in streamed context search: {e}", exc_info=True)
+            events.put(_sse("error", {"error": str(e)}))
+        finally:
+            events.put(None)
+
+    threading.Thread(target=run_search, daemon=True).start()
+
+    def generate():
+        while True:
+            try:
+                event = events.get(timeout=KEEPALIVE_INTERVAL)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                return
+            yield event
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Don't let nginx buffer the stream
+        },
+    )
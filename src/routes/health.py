@@ -205,6 +205,29 @@ def jira_health_check():
         return jsonify({"error": str(e), "traceback": traceback.format_exc()}), 500
 
 
+@health_bp.route("/health/llm-cache", methods=["GET"])
+def llm_cache_health_check():
+    """LLM response cache statistics endpoint.
+
+    Returns per-call-site hit/miss/bypass counts and hit rates.
+    """
+    try:
+        from src.services.llm_gateway import get_stats
+
+        return (
+            jsonify(
+                {
+                    "timestamp": datetime.now().isoformat(),
+                    "call_sites": get_stats(),
+                }
+            ),
+            200,
+        )
+    except Exception as e:
+        logger.error(f"LLM cache stats failed: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
 @health_bp.route("/health/celery", methods=["GET"])
 def celery_health_check():
     """
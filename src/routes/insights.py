@@ -13,6 +13,10 @@ from src.models import (
     UserWatchedProject,
 )
 from src.services.auth import auth_required
+from src.services.insight_stats import (
+    get_insight_stats as get_cached_insight_stats,
+    invalidate_insight_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -175,6 +179,7 @@ def dismiss_insight(user: User, insight_id: str):
         # Mark as dismissed
         insight.dismissed_at = datetime.now(timezone.utc)
         db.commit()
+        invalidate_insight_stats([user.id])
 
         logger.info(f"User {user.id} dismissed insight {insight_id}")
 
@@ -233,6 +238,7 @@ def act_on_insight(user: User, insight_id: str):
         insight.acted_on_at = datetime.now(timezone.utc)
         insight.action_taken = action_taken
         db.commit()
+        invalidate_insight_stats([user.id])
 
         logger.info(f"User {user.id} acted on insight {insight_id}: {action_taken}")
 
@@ -276,82 +282,10 @@ def get_insight_stats(user: User):
         # Check admin-only parameters
         all_projects = request.args.get("all_projects", "false").lower() == "true"
 
-        # Build base query for non-dismissed insights
-        query = db.query(ProactiveInsight).filter(
-            ProactiveInsight.user_id == user.id,
-            ProactiveInsight.dismissed_at.is_(None),
-        )
-
-        # Filter by watched projects (unless admin with all_projects=true)
-        if not (user.is_admin() and all_projects):
-            watched_projects = (
-                db.query(UserWatchedProject)
-                .filter(UserWatchedProject.user_id == user.id)
-                .all()
-            )
-            watched_keys = [wp.project_key for wp in watched_projects]
-
-            if watched_keys:
-                query = query.filter(ProactiveInsight.project_key.in_(watched_keys))
-            else:
-                # User has no watched projects - return empty stats
-                return (
-                    jsonify(
-                        {
-                            "total_insights": 0,
-                            "by_severity": {"critical": 0, "warning": 0, "info": 0},
-                            "by_type": {},
-                            "dismissed_count": 0,
-                            "acted_on_count": 0,
-                        }
-                    ),
-                    200,
-                )
-
-        insights = query.all()
-
-        # Build dismissed count query
-        dismissed_query = db.query(ProactiveInsight).filter(
-            ProactiveInsight.user_id == user.id,
-            ProactiveInsight.dismissed_at.isnot(None),
+        # Counts come from one aggregate query, cached until an insight changes
+        stats = get_cached_insight_stats(
+            db, user.id, all_projects=user.is_admin() and all_projects
         )
-        if not (user.is_admin() and all_projects):
-            if watched_keys:
-                dismissed_query = dismissed_query.filter(
-                    ProactiveInsight.project_key.in_(watched_keys)
-                )
-
-        # Build acted on count query
-        acted_on_query = db.query(ProactiveInsight).filter(
-            ProactiveInsight.user_id == user.id,
-            ProactiveInsight.acted_on_at.isnot(None),
-        )
-        if not (user.is_admin() and all_projects):
-            if watched_keys:
-                acted_on_query = acted_on_query.filter(
-                    ProactiveInsight.project_key.in_(watched_keys)
-                )
-
-        # Calculate stats
-        stats = {
-            "total_insights": len(insights),
-            "by_severity": {
-                "critical": sum(1 for i in insights if i.severity == "critical"),
-                "warning": sum(1 for i in insights if i.severity == "warning"),
-                "info": sum(1 for i in insights if i.severity == "info"),
-            },
-            "by_type": {},
-            "dismissed_count": dismissed_query.count(),
-            "acted_on_count": acted_on_query.count(),
-        }
-
-        # Count by type
-        for insight in insights:
-            insight_type = insight.insight_type
-            if insight_type not in stats["by_type"]:
-                stats["by_type"][insight_type] = 0
-            stats["by_type"][insight_type] += 1
-
         return jsonify(stats), 200
 
     except Exception as e:
@@ -9,6 +9,10 @@ from config.settings import settings
 from src.integrations.jira_mcp import JiraMCPClient
 from src.utils.database import get_engine
 from src.utils.cache_manager import cached_endpoint, invalidate_cache
+from src.services.jira_metadata_cache import (
+    get_jira_metadata_cache,
+    invalidate_jira_metadata,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -349,15 +353,11 @@ def get_jira_issue_types():
     try:
         project_key = request.args.get("project")
 
-        async def fetch_issue_types():
-            async with JiraMCPClient(
-                jira_url=settings.jira.url,
-                username=settings.jira.username,
-                api_token=settings.jira.api_token,
-            ) as jira_client:
-                return await jira_client.get_issue_types(project_key)
-
-        issue_types = asyncio.run(fetch_issue_types())
+        issue_types = get_jira_metadata_cache().get(
+            "issue_types",
+            lambda jira_client: jira_client.get_issue_types(project_key),
+            project_key=project_key,
+        )
         return success_response(data={"issue_types": issue_types})
     except Exception as e:
         logger.error(f"Error fetching Jira issue types: {e}")
@@ -371,15 +371,12 @@ def get_jira_users():
         project_key = request.args.get("project")
         max_results = int(request.args.get("max_results", 200))
 
-        async def fetch_users():
-            async with JiraMCPClient(
-                jira_url=settings.jira.url,
-                username=settings.jira.username,
-                api_token=settings.jira.api_token,
-            ) as jira_client:
-                return await jira_client.get_users(project_key, max_results)
-
-        users = asyncio.run(fetch_users())
+        users = get_jira_metadata_cache().get(
+            "users",
+            lambda jira_client: jira_client.get_users(project_key, max_results),
+            project_key=project_key,
+            max_results=max_results,
+        )
         return success_response(data={"users": users})
     except Exception as e:
         logger.error(f"Error fetching Jira users: {e}")
@@ -401,15 +398,15 @@ def search_jira_users():
             request.args.get("max_results", 20)
         )  # Smaller limit for autocomplete
 
-        async def fetch_users():
-            async with JiraMCPClient(
-                jira_url=settings.jira.url,
-                username=settings.jira.username,
-                api_token=settings.jira.api_token,
-            ) as jira_client:
-                return await jira_client.search_users(query, project_key, max_results)
-
-        users = asyncio.run(fetch_users())
+        users = get_jira_metadata_cache().get(
+            "user_search",
+            lambda jira_client: jira_client.search_users(
+                query, project_key, max_results
+            ),
+            project_key=project_key,
+            query=query.lower(),
+            max_results=max_results,
+        )
         return success_response(data={"users": users})
     except Exception as e:
         logger.error(f"Error searching Jira users: {e}")
@@ -420,16 +417,9 @@ def search_jira_users():
 def get_jira_priorities():
     """Get Jira priorities."""
     try:
-
-        async def fetch_priorities():
-            async with JiraMCPClient(
-                jira_url=settings.jira.url,
-                username=settings.jira.username,
-                api_token=settings.jira.api_token,
-            ) as jira_client:
-                return await jira_client.get_priorities()
-
-        priorities = asyncio.run(fetch_priorities())
+        priorities = get_jira_metadata_cache().get(
+            "priorities", lambda jira_client: jira_client.get_priorities()
+        )
         return success_response(data={"priorities": priorities})
     except Exception as e:
         logger.error(f"Error fetching Jira priorities: {e}")
@@ -451,17 +441,14 @@ def get_jira_statuses():
         project_key = request.args.get("project")
         issue_type = request.args.get("issueType")
 
-        async def fetch_statuses():
-            async with JiraMCPClient(
-                jira_url=settings.jira.url,
-                username=settings.jira.username,
-                api_token=settings.jira.api_token,
-            ) as jira_client:
-                return await jira_client.get_statuses(
-                    project_key=project_key, issue_type=issue_type
-                )
-
-        statuses = asyncio.run(fetch_statuses())
+        statuses = get_jira_metadata_cache().get(
+            "statuses",
+            lambda jira_client: jira_client.get_statuses(
+                project_key=project_key, issue_type=issue_type
+            ),
+            project_key=project_key,
+            issue_type=issue_type,
+        )
         return success_response(data={"statuses": statuses})
     except Exception as e:
         logger.error(f"Error fetching Jira statuses: {e}")
@@ -472,16 +459,11 @@ def get_jira_statuses():
 def get_jira_metadata(project_key):
     """Get comprehensive Jira metadata for a project."""
     try:
-
-        async def fetch_metadata():
-            async with JiraMCPClient(
-                jira_url=settings.jira.url,
-                username=settings.jira.username,
-                api_token=settings.jira.api_token,
-            ) as jira_client:
-                return await jira_client.get_project_metadata(project_key)
-
-        metadata = asyncio.run(fetch_metadata())
+        metadata = get_jira_metadata_cache().get(
+            "project_metadata",
+            lambda jira_client: jira_client.get_project_metadata(project_key),
+            project_key=project_key,
+        )
         return success_response(data={"metadata": metadata})
     except Exception as e:
         logger.error(f"Error fetching Jira metadata: {e}")
@@ -702,38 +684,35 @@ def get_project_epics(project_key):
         logger.info(f"Fetching epics for project {project_key}")
 
         # Fetch epics from Jira using JQL
-        async def fetch_epics():
-            async with JiraMCPClient(
-                jira_url=settings.jira.url,
-                username=settings.jira.username,
-                api_token=settings.jira.api_token,
-            ) as jira_client:
-                # JQL to get all epics for the project
-                jql = f"project = {project_key} AND issuetype = Epic ORDER BY created DESC"
-                issues = await jira_client.search_tickets(jql, max_results=1000)
-                return issues
+        async def fetch_epics(jira_client):
+            # JQL to get all epics for the project
+            jql = f"project = {project_key} AND issuetype = Epic ORDER BY created DESC"
+            epics = await jira_client.search_tickets(jql, max_results=1000)
 
-        epics = asyncio.run(fetch_epics())
+            # Format epic data for frontend
+            formatted_epics = []
+            for epic in epics:
+                fields = epic.get("fields", {})
+                formatted_epics.append(
+                    {
+                        "key": epic.get("key"),
+                        "summary": fields.get("summary", ""),
+                        "status": fields.get("status", {}).get("name", "Unknown"),
+                        "created": fields.get("created"),
+                        "updated": fields.get("updated"),
+                        "assignee": (
+                            fields.get("assignee", {}).get("displayName")
+                            if fields.get("assignee")
+                            else None
+                        ),
+                        "description": fields.get("description", ""),
+                    }
+                )
+            return formatted_epics
 
-        # Format epic data for frontend
-        formatted_epics = []
-        for epic in epics:
-            fields = epic.get("fields", {})
-            formatted_epics.append(
-                {
-                    "key": epic.get("key"),
-                    "summary": fields.get("summary", ""),
-                    "status": fields.get("status", {}).get("name", "Unknown"),
-                    "created": fields.get("created"),
-                    "updated": fields.get("updated"),
-                    "assignee": (
-                        fields.get("assignee", {}).get("displayName")
-                        if fields.get("assignee")
-                        else None
-                    ),
-                    "description": fields.get("description", ""),
-                }
-            )
+        formatted_epics = get_jira_metadata_cache().get(
+            "epics", fetch_epics, project_key=project_key
+        )
 
         logger.info(f"Retrieved {len(formatted_epics)} epics for project {project_key}")
         return success_response(
@@ -851,6 +830,12 @@ def import_project_epics(project_key):
 
             session.commit()
 
+            from src.services.epic_budget_summary import (
+                invalidate_project_budget_summary,
+            )
+
+            invalidate_project_budget_summary(project_key)
+
             logger.info(
                 f"Import complete: {created_count} created, {skipped_count} skipped"
             )
@@ -1280,6 +1265,9 @@ def create_jira_ticket():
 
         logger.info(f"Created Jira ticket: {result.get('key')} for '{data['title']}'")
 
+        if data["issueType"].lower() == "epic":
+            invalidate_jira_metadata("epics", data["project"])
+
         return success_response(
             data={
                 "ticket_key": result.get("key"),
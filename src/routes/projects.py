@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from src.services.auth import auth_required
 from src.utils.database import session_scope
 from src.models.user import UserWatchedProject
+from src.services.insight_stats import invalidate_insight_stats
 from src.managers.notifications import NotificationContent
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,8 @@ def watch_project(user, project_key):
             )
             db_session.add(watched_project)
 
+        # Insight stats are scoped to watched projects
+        invalidate_insight_stats([user.id])
         return jsonify({"success": True, "message": f"Now watching {project_key}"})
 
     except Exception as e:
@@ -96,13 +99,15 @@ def unwatch_project(user, project_key):
 
             if watched_project:
                 db_session.delete(watched_project)
-                return jsonify(
-                    {"success": True, "message": f"Stopped watching {project_key}"}
-                )
-            else:
-                return jsonify(
-                    {"success": False, "message": "Project not in watched list"}
-                )
+
+        if watched_project:
+            # Insight stats are scoped to watched projects
+            invalidate_insight_stats([user.id])
+            return jsonify(
+                {"success": True, "message": f"Stopped watching {project_key}"}
+            )
+        else:
+            return jsonify({"success": False, "message": "Project not in watched list"})
 
     except Exception as e:
         logger.error(f"Failed to unwatch project {project_key}: {e}")
@@ -497,36 +502,22 @@ def update_project_resource_mapping(project_key):
 
 @projects_bp.route("/search/slack-channels", methods=["GET"])
 def search_slack_channels():
-    """Search for Slack channels by name."""
+    """Search for Slack channels by name (from the local resource directory)."""
     try:
-        query = request.args.get("q", "").lower()
+        from src.services.resource_directory import search_resources
 
-        import os
-        from slack_sdk import WebClient
-
-        slack_token = os.getenv("SLACK_BOT_TOKEN")
-        if not slack_token:
-            return jsonify({"success": False, "error": "Slack not configured"}), 500
-
-        slack_client = WebClient(token=slack_token)
-
-        # Get only public channels (bot doesn't have groups:read scope for private channels)
-        response = slack_client.conversations_list(types="public_channel", limit=1000)
-
-        channels = []
-        for channel in response["channels"]:
-            if query in channel["name"].lower():
-                channels.append(
-                    {
-                        "id": channel["id"],
-                        "name": channel["name"],
-                        "is_private": channel.get("is_private", False),
-                        "num_members": channel.get("num_members", 0),
-                    }
+        with session_scope() as db_session:
+            channels = [
+                {
+                    "id": resource.resource_id,
+                    "name": resource.name,
+                    "is_private": resource.attributes.get("is_private", False),
+                    "num_members": resource.attributes.get("num_members", 0),
+                }
+                for resource in search_resources(
+                    db_session, "slack", request.args.get("q", "")
                 )
-
-        # Sort by name
-        channels.sort(key=lambda x: x["name"])
+            ]
 
         return jsonify({"success": True, "channels": channels})
 
@@ -539,64 +530,27 @@ def search_slack_channels():
 def search_notion_pages():
     """Search for Notion pages by title with parent/child hierarchy info."""
     try:
-        query = request.args.get("q", "").lower()
-
-        import os
-        from src.integrations.notion_api import NotionAPIClient
-
-        notion_api_key = os.getenv("NOTION_API_KEY")
-        if not notion_api_key:
-            return jsonify({"success": False, "error": "Notion not configured"}), 500
-
-        notion_client = NotionAPIClient(api_key=notion_api_key)
-
-        # Use Notion search API with query parameter for faster results
-        search_result = notion_client.search(
-            query=query, filter_type="page", page_size=50
-        )
-
-        # Extract pages with proper title extraction and parent info
-        pages = []
-        page_ids_in_results = set()
+        from src.services.resource_directory import search_resources
 
-        for page in search_result.get("results", []):
-            # Use the get_page_title method to properly extract title
-            title = notion_client.get_page_title(page)
-
-            if query in title.lower():
-                page_id = page.get("id")
-                parent = page.get("parent", {})
-                parent_type = parent.get("type", "workspace")
-
-                # Extract parent ID based on type
-                parent_id = None
-                if parent_type == "page_id":
-                    parent_id = parent.get("page_id")
-                elif parent_type == "database_id":
-                    parent_id = parent.get("database_id")
-
-                page_ids_in_results.add(page_id)
-
-                pages.append(
-                    {
-                        "id": page_id,
-                        "title": title,
-                        "url": page.get("url", ""),
-                        "parent": parent,
-                        "parent_type": parent_type,
-                        "parent_id": parent_id,
-                        "is_parent": False,  # Will be updated below
-                    }
+        with session_scope() as db_session:
+            pages = [
+                {
+                    "id": resource.resource_id,
+                    "title": resource.name,
+                    "url": resource.attributes.get("url", ""),
+                    "parent": resource.attributes.get("parent", {}),
+                    "parent_type": resource.attributes.get("parent_type", "workspace"),
+                    "parent_id": resource.attributes.get("parent_id"),
+                }
+                for resource in search_resources(
+                    db_session, "notion", request.args.get("q", "")
                 )
+            ]
 
-        # Determine which pages are parents (have children in the result set)
+        # A page is a parent if another page in the results is its child
+        parent_ids = {page["parent_id"] for page in pages}
         for page in pages:
-            page_id = page["id"]
-            # Check if any other page has this page as parent
-            has_children = any(
-                p.get("parent_id") == page_id for p in pages if p["id"] != page_id
-            )
-            page["is_parent"] = has_children
+            page["is_parent"] = page["id"] in parent_ids
 
         # Sort: parents first, then by title
         pages.sort(key=lambda x: (not x["is_parent"], x["title"]))
@@ -610,101 +564,92 @@ def search_notion_pages():
 
 @projects_bp.route("/search/github-repos", methods=["GET"])
 def search_github_repos():
-    """Search for GitHub repositories from GitHub API."""
+    """Search for GitHub repositories (from the local resource directory)."""
     try:
-        query = request.args.get("q", "").lower()
-
-        import asyncio
-        from src.integrations.github_client import GitHubClient
-        from config.settings import settings
-
-        # Check if GitHub is configured
-        has_app_auth = all(
-            [
-                settings.github.app_id,
-                settings.github.private_key,
-                settings.github.installation_id,
+        from src.services.resource_directory import search_resources
+
+        with session_scope() as db_session:
+            repos = [
+                {"name": resource.name}
+                for resource in search_resources(
+                    db_session, "github", request.args.get("q", "")
+                )
             ]
-        )
-        has_token_auth = bool(settings.github.api_token)
-
-        if not (has_app_auth or has_token_auth):
-            return jsonify({"success": False, "error": "GitHub not configured"}), 500
-
-        # Initialize GitHub client (same pattern as context_search.py)
-        github_client = GitHubClient(
-            api_token=settings.github.api_token,
-            organization=settings.github.organization,
-            app_id=settings.github.app_id,
-            private_key=settings.github.private_key,
-            installation_id=settings.github.installation_id,
-        )
 
-        # Get all accessible repos from GitHub
-        async def get_repos():
-            return await github_client.list_accessible_repos()
+        return jsonify({"success": True, "repos": repos})
 
-        all_repos = asyncio.run(get_repos())
+    except Exception as e:
+        logger.error(f"Error searching GitHub repos: {e}")
+        return jsonify({"success": False, "error": str(e)}), 500
 
-        # Filter by query
-        filtered_repos = []
-        for repo in all_repos:
-            if query in repo.lower():
-                filtered_repos.append({"name": repo})
 
-        # Sort by name
-        filtered_repos.sort(key=lambda x: x["name"])
+@projects_bp.route("/search/jira-projects", methods=["GET"])
+def search_jira_projects():
+    """Search for Jira projects by key or name (from the local resource directory)."""
+    try:
+        from src.services.resource_directory import search_resources
+
+        with session_scope() as db_session:
+            projects = [
+                {"key": resource.resource_id, "name": resource.name}
+                for resource in search_resources(
+                    db_session, "jira", request.args.get("q", "")
+                )
+            ]
 
-        return jsonify({"success": True, "repos": filtered_repos})
+        return jsonify({"success": True, "projects": projects})
 
     except Exception as e:
-        logger.error(f"Error searching GitHub repos: {e}")
+        logger.error(f"Error searching Jira projects: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@projects_bp.route("/search/jira-projects", methods=["GET"])
-def search_jira_projects():
-    """Search for Jira projects by key or name."""
+@projects_bp.route("/search/refresh", methods=["POST"])
+def refresh_resource_directory():
+    """Queue a refresh of the resource directory behind the search routes.
+
+    Request body (optional):
+    {
+        "providers": ["slack", "notion", "github", "jira"]
+    }
+    """
     try:
-        query = request.args.get("q", "").lower()
-
-        from config.settings import settings
-        import requests
-        from requests.auth import HTTPBasicAuth
-
-        # Check if Jira is configured
-        if not all(
-            [settings.jira.url, settings.jira.username, settings.jira.api_token]
-        ):
-            return jsonify({"success": False, "error": "Jira not configured"}), 500
-
-        # Call Jira REST API to get all projects
-        url = f"{settings.jira.url}/rest/api/3/project"
-        auth = HTTPBasicAuth(settings.jira.username, settings.jira.api_token)
-        headers = {"Accept": "application/json"}
-
-        response = requests.get(url, auth=auth, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        all_projects = response.json()
-
-        # Filter by query (search in both key and name)
-        filtered_projects = []
-        for project in all_projects:
-            project_key = project.get("key", "").lower()
-            project_name = project.get("name", "").lower()
-            if query in project_key or query in project_name:
-                filtered_projects.append(
-                    {"key": project.get("key"), "name": project.get("name")}
+        from src.services.resource_directory import PROVIDERS
+        from src.tasks.directory_tasks import (
+            refresh_resource_directory as refresh_task,
+        )
+
+        data = request.get_json(silent=True) or {}
+        providers = data.get("providers")
+        if providers is not None:
+            unknown = set(providers) - set(PROVIDERS)
+            if unknown:
+                return (
+                    jsonify(
+                        {
+                            "success": False,
+                            "error": f"Unknown providers: {', '.join(sorted(unknown))}",
+                        }
+                    ),
+                    400,
                 )
 
-        # Sort by key
-        filtered_projects.sort(key=lambda x: x["key"])
+        task = refresh_task.delay(providers)
+        logger.info(f"Resource directory refresh queued with ID: {task.id}")
 
-        return jsonify({"success": True, "projects": filtered_projects})
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    "message": "Resource directory refresh started",
+                    "task_id": task.id,
+                }
+            ),
+            202,
+        )
 
     except Exception as e:
-        logger.error(f"Error searching Jira projects: {e}")
+        logger.error(f"Error queueing resource directory refresh: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -830,6 +775,13 @@ def update_project_keywords(project_key):
                         },
                     )
 
+        # Recompile the shared project keyword matcher on next use
+        from src.services.project_keyword_matcher import (
+            invalidate_project_keyword_matcher,
+        )
+
+        invalidate_project_keyword_matcher()
+
         return jsonify({"success": True, "message": "Keywords updated successfully"})
 
     except Exception as e:
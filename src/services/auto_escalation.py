@@ -10,19 +10,28 @@ This service handles the core escalation logic:
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import case, func, insert, or_, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from slack_sdk import WebClient
 
 from config.settings import settings
 from src.models.proactive_insight import ProactiveInsight
 from src.models.escalation import EscalationHistory, EscalationPreferences
+from src.models.notification_preferences import UserNotificationPreferences
 from src.models.user import User
 from src.services.channel_safety import ChannelSafetyValidator
 from src.integrations.github_client import GitHubClient
 
 logger = logging.getLogger(__name__)
 
+# Highest escalation tier (critical: GitHub + channel + DM)
+MAX_ESCALATION_LEVEL = 3
+
+# Don't escalate the same insight more than once per this many hours
+ESCALATION_RATE_LIMIT_HOURS = 24
+
 
 class AutoEscalationService:
     """Service for automatically escalating stale proactive insights."""
@@ -52,10 +61,20 @@ class AutoEscalationService:
             installation_id=settings.github.installation_id,
         )
         self.channel_validator = ChannelSafetyValidator(db)
+        self._safe_channels: Dict[str, List[str]] = {}
+        self._pending_history: List[Dict[str, Any]] = []
 
     def run_escalation_check(self) -> Dict[str, Any]:
         """Run escalation check for all active insights.
 
+        Candidates are selected with a single joined query that already
+        excludes insights whose owner has escalations disabled, that are at
+        the top tier, or that were escalated within the rate-limit window.
+        All due insights are claimed with one UPDATE and committed before any
+        notification is sent, so a failure later in the run never causes them
+        to be sent twice. The audit trail is written with one bulk INSERT at
+        the end of the run.
+
         Returns:
             Dict with statistics about escalations performed
         """
@@ -72,25 +91,35 @@ class AutoEscalationService:
             "skipped_disabled": 0,
         }
 
+        self._safe_channels = {}
+        self._pending_history = []
+        # Keep the loaded candidates after the claim commit instead of
+        # reloading every row (this run is their only writer)
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
         try:
-            # Get all active (non-dismissed, non-acted-on) insights
-            active_insights = self._get_active_insights()
-            stats["total_checked"] = len(active_insights)
+            total_active, with_prefs, escalation_enabled = self._count_active_insights()
+            stats["total_checked"] = total_active
+            stats["skipped_no_prefs"] = total_active - with_prefs
+            stats["skipped_disabled"] = with_prefs - escalation_enabled
 
-            logger.info(f"Found {len(active_insights)} active insights to check")
+            candidates = self._get_escalation_candidates()
+            logger.info(
+                f"Found {total_active} active insights, "
+                f"{len(candidates)} due for escalation"
+            )
 
-            for insight in active_insights:
+            self._claim_escalations(candidates)
+
+            for insight, user, prefs, target_level in candidates:
                 try:
-                    result = self._process_insight_escalation(insight)
-                    if result["escalated"]:
-                        stats["escalations_performed"] += 1
-                        stats["dm_sent"] += result.get("dm_sent", 0)
-                        stats["channel_posts"] += result.get("channel_posts", 0)
-                        stats["github_comments"] += result.get("github_comments", 0)
-                    elif result.get("skipped_reason") == "no_prefs":
-                        stats["skipped_no_prefs"] += 1
-                    elif result.get("skipped_reason") == "disabled":
-                        stats["skipped_disabled"] += 1
+                    result = self._execute_escalation(
+                        insight, target_level, prefs, user=user
+                    )
+                    stats["escalations_performed"] += 1
+                    stats["dm_sent"] += result.get("dm_sent", 0)
+                    stats["channel_posts"] += result.get("channel_posts", 0)
+                    stats["github_comments"] += result.get("github_comments", 0)
 
                 except Exception as e:
                     logger.error(
@@ -98,151 +127,190 @@ class AutoEscalationService:
                     )
                     stats["errors"] += 1
 
+            self._save_history()
+
             logger.info(f"Escalation check complete: {stats}")
             return stats
 
         except Exception as e:
             logger.error(f"Critical error in escalation check: {e}", exc_info=True)
+            self.db.rollback()
             stats["errors"] += 1
             return stats
 
-    def _get_active_insights(self) -> List[ProactiveInsight]:
-        """Get all active insights that could need escalation.
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
+    def _active_insight_filters(self) -> List[Any]:
+        """SQL filters for active (non-dismissed, non-acted-on) insights."""
+        return [
+            ProactiveInsight.dismissed_at.is_(None),
+            ProactiveInsight.acted_on_at.is_(None),
+            ProactiveInsight.insight_type == "stale_pr",  # Start with stale PRs only
+        ]
+
+    def _count_active_insights(self) -> Tuple[int, int, int]:
+        """Count active insights by their owner's notification preferences.
 
         Returns:
-            List of active ProactiveInsight objects
+            Tuple of (active insights, active insights whose owner has
+            notification preferences, active insights whose owner has
+            escalations enabled)
         """
-        return (
-            self.db.query(ProactiveInsight)
-            .filter(
-                ProactiveInsight.dismissed_at.is_(None),
-                ProactiveInsight.acted_on_at.is_(None),
-                ProactiveInsight.insight_type
-                == "stale_pr",  # Start with stale PRs only
+        total, with_prefs, enabled = (
+            self.db.query(
+                func.count(ProactiveInsight.id),
+                func.count(UserNotificationPreferences.user_id),
+                func.count(UserNotificationPreferences.user_id).filter(
+                    UserNotificationPreferences.enable_escalations.is_(True)
+                ),
             )
-            .all()
+            .outerjoin(
+                UserNotificationPreferences,
+                UserNotificationPreferences.user_id == ProactiveInsight.user_id,
+            )
+            .filter(*self._active_insight_filters())
+            .one()
         )
+        return total or 0, with_prefs or 0, enabled or 0
 
-    def _process_insight_escalation(self, insight: ProactiveInsight) -> Dict[str, Any]:
-        """Process escalation for a single insight.
+    def _get_escalation_candidates(
+        self,
+    ) -> List[Tuple[ProactiveInsight, User, EscalationPreferences, int]]:
+        """Load the active insights that are due for escalation.
 
-        Args:
-            insight: ProactiveInsight to potentially escalate
+        Insights, owners and escalation preferences come back from one joined
+        query; only the age-vs-threshold check (per-user thresholds) runs in
+        Python on the already-loaded rows.
 
         Returns:
-            Dict with escalation results
+            List of (insight, user, escalation prefs, target level) tuples
         """
-        result = {
-            "escalated": False,
-            "dm_sent": 0,
-            "channel_posts": 0,
-            "github_comments": 0,
-            "skipped_reason": None,
-        }
-
-        # Get user preferences using UserNotificationPreferences
-        from src.models import User, UserNotificationPreferences
-        from src.services.notification_preference_checker import (
-            NotificationPreferenceChecker,
+        rate_limit_cutoff = datetime.now(timezone.utc) - timedelta(
+            hours=ESCALATION_RATE_LIMIT_HOURS
         )
 
-        user = self.db.query(User).filter_by(id=insight.user_id).first()
-        if not user:
-            logger.debug(
-                f"User {insight.user_id} not found, skipping insight {insight.id}"
+        rows = (
+            self.db.query(ProactiveInsight, User, EscalationPreferences)
+            .join(User, User.id == ProactiveInsight.user_id)
+            .join(
+                UserNotificationPreferences,
+                UserNotificationPreferences.user_id == ProactiveInsight.user_id,
+            )
+            .outerjoin(
+                EscalationPreferences,
+                EscalationPreferences.user_id == ProactiveInsight.user_id,
             )
-            result["skipped_reason"] = "user_not_found"
-            return result
+            .filter(
+                *self._active_insight_filters(),
+                UserNotificationPreferences.enable_escalations.is_(True),
+                ProactiveInsight.escalation_level < MAX_ESCALATION_LEVEL,
+                or_(
+                    ProactiveInsight.last_escalated_at.is_(None),
+                    ProactiveInsight.last_escalated_at <= rate_limit_cutoff,
+                ),
+            )
+            .order_by(ProactiveInsight.created_at)
+            .all()
+        )
 
-        pref_checker = NotificationPreferenceChecker(self.db)
+        candidates = []
+        default_prefs: Dict[int, EscalationPreferences] = {}
+        for insight, user, prefs in rows:
+            if prefs is None:
+                # Created once per user and persisted with the next commit
+                prefs = default_prefs.get(user.id)
+                if prefs is None:
+                    prefs = self._create_default_preferences(user.id)
+                    default_prefs[user.id] = prefs
 
-        # Check if escalations are enabled using unified preferences
-        user_prefs = (
-            self.db.query(UserNotificationPreferences)
-            .filter_by(user_id=insight.user_id)
-            .first()
-        )
+            target_level = self._get_target_level(insight, prefs)
+            if target_level > insight.escalation_level:
+                candidates.append((insight, user, prefs, target_level))
 
-        if not user_prefs or not user_prefs.enable_escalations:
-            logger.debug(
-                f"Auto-escalation disabled for user {insight.user_id}, "
-                f"skipping insight {insight.id}"
-            )
-            result["skipped_reason"] = "disabled"
-            return result
-
-        # For backward compatibility, still use EscalationPreferences for timing config if it exists
-        prefs = (
-            self.db.query(EscalationPreferences)
-            .filter_by(user_id=insight.user_id)
-            .first()
+        return candidates
+
+    def _create_default_preferences(self, user_id: int) -> EscalationPreferences:
+        """Add default escalation timing for a user without EscalationPreferences.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            New EscalationPreferences (added to the session, not committed)
+        """
+        prefs = EscalationPreferences(
+            user_id=user_id,
+            enable_auto_escalation=True,  # Already checked via UserNotificationPreferences
+            enable_dm_escalation=True,
+            enable_channel_escalation=True,
+            enable_github_escalation=True,
+            dm_threshold_days=3,
+            channel_threshold_days=5,
+            critical_threshold_days=7,
         )
+        self.db.add(prefs)
+        return prefs
 
-        # If no EscalationPreferences exist, create default escalation timing
-        if not prefs:
-            prefs = EscalationPreferences(
-                user_id=insight.user_id,
-                enable_auto_escalation=True,  # Already checked via UserNotificationPreferences
-                level_1_days=2,
-                level_2_days=4,
-                level_3_days=7,
-            )
-            self.db.add(prefs)
-            self.db.commit()
+    def _get_target_level(
+        self, insight: ProactiveInsight, prefs: EscalationPreferences
+    ) -> int:
+        """Determine the escalation level an insight's age calls for.
 
-        # Determine escalation level based on age
-        # Handle both naive and aware datetimes
-        created_at = insight.created_at
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
+        Args:
+            insight: Insight to check
+            prefs: Owner's escalation preferences
+
+        Returns:
+            Escalation level (0-3)
+        """
+        created_at = self._ensure_timezone_aware(insight.created_at)
         days_old = (datetime.now(timezone.utc) - created_at).days
-        target_level = self._determine_escalation_level(days_old, prefs)
+        return self._determine_escalation_level(days_old, prefs)
 
-        if target_level == 0:
-            logger.debug(
-                f"Insight {insight.id} ({days_old} days old) "
-                f"not yet ready for escalation"
-            )
-            return result
+    def _claim_escalations(
+        self,
+        candidates: List[Tuple[ProactiveInsight, User, EscalationPreferences, int]],
+    ) -> None:
+        """Record every due escalation with one UPDATE and commit it.
 
-        # Check if already escalated to this level
-        if insight.escalation_level >= target_level:
-            logger.debug(
-                f"Insight {insight.id} already at level {insight.escalation_level}, "
-                f"target is {target_level}"
-            )
-            return result
-
-        # Check rate limiting (don't escalate more than once per day)
-        if insight.last_escalated_at:
-            last_escalated = self._ensure_timezone_aware(insight.last_escalated_at)
-            hours_since_last = (
-                datetime.now(timezone.utc) - last_escalated
-            ).total_seconds() / 3600
-            if hours_since_last < 24:
-                logger.debug(
-                    f"Insight {insight.id} escalated {hours_since_last:.1f}h ago, "
-                    f"rate limiting"
-                )
-                return result
-
-        # Execute escalation actions based on level and preferences
-        logger.info(
-            f"Escalating insight {insight.id} to level {target_level} "
-            f"(current: {insight.escalation_level})"
-        )
+        Default preferences created while selecting candidates are committed
+        in the same transaction. The loaded insights are brought up to date
+        without reloading them.
 
-        escalation_results = self._execute_escalation(insight, target_level, prefs)
+        Args:
+            candidates: (insight, user, escalation prefs, target level) tuples
+        """
+        if not candidates:
+            self.db.commit()
+            return
 
-        # Update insight escalation tracking
-        insight.escalation_level = target_level
-        insight.escalation_count += 1
-        insight.last_escalated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        levels = {
+            insight.id: target_level for insight, _, _, target_level in candidates
+        }
+        self.db.execute(
+            update(ProactiveInsight)
+            .where(ProactiveInsight.id.in_(levels))
+            .values(
+                escalation_level=case(levels, value=ProactiveInsight.id),
+                escalation_count=ProactiveInsight.escalation_count + 1,
+                last_escalated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
 
-        result["escalated"] = True
-        result.update(escalation_results)
-        return result
+        for insight, _, _, target_level in candidates:
+            logger.info(
+                f"Escalating insight {insight.id} to level {target_level} "
+                f"(current: {insight.escalation_level})"
+            )
+            set_committed_value(insight, "escalation_level", target_level)
+            set_committed_value(
+                insight, "escalation_count", (insight.escalation_count or 0) + 1
+            )
+            set_committed_value(insight, "last_escalated_at", now)
 
     def _ensure_timezone_aware(self, dt: datetime) -> datetime:
         """Ensure datetime is timezone-aware (convert naive to UTC).
@@ -279,7 +347,11 @@ class AutoEscalationService:
             return 0  # No escalation yet
 
     def _execute_escalation(
-        self, insight: ProactiveInsight, target_level: int, prefs: EscalationPreferences
+        self,
+        insight: ProactiveInsight,
+        target_level: int,
+        prefs: EscalationPreferences,
+        user: Optional[User] = None,
     ) -> Dict[str, int]:
         """Execute escalation actions based on level and preferences.
 
@@ -287,6 +359,7 @@ class AutoEscalationService:
             insight: Insight to escalate
             target_level: Target escalation level (1-3)
             prefs: User's escalation preferences
+            user: Insight owner (looked up if not provided)
 
         Returns:
             Dict with counts of actions taken
@@ -294,7 +367,8 @@ class AutoEscalationService:
         results = {"dm_sent": 0, "channel_posts": 0, "github_comments": 0}
 
         # Get user info
-        user = self.db.query(User).filter_by(id=insight.user_id).first()
+        if user is None:
+            user = self.db.query(User).filter_by(id=insight.user_id).first()
         if not user:
             logger.error(f"User {insight.user_id} not found for insight {insight.id}")
             return results
@@ -372,6 +446,21 @@ class AutoEscalationService:
             )
             return False
 
+    def _get_safe_channels(self, project_key: str) -> List[str]:
+        """Get a project's safe channels, looked up once per escalation run.
+
+        Args:
+            project_key: Project key
+
+        Returns:
+            List of internal channel IDs
+        """
+        if project_key not in self._safe_channels:
+            self._safe_channels[project_key] = (
+                self.channel_validator.get_safe_channels_for_project(project_key)
+            )
+        return self._safe_channels[project_key]
+
     def _send_channel_escalation(
         self, insight: ProactiveInsight, user: User, level: int
     ) -> bool:
@@ -393,9 +482,7 @@ class AutoEscalationService:
             )
             return False
 
-        safe_channels = self.channel_validator.get_safe_channels_for_project(
-            insight.project_key
-        )
+        safe_channels = self._get_safe_channels(insight.project_key)
 
         if not safe_channels:
             logger.warning(
@@ -626,7 +713,7 @@ class AutoEscalationService:
         success: bool,
         error_message: Optional[str],
     ) -> None:
-        """Record escalation action in audit trail.
+        """Queue an escalation action for the audit trail (see _save_history).
 
         Args:
             insight: Insight being escalated
@@ -637,23 +724,35 @@ class AutoEscalationService:
             success: Whether escalation succeeded
             error_message: Error message (if failed)
         """
+        self._pending_history.append(
+            {
+                "insight_id": insight.id,
+                "escalation_type": escalation_type,
+                "escalation_level": level,
+                "target": target,
+                "message_sent": message,
+                "success": success,
+                "error_message": error_message,
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+
+    def _save_history(self) -> None:
+        """Write the run's recorded escalation actions in one bulk INSERT."""
+        if not self._pending_history:
+            return
+
         try:
-            history = EscalationHistory(
-                insight_id=insight.id,
-                escalation_type=escalation_type,
-                escalation_level=level,
-                target=target,
-                message_sent=message,
-                success=success,
-                error_message=error_message,
-                created_at=datetime.now(timezone.utc),
-            )
-            self.db.add(history)
+            self.db.execute(insert(EscalationHistory), self._pending_history)
             self.db.commit()
 
         except Exception as e:
             logger.error(
-                f"Error recording escalation history for insight {insight.id}: {e}",
+                f"Error recording {len(self._pending_history)} escalation "
+                f"history rows: {e}",
                 exc_info=True,
             )
             self.db.rollback()
+
+        finally:
+            self._pending_history = []
@@ -3,7 +3,7 @@
 import logging
 import re
 import hashlib
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import numpy as np
@@ -56,14 +56,10 @@ class ContextSearchService:
     def __init__(self):
         """Initialize the context search service."""
         self.logger = logging.getLogger(__name__)
-        self._project_keywords_cache = None
-        self._project_keywords_cache_time = None
         self._embedding_cache = (
             {}
         )  # Cache embeddings: hash(text) -> (embedding, timestamp)
         self._embedding_cache_ttl = 3600  # 1 hour cache TTL
-        self._slack_user_cache = {}  # Cache Slack user IDs: user_id -> display_name
-        self._slack_user_cache_time = None
 
         # Initialize query expander for synonym/term expansion
         from src.services.query_expander import QueryExpander
@@ -127,8 +123,15 @@ class ContextSearchService:
             self.logger.warning(f"Could not get user email for user_id {user_id}: {e}")
             return None
 
+    def _get_slack_user_directory(self):
+        """Get the shared Slack user directory (None if Slack isn't configured)."""
+        from config.settings import settings
+        from src.services.slack_directory import get_slack_user_directory
+
+        return get_slack_user_directory(settings.notifications.slack_bot_token)
+
     def _resolve_slack_user_id(self, user_id: str) -> str:
-        """Resolve Slack user ID to display name using Slack API.
+        """Resolve Slack user ID to display name using the shared user directory.
 
         Args:
             user_id: Slack user ID (e.g., 'U012EQ1KQFK')
@@ -136,37 +139,11 @@ class ContextSearchService:
         Returns:
             Display name if found, otherwise returns the user ID
         """
-        # Check cache first (cache for 1 hour)
-        if (
-            self._slack_user_cache_time
-            and (datetime.now() - self._slack_user_cache_time).total_seconds() < 3600
-        ):
-            if user_id in self._slack_user_cache:
-                return self._slack_user_cache[user_id]
-
-        # Fetch from Slack API
         try:
-            from config.settings import settings
-            from slack_sdk import WebClient
-
-            client = WebClient(token=settings.notifications.slack_bot_token)
-            response = client.users_info(user=user_id)
-
-            if response.get("ok"):
-                user_info = response.get("user", {})
-                display_name = (
-                    user_info.get("profile", {}).get("display_name")
-                    or user_info.get("real_name")
-                    or user_id
-                )
-
-                # Cache the result
-                self._slack_user_cache[user_id] = display_name
-                self._slack_user_cache_time = datetime.now()
-
-                return display_name
-            else:
+            directory = self._get_slack_user_directory()
+            if not directory:
                 return user_id
+            return directory.get_display_name(user_id)
 
         except Exception as e:
             self.logger.warning(f"Could not resolve Slack user ID {user_id}: {e}")
@@ -181,59 +158,25 @@ class ContextSearchService:
         Returns:
             Text with user IDs replaced by display names
         """
-        import re
-
-        # Find all Slack user ID mentions <@USERID>
-        pattern = r"<@([A-Z0-9]+)>"
-
-        def replace_mention(match):
-            user_id = match.group(1)
-            display_name = self._resolve_slack_user_id(user_id)
-            return f"@{display_name}"
+        try:
+            directory = self._get_slack_user_directory()
+            if not directory:
+                return text
+            return directory.replace_mentions(text)
 
-        return re.sub(pattern, replace_mention, text)
+        except Exception as e:
+            self.logger.warning(f"Could not replace Slack user mentions: {e}")
+            return text
 
     def _get_project_keywords(self) -> Dict[str, List[str]]:
-        """Get project keywords from database with caching.
+        """Get project keywords from the shared project keyword matcher.
 
         Returns:
             Dict mapping project_key to list of keywords
         """
-        # Cache for 5 minutes
-        if (
-            self._project_keywords_cache
-            and self._project_keywords_cache_time
-            and (datetime.now() - self._project_keywords_cache_time).total_seconds()
-            < 300
-        ):
-            return self._project_keywords_cache
+        from src.services.project_keyword_matcher import get_project_keyword_matcher
 
-        try:
-            from src.utils.database import get_engine
-            from sqlalchemy import text
-
-            engine = get_engine()
-            project_keywords = {}
-
-            with engine.connect() as conn:
-                result = conn.execute(
-                    text("SELECT project_key, keyword FROM project_keywords")
-                )
-                for row in result:
-                    project_key = row[0]
-                    keyword = row[1]
-                    if project_key not in project_keywords:
-                        project_keywords[project_key] = []
-                    project_keywords[project_key].append(keyword.lower())
-
-            self._project_keywords_cache = project_keywords
-            self._project_keywords_cache_time = datetime.now()
-            self.logger.info(f"Loaded {len(project_keywords)} project keyword mappings")
-            return project_keywords
-
-        except Exception as e:
-            self.logger.error(f"Error loading project keywords: {e}")
-            return {}
+        return get_project_keyword_matcher().keyword_map
 
     def _detect_project_and_expand_query(
         self, query: str
@@ -246,7 +189,10 @@ class ContextSearchService:
         Returns:
             Tuple of (detected_project_key, project_keywords_set, topic_keywords_set)
         """
-        project_keywords_map = self._get_project_keywords()
+        from src.services.project_keyword_matcher import get_project_keyword_matcher
+
+        matcher = get_project_keyword_matcher()
+        project_keywords_map = matcher.keyword_map
 
         # Extract potential project keys (uppercase words 2-5 chars like "BC", "SUBS")
         potential_keys = re.findall(r"\b[A-Z]{2,5}\b", query.upper())
@@ -266,24 +212,18 @@ class ContextSearchService:
                 )
                 break
 
-        # If no project key found yet, try matching query words against keyword mappings
+        # If no project key found yet, scan the query for project keywords in one pass
         # This handles queries like "beauchamp's cart" where "beauchamp" maps to BC project
         if not detected_project:
-            query_words = re.findall(r"\b\w{3,}\b", query.lower())
-
-            # Check each word against all project keyword mappings
-            for project_key, keywords in project_keywords_map.items():
-                for word in query_words:
-                    if word in keywords:
-                        detected_project = project_key
-                        project_keywords.add(project_key.lower())
-                        project_keywords.update(keywords)
-                        self.logger.info(
-                            f"Detected project {project_key} via keyword '{word}' (from {len(keywords)} keywords)"
-                        )
-                        break
-                if detected_project:
-                    break
+            matches = matcher.match(query)
+            if matches:
+                detected_project, matched_keywords = next(iter(matches.items()))
+                keywords = project_keywords_map[detected_project]
+                project_keywords.add(detected_project.lower())
+                project_keywords.update(keywords)
+                self.logger.info(
+                    f"Detected project {detected_project} via keyword '{matched_keywords[0]}' (from {len(keywords)} keywords)"
+                )
 
         # Tokenize the query into topic keywords (min 3 chars, exclude common words and project terms)
         query_words = re.findall(r"\b\w{3,}\b", query.lower())
@@ -697,6 +637,7 @@ class ContextSearchService:
         detail_level: str = "normal",
         project: Optional[str] = None,
         conversation_history: Optional[List[Dict[str, str]]] = None,
+        on_summary_token: Optional[Callable[[str], Any]] = None,
     ) -> ContextSearchResults:
         """Search for context across all sources using vector database.
 
@@ -709,6 +650,8 @@ class ContextSearchService:
             detail_level: Summary detail level - 'brief', 'normal', or 'detailed'
             project: Filter by project key (e.g., 'SUBS', 'BC')
             conversation_history: Optional list of prior conversation turns for threaded context
+            on_summary_token: Optional callback (sync or async) receiving the AI
+                summary text chunk by chunk as it streams
 
         Returns:
             ContextSearchResults with aggregated results from vector search
@@ -893,6 +836,7 @@ class ContextSearchService:
             entity_links,
             progress_analysis,
             conversation_history,
+            on_token=on_summary_token,
         )
 
         return ContextSearchResults(
@@ -1954,6 +1898,7 @@ class ContextSearchService:
         try:
             from openai import AsyncOpenAI
             from config.settings import settings
+            from src.services.llm_gateway import acomplete
             import json
 
             if not results or len(results) <= 1:
@@ -2039,8 +1984,25 @@ IMPORTANT:
             ) and not settings.ai.model.startswith("gpt-5"):
                 api_params["temperature"] = 0.3
 
-            response = await client.chat.completions.create(**api_params)
-            llm_response = response.choices[0].message.content.strip()
+            async def rerank() -> str:
+                response = await client.chat.completions.create(**api_params)
+                return response.choices[0].message.content
+
+            llm_response = (
+                await acomplete(
+                    "search_rerank",
+                    "openai",
+                    api_params["model"],
+                    api_params["messages"],
+                    rerank,
+                    params={
+                        key: value
+                        for key, value in api_params.items()
+                        if key not in ("model", "messages")
+                    },
+                    validate=json.loads,
+                )
+            ).strip()
 
             # Parse JSON response
             try:
@@ -2151,6 +2113,7 @@ IMPORTANT:
         entity_links: Optional[Dict[str, Any]] = None,
         progress_analysis: Optional[Any] = None,
         conversation_history: Optional[List[Dict[str, str]]] = None,
+        on_token: Optional[Callable[[str], Any]] = None,
     ):
         """Generate AI-powered insights from search results using ContextSummarizer.
 
@@ -2162,6 +2125,7 @@ IMPORTANT:
             entity_links: Entity cross-references
             progress_analysis: Optional ProgressAnalysis object with progress signals
             conversation_history: Optional list of prior conversation turns for threaded context
+            on_token: Optional callback for streamed summary text chunks
 
         Returns:
             SummarizedContext object with all fields, or None if no results
@@ -2187,6 +2151,7 @@ IMPORTANT:
                 entity_links=entity_links,
                 progress_analysis=progress_analysis,
                 conversation_history=conversation_history,
+                on_token=on_token,
             )
 
             # Convert timeline format to match expected format
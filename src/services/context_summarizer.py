@@ -1,16 +1,34 @@
 """AI-powered context summarization with citations."""
 
+import inspect
 import logging
-from typing import List, Dict, Any, Tuple, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 from openai import AsyncOpenAI
 from anthropic import AsyncAnthropic
 import google.generativeai as genai
 from config.settings import settings
+from src.services.llm_gateway import acomplete
 
 logger = logging.getLogger(__name__)
 
+# Receives each chunk of summary text as it streams (may be async)
+TokenCallback = Callable[[str], Union[None, Awaitable[None]]]
+
+
+async def _deliver_token(on_token: Optional[TokenCallback], text: Optional[str]):
+    """Pass a chunk of summary text to the token callback, if any."""
+    if on_token is None or not text:
+        return
+    try:
+        result = on_token(text)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        # A failing consumer shouldn't cost us the summary
+        logger.warning(f"Summary token callback failed: {e}")
+
 
 @dataclass
 class Citation:
@@ -102,6 +120,7 @@ class ContextSummarizer:
         entity_links: Optional[Dict[str, Any]] = None,
         progress_analysis: Optional[Any] = None,
         conversation_history: Optional[List[Dict[str, str]]] = None,
+        on_token: Optional[TokenCallback] = None,
     ) -> SummarizedContext:
         """Generate AI summary with inline citations.
 
@@ -114,6 +133,9 @@ class ContextSummarizer:
             entity_links: Optional dict with entity cross-references
             progress_analysis: Optional ProgressAnalysis object with progress signals
             conversation_history: Optional list of prior conversation turns [{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}]
+            on_token: Optional callback (sync or async) called with each chunk of
+                summary text as the provider streams it. The returned
+                SummarizedContext is the same whether or not it is set.
 
         Returns:
             SummarizedContext with summary, citations, key people, and timeline
@@ -196,60 +218,28 @@ class ContextSummarizer:
                 default="You are an expert technical analyst helping engineers understand project context. IMPORTANT: When analyzing Jira tickets, always use the explicit Status, Priority, and Issue fields provided in the search results - DO NOT infer status from content text. If a result shows 'Status: Closed', treat it as closed regardless of what the content says.",
             )
 
-            # Call AI provider based on configured provider
-            if provider == "openai":
-                # Build API parameters - some models don't support temperature/max_completion_tokens
-                api_params = {
-                    "model": model,
-                    "messages": [
-                        {"role": "system", "content": system_message},
-                        {"role": "user", "content": prompt},
-                    ],
-                }
-
-                # Only add temperature and max_completion_tokens for models that support them
-                # Reasoning models like gpt-5/o1 don't support these parameters
-                if not model.startswith("o1") and not model.startswith("gpt-5"):
-                    api_params["temperature"] = (
-                        0.2  # Very low temperature for maximum factual accuracy
-                    )
-                    api_params["max_completion_tokens"] = (
-                        4000  # Increased from 1500 to allow comprehensive summaries
-                    )
+            generated = False
 
-                response = await client.chat.completions.create(**api_params)
-                ai_response = response.choices[0].message.content
-
-            elif provider == "anthropic":
-                # Anthropic uses a different API structure
-                response = await client.messages.create(
-                    model=model,
-                    max_tokens=4000,
-                    temperature=0.2,
-                    system=system_message,
-                    messages=[{"role": "user", "content": prompt}],
+            async def generate() -> str:
+                nonlocal generated
+                generated = True
+                return await self._generate(
+                    client, model, provider, system_message, prompt, on_token
                 )
-                ai_response = response.content[0].text
 
-            elif provider == "google":
-                # Google uses a different API structure
-                from google.generativeai.types import GenerationConfig
-
-                # For Google, combine system message and prompt
-                combined_prompt = f"{system_message}\n\n{prompt}"
-
-                model_instance = genai.GenerativeModel(model)
-                response = await model_instance.generate_content_async(
-                    combined_prompt,
-                    generation_config=GenerationConfig(
-                        temperature=0.2,
-                        max_output_tokens=4000,
-                    ),
-                )
-                ai_response = response.text
-
-            else:
-                raise ValueError(f"Unsupported provider: {provider}")
+            ai_response = await acomplete(
+                "context_summary",
+                provider,
+                model,
+                [
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": prompt},
+                ],
+                generate,
+            )
+            if not generated:
+                # Cached response: deliver it to streaming consumers in one chunk
+                await _deliver_token(on_token, ai_response)
 
             if debug:
                 logger.info(f"🤖 RAW AI RESPONSE:\n{ai_response[:500]}...")
@@ -305,6 +295,122 @@ class ContextSummarizer:
                 confidence="low",
             )
 
+    async def _generate(
+        self,
+        client: Any,
+        model: str,
+        provider: str,
+        system_message: str,
+        prompt: str,
+        on_token: Optional[TokenCallback] = None,
+    ) -> str:
+        """Call the configured provider and return the full response text.
+
+        With ``on_token`` set, the response is streamed and each text chunk is
+        passed to the callback as it arrives.
+
+        Args:
+            client: Provider client from ``_get_fresh_client``
+            model: Model name
+            provider: 'openai', 'anthropic' or 'google'
+            system_message: System prompt
+            prompt: User prompt
+            on_token: Optional callback for streamed text chunks
+
+        Returns:
+            Complete response text
+        """
+        chunks: List[str] = []
+
+        async def emit(text: Optional[str]):
+            if not text:
+                return
+            chunks.append(text)
+            await _deliver_token(on_token, text)
+
+        if provider == "openai":
+            # Build API parameters - some models don't support temperature/max_completion_tokens
+            api_params = {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": prompt},
+                ],
+            }
+
+            # Only add temperature and max_completion_tokens for models that support them
+            # Reasoning models like gpt-5/o1 don't support these parameters (or streaming
+            # for unverified orgs)
+            is_reasoning_model = model.startswith("o1") or model.startswith("gpt-5")
+            if not is_reasoning_model:
+                api_params["temperature"] = (
+                    0.2  # Very low temperature for maximum factual accuracy
+                )
+                api_params["max_completion_tokens"] = (
+                    4000  # Increased from 1500 to allow comprehensive summaries
+                )
+
+            if on_token is not None and not is_reasoning_model:
+                stream = await client.chat.completions.create(**api_params, stream=True)
+                async for chunk in stream:
+                    if chunk.choices:
+                        await emit(chunk.choices[0].delta.content)
+            else:
+                response = await client.chat.completions.create(**api_params)
+                await emit(response.choices[0].message.content)
+
+        elif provider == "anthropic":
+            # Anthropic uses a different API structure
+            params = {
+                "model": model,
+                "max_tokens": 4000,
+                "temperature": 0.2,
+                "system": system_message,
+                "messages": [{"role": "user", "content": prompt}],
+            }
+            if on_token is not None:
+                async with client.messages.stream(**params) as stream:
+                    async for text in stream.text_stream:
+                        await emit(text)
+            else:
+                response = await client.messages.create(**params)
+                await emit(response.content[0].text)
+
+        elif provider == "google":
+            # Google uses a different API structure
+            from google.generativeai.types import GenerationConfig
+
+            # For Google, combine system message and prompt
+            combined_prompt = f"{system_message}\n\n{prompt}"
+
+            model_instance = genai.GenerativeModel(model)
+            generation_config = GenerationConfig(
+                temperature=0.2,
+                max_output_tokens=4000,
+            )
+            if on_token is not None:
+                response = await model_instance.generate_content_async(
+                    combined_prompt,
+                    generation_config=generation_config,
+                    stream=True,
+                )
+                async for chunk in response:
+                    try:
+                        await emit(chunk.text)
+                    except ValueError:
+                        # Chunk without text parts (e.g. safety metadata only)
+                        continue
+            else:
+                response = await model_instance.generate_content_async(
+                    combined_prompt, generation_config=generation_config
+                )
+                await emit(response.text)
+
+        else:
+            raise ValueError(f"Unsupported provider: {provider}")
+
+        return "".join(chunks)
+
     def _build_summarization_prompt(
         self,
         query: str,
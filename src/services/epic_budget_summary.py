@@ -0,0 +1,178 @@
+"""Budget-vs-actual summary for a project's epics.
+
+Builds the rows behind ``GET /api/epic-budgets/<project_key>``: every epic
+that has a budget, actual hours, or both, with actuals broken down by month.
+Budgets and monthly actuals are combined with a single FULL OUTER JOIN and
+the response is cached per project until budgets or epic hours change
+(budget routes, epic imports and epic hours syncs call
+``invalidate_project_budget_summary``).
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+
+from src.models import EpicBudget, EpicHours
+from src.utils.cache_manager import get_cache_manager
+
+logger = logging.getLogger(__name__)
+
+# Cache key prefix (keys are api_cache:epic_budgets:{project_key})
+CACHE_PREFIX = "epic_budgets"
+
+# Seconds a summary stays cached. Historical imports and the epic enrichment
+# and categorization jobs also write epic_hours without invalidating, so
+# their changes show up within this window.
+CACHE_TTL = 600
+
+
+def build_project_budget_summary(session, project_key: str) -> List[Dict[str, Any]]:
+    """
+    Compute budget vs. actual hours for all epics in a project.
+
+    Uses FULL OUTER JOIN pattern to show:
+    - Epics with budgets (imported from Jira)
+    - Epics with actual hours (synced from Tempo)
+    - Or both
+
+    Args:
+        session: SQLAlchemy session
+        project_key: Project key
+
+    Returns:
+        List of epic budget dicts (see GET /api/epic-budgets/<project_key>)
+    """
+    budgets = (
+        select(
+            EpicBudget.id,
+            EpicBudget.epic_key,
+            EpicBudget.epic_summary,
+            EpicBudget.estimated_hours,
+            EpicBudget.created_at,
+            EpicBudget.updated_at,
+        )
+        .where(EpicBudget.project_key == project_key)
+        .subquery("budgets")
+    )
+    actuals = (
+        select(
+            EpicHours.epic_key,
+            EpicHours.month,
+            func.sum(EpicHours.hours).label("hours"),
+            func.max(EpicHours.epic_category).label("epic_category"),
+        )
+        .where(EpicHours.project_key == project_key)
+        .group_by(EpicHours.epic_key, EpicHours.month)
+        .subquery("actuals")
+    )
+    epic_key = func.coalesce(budgets.c.epic_key, actuals.c.epic_key).label("epic_key")
+    stmt = (
+        select(
+            epic_key,
+            budgets.c.id,
+            budgets.c.epic_summary,
+            budgets.c.estimated_hours,
+            budgets.c.created_at,
+            budgets.c.updated_at,
+            actuals.c.month,
+            actuals.c.hours,
+            actuals.c.epic_category,
+        )
+        .select_from(budgets)
+        .join(actuals, budgets.c.epic_key == actuals.c.epic_key, full=True)
+        .order_by(epic_key, actuals.c.month)
+    )
+
+    epics: Dict[str, Dict[str, Any]] = {}
+    for row in session.execute(stmt):
+        epic = epics.get(row.epic_key)
+        if epic is None:
+            is_budgeted = row.id is not None
+            epic = epics[row.epic_key] = {
+                "id": row.id,
+                "project_key": project_key,
+                "epic_key": row.epic_key,
+                "epic_summary": row.epic_summary if is_budgeted else row.epic_key,
+                "epic_category": None,  # Category from epic_hours table
+                "estimated_hours": (
+                    float(row.estimated_hours) if row.estimated_hours else 0.0
+                ),
+                "actuals_by_month": {},
+                "is_budgeted": is_budgeted,  # Flag to indicate if budget exists
+                "created_at": (row.created_at.isoformat() if row.created_at else None),
+                "updated_at": (row.updated_at.isoformat() if row.updated_at else None),
+            }
+
+        if row.epic_category and (
+            epic["epic_category"] is None or row.epic_category > epic["epic_category"]
+        ):
+            epic["epic_category"] = row.epic_category
+
+        if row.month is not None and row.hours is not None:
+            month_str = row.month.strftime("%Y-%m")
+            actuals_by_month = epic["actuals_by_month"]
+            actuals_by_month[month_str] = actuals_by_month.get(month_str, 0.0) + float(
+                row.hours
+            )
+
+    result = []
+    for epic in epics.values():
+        total_actual = sum(epic["actuals_by_month"].values())
+        estimated = epic["estimated_hours"]
+
+        # Calculate % complete:
+        # - If estimate > 0: standard calculation
+        # - If estimate = 0 but has actuals: show 100% (over budget)
+        # - If estimate = 0 and no actuals: show 0%
+        if estimated > 0:
+            pct_complete = total_actual / estimated * 100
+        elif total_actual > 0:
+            pct_complete = 100.0  # Has actuals but no estimate = over budget
+        else:
+            pct_complete = 0.0
+
+        epic["total_actual"] = total_actual
+        epic["remaining"] = estimated - total_actual
+        epic["pct_complete"] = round(pct_complete, 1)
+        result.append(epic)
+
+    return result
+
+
+def get_project_budget_summary(session, project_key: str) -> List[Dict[str, Any]]:
+    """
+    Get the (cached) budget vs. actual summary for a project.
+
+    Args:
+        session: SQLAlchemy session (used on cache miss)
+        project_key: Project key
+
+    Returns:
+        List of epic budget dicts
+    """
+    cache = get_cache_manager()
+    prefix = f"{CACHE_PREFIX}:{project_key}"
+
+    cached = cache.get(prefix)
+    if cached is not None:
+        return cached["data"]
+
+    result = build_project_budget_summary(session, project_key)
+    cache.set(result, prefix, CACHE_TTL)
+    return result
+
+
+def invalidate_project_budget_summary(project_key: Optional[str] = None) -> int:
+    """
+    Drop cached budget summaries after budgets or epic hours change.
+
+    Args:
+        project_key: Project to drop, or None for all projects
+
+    Returns:
+        Number of keys deleted
+    """
+    return get_cache_manager().invalidate(
+        f"api_cache:{CACHE_PREFIX}:{project_key or '*'}"
+    )
@@ -1,17 +1,137 @@
 """AI-powered epic categorization service for historical data import."""
 
 import logging
-from typing import Optional, Dict
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.output_parsers import JsonOutputParser
+from pydantic import BaseModel, Field
 from config.settings import Settings
 from sqlalchemy.orm import Session
 from src.models.epic_category_mapping import EpicCategoryMapping
+from src.models.epic_name_category import EpicNameCategory
+from src.services.llm_gateway import invoke_chat_model
 
 logger = logging.getLogger(__name__)
 
+# Epic names sent to the LLM per prompt, and prompts in flight at once
+BATCH_SIZE = 40
+MAX_CONCURRENCY = 4
+
+# Summaries that are just an issue key (no details found in Jira)
+ISSUE_KEY_PATTERN = re.compile(r"^[a-z][a-z0-9]*-\d+$")
+
+# Category descriptions with keyword hints (used in categorization prompts)
+CATEGORY_DESCRIPTIONS = {
+    "Project Oversight": "Project management, planning, coordination, stakeholder management, meetings, status updates, UAT, testing, QA, environment setup, infrastructure setup, DevOps",
+    "UX": "User experience research, usability testing, UX design, user flows, wireframes, customer interviews",
+    "Design": "Visual design, UI design, graphics, branding, design systems, mockups, style guides",
+    "UI Dev": "Frontend development, user interface implementation, pages, components, navigation, headers, footers, forms, buttons, modals. DEFAULT choice if epic involves user-facing work and category is unclear.",
+    "Customizations": "Client-specific features, custom functionality, tailored solutions, special requirements, custom purchasing flows, scholarships, donations, configurators, custom forms, bulk tools, custom uploaders",
+    "Integrations": "External system integrations, API connections, third-party services, middleware, import/export systems, sync operations, order sync, product imports, data integrations (NOT marketplace apps)",
+    "Migrations": "Data migrations, platform migrations, system transitions, legacy system updates, product migrations, moving between systems",
+    "3rd Party Apps": "Shopify apps, marketplace plugins, app store integrations, pre-built third-party extensions",
+    "SEO & Analytics": "Search engine optimization, analytics implementation, tracking, performance monitoring",
+    "POS": "Point of sale systems, retail solutions, in-store technology (NOT scholarship systems with POS in name)",
+    "Launch Support": "Go-live activities, production support, launch coordination, post-launch fixes",
+}
+
+CATEGORIZATION_GUIDE = """**CATEGORIZATION STRATEGY (apply in this order)**:
+
+1. **Check for OBVIOUS KEYWORDS first**:
+   - UAT, testing, QA, environment setup, infrastructure → "Project Oversight"
+   - Import, export, sync, middleware, data integration → "Integrations"
+   - Migration, moving between systems → "Migrations"
+   - Shopify app, marketplace plugin → "3rd Party Apps"
+   - SEO, analytics, tracking → "SEO & Analytics"
+
+2. **Check if it's a STANDARD E-COMMERCE UI COMPONENT**:
+   Standard UI patterns that should be "UI Dev":
+   - Headers, footers, navigation, menus
+   - Product listings (PLP), product details (PDP), collections
+   - Cart, mini-cart, checkout flow
+   - Search, filters, sorting
+   - Account pages, login, registration
+   - Homepage sections, landing pages
+   - Forms (standard contact, newsletter)
+
+   If it matches these → "UI Dev"
+
+3. **Check if it's CUSTOM BUSINESS LOGIC**:
+   If it's a functional deliverable that is NOT a standard e-commerce pattern:
+   - Custom purchasing flows (academic purchasing, group orders)
+   - Custom business features (scholarships, donations, memberships)
+   - Custom configurators or builders
+   - Custom bulk tools or uploaders
+   - Client-specific workflows
+
+   If it's unique business logic → "Customizations"
+
+4. **Last resort**: If still unclear and user-facing → "UI Dev"
+
+**EXAMPLES**:
+- "UAT | PLP" → "Project Oversight" (testing keyword)
+- "Environment Setup" → "Project Oversight" (infrastructure keyword)
+- "Import products from eagle" → "Integrations" (import keyword)
+- "Order Sync" → "Integrations" (sync keyword)
+- "Product Migration" → "Migrations" (migration keyword)
+- "Product Listings" → "UI Dev" (standard e-commerce UI)
+- "Cart" → "UI Dev" (standard e-commerce UI)
+- "Header" → "UI Dev" (standard e-commerce UI)
+- "Scholarships" → "Customizations" (unique business logic)
+- "Academic Purchasing Journey" → "Customizations" (unique business logic)
+- "Configurator" → "Customizations" (unique business logic)
+- "Bulk Image Uploader" → "Customizations" (unique business tool)
+"""
+
+
+class EpicNameAssignment(BaseModel):
+    """Category chosen for one numbered epic name."""
+
+    index: int = Field(description="Number of the epic in the list")
+    category: str = Field(description="Category name, exactly as listed")
+
+
+class EpicNameAssignments(BaseModel):
+    """Structured output for batch epic categorization."""
+
+    assignments: List[EpicNameAssignment] = Field(
+        description="One assignment per epic in the list"
+    )
+
+
+def _format_categories(valid_categories: list[str]) -> str:
+    """Format the category list (with descriptions) for a prompt."""
+    return "\n".join(
+        [
+            f"- {cat}: {CATEGORY_DESCRIPTIONS.get(cat, 'General category')}"
+            for cat in valid_categories
+            if cat != "Uncategorized"
+        ]
+    )
+
+
+def normalize_epic_name(epic_summary: Optional[str]) -> Optional[str]:
+    """Normalize an epic summary for memo lookups.
+
+    Args:
+        epic_summary: Epic title/summary
+
+    Returns:
+        Lowercased, whitespace-collapsed name, or None if the summary is
+        empty or only an issue key
+    """
+    if not epic_summary:
+        return None
+    name = " ".join(epic_summary.lower().split())
+    if not name or ISSUE_KEY_PATTERN.match(name):
+        return None
+    return name[:500]
+
 
 class EpicCategorizer:
     """Service for categorizing epics using AI."""
@@ -24,6 +144,8 @@ class EpicCategorizer:
         """
         self.db_session = db_session
         self.llm = self._create_llm()
+        self._batch_llm = None
+        self.parser = JsonOutputParser(pydantic_object=EpicNameAssignments)
         self._cache: Dict[str, str] = {}
         self._valid_categories: Optional[list[str]] = None
 
@@ -64,8 +186,13 @@ class EpicCategorizer:
             # Fallback to basic list if database load fails
             return ["UI Dev", "Project Oversight", "Uncategorized"]
 
-    def _create_llm(self):
-        """Create LLM instance based on centralized settings."""
+    def _create_llm(self, max_tokens: int = 50):
+        """Create LLM instance based on centralized settings.
+
+        Args:
+            max_tokens: Response token limit (single answers only need a
+                category name; batch answers need more)
+        """
         ai_config = Settings.get_fresh_ai_config()
 
         if not ai_config:
@@ -82,7 +209,7 @@ class EpicCategorizer:
             return ChatOpenAI(
                 model=ai_config.model,
                 temperature=0.1,  # Low temperature for consistent categorization
-                max_tokens=50,  # Only need category name
+                max_tokens=max_tokens,  # Only need category name(s)
                 api_key=ai_config.api_key,
             )
         elif ai_config.provider == "anthropic":
@@ -90,29 +217,33 @@ class EpicCategorizer:
                 model=ai_config.model,
                 anthropic_api_key=ai_config.api_key,
                 temperature=0.1,
-                max_tokens=50,
+                max_tokens=max_tokens,
             )
         elif ai_config.provider == "google":
             return ChatGoogleGenerativeAI(
                 model=ai_config.model,
                 google_api_key=ai_config.api_key,
                 temperature=0.1,
-                max_tokens=50,
+                max_tokens=max_tokens,
             )
         else:
             logger.error(f"Unsupported AI provider: {ai_config.provider}")
             return None
 
-    def _fuzzy_match_category(self, epic_summary: str) -> Optional[str]:
+    def _fuzzy_match_category(
+        self, epic_summary: str, valid_categories: Optional[list[str]] = None
+    ) -> Optional[str]:
         """Try to match epic summary to a category using fuzzy matching.
 
         Args:
             epic_summary: Epic title/summary
+            valid_categories: Category list (loaded if not provided)
 
         Returns:
             Category name if match found, None otherwise
         """
-        valid_categories = self._load_valid_categories()
+        if valid_categories is None:
+            valid_categories = self._load_valid_categories()
         summary_lower = epic_summary.lower().strip()
 
         # Exact match (case-insensitive)
@@ -144,49 +275,19 @@ class EpicCategorizer:
         Returns:
             Category name (one of VALID_CATEGORIES)
         """
-        # Check local cache first
-        if epic_key in self._cache:
-            logger.debug(f"Using cached category for {epic_key}")
-            return self._cache[epic_key]
-
-        # Check database for existing mapping
-        existing_mapping = (
-            self.db_session.query(EpicCategoryMapping)
-            .filter_by(epic_key=epic_key)
-            .first()
+        results = self._categorize(
+            [(epic_key, epic_summary)], self._load_valid_categories()
         )
+        return results[epic_key]
 
-        if existing_mapping:
-            logger.debug(
-                f"Found existing category mapping for {epic_key}: {existing_mapping.category}"
-            )
-            self._cache[epic_key] = existing_mapping.category
-            return existing_mapping.category
-
-        # Try fuzzy matching first (faster and cheaper than AI)
-        fuzzy_category = self._fuzzy_match_category(epic_summary)
-        if fuzzy_category:
-            logger.info(f"Fuzzy matched {epic_key} to {fuzzy_category}, skipping AI")
-            self._save_mapping(epic_key, fuzzy_category)
-            self._cache[epic_key] = fuzzy_category
-            return fuzzy_category
-
-        # Use AI to categorize
-        category = self._categorize_with_ai(epic_summary)
-
-        # Save to database
-        self._save_mapping(epic_key, category)
-
-        # Cache result
-        self._cache[epic_key] = category
-
-        return category
-
-    def _categorize_with_ai(self, epic_summary: str) -> str:
+    def _categorize_with_ai(
+        self, epic_summary: str, valid_categories: Optional[list[str]] = None
+    ) -> str:
         """Use AI to categorize an epic.
 
         Args:
             epic_summary: Epic title/summary
+            valid_categories: Category list (loaded if not provided)
 
         Returns:
             Category name
@@ -195,31 +296,11 @@ class EpicCategorizer:
             logger.warning("LLM not available, defaulting to 'Uncategorized'")
             return "Uncategorized"
 
-        valid_categories = self._load_valid_categories()
-
-        # Build category descriptions dynamically with keyword hints
-        category_descriptions = {
-            "Project Oversight": "Project management, planning, coordination, stakeholder management, meetings, status updates, UAT, testing, QA, environment setup, infrastructure setup, DevOps",
-            "UX": "User experience research, usability testing, UX design, user flows, wireframes, customer interviews",
-            "Design": "Visual design, UI design, graphics, branding, design systems, mockups, style guides",
-            "UI Dev": "Frontend development, user interface implementation, pages, components, navigation, headers, footers, forms, buttons, modals. DEFAULT choice if epic involves user-facing work and category is unclear.",
-            "Customizations": "Client-specific features, custom functionality, tailored solutions, special requirements, custom purchasing flows, scholarships, donations, configurators, custom forms, bulk tools, custom uploaders",
-            "Integrations": "External system integrations, API connections, third-party services, middleware, import/export systems, sync operations, order sync, product imports, data integrations (NOT marketplace apps)",
-            "Migrations": "Data migrations, platform migrations, system transitions, legacy system updates, product migrations, moving between systems",
-            "3rd Party Apps": "Shopify apps, marketplace plugins, app store integrations, pre-built third-party extensions",
-            "SEO & Analytics": "Search engine optimization, analytics implementation, tracking, performance monitoring",
-            "POS": "Point of sale systems, retail solutions, in-store technology (NOT scholarship systems with POS in name)",
-            "Launch Support": "Go-live activities, production support, launch coordination, post-launch fixes",
-        }
+        if valid_categories is None:
+            valid_categories = self._load_valid_categories()
 
         # Build prompt with categories from database
-        categories_list = "\n".join(
-            [
-                f"- {cat}: {category_descriptions.get(cat, 'General category')}"
-                for cat in valid_categories
-                if cat != "Uncategorized"
-            ]
-        )
+        categories_list = _format_categories(valid_categories)
 
         system_prompt = f"""You are an expert at categorizing software development epics for e-commerce and web development projects.
 
@@ -229,53 +310,7 @@ Categorize the following epic into ONE of these categories:
 
 **CRITICAL**: Your response MUST be ONLY the category name, nothing else. No explanations, no markdown, no reasoning.
 
-**CATEGORIZATION STRATEGY (apply in this order)**:
-
-1. **Check for OBVIOUS KEYWORDS first**:
-   - UAT, testing, QA, environment setup, infrastructure → "Project Oversight"
-   - Import, export, sync, middleware, data integration → "Integrations"
-   - Migration, moving between systems → "Migrations"
-   - Shopify app, marketplace plugin → "3rd Party Apps"
-   - SEO, analytics, tracking → "SEO & Analytics"
-
-2. **Check if it's a STANDARD E-COMMERCE UI COMPONENT**:
-   Standard UI patterns that should be "UI Dev":
-   - Headers, footers, navigation, menus
-   - Product listings (PLP), product details (PDP), collections
-   - Cart, mini-cart, checkout flow
-   - Search, filters, sorting
-   - Account pages, login, registration
-   - Homepage sections, landing pages
-   - Forms (standard contact, newsletter)
-
-   If it matches these → "UI Dev"
-
-3. **Check if it's CUSTOM BUSINESS LOGIC**:
-   If it's a functional deliverable that is NOT a standard e-commerce pattern:
-   - Custom purchasing flows (academic purchasing, group orders)
-   - Custom business features (scholarships, donations, memberships)
-   - Custom configurators or builders
-   - Custom bulk tools or uploaders
-   - Client-specific workflows
-
-   If it's unique business logic → "Customizations"
-
-4. **Last resort**: If still unclear and user-facing → "UI Dev"
-
-**EXAMPLES**:
-- "UAT | PLP" → "Project Oversight" (testing keyword)
-- "Environment Setup" → "Project Oversight" (infrastructure keyword)
-- "Import products from eagle" → "Integrations" (import keyword)
-- "Order Sync" → "Integrations" (sync keyword)
-- "Product Migration" → "Migrations" (migration keyword)
-- "Product Listings" → "UI Dev" (standard e-commerce UI)
-- "Cart" → "UI Dev" (standard e-commerce UI)
-- "Header" → "UI Dev" (standard e-commerce UI)
-- "Scholarships" → "Customizations" (unique business logic)
-- "Academic Purchasing Journey" → "Customizations" (unique business logic)
-- "Configurator" → "Customizations" (unique business logic)
-- "Bulk Image Uploader" → "Customizations" (unique business tool)
-
+{CATEGORIZATION_GUIDE}
 Example responses:
 "UI Dev"
 "Project Oversight"
@@ -290,7 +325,13 @@ Example responses:
                 HumanMessage(content=user_prompt),
             ]
 
-            response = self.llm.invoke(messages)
+            # Only answers that name a valid category are worth caching
+            response = invoke_chat_model(
+                "epic_categorization",
+                self.llm,
+                messages,
+                validate=lambda text: any(cat in text for cat in valid_categories),
+            )
             raw_response = response.content.strip()
 
             # Try to extract category name from response
@@ -338,50 +379,290 @@ Example responses:
             logger.error(f"Error categorizing epic with AI: {e}", exc_info=True)
             return "Uncategorized"
 
-    def _save_mapping(self, epic_key: str, category: str):
-        """Save epic category mapping to database.
+    def categorize_batch(
+        self,
+        epics: list[tuple[str, str]],
+        batch_size: int = BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> Dict[str, str]:
+        """Categorize multiple epics in batch.
+
+        Epics already mapped, or whose normalized name was categorized
+        before (epic_name_categories), never reach the LLM. The remaining
+        distinct names are packed into prompts of ``batch_size`` names, with
+        up to ``max_concurrency`` prompts in flight.
 
         Args:
-            epic_key: Jira epic key
-            category: Category name
+            epics: List of (epic_key, epic_summary) tuples
+            batch_size: Epic names per LLM prompt
+            max_concurrency: Maximum concurrent LLM prompts
+
+        Returns:
+            Dictionary mapping epic_key to category
         """
-        try:
-            # Check if mapping already exists
-            existing = (
-                self.db_session.query(EpicCategoryMapping)
-                .filter_by(epic_key=epic_key)
-                .first()
-            )
+        # Load the category list once for the whole batch
+        self._valid_categories = None
+        valid_categories = self._load_valid_categories()
+        return self._categorize(epics, valid_categories, batch_size, max_concurrency)
+
+    def _categorize(
+        self,
+        epics: list[tuple[str, str]],
+        valid_categories: list[str],
+        batch_size: int = BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> Dict[str, str]:
+        """Resolve categories via cache, mappings, memo, fuzzy match, then AI."""
+        results: Dict[str, str] = {}
+        pending = {}  # epic_key -> epic_summary
 
-            if existing:
-                # Update existing mapping
-                existing.category = category
-                logger.debug(f"Updated category mapping for {epic_key} to {category}")
+        for epic_key, epic_summary in epics:
+            if epic_key in self._cache:
+                results[epic_key] = self._cache[epic_key]
             else:
-                # Create new mapping
-                mapping = EpicCategoryMapping(epic_key=epic_key, category=category)
-                self.db_session.add(mapping)
-                logger.debug(f"Created category mapping for {epic_key}: {category}")
+                pending[epic_key] = epic_summary
 
-            self.db_session.commit()
+        if not pending:
+            return results
 
-        except Exception as e:
-            logger.error(
-                f"Error saving category mapping for {epic_key}: {e}", exc_info=True
+        existing_mappings = self._load_mappings(list(pending))
+        for epic_key, category in existing_mappings.items():
+            logger.debug(f"Found existing category mapping for {epic_key}: {category}")
+            results[epic_key] = category
+            pending.pop(epic_key)
+
+        names = {
+            epic_key: normalize_epic_name(epic_summary)
+            for epic_key, epic_summary in pending.items()
+        }
+        memo = self._load_memo({name for name in names.values() if name})
+
+        new_mappings: Dict[str, str] = {}
+        needs_ai: Dict[str, list[str]] = {}  # epic name -> epic keys
+        for epic_key, epic_summary in pending.items():
+            name = names[epic_key]
+            category = memo.get(name) if name else None
+            if category in valid_categories:
+                logger.debug(f"Memo matched {epic_key} ('{name}') to {category}")
+            else:
+                category = self._fuzzy_match_category(
+                    epic_summary or "", valid_categories
+                )
+
+            if category:
+                new_mappings[epic_key] = category
+            else:
+                prompt_name = name or (epic_summary or epic_key).strip()
+                needs_ai.setdefault(prompt_name, []).append(epic_key)
+
+        if needs_ai:
+            ai_categories = self._categorize_names_with_ai(
+                list(needs_ai), valid_categories, batch_size, max_concurrency
+            )
+            for name, epic_keys in needs_ai.items():
+                for epic_key in epic_keys:
+                    new_mappings[epic_key] = ai_categories[name]
+            memo_names = set(names.values())
+            self._save_memo(
+                {
+                    name: category
+                    for name, category in ai_categories.items()
+                    # Don't pin fallbacks from failed/uncertain answers
+                    if name in memo_names and category != "Uncategorized"
+                }
             )
-            self.db_session.rollback()
 
-    def categorize_batch(self, epics: list[tuple[str, str]]) -> Dict[str, str]:
-        """Categorize multiple epics in batch.
+        self._save_mappings(new_mappings)
+        results.update(new_mappings)
+        self._cache.update(results)
+        return results
+
+    def _categorize_names_with_ai(
+        self,
+        names: list[str],
+        valid_categories: list[str],
+        batch_size: int = BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> Dict[str, str]:
+        """Categorize distinct epic names with batched, concurrent LLM prompts.
+
+        Names missing from a batch answer (or in a failed batch) fall back to
+        one-at-a-time categorization.
 
         Args:
-            epics: List of (epic_key, epic_summary) tuples
+            names: Distinct normalized epic names
+            valid_categories: Category list
+            batch_size: Names per prompt
+            max_concurrency: Maximum concurrent prompts
 
         Returns:
-            Dictionary mapping epic_key to category
+            Dictionary mapping each name to a category
         """
-        results = {}
-        for epic_key, epic_summary in epics:
-            category = self.categorize_epic(epic_key, epic_summary)
-            results[epic_key] = category
+        if not self.llm:
+            logger.warning("LLM not available, defaulting to 'Uncategorized'")
+            return {name: "Uncategorized" for name in names}
+
+        batch_size = max(1, batch_size)
+        if self._batch_llm is None:
+            # Roughly 20 output tokens per assignment, plus JSON overhead
+            self._batch_llm = self._create_llm(max_tokens=200 + 20 * batch_size)
+        batches = [names[i : i + batch_size] for i in range(0, len(names), batch_size)]
+        logger.info(
+            f"Categorizing {len(names)} epic names with AI in {len(batches)} "
+            f"batches (concurrency={max_concurrency})"
+        )
+
+        def categorize(batch: list[str]) -> Dict[str, Optional[str]]:
+            try:
+                return self._categorize_batch_with_ai(batch, valid_categories)
+            except Exception as e:
+                logger.error(f"Error categorizing epic batch with AI: {e}")
+                return {}
+
+        workers = max(1, min(max_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            batch_results = list(pool.map(categorize, batches))
+
+        categories: Dict[str, str] = {}
+        for batch, batch_result in zip(batches, batch_results):
+            for name in batch:
+                category = batch_result.get(name)
+                if category is None:
+                    category = self._categorize_with_ai(name, valid_categories)
+                categories[name] = category
+        return categories
+
+    def _categorize_batch_with_ai(
+        self, names: list[str], valid_categories: list[str]
+    ) -> Dict[str, Optional[str]]:
+        """Categorize several epic names with one structured-output prompt.
+
+        Args:
+            names: Epic names to categorize
+            valid_categories: Category list
+
+        Returns:
+            Dictionary mapping name to category (None if the answer was
+            missing or not a valid category)
+        """
+        llm = self._batch_llm or self.llm
+
+        system_prompt = f"""You are an expert at categorizing software development epics for e-commerce and web development projects.
+
+Categorize EACH numbered epic below into ONE of these categories:
+{_format_categories(valid_categories)}
+- Uncategorized: ONLY if none of the above fit and you are uncertain
+
+Use the category names exactly as written.
+
+{CATEGORIZATION_GUIDE}
+{self.parser.get_format_instructions()}
+"""
+        epic_list = "\n".join(f"{i}. {name}" for i, name in enumerate(names, 1))
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=f"Epics:\n{epic_list}"),
+        ]
+
+        response = invoke_chat_model(
+            "epic_categorization", llm, messages, validate=self.parser.parse
+        )
+        parsed = self.parser.parse(response.content)
+
+        results: Dict[str, Optional[str]] = {}
+        for assignment in parsed.get("assignments", []):
+            index = assignment.get("index")
+            if not isinstance(index, int) or not 1 <= index <= len(names):
+                continue
+            category = str(assignment.get("category", "")).replace("*", "").strip()
+            if category not in valid_categories:
+                logger.warning(
+                    f"AI returned invalid category '{category[:100]}' for "
+                    f"'{names[index - 1]}'"
+                )
+                continue
+            results[names[index - 1]] = category
+
+        logger.info(f"AI categorized {len(results)}/{len(names)} epics in one batch")
         return results
+
+    def _load_mappings(self, epic_keys: list[str]) -> Dict[str, str]:
+        """Load existing epic → category mappings in one query."""
+        try:
+            rows = (
+                self.db_session.query(
+                    EpicCategoryMapping.epic_key, EpicCategoryMapping.category
+                )
+                .filter(EpicCategoryMapping.epic_key.in_(epic_keys))
+                .all()
+            )
+            return {epic_key: category for epic_key, category in rows}
+        except Exception as e:
+            logger.error(f"Error loading category mappings: {e}", exc_info=True)
+            self.db_session.rollback()
+            return {}
+
+    def _load_memo(self, names: set[str]) -> Dict[str, str]:
+        """Load memoized name → category assignments in one query."""
+        if not names:
+            return {}
+        try:
+            rows = (
+                self.db_session.query(
+                    EpicNameCategory.normalized_name, EpicNameCategory.category
+                )
+                .filter(EpicNameCategory.normalized_name.in_(names))
+                .all()
+            )
+            return {name: category for name, category in rows}
+        except Exception as e:
+            logger.error(f"Error loading epic name categories: {e}", exc_info=True)
+            self.db_session.rollback()
+            return {}
+
+    def _save_memo(self, categories: Dict[str, str]):
+        """Store AI name → category assignments for reuse.
+
+        Args:
+            categories: Dict mapping normalized name to category
+        """
+        if not categories:
+            return
+        try:
+            existing = {
+                row.normalized_name: row
+                for row in self.db_session.query(EpicNameCategory).filter(
+                    EpicNameCategory.normalized_name.in_(list(categories))
+                )
+            }
+            for name, category in categories.items():
+                if name in existing:
+                    existing[name].category = category
+                else:
+                    self.db_session.add(
+                        EpicNameCategory(normalized_name=name, category=category)
+                    )
+            self.db_session.commit()
+            logger.debug(f"Saved {len(categories)} epic name categories")
+        except Exception as e:
+            logger.error(f"Error saving epic name categories: {e}", exc_info=True)
+            self.db_session.rollback()
+
+    def _save_mappings(self, mappings: Dict[str, str]):
+        """Save new epic category mappings in one transaction.
+
+        Args:
+            mappings: Dict mapping epic_key to category (keys not yet mapped)
+        """
+        if not mappings:
+            return
+        try:
+            for epic_key, category in mappings.items():
+                self.db_session.add(
+                    EpicCategoryMapping(epic_key=epic_key, category=category)
+                )
+            self.db_session.commit()
+            logger.debug(f"Created {len(mappings)} category mappings")
+        except Exception as e:
+            logger.error(f"Error saving category mappings: {e}", exc_info=True)
+            self.db_session.rollback()
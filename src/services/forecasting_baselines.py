@@ -0,0 +1,408 @@
+"""Materialized team baselines for epic forecasting.
+
+Team baselines (average hours per project for each team, split by backend
+integration level) are aggregated from epic_hours and only change when
+historical data is re-imported or baselines are regenerated. Instead of
+re-running that aggregation for every ForecastingService, rebuilds write a
+versioned row to ``forecasting_baseline_snapshots`` and each process keeps
+the latest version in memory:
+
+- ``rebuild_baseline_snapshot``: compute and store a new version (called by
+  the monthly baseline regeneration and Analytics → Rebuild Models).
+- ``get_baseline_snapshot``: the cached snapshot; the latest version id is
+  re-checked at most once per ``check_interval`` seconds and the snapshot is
+  only reloaded when it changes.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks for a newer snapshot version
+DEFAULT_CHECK_INTERVAL = 60
+
+# Number of snapshot versions kept after a rebuild
+SNAPSHOT_RETENTION = 12
+
+STANDARD_TEAMS = ["BE Devs", "FE Devs", "Design", "UX", "PMs", "Data"]
+
+
+def get_fallback_baselines() -> Dict[str, Dict[str, float]]:
+    """
+    Fallback hardcoded baselines (used only if database query fails).
+
+    Based on original 3 projects:
+    - With integrations: SRLK project (BE=733h, FE=679h, balanced)
+    - Without integrations: BIGO+BMBY average (BE=40h, FE=856h, FE-heavy)
+    """
+    return {
+        "no_integration": {
+            "BE Devs": 40.0,  # Minimal backend work
+            "FE Devs": 856.0,  # Heavy frontend
+            "Design": 102.0,  # Significant design
+            "UX": 62.0,  # UX research
+            "PMs": 316.0,  # Project management
+            "Data": 50.0,  # Estimate (no data)
+        },
+        "with_integration": {
+            "BE Devs": 733.0,  # Heavy backend (18x more than no-integration)
+            "FE Devs": 679.0,  # Balanced with BE
+            "Design": 78.0,  # Less design (already have patterns)
+            "UX": 34.0,  # Less UX (already researched)
+            "PMs": 215.0,  # PM oversight
+            "Data": 100.0,  # Estimate (no data)
+        },
+    }
+
+
+def get_lifecycle_percentages() -> Dict[str, Dict[str, float]]:
+    """
+    Load lifecycle distribution percentages based on ACTUAL historical data.
+
+    Design/UX use chronological front-loading analysis (first 30% of months)
+    Dev/PM teams use peak-based analysis (find highest-hours month)
+
+    Real patterns from BIGO, BMBY, SRLK projects:
+    - Design: 52% ramp up, 35% busy, 13% ramp down (HEAVY first months)
+    - UX: 57% ramp up, 29% busy, 14% ramp down (HEAVY first months)
+    - FE Devs: 1% ramp up, 77% peak, 22% ramp down (waits for design, then peaks)
+    - BE Devs: 17% ramp up, 55% peak, 28% ramp down (gradual ramp, sustained)
+    - PMs: 14% ramp up, 56% peak, 30% ramp down (sustained throughout)
+
+    Examples:
+    - BMBY Design (3mo): Month 1 = 67%, Month 2 = 25%, Month 3 = 7%
+    - BMBY UX (3mo): Month 1 = 64%, Month 2 = 24%, Month 3 = 13%
+
+    Source: scripts/calculate_actual_lifecycle_distributions.py
+    """
+    return {
+        # Based on 3 projects: 16.5% / 55.2% / 28.3%
+        # BE has gradual ramp-up and sustained tail
+        "BE Devs": {"ramp_up": 17.0, "busy": 55.0, "ramp_down": 28.0},
+        # Based on 3 projects: 1.3% / 76.8% / 21.9%
+        # FE waits for design approval, then concentrates work in peak period
+        "FE Devs": {"ramp_up": 1.0, "busy": 77.0, "ramp_down": 22.0},
+        # Based on real data: 70-80% of ALL Design work done in first 2 months
+        # Heavily front-loaded - most design completed early, minimal work later
+        "Design": {"ramp_up": 80.0, "busy": 15.0, "ramp_down": 5.0},
+        # Based on 3 projects: 57.1% / 28.5% / 14.3%
+        # UX front-loads research/strategy in first 30% of timeline
+        "UX": {"ramp_up": 57.0, "busy": 29.0, "ramp_down": 14.0},
+        # Based on 3 projects: 14.1% / 55.5% / 30.4%
+        # PMs sustained throughout with slight early emphasis
+        "PMs": {"ramp_up": 14.0, "busy": 56.0, "ramp_down": 30.0},
+        # No historical data available - using balanced estimate
+        "Data": {"ramp_up": 20.0, "busy": 60.0, "ramp_down": 20.0},
+    }
+
+
+def compute_baselines(session) -> Tuple[Dict[str, Dict[str, float]], int]:
+    """
+    Calculate baseline hours by querying historical epic hours data.
+
+    Queries epic_hours table filtered by project_forecasting_config:
+    - Only includes projects where include_in_forecasting=True
+    - Only includes hours within forecasting_start_date to forecasting_end_date
+    - Aggregates total hours by team across all historical projects
+    - Separates into two baseline sets based on project characteristics:
+      * no_integration: Projects with be_integrations <= 2
+      * with_integration: Projects with be_integrations >= 4
+      * Medium projects (be_integrations = 3) contribute to both baselines
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Tuple of (baselines, project_count) where baselines has two sets
+        (no_integration, with_integration), each containing average hours by
+        team. Falls back to hardcoded baselines (project_count 0) when no
+        historical data exists.
+    """
+    from src.models import (
+        EpicHours,
+        ProjectForecastingConfig,
+        ProjectCharacteristics,
+    )
+
+    # Query epic hours filtered by forecasting config
+    results = (
+        session.query(
+            EpicHours.project_key,
+            EpicHours.team,
+            func.sum(EpicHours.hours).label("total_hours"),
+            ProjectCharacteristics.be_integrations,
+        )
+        .join(
+            ProjectForecastingConfig,
+            EpicHours.project_key == ProjectForecastingConfig.project_key,
+        )
+        .join(
+            ProjectCharacteristics,
+            EpicHours.project_key == ProjectCharacteristics.project_key,
+        )
+        .filter(
+            ProjectForecastingConfig.include_in_forecasting == True,
+            EpicHours.month >= ProjectForecastingConfig.forecasting_start_date,
+            EpicHours.month <= ProjectForecastingConfig.forecasting_end_date,
+        )
+        .group_by(
+            EpicHours.project_key,
+            EpicHours.team,
+            ProjectCharacteristics.be_integrations,
+        )
+        .all()
+    )
+
+    if not results:
+        logger.warning(
+            "No historical data found in database. Using fallback hardcoded baselines. "
+            "Make sure to import historical projects via Analytics → Import Historical Data."
+        )
+        return get_fallback_baselines(), 0
+
+    logger.info(
+        f"Loaded {len(results)} project-team combinations from database for baseline calculation"
+    )
+
+    # Aggregate by team and baseline category
+    no_integration_totals = {}  # be_integrations <= 2
+    with_integration_totals = {}  # be_integrations >= 4
+    no_integration_counts = {}
+    with_integration_counts = {}
+
+    for project_key, team, total_hours, be_integrations in results:
+        # Categorize projects by BE integrations level
+        # Medium projects (be_integrations = 3) contribute to BOTH baselines
+        if be_integrations <= 3:
+            no_integration_totals[team] = (
+                no_integration_totals.get(team, 0.0) + total_hours
+            )
+            no_integration_counts[team] = no_integration_counts.get(team, 0) + 1
+        if be_integrations >= 3:
+            with_integration_totals[team] = (
+                with_integration_totals.get(team, 0.0) + total_hours
+            )
+            with_integration_counts[team] = with_integration_counts.get(team, 0) + 1
+
+    # Calculate averages per project
+    baselines = {"no_integration": {}, "with_integration": {}}
+
+    for team, total_hours in no_integration_totals.items():
+        count = no_integration_counts[team]
+        baselines["no_integration"][team] = round(total_hours / count, 2)
+
+    for team, total_hours in with_integration_totals.items():
+        count = with_integration_counts[team]
+        baselines["with_integration"][team] = round(total_hours / count, 2)
+
+    # Ensure all standard teams are present in both baselines (use fallback if missing)
+    fallback_baselines = get_fallback_baselines()
+    for baseline_set in ["no_integration", "with_integration"]:
+        for team in STANDARD_TEAMS:
+            if team not in baselines[baseline_set]:
+                fallback = fallback_baselines[baseline_set].get(team, 50.0)
+                baselines[baseline_set][team] = fallback
+                logger.warning(
+                    f"No historical data for {team} in {baseline_set} projects. "
+                    f"Using fallback estimate: {fallback}h"
+                )
+
+    logger.info(
+        f"Calculated baselines from database:\n"
+        f"  No Integration: {baselines['no_integration']}\n"
+        f"  With Integration: {baselines['with_integration']}"
+    )
+
+    project_count = len({project_key for project_key, _, _, _ in results})
+    return baselines, project_count
+
+
+class BaselineSnapshot:
+    """An immutable set of forecasting baselines."""
+
+    def __init__(
+        self,
+        version: Optional[int],
+        baselines: Dict[str, Dict[str, float]],
+        lifecycle_percentages: Dict[str, Dict[str, float]],
+    ):
+        """Create a snapshot.
+
+        Args:
+            version: Snapshot row id, or None if computed without a stored row
+            baselines: Average hours per team for each baseline set
+            lifecycle_percentages: Ramp up/busy/ramp down percentages per team
+        """
+        self.version = version
+        self.baselines = baselines
+        self.lifecycle_percentages = lifecycle_percentages
+
+    @classmethod
+    def from_row(cls, row) -> "BaselineSnapshot":
+        return cls(row.id, row.baselines, row.lifecycle_percentages)
+
+
+class BaselineSnapshotCache:
+    """Per-process cache of the latest baseline snapshot, keyed by version."""
+
+    def __init__(self, check_interval: int = DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot: Optional[BaselineSnapshot] = None
+        self._checked_at: Optional[float] = None
+
+    def _is_fresh(self, now: float) -> bool:
+        return (
+            self._snapshot is not None
+            and self._checked_at is not None
+            and now - self._checked_at < self.check_interval
+        )
+
+    def get(self, session=None) -> BaselineSnapshot:
+        """Return the latest snapshot, reloading it if a newer version exists.
+
+        Args:
+            session: Optional SQLAlchemy session (a new one is used if omitted)
+        """
+        if self._is_fresh(time.monotonic()):
+            return self._snapshot
+
+        with self._lock:
+            if self._is_fresh(time.monotonic()):
+                return self._snapshot
+
+            should_close = session is None
+            if should_close:
+                from src.utils.database import get_session
+
+                session = get_session()
+            try:
+                self._snapshot = self._load(session)
+            except Exception as e:
+                logger.error(
+                    f"Error loading forecasting baseline snapshot: {e}", exc_info=True
+                )
+                if self._snapshot is None:
+                    logger.warning("Falling back to hardcoded baselines")
+                    self._snapshot = BaselineSnapshot(
+                        None, get_fallback_baselines(), get_lifecycle_percentages()
+                    )
+            finally:
+                if should_close:
+                    session.close()
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def _load(self, session) -> BaselineSnapshot:
+        """Load the latest snapshot unless the cached one is already current."""
+        from src.models import ForecastingBaselineSnapshot
+
+        version = session.query(func.max(ForecastingBaselineSnapshot.id)).scalar()
+
+        # Unchanged version (including "none stored yet", where the snapshot
+        # computed on first use is kept)
+        if self._snapshot is not None and self._snapshot.version == version:
+            return self._snapshot
+
+        if version is None:
+            logger.warning(
+                "No forecasting baseline snapshot stored yet; computing baselines "
+                "in-process until the next baseline rebuild"
+            )
+            baselines, _ = compute_baselines(session)
+            return BaselineSnapshot(None, baselines, get_lifecycle_percentages())
+
+        row = session.get(ForecastingBaselineSnapshot, version)
+        logger.info(f"Loaded forecasting baseline snapshot v{version}")
+        return BaselineSnapshot.from_row(row)
+
+    def set(self, snapshot: BaselineSnapshot) -> None:
+        """Replace the cached snapshot (after a rebuild in this process)."""
+        with self._lock:
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Force the next ``get`` to check for a newer version."""
+        with self._lock:
+            self._checked_at = None
+
+
+# Singleton instance
+_snapshot_cache: Optional[BaselineSnapshotCache] = None
+
+
+def get_snapshot_cache() -> BaselineSnapshotCache:
+    """Get the per-process baseline snapshot cache."""
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        _snapshot_cache = BaselineSnapshotCache()
+    return _snapshot_cache
+
+
+def get_baseline_snapshot(session=None) -> BaselineSnapshot:
+    """Get the current forecasting baselines.
+
+    Args:
+        session: Optional SQLAlchemy session for the version check/reload
+
+    Returns:
+        The cached BaselineSnapshot for the latest stored version
+    """
+    return get_snapshot_cache().get(session)
+
+
+def rebuild_baseline_snapshot(session=None) -> Optional[Dict[str, Any]]:
+    """Compute baselines from historical data and store them as a new version.
+
+    Args:
+        session: Optional SQLAlchemy session (a new one is used if omitted)
+
+    Returns:
+        Dict with the new version and project_count, or None on error
+    """
+    from src.models import ForecastingBaselineSnapshot
+
+    should_close = session is None
+    if should_close:
+        from src.utils.database import get_session
+
+        session = get_session()
+
+    try:
+        baselines, project_count = compute_baselines(session)
+        row = ForecastingBaselineSnapshot(
+            baselines=baselines,
+            lifecycle_percentages=get_lifecycle_percentages(),
+            project_count=project_count,
+        )
+        session.add(row)
+        session.flush()
+
+        # Keep a short history of versions for comparison/rollback
+        session.query(ForecastingBaselineSnapshot).filter(
+            ForecastingBaselineSnapshot.id <= row.id - SNAPSHOT_RETENTION
+        ).delete(synchronize_session=False)
+        session.commit()
+
+        get_snapshot_cache().set(BaselineSnapshot.from_row(row))
+        logger.info(
+            f"Stored forecasting baseline snapshot v{row.id} "
+            f"({project_count} projects)"
+        )
+        return {"version": row.id, "project_count": project_count}
+
+    except Exception as e:
+        logger.error(
+            f"Error rebuilding forecasting baseline snapshot: {e}", exc_info=True
+        )
+        session.rollback()
+        return None
+    finally:
+        if should_close:
+            session.close()
@@ -7,7 +7,6 @@ import csv
 import warnings
 import logging
 from pathlib import Path
-from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -17,244 +16,52 @@ class ForecastingService:
     """Calculate epic forecasts based on project characteristics and historical baselines."""
 
     def __init__(self, session: Session = None):
-        """Initialize forecasting service with baseline data.
+        """Initialize forecasting service.
+
+        Baselines come from the shared materialized snapshot (see
+        src.services.forecasting_baselines), so construction runs no queries.
 
         Args:
             session: Optional SQLAlchemy session for database queries.
                     If not provided, will create a new session when needed.
         """
         self.session = session
-        self.baselines = self._load_baselines()
-        # DEPRECATED: Replaced with learned temporal patterns from TemporalPatternService
-        self.lifecycle_percentages = self._load_lifecycle_percentages()
-        # NEW: Use learned patterns from historical data
-        from src.services.temporal_pattern_service import TemporalPatternService
-        from src.services.characteristic_impact_service import (
-            CharacteristicImpactService,
-        )
-
-        self.temporal_pattern_service = TemporalPatternService()
-        self.characteristic_impact_service = CharacteristicImpactService()
-
-    def _load_baselines(self) -> Dict[str, Dict[str, float]]:
-        """
-        Load baseline hours from database by querying historical epic hours data.
-
-        Queries epic_hours table filtered by project_forecasting_config:
-        - Only includes projects where include_in_forecasting=True
-        - Only includes hours within forecasting_start_date to forecasting_end_date
-        - Aggregates total hours by team across all historical projects
-        - Separates into two baseline sets based on project characteristics:
-          * no_integration: Projects with be_integrations <= 2
-          * with_integration: Projects with be_integrations >= 4
-          * Medium projects (be_integrations = 3) contribute to both baselines
-
-        Returns:
-            Dictionary with two baseline sets (no_integration, with_integration),
-            each containing total hours by team.
-        """
-        from src.models import (
-            EpicHours,
-            ProjectForecastingConfig,
-            ProjectCharacteristics,
-        )
-        from src.utils.database import get_session
-
-        # Use provided session or create new one
-        if self.session:
-            session = self.session
-            should_close = False
-        else:
-            session = get_session()
-            should_close = True
-
-        try:
-            # Query epic hours filtered by forecasting config
-            query = (
-                session.query(
-                    EpicHours.project_key,
-                    EpicHours.team,
-                    func.sum(EpicHours.hours).label("total_hours"),
-                    ProjectCharacteristics.be_integrations,
-                )
-                .join(
-                    ProjectForecastingConfig,
-                    EpicHours.project_key == ProjectForecastingConfig.project_key,
-                )
-                .join(
-                    ProjectCharacteristics,
-                    EpicHours.project_key == ProjectCharacteristics.project_key,
-                )
-                .filter(
-                    ProjectForecastingConfig.include_in_forecasting == True,
-                    EpicHours.month >= ProjectForecastingConfig.forecasting_start_date,
-                    EpicHours.month <= ProjectForecastingConfig.forecasting_end_date,
-                )
-                .group_by(
-                    EpicHours.project_key,
-                    EpicHours.team,
-                    ProjectCharacteristics.be_integrations,
-                )
-            )
-
-            results = query.all()
-
-            if not results:
-                logger.warning(
-                    "No historical data found in database. Using fallback hardcoded baselines. "
-                    "Make sure to import historical projects via Analytics → Import Historical Data."
-                )
-                return self._get_fallback_baselines()
-
-            logger.info(
-                f"Loaded {len(results)} project-team combinations from database for baseline calculation"
+        self._temporal_pattern_service = None
+        self._characteristic_impact_service = None
+
+    @property
+    def baselines(self) -> Dict[str, Dict[str, float]]:
+        """Average hours per team for each baseline set (latest snapshot)."""
+        from src.services.forecasting_baselines import get_baseline_snapshot
+
+        return get_baseline_snapshot(self.session).baselines
+
+    @property
+    def lifecycle_percentages(self) -> Dict[str, Dict[str, float]]:
+        """DEPRECATED: Replaced with learned temporal patterns from TemporalPatternService."""
+        from src.services.forecasting_baselines import get_baseline_snapshot
+
+        return get_baseline_snapshot(self.session).lifecycle_percentages
+
+    @property
+    def temporal_pattern_service(self):
+        """Learned temporal patterns from historical data (created on first use)."""
+        if self._temporal_pattern_service is None:
+            from src.services.temporal_pattern_service import TemporalPatternService
+
+            self._temporal_pattern_service = TemporalPatternService()
+        return self._temporal_pattern_service
+
+    @property
+    def characteristic_impact_service(self):
+        """Learned characteristic impacts from historical data (created on first use)."""
+        if self._characteristic_impact_service is None:
+            from src.services.characteristic_impact_service import (
+                CharacteristicImpactService,
             )
 
-            # Aggregate by team and baseline category
-            no_integration_totals = {}  # be_integrations <= 2
-            with_integration_totals = {}  # be_integrations >= 4
-            no_integration_counts = {}
-            with_integration_counts = {}
-
-            for project_key, team, total_hours, be_integrations in results:
-                # Categorize projects by BE integrations level
-                if be_integrations <= 2:
-                    # Low integration projects
-                    no_integration_totals[team] = (
-                        no_integration_totals.get(team, 0.0) + total_hours
-                    )
-                    no_integration_counts[team] = no_integration_counts.get(team, 0) + 1
-                elif be_integrations >= 4:
-                    # High integration projects
-                    with_integration_totals[team] = (
-                        with_integration_totals.get(team, 0.0) + total_hours
-                    )
-                    with_integration_counts[team] = (
-                        with_integration_counts.get(team, 0) + 1
-                    )
-                else:
-                    # Medium projects (be_integrations = 3) contribute to BOTH baselines
-                    no_integration_totals[team] = (
-                        no_integration_totals.get(team, 0.0) + total_hours
-                    )
-                    no_integration_counts[team] = no_integration_counts.get(team, 0) + 1
-                    with_integration_totals[team] = (
-                        with_integration_totals.get(team, 0.0) + total_hours
-                    )
-                    with_integration_counts[team] = (
-                        with_integration_counts.get(team, 0) + 1
-                    )
-
-            # Calculate averages per project
-            baselines = {"no_integration": {}, "with_integration": {}}
-
-            # Calculate no_integration baselines (average hours per project)
-            for team, total_hours in no_integration_totals.items():
-                count = no_integration_counts[team]
-                baselines["no_integration"][team] = round(total_hours / count, 2)
-
-            # Calculate with_integration baselines (average hours per project)
-            for team, total_hours in with_integration_totals.items():
-                count = with_integration_counts[team]
-                baselines["with_integration"][team] = round(total_hours / count, 2)
-
-            # Ensure all standard teams are present in both baselines (use Data team estimate if missing)
-            standard_teams = ["BE Devs", "FE Devs", "Design", "UX", "PMs", "Data"]
-            for baseline_set in ["no_integration", "with_integration"]:
-                for team in standard_teams:
-                    if team not in baselines[baseline_set]:
-                        # Use fallback estimate for missing teams
-                        fallback = self._get_fallback_baselines()[baseline_set].get(
-                            team, 50.0
-                        )
-                        baselines[baseline_set][team] = fallback
-                        logger.warning(
-                            f"No historical data for {team} in {baseline_set} projects. "
-                            f"Using fallback estimate: {fallback}h"
-                        )
-
-            logger.info(
-                f"Calculated baselines from database:\n"
-                f"  No Integration: {baselines['no_integration']}\n"
-                f"  With Integration: {baselines['with_integration']}"
-            )
-
-            return baselines
-
-        except Exception as e:
-            logger.error(f"Error loading baselines from database: {e}", exc_info=True)
-            logger.warning("Falling back to hardcoded baselines")
-            return self._get_fallback_baselines()
-        finally:
-            if should_close:
-                session.close()
-
-    def _get_fallback_baselines(self) -> Dict[str, Dict[str, float]]:
-        """
-        Fallback hardcoded baselines (used only if database query fails).
-
-        Based on original 3 projects:
-        - With integrations: SRLK project (BE=733h, FE=679h, balanced)
-        - Without integrations: BIGO+BMBY average (BE=40h, FE=856h, FE-heavy)
-        """
-        return {
-            "no_integration": {
-                "BE Devs": 40.0,  # Minimal backend work
-                "FE Devs": 856.0,  # Heavy frontend
-                "Design": 102.0,  # Significant design
-                "UX": 62.0,  # UX research
-                "PMs": 316.0,  # Project management
-                "Data": 50.0,  # Estimate (no data)
-            },
-            "with_integration": {
-                "BE Devs": 733.0,  # Heavy backend (18x more than no-integration)
-                "FE Devs": 679.0,  # Balanced with BE
-                "Design": 78.0,  # Less design (already have patterns)
-                "UX": 34.0,  # Less UX (already researched)
-                "PMs": 215.0,  # PM oversight
-                "Data": 100.0,  # Estimate (no data)
-            },
-        }
-
-    def _load_lifecycle_percentages(self) -> Dict[str, Dict[str, float]]:
-        """
-        Load lifecycle distribution percentages based on ACTUAL historical data.
-
-        Design/UX use chronological front-loading analysis (first 30% of months)
-        Dev/PM teams use peak-based analysis (find highest-hours month)
-
-        Real patterns from BIGO, BMBY, SRLK projects:
-        - Design: 52% ramp up, 35% busy, 13% ramp down (HEAVY first months)
-        - UX: 57% ramp up, 29% busy, 14% ramp down (HEAVY first months)
-        - FE Devs: 1% ramp up, 77% peak, 22% ramp down (waits for design, then peaks)
-        - BE Devs: 17% ramp up, 55% peak, 28% ramp down (gradual ramp, sustained)
-        - PMs: 14% ramp up, 56% peak, 30% ramp down (sustained throughout)
-
-        Examples:
-        - BMBY Design (3mo): Month 1 = 67%, Month 2 = 25%, Month 3 = 7%
-        - BMBY UX (3mo): Month 1 = 64%, Month 2 = 24%, Month 3 = 13%
-
-        Source: scripts/calculate_actual_lifecycle_distributions.py
-        """
-        return {
-            # Based on 3 projects: 16.5% / 55.2% / 28.3%
-            # BE has gradual ramp-up and sustained tail
-            "BE Devs": {"ramp_up": 17.0, "busy": 55.0, "ramp_down": 28.0},
-            # Based on 3 projects: 1.3% / 76.8% / 21.9%
-            # FE waits for design approval, then concentrates work in peak period
-            "FE Devs": {"ramp_up": 1.0, "busy": 77.0, "ramp_down": 22.0},
-            # Based on real data: 70-80% of ALL Design work done in first 2 months
-            # Heavily front-loaded - most design completed early, minimal work later
-            "Design": {"ramp_up": 80.0, "busy": 15.0, "ramp_down": 5.0},
-            # Based on 3 projects: 57.1% / 28.5% / 14.3%
-            # UX front-loads research/strategy in first 30% of timeline
-            "UX": {"ramp_up": 57.0, "busy": 29.0, "ramp_down": 14.0},
-            # Based on 3 projects: 14.1% / 55.5% / 30.4%
-            # PMs sustained throughout with slight early emphasis
-            "PMs": {"ramp_up": 14.0, "busy": 56.0, "ramp_down": 30.0},
-            # No historical data available - using balanced estimate
-            "Data": {"ramp_up": 20.0, "busy": 60.0, "ramp_down": 20.0},
-        }
+            self._characteristic_impact_service = CharacteristicImpactService()
+        return self._characteristic_impact_service
 
     def calculate_forecast(
         self,
@@ -15,6 +15,7 @@ from src.models import (
     MeetingMetadata,
 )
 from src.integrations.github_client import GitHubClient
+from src.services.insight_stats import invalidate_insight_stats
 from src.utils.database import session_scope, get_db
 
 logger = logging.getLogger(__name__)
@@ -778,6 +779,7 @@ class InsightDetector:
 
             self.db.commit()
             logger.info(f"Stored {len(insights)} insights")
+            invalidate_insight_stats(insight.user_id for insight in insights)
             return len(insights)
 
         except Exception as e:
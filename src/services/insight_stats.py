@@ -0,0 +1,135 @@
+"""Per-user proactive insight statistics.
+
+Builds the counts behind ``GET /api/insights/stats`` (polled by the UI's
+insight badge). Severity, type, dismissed and acted-on counts come from a
+single aggregate query with ``FILTER`` clauses grouped by insight type, and
+the result is cached per user until one of their insights or watched
+projects changes (callers use ``invalidate_insight_stats``).
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import and_, func, select
+
+from src.models import ProactiveInsight, UserWatchedProject
+from src.utils.cache_manager import get_cache_manager
+
+logger = logging.getLogger(__name__)
+
+# Cache key prefix (keys are api_cache:insight_stats:user:{user_id}:...)
+CACHE_PREFIX = "insight_stats"
+
+# Seconds a user's stats stay cached. Detection, dismiss/act and watch changes
+# invalidate immediately; edits made to proactive_insights any other way
+# (cleanup scripts, manual fixes) show up within this window.
+CACHE_TTL = 300
+
+SEVERITIES = ("critical", "warning", "info")
+
+
+def build_insight_stats(
+    session, user_id: int, all_projects: bool = False
+) -> Dict[str, Any]:
+    """
+    Compute insight statistics for a user in one aggregate query.
+
+    Args:
+        session: SQLAlchemy session
+        user_id: User whose insights are counted
+        all_projects: Count insights for every project instead of only the
+            user's watched projects
+
+    Returns:
+        Dict with total_insights, by_severity, by_type, dismissed_count and
+        acted_on_count (total, severity and type count non-dismissed insights)
+    """
+    active = ProactiveInsight.dismissed_at.is_(None)
+    stmt = select(
+        ProactiveInsight.insight_type,
+        func.count().filter(active).label("active"),
+        *[
+            func.count()
+            .filter(and_(active, ProactiveInsight.severity == severity))
+            .label(severity)
+            for severity in SEVERITIES
+        ],
+        func.count()
+        .filter(ProactiveInsight.dismissed_at.isnot(None))
+        .label("dismissed"),
+        func.count().filter(ProactiveInsight.acted_on_at.isnot(None)).label("acted_on"),
+    ).where(ProactiveInsight.user_id == user_id)
+
+    if not all_projects:
+        # No watched projects means an empty IN and all-zero stats
+        watched_keys = select(UserWatchedProject.project_key).where(
+            UserWatchedProject.user_id == user_id
+        )
+        stmt = stmt.where(ProactiveInsight.project_key.in_(watched_keys))
+
+    stmt = stmt.group_by(ProactiveInsight.insight_type)
+
+    stats = {
+        "total_insights": 0,
+        "by_severity": {severity: 0 for severity in SEVERITIES},
+        "by_type": {},
+        "dismissed_count": 0,
+        "acted_on_count": 0,
+    }
+    for row in session.execute(stmt):
+        stats["total_insights"] += row.active
+        for severity in SEVERITIES:
+            stats["by_severity"][severity] += getattr(row, severity)
+        if row.active:
+            stats["by_type"][row.insight_type] = row.active
+        stats["dismissed_count"] += row.dismissed
+        stats["acted_on_count"] += row.acted_on
+
+    return stats
+
+
+def get_insight_stats(
+    session, user_id: int, all_projects: bool = False
+) -> Dict[str, Any]:
+    """
+    Get the (cached) insight statistics for a user.
+
+    Args:
+        session: SQLAlchemy session (used on cache miss)
+        user_id: User whose insights are counted
+        all_projects: Count insights for every project (admin view)
+
+    Returns:
+        Stats dict (see ``build_insight_stats``)
+    """
+    cache = get_cache_manager()
+
+    cached = cache.get(CACHE_PREFIX, user_id=user_id, all_projects=all_projects)
+    if cached is not None:
+        return cached["data"]
+
+    stats = build_insight_stats(session, user_id, all_projects)
+    cache.set(
+        stats, CACHE_PREFIX, CACHE_TTL, user_id=user_id, all_projects=all_projects
+    )
+    return stats
+
+
+def invalidate_insight_stats(user_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Drop cached insight stats after insights or watched projects change.
+
+    Args:
+        user_ids: Users to drop, or None for all users
+
+    Returns:
+        Number of keys deleted
+    """
+    cache = get_cache_manager()
+    if user_ids is None:
+        return cache.invalidate(f"api_cache:{CACHE_PREFIX}:*")
+
+    deleted = 0
+    for user_id in set(user_ids):
+        deleted += cache.invalidate(f"api_cache:{CACHE_PREFIX}:user:{user_id}:*")
+    return deleted
@@ -14,6 +14,41 @@ from sqlalchemy import func, and_
 logger = logging.getLogger(__name__)
 
 
+def _strip_code_fences(response_text: str) -> str:
+    """Extract the JSON body from a response that may be wrapped in markdown."""
+    response_text = response_text.strip()
+
+    # Try to extract JSON from markdown code blocks
+    if response_text.startswith("```json"):
+        # Remove ```json from start
+        response_text = response_text[7:].strip()
+        # Remove trailing ```
+        if response_text.endswith("```"):
+            response_text = response_text[:-3].strip()
+    elif response_text.startswith("```"):
+        # Generic code block
+        response_text = response_text[3:].strip()
+        if response_text.endswith("```"):
+            response_text = response_text[:-3].strip()
+    elif "```json" in response_text:
+        # Extract content between ```json and ``` (for inline code blocks)
+        start = response_text.find("```json") + 7
+        end = response_text.find("```", start)
+        if end > start:
+            response_text = response_text[start:end].strip()
+
+    return response_text
+
+
+def _parse_forecast_json(response_text: str) -> Dict[str, Any]:
+    """Strictly parse a forecast response (no truncation/regex recovery).
+
+    Used to decide whether a response may be cached: answers that only parse
+    after repair are still used once, but never replayed from the cache.
+    """
+    return json.loads(_strip_code_fences(response_text))
+
+
 class IntelligentForecastingService:
     """AI-powered forecasting service that analyzes similar historical projects."""
 
@@ -195,7 +230,9 @@ class IntelligentForecastingService:
         """
         Find historical projects with similar characteristics.
 
-        Uses Euclidean distance in characteristic space to find most similar projects.
+        Uses Euclidean distance in characteristic space (via the shared
+        precomputed SimilarProjectIndex) to find the most similar projects,
+        then loads hour breakdowns for just those projects in one query.
 
         Args:
             target_characteristics: Characteristics of new project (1-5 scale)
@@ -204,118 +241,51 @@ class IntelligentForecastingService:
         Returns:
             List of similar projects with their data, sorted by similarity
         """
-        from src.models import (
-            ProjectCharacteristics,
-            ProjectForecastingConfig,
-            EpicHours,
-        )
-
-        # Query all projects with forecasting configs
-        query = (
-            self.session.query(ProjectCharacteristics, ProjectForecastingConfig)
-            .join(
-                ProjectForecastingConfig,
-                ProjectCharacteristics.project_key
-                == ProjectForecastingConfig.project_key,
-            )
-            .filter(ProjectForecastingConfig.include_in_forecasting == True)
-        )
+        from src.services.similar_project_index import get_similar_project_index
 
-        results = query.all()
+        index = get_similar_project_index(self.session)
+        nearest = index.nearest(target_characteristics, limit=limit)
 
-        if not results:
+        if not nearest:
             return []
 
-        # Calculate similarity scores using Euclidean distance
-        similar_projects = []
-        for char, config in results:
-            # Calculate distance in 6-dimensional characteristic space
-            distance_squared = sum(
-                [
-                    (getattr(char, key, 3) - target_characteristics.get(key, 3)) ** 2
-                    for key in [
-                        "be_integrations",
-                        "custom_theme",
-                        "custom_designs",
-                        "ux_research",
-                        "extensive_customizations",
-                        "project_oversight",
-                    ]
-                ]
-            )
-
-            # Convert distance to similarity score (0-1, where 1 = identical)
-            # Max possible distance = sqrt(6 * 4^2) = sqrt(96) ≈ 9.8
-            # Normalize to 0-1 range
-            similarity_score = max(0, 1 - (distance_squared**0.5) / 9.8)
-
-            # Get team hours for this project (use ALL project hours, not filtered by forecast dates)
-            team_hours = (
-                self.session.query(
-                    EpicHours.team, func.sum(EpicHours.hours).label("total_hours")
-                )
-                .filter(
-                    EpicHours.project_key == char.project_key,
-                )
-                .group_by(EpicHours.team)
-                .all()
-            )
-
-            # Get monthly distribution for this project (use ALL months)
-            monthly_hours = (
-                self.session.query(
-                    EpicHours.month,
-                    EpicHours.team,
-                    func.sum(EpicHours.hours).label("hours"),
-                )
-                .filter(
-                    EpicHours.project_key == char.project_key,
-                )
-                .group_by(EpicHours.month, EpicHours.team)
-                .order_by(EpicHours.month)
-                .all()
-            )
+        breakdowns = self._load_project_breakdowns(
+            [project_key for project_key, _ in nearest]
+        )
 
-            # Get epic breakdown for this project (use ALL epics)
-            epic_breakdown = (
-                self.session.query(
-                    EpicHours.epic_category, func.sum(EpicHours.hours).label("hours")
-                )
-                .filter(
-                    EpicHours.project_key == char.project_key,
-                    EpicHours.epic_category.isnot(None),
-                )
-                .group_by(EpicHours.epic_category)
-                .all()
-            )
+        similar_projects = []
+        for project_key, similarity_score in nearest:
+            breakdown = breakdowns.get(project_key) or {
+                "team_hours": {},
+                "monthly_hours": {},
+                "epic_breakdown": {},
+            }
+            team_hours = breakdown["team_hours"]
+            monthly_hours = sorted(breakdown["monthly_hours"].items())
 
-            total_project_hours = sum(hours for _, hours in team_hours)
+            total_project_hours = sum(team_hours.values())
 
             # Calculate actual project date range from monthly data
-            months = [month for month, _, _ in monthly_hours]
+            months = [month for (month, _), _ in monthly_hours]
             project_start = str(min(months)) if months else "N/A"
             project_end = str(max(months)) if months else "N/A"
 
             similar_projects.append(
                 {
-                    "project_key": char.project_key,
-                    "similarity_score": round(similarity_score, 3),
-                    "characteristics": {
-                        "be_integrations": char.be_integrations,
-                        "custom_theme": char.custom_theme,
-                        "custom_designs": char.custom_designs,
-                        "ux_research": char.ux_research,
-                        "extensive_customizations": char.extensive_customizations,
-                        "project_oversight": char.project_oversight,
-                    },
+                    "project_key": project_key,
+                    "similarity_score": similarity_score,
+                    "characteristics": dict(index.characteristics[project_key]),
                     "total_hours": round(total_project_hours, 2),
-                    "team_hours": {team: round(hours, 2) for team, hours in team_hours},
+                    "team_hours": {
+                        team: round(hours, 2) for team, hours in team_hours.items()
+                    },
                     "monthly_distribution": [
                         {"month": str(month), "team": team, "hours": round(hours, 2)}
-                        for month, team, hours in monthly_hours
+                        for (month, team), hours in monthly_hours
                     ],
                     "epic_breakdown": {
-                        category: round(hours, 2) for category, hours in epic_breakdown
+                        category: round(hours, 2)
+                        for category, hours in breakdown["epic_breakdown"].items()
                     },
                     "date_range": {
                         "start": project_start,
@@ -324,9 +294,64 @@ class IntelligentForecastingService:
                 }
             )
 
-        # Sort by similarity (most similar first) and return top N
-        similar_projects.sort(key=lambda x: x["similarity_score"], reverse=True)
-        return similar_projects[:limit]
+        return similar_projects
+
+    def _load_project_breakdowns(
+        self, project_keys: List[str]
+    ) -> Dict[str, Dict[str, Dict]]:
+        """
+        Load team, monthly and epic-category hour totals for several projects.
+
+        Uses ALL project hours (not filtered by forecast dates), aggregated in
+        a single grouped query.
+
+        Args:
+            project_keys: Projects to load
+
+        Returns:
+            Dict mapping project_key to:
+                - team_hours: {team: hours}
+                - monthly_hours: {(month, team): hours}
+                - epic_breakdown: {epic_category: hours}
+        """
+        from src.models import EpicHours
+
+        rows = (
+            self.session.query(
+                EpicHours.project_key,
+                EpicHours.month,
+                EpicHours.team,
+                EpicHours.epic_category,
+                func.sum(EpicHours.hours).label("hours"),
+            )
+            .filter(EpicHours.project_key.in_(project_keys))
+            .group_by(
+                EpicHours.project_key,
+                EpicHours.month,
+                EpicHours.team,
+                EpicHours.epic_category,
+            )
+            .all()
+        )
+
+        breakdowns: Dict[str, Dict[str, Dict]] = {}
+        for project_key, month, team, epic_category, hours in rows:
+            breakdown = breakdowns.setdefault(
+                project_key,
+                {"team_hours": {}, "monthly_hours": {}, "epic_breakdown": {}},
+            )
+            hours = hours or 0.0
+            team_hours = breakdown["team_hours"]
+            team_hours[team] = team_hours.get(team, 0.0) + hours
+            monthly_hours = breakdown["monthly_hours"]
+            monthly_hours[(month, team)] = monthly_hours.get((month, team), 0.0) + hours
+            if epic_category is not None:
+                epic_breakdown = breakdown["epic_breakdown"]
+                epic_breakdown[epic_category] = (
+                    epic_breakdown.get(epic_category, 0.0) + hours
+                )
+
+        return breakdowns
 
     def _build_historical_context(self, similar_projects: List[Dict[str, Any]]) -> str:
         """
@@ -712,26 +737,7 @@ IMPORTANT:
             logger.info(f"Raw AI response (first 500 chars): {response_text[:500]}...")
 
             # Parse AI response with robust JSON extraction
-            response_text = response_text.strip()
-
-            # Try to extract JSON from markdown code blocks
-            if response_text.startswith("```json"):
-                # Remove ```json from start
-                response_text = response_text[7:].strip()
-                # Remove trailing ```
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3].strip()
-            elif response_text.startswith("```"):
-                # Generic code block
-                response_text = response_text[3:].strip()
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3].strip()
-            elif "```json" in response_text:
-                # Extract content between ```json and ``` (for inline code blocks)
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                if end > start:
-                    response_text = response_text[start:end].strip()
+            response_text = _strip_code_fences(response_text)
 
             # Log cleaned response for debugging
             logger.info(f"Cleaned response (first 500 chars): {response_text[:500]}...")
@@ -854,43 +860,69 @@ IMPORTANT:
             }
 
     def _call_openai(self, prompt: str) -> str:
-        """Call OpenAI API."""
+        """Call OpenAI API (through the LLM response cache)."""
         from openai import OpenAI
         from config.settings import settings
+        from src.services.llm_gateway import complete
+
+        model = settings.ai.model or "gpt-4"
+        messages = [
+            {
+                "role": "system",
+                "content": "You are an expert software project forecaster with deep knowledge of team dynamics and project planning.",
+            },
+            {"role": "user", "content": prompt},
+        ]
+        params = {
+            "temperature": 0.0,  # Deterministic - ensures consistent forecasts for same inputs
+            "max_tokens": 2000,
+        }
 
-        client = OpenAI(api_key=settings.ai.api_key)
-
-        response = client.chat.completions.create(
-            model=settings.ai.model or "gpt-4",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert software project forecaster with deep knowledge of team dynamics and project planning.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.0,  # Deterministic - ensures consistent forecasts for same inputs
-            max_tokens=2000,
+        def call() -> str:
+            client = OpenAI(api_key=settings.ai.api_key)
+            response = client.chat.completions.create(
+                model=model, messages=messages, **params
+            )
+            return response.choices[0].message.content
+
+        return complete(
+            "ai_forecast",
+            "openai",
+            model,
+            messages,
+            call,
+            params=params,
+            validate=_parse_forecast_json,
         )
 
-        return response.choices[0].message.content
-
     def _call_anthropic(self, prompt: str) -> str:
-        """Call Anthropic (Claude) API."""
+        """Call Anthropic (Claude) API (through the LLM response cache)."""
         from anthropic import Anthropic
         from config.settings import settings
+        from src.services.llm_gateway import complete
 
-        client = Anthropic(api_key=settings.ai.api_key)
+        model = settings.ai.model or "claude-3-5-sonnet-20241022"
+        messages = [{"role": "user", "content": prompt}]
+        params = {
+            "max_tokens": 2000,
+            "temperature": 0.0,  # Deterministic - ensures consistent forecasts for same inputs
+        }
 
-        response = client.messages.create(
-            model=settings.ai.model or "claude-3-5-sonnet-20241022",
-            max_tokens=2000,
-            temperature=0.0,  # Deterministic - ensures consistent forecasts for same inputs
-            messages=[{"role": "user", "content": prompt}],
+        def call() -> str:
+            client = Anthropic(api_key=settings.ai.api_key)
+            response = client.messages.create(model=model, messages=messages, **params)
+            return response.content[0].text
+
+        return complete(
+            "ai_forecast",
+            "anthropic",
+            model,
+            messages,
+            call,
+            params=params,
+            validate=_parse_forecast_json,
         )
 
-        return response.content[0].text
-
     def _structure_ai_forecast(
         self,
         ai_forecast: Dict[str, Any],
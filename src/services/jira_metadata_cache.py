@@ -0,0 +1,301 @@
+"""Cached Jira metadata lookups behind a long-lived Jira client.
+
+Form renders hit the metadata routes (issue types, users, priorities,
+statuses, project metadata, epics) constantly, and each call used to build a
+fresh ``JiraMCPClient`` inside ``asyncio.run`` - a new TLS handshake plus a
+live Jira round trip per click. This module provides:
+
+- ``JiraClientRunner``: one ``JiraMCPClient`` per worker process, living on a
+  dedicated event loop thread so its HTTP connections are reused across
+  requests (recreated after a fork).
+- ``JiraMetadataCache``: Redis-backed read-through cache with per-resource
+  TTLs and single-flight refresh (one fetch per key within a process, and a
+  short Redis lock so other workers wait for the cache instead of also
+  calling Jira).
+- ``invalidate_jira_metadata``: explicit invalidation for write paths.
+
+Redis being unavailable degrades to live fetches, as with ``cached_endpoint``.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.integrations.jira_mcp import JiraMCPClient
+from src.utils.cache_manager import get_cache_manager
+
+logger = logging.getLogger(__name__)
+
+# Cache TTL (seconds) per metadata resource
+RESOURCE_TTLS = {
+    "issue_types": 3600,
+    "priorities": 86400,
+    "statuses": 3600,
+    "users": 900,
+    "user_search": 300,
+    "project_metadata": 1800,
+    "epics": 300,
+}
+DEFAULT_TTL = 600
+
+# Cross-worker refresh lock and how long followers wait for the leader
+REFRESH_LOCK_TTL = 30
+REFRESH_WAIT_SECONDS = 10.0
+REFRESH_POLL_INTERVAL = 0.1
+
+# Upper bound for a single Jira call made through the shared client
+FETCH_TIMEOUT = 60.0
+
+CACHE_PREFIX = "jira_meta"
+
+JiraFetch = Callable[[JiraMCPClient], Awaitable[Any]]
+
+
+class JiraClientRunner:
+    """Runs coroutines against one long-lived JiraMCPClient.
+
+    Flask handlers are synchronous, so the client lives on a private event
+    loop in a daemon thread and callers submit work with ``run``. The
+    loop/client pair is rebuilt if the process has forked since it started.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[JiraMCPClient] = None
+        self._pid: Optional[int] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread if needed and return the loop."""
+        if (
+            self._loop is not None
+            and self._pid == os.getpid()
+            and self._thread.is_alive()
+        ):
+            return self._loop
+
+        with self._lock:
+            if (
+                self._loop is None
+                or self._pid != os.getpid()
+                or not self._thread.is_alive()
+            ):
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="jira-metadata-client",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._client = None
+                self._pid = os.getpid()
+            return self._loop
+
+    def _get_client(self) -> JiraMCPClient:
+        """Create the shared client on first use (runs on the loop thread)."""
+        if self._client is None:
+            from config.settings import settings
+
+            self._client = JiraMCPClient(
+                jira_url=settings.jira.url,
+                username=settings.jira.username,
+                api_token=settings.jira.api_token,
+            )
+        return self._client
+
+    async def _call(self, fetch: JiraFetch) -> Any:
+        return await fetch(self._get_client())
+
+    def run(self, fetch: JiraFetch, timeout: float = FETCH_TIMEOUT) -> Any:
+        """Run ``fetch(client)`` on the shared client and return its result.
+
+        Args:
+            fetch: Async callable taking the JiraMCPClient
+            timeout: Seconds to wait for the result
+
+        Returns:
+            Whatever ``fetch`` returns
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._call(fetch), loop)
+        return future.result(timeout=timeout)
+
+    def close(self) -> None:
+        """Close the shared client and stop the event loop thread."""
+        with self._lock:
+            loop, client = self._loop, self._client
+            self._loop = self._thread = self._client = None
+            self._pid = None
+
+        if loop is None or not loop.is_running():
+            return
+        if client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(client.client.aclose(), loop).result(
+                    timeout=5
+                )
+            except Exception as e:
+                logger.warning(f"Error closing shared Jira client: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class JiraMetadataCache:
+    """Read-through Redis cache for Jira metadata with single-flight refresh."""
+
+    def __init__(
+        self,
+        runner: Optional[JiraClientRunner] = None,
+        ttls: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            runner: Client runner to fetch with (defaults to a new one)
+            ttls: Per-resource TTL overrides
+        """
+        self.runner = runner or JiraClientRunner()
+        self.ttls = {**RESOURCE_TTLS, **(ttls or {})}
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(
+        resource: str, project_key: Optional[str], params: Dict[str, Any]
+    ) -> str:
+        """Build the cache key prefix for a request.
+
+        The project key stays readable so writes can invalidate one
+        project's entries by pattern; other parameters (e.g. a user search
+        query) are identified by a full SHA-256 digest rather than
+        CacheManager's short params hash, so distinct requests can't collide.
+        """
+        key = f"{CACHE_PREFIX}:{resource}:{project_key or '_'}"
+        if params:
+            payload = json.dumps(params, sort_keys=True, default=str)
+            key += f":{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+        return key
+
+    def get(
+        self,
+        resource: str,
+        fetch: JiraFetch,
+        project_key: Optional[str] = None,
+        **params,
+    ) -> Any:
+        """Return cached metadata, fetching from Jira on a miss.
+
+        Args:
+            resource: Resource name (a key of RESOURCE_TTLS)
+            fetch: Async callable taking the JiraMCPClient
+            project_key: Optional project the metadata belongs to
+            **params: Other request parameters that vary the result
+
+        Returns:
+            The cached or freshly fetched metadata
+        """
+        cache = get_cache_manager()
+        key = self._cache_key(resource, project_key, params)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return cached["data"]
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            return future.result(timeout=FETCH_TIMEOUT)
+
+        try:
+            data = self._refresh(resource, key, fetch)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _refresh(self, resource: str, key: str, fetch: JiraFetch) -> Any:
+        """Fetch from Jira and store, unless another worker is already doing so."""
+        cache = get_cache_manager()
+        lock_name = f"refresh:{key}"
+
+        locked = cache.acquire_lock(lock_name, REFRESH_LOCK_TTL)
+        if not locked:
+            deadline = time.monotonic() + REFRESH_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(REFRESH_POLL_INTERVAL)
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached["data"]
+            logger.warning(f"Timed out waiting for {key}; fetching directly")
+
+        try:
+            data = self.runner.run(fetch)
+            # JiraMCPClient returns empty results on errors; don't pin those
+            if data:
+                cache.set(data, key, self.ttls.get(resource, DEFAULT_TTL))
+            return data
+        finally:
+            if locked:
+                cache.release_lock(lock_name)
+
+    def invalidate(
+        self, resource: Optional[str] = None, project_key: Optional[str] = None
+    ) -> int:
+        """Drop cached metadata.
+
+        Args:
+            resource: Resource to drop (all resources if None)
+            project_key: Project to drop (all projects if None)
+
+        Returns:
+            Number of keys deleted
+        """
+        cache = get_cache_manager()
+        base = f"api_cache:{CACHE_PREFIX}:{resource or '*'}"
+        if project_key is None:
+            return cache.invalidate(f"{base}:*")
+        return cache.invalidate(f"{base}:{project_key}") + cache.invalidate(
+            f"{base}:{project_key}:*"
+        )
+
+
+# Singleton instance
+_metadata_cache: Optional[JiraMetadataCache] = None
+
+
+def get_jira_metadata_cache() -> JiraMetadataCache:
+    """Get the per-process Jira metadata cache."""
+    global _metadata_cache
+    if _metadata_cache is None:
+        _metadata_cache = JiraMetadataCache()
+    return _metadata_cache
+
+
+def invalidate_jira_metadata(
+    resource: Optional[str] = None, project_key: Optional[str] = None
+) -> int:
+    """Invalidate cached Jira metadata after a write.
+
+    Args:
+        resource: Resource to drop (e.g. 'epics'), or None for all
+        project_key: Project to drop, or None for all projects
+
+    Returns:
+        Number of keys deleted
+    """
+    return get_jira_metadata_cache().invalidate(resource, project_key)
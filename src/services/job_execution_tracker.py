@@ -25,17 +25,21 @@ Usage:
 import logging
 import traceback
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from celery import Task
 
-from src.models.job_execution import JobExecution
+from src.models.job_execution import JobExecution, JobExecutionRollup
 from src.config.job_monitoring_config import get_job_config, JOBS
 
 logger = logging.getLogger(__name__)
 
+# Terminal statuses counted as failures in rollups and digests
+FAILURE_STATUSES = ("failed", "timeout", "cancelled")
+
 
 class JobExecutionTracker:
     """Tracks execution lifecycle of Celery Beat scheduled jobs.
@@ -145,6 +149,17 @@ class JobExecutionTracker:
         """
         self._result_data = result_data
 
+    def _previous_outcome(self) -> Tuple[Optional[str], Optional[int]]:
+        """Return the status/duration already rolled up for this execution.
+
+        A reused execution record (Celery retry) may already have finished
+        once; its earlier outcome is backed out of the rollup before the new
+        one is added.
+        """
+        if self.execution.status in ("success", *FAILURE_STATUSES):
+            return self.execution.status, self.execution.duration_seconds
+        return None, None
+
     def complete(
         self,
         result_data: Optional[Dict[str, Any]] = None,
@@ -170,6 +185,7 @@ class JobExecutionTracker:
 
             completed_at = datetime.now(timezone.utc)
             duration = int((completed_at - self.execution.started_at).total_seconds())
+            previous_status, previous_duration = self._previous_outcome()
 
             self.execution.status = "success"
             self.execution.completed_at = completed_at
@@ -187,6 +203,9 @@ class JobExecutionTracker:
                     f"Database session inactive - cannot record job completion for {self.job_name}"
                 )
 
+            record_execution_rollup(
+                self.db_session, self.execution, previous_status, previous_duration
+            )
             self.db_session.commit()
             logger.info(
                 f"✅ Job completed: {self.job_name} "
@@ -232,6 +251,7 @@ class JobExecutionTracker:
 
             completed_at = datetime.now(timezone.utc)
             duration = int((completed_at - self.execution.started_at).total_seconds())
+            previous_status, previous_duration = self._previous_outcome()
 
             self.execution.status = "failed"
             self.execution.completed_at = completed_at
@@ -250,6 +270,9 @@ class JobExecutionTracker:
                     f"Database session inactive - cannot record job failure for {self.job_name}"
                 )
 
+            record_execution_rollup(
+                self.db_session, self.execution, previous_status, previous_duration
+            )
             self.db_session.commit()
             logger.error(
                 f"❌ Job failed: {self.job_name} "
@@ -277,6 +300,7 @@ class JobExecutionTracker:
 
         completed_at = datetime.now(timezone.utc)
         duration = int((completed_at - self.execution.started_at).total_seconds())
+        previous_status, previous_duration = self._previous_outcome()
 
         self.execution.status = "timeout"
         self.execution.completed_at = completed_at
@@ -284,6 +308,9 @@ class JobExecutionTracker:
         self.execution.error_message = f"Job exceeded time limit ({duration}s)"
 
         try:
+            record_execution_rollup(
+                self.db_session, self.execution, previous_status, previous_duration
+            )
             self.db_session.commit()
             logger.error(
                 f"⏱️ Job timed out: {self.job_name} "
@@ -381,6 +408,146 @@ def track_job_execution(
         yield tracker
 
 
+# ============================================================================
+# ROLLUP HELPERS
+# ============================================================================
+
+
+def rollup_hour(moment: datetime) -> datetime:
+    """Truncate a timestamp to the start of its UTC hour.
+
+    Args:
+        moment: Timestamp (naive values are treated as UTC)
+
+    Returns:
+        Timezone-aware datetime at the start of the hour
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _percentile(sorted_values: List[int], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile (matches Postgres percentile_cont)."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * pct
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = rank - lower
+    return float(
+        sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+    )
+
+
+def _apply_outcome(
+    rollup: JobExecutionRollup,
+    status: str,
+    duration: Optional[int],
+    sign: int,
+) -> None:
+    """Add (sign=1) or remove (sign=-1) one execution outcome from a rollup."""
+    rollup.execution_count = (rollup.execution_count or 0) + sign
+
+    if status in FAILURE_STATUSES:
+        rollup.failure_count = (rollup.failure_count or 0) + sign
+        return
+    if status != "success":
+        return
+
+    rollup.success_count = (rollup.success_count or 0) + sign
+    if duration is None:
+        return
+
+    # Assign a new list so the JSON column change is detected
+    durations = list(rollup.durations or [])
+    if sign > 0:
+        durations.append(duration)
+    elif duration in durations:
+        durations.remove(duration)
+    else:
+        return
+    durations.sort()
+
+    rollup.durations = durations
+    rollup.duration_count = len(durations)
+    rollup.total_duration_seconds = (rollup.total_duration_seconds or 0) + (
+        sign * duration
+    )
+    rollup.max_duration_seconds = durations[-1] if durations else None
+    rollup.p50_duration_seconds = _percentile(durations, 0.5)
+    rollup.p95_duration_seconds = _percentile(durations, 0.95)
+
+
+def record_execution_rollup(
+    db_session: Session,
+    execution: JobExecution,
+    previous_status: Optional[str] = None,
+    previous_duration: Optional[int] = None,
+) -> None:
+    """Fold a finished execution into its per-job, per-hour rollup.
+
+    Runs inside a savepoint and does not commit, so the rollup is persisted
+    atomically with the execution's final status by the caller's commit.
+    Errors are logged and swallowed - a missed rollup must never fail a job.
+
+    Args:
+        db_session: SQLAlchemy database session
+        execution: Execution that just reached a terminal status
+        previous_status: Terminal status already counted for this execution
+            (Celery retries reuse the record), which is backed out first
+        previous_duration: Duration counted with previous_status
+    """
+    if not execution.started_at:
+        return
+
+    hour_start = rollup_hour(execution.started_at)
+
+    # Retry once if a concurrent worker inserted the same job/hour row first
+    for attempt in range(2):
+        try:
+            with db_session.begin_nested():
+                rollup = (
+                    db_session.query(JobExecutionRollup)
+                    .filter(
+                        JobExecutionRollup.job_name == execution.job_name,
+                        JobExecutionRollup.hour_start == hour_start,
+                    )
+                    .with_for_update()
+                    .first()
+                )
+                if rollup is None:
+                    rollup = JobExecutionRollup(
+                        job_name=execution.job_name,
+                        job_category=execution.job_category,
+                        hour_start=hour_start,
+                        execution_count=0,
+                        success_count=0,
+                        failure_count=0,
+                        duration_count=0,
+                        total_duration_seconds=0,
+                        durations=[],
+                    )
+                    db_session.add(rollup)
+
+                if previous_status:
+                    _apply_outcome(rollup, previous_status, previous_duration, -1)
+                _apply_outcome(rollup, execution.status, execution.duration_seconds, 1)
+            return
+        except IntegrityError:
+            if attempt == 0:
+                continue
+            logger.warning(
+                f"Could not record rollup for {execution.job_name} at {hour_start}: "
+                f"concurrent insert conflict"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not record rollup for {execution.job_name} at {hour_start}: {e}"
+            )
+            return
+
+
 # ============================================================================
 # QUERY HELPERS
 # ============================================================================
@@ -411,6 +578,28 @@ def get_recent_failures(
     return query.order_by(JobExecution.started_at.desc()).limit(limit).all()
 
 
+def _rollup_totals(db_session: Session, job_name: str, days: int):
+    """Sum a job's rollups over the past N days (one aggregate query)."""
+    from datetime import timedelta
+    from sqlalchemy import func
+
+    cutoff = rollup_hour(datetime.now(timezone.utc) - timedelta(days=days))
+
+    return (
+        db_session.query(
+            func.coalesce(func.sum(JobExecutionRollup.execution_count), 0),
+            func.coalesce(func.sum(JobExecutionRollup.success_count), 0),
+            func.coalesce(func.sum(JobExecutionRollup.duration_count), 0),
+            func.coalesce(func.sum(JobExecutionRollup.total_duration_seconds), 0),
+        )
+        .filter(
+            JobExecutionRollup.job_name == job_name,
+            JobExecutionRollup.hour_start >= cutoff,
+        )
+        .one()
+    )
+
+
 def get_job_success_rate(
     db_session: Session,
     job_name: str,
@@ -418,6 +607,9 @@ def get_job_success_rate(
 ) -> float:
     """Calculate success rate for a job over the past N days.
 
+    Reads the hourly rollups, so finished executions are counted even after
+    their raw rows have been pruned.
+
     Args:
         db_session: SQLAlchemy database session
         job_name: Job name to analyze
@@ -426,32 +618,11 @@ def get_job_success_rate(
     Returns:
         Success rate as a percentage (0.0-100.0)
     """
-    from datetime import timedelta
-
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    total, successful, _, _ = _rollup_totals(db_session, job_name, days)
 
-    total = (
-        db_session.query(JobExecution)
-        .filter(
-            JobExecution.job_name == job_name,
-            JobExecution.started_at >= cutoff,
-        )
-        .count()
-    )
-
-    if total == 0:
+    if not total:
         return 0.0
 
-    successful = (
-        db_session.query(JobExecution)
-        .filter(
-            JobExecution.job_name == job_name,
-            JobExecution.started_at >= cutoff,
-            JobExecution.status == "success",
-        )
-        .count()
-    )
-
     return (successful / total) * 100.0
 
 
@@ -468,22 +639,8 @@ def get_average_duration(
         days: Number of days to look back
 
     Returns:
-        Average duration in seconds, or None if no data
+        Average duration in seconds of successful runs, or None if no data
     """
-    from datetime import timedelta
-    from sqlalchemy import func
-
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-    result = (
-        db_session.query(func.avg(JobExecution.duration_seconds))
-        .filter(
-            JobExecution.job_name == job_name,
-            JobExecution.started_at >= cutoff,
-            JobExecution.status == "success",
-            JobExecution.duration_seconds.isnot(None),
-        )
-        .scalar()
-    )
+    _, _, duration_count, total_duration = _rollup_totals(db_session, job_name, days)
 
-    return float(result) if result else None
+    return float(total_duration) / duration_count if duration_count else None
@@ -12,7 +12,8 @@ from collections import defaultdict
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 
-from src.models.job_execution import JobExecution
+from src.models.job_execution import JobExecution, JobExecutionRollup
+from src.services.job_execution_tracker import FAILURE_STATUSES, rollup_hour
 from src.config.job_monitoring_config import (
     get_job_config,
     get_all_categories,
@@ -53,38 +54,32 @@ class JobMonitoringDigestService:
         """
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
 
-        # Query all executions in the time window
-        executions = (
-            self.db_session.query(JobExecution)
-            .filter(JobExecution.started_at >= cutoff_time)
-            .order_by(JobExecution.started_at.desc())
-            .all()
-        )
+        # Per-job totals come from the hourly rollups; raw rows are only read
+        # for running counts, failures and slow-job candidates.
+        job_stats = self._get_job_stats(cutoff_time)
+        running_by_category = self._count_running(cutoff_time)
 
-        logger.info(
-            f"Generating digest for {len(executions)} executions from last {hours_back} hours"
-        )
+        successful = sum(stats["successful"] for stats in job_stats)
+        failed = sum(stats["failed"] for stats in job_stats)
+        running = sum(running_by_category.values())
+        total_executions = sum(stats["total"] for stats in job_stats) + running
 
-        # Calculate overall statistics
-        total_executions = len(executions)
-        successful = sum(1 for e in executions if e.status == "success")
-        failed = sum(
-            1 for e in executions if e.status in ("failed", "timeout", "cancelled")
+        logger.info(
+            f"Generating digest for {total_executions} executions from last {hours_back} hours"
         )
-        running = sum(1 for e in executions if e.status == "running")
 
         success_rate = (
             (successful / total_executions * 100) if total_executions > 0 else 0
         )
 
         # Group by category
-        by_category = self._group_by_category(executions)
+        by_category = self._group_by_category(job_stats, running_by_category)
 
         # Identify failures
-        failures = self._get_failures(executions)
+        failures = self._get_failures(cutoff_time)
 
         # Identify slow jobs
-        slow_jobs = self._get_slow_jobs(executions)
+        slow_jobs = self._get_slow_jobs(cutoff_time, job_stats)
 
         # Generate recommendations
         recommendations = self._generate_recommendations(
@@ -92,7 +87,7 @@ class JobMonitoringDigestService:
         )
 
         # Get all jobs with status
-        all_jobs = self._get_all_jobs(executions)
+        all_jobs = self._get_all_jobs(job_stats)
 
         # Build digest
         digest = {
@@ -115,13 +110,95 @@ class JobMonitoringDigestService:
 
         return digest
 
+    def _get_job_stats(self, cutoff_time: datetime) -> List[Dict[str, Any]]:
+        """Aggregate finished executions per job from the hourly rollups.
+
+        Rollups are bucketed by hour, so the window starts at the beginning
+        of the hour containing ``cutoff_time``.
+
+        Args:
+            cutoff_time: Start of the reporting window
+
+        Returns:
+            List of per-job statistics dicts
+        """
+        rows = (
+            self.db_session.query(
+                JobExecutionRollup.job_name,
+                JobExecutionRollup.job_category,
+                func.sum(JobExecutionRollup.execution_count),
+                func.sum(JobExecutionRollup.success_count),
+                func.sum(JobExecutionRollup.failure_count),
+                func.sum(JobExecutionRollup.duration_count),
+                func.sum(JobExecutionRollup.total_duration_seconds),
+                func.max(JobExecutionRollup.max_duration_seconds),
+                func.max(JobExecutionRollup.hour_start),
+            )
+            .filter(JobExecutionRollup.hour_start >= rollup_hour(cutoff_time))
+            .group_by(JobExecutionRollup.job_name, JobExecutionRollup.job_category)
+            .all()
+        )
+
+        return [
+            {
+                "job_name": job_name,
+                "category": category,
+                "total": int(total or 0),
+                "successful": int(successful or 0),
+                "failed": int(failed or 0),
+                "average_duration": (
+                    int(round(total_duration / duration_count))
+                    if duration_count
+                    else None
+                ),
+                "max_duration": max_duration,
+                "last_hour": last_hour,
+            }
+            for (
+                job_name,
+                category,
+                total,
+                successful,
+                failed,
+                duration_count,
+                total_duration,
+                max_duration,
+                last_hour,
+            ) in rows
+        ]
+
+    def _count_running(self, cutoff_time: datetime) -> Dict[str, int]:
+        """Count executions still running in the window, by category.
+
+        Args:
+            cutoff_time: Start of the reporting window
+
+        Returns:
+            Dict mapping category name to running execution count
+        """
+        rows = (
+            self.db_session.query(
+                JobExecution.job_category, func.count(JobExecution.id)
+            )
+            .filter(
+                JobExecution.started_at >= cutoff_time,
+                JobExecution.status == "running",
+            )
+            .group_by(JobExecution.job_category)
+            .all()
+        )
+        return {category: count for category, count in rows}
+
     def _group_by_category(
-        self, executions: List[JobExecution]
+        self,
+        job_stats: List[Dict[str, Any]],
+        running_by_category: Dict[str, int],
     ) -> Dict[str, Dict[str, Any]]:
-        """Group executions by job category with statistics.
+        """Group per-job statistics by job category.
 
         Args:
-            executions: List of JobExecution records
+            job_stats: Per-job statistics from _get_job_stats()
+            running_by_category: Running execution counts by category
 
         Returns:
             Dict mapping category name to statistics
@@ -136,19 +213,17 @@ class JobMonitoringDigestService:
             }
         )
 
-        for execution in executions:
-            category = execution.job_category
-            stats = category_stats[category]
+        for job in job_stats:
+            stats = category_stats[job["category"]]
+            stats["total"] += job["total"]
+            stats["successful"] += job["successful"]
+            stats["failed"] += job["failed"]
+            stats["jobs"].add(job["job_name"])
 
-            stats["total"] += 1
-            stats["jobs"].add(execution.job_name)
-
-            if execution.status == "success":
-                stats["successful"] += 1
-            elif execution.status in ("failed", "timeout", "cancelled"):
-                stats["failed"] += 1
-            elif execution.status == "running":
-                stats["running"] += 1
+        for category, count in running_by_category.items():
+            stats = category_stats[category]
+            stats["total"] += count
+            stats["running"] += count
 
         # Convert sets to counts and calculate success rates
         result = {}
@@ -166,21 +241,28 @@ class JobMonitoringDigestService:
 
         return result
 
-    def _get_failures(self, executions: List[JobExecution]) -> List[Dict[str, Any]]:
-        """Extract failed jobs with details.
+    def _get_failures(self, cutoff_time: datetime) -> List[Dict[str, Any]]:
+        """Load failed executions in the window with details.
 
         Args:
-            executions: List of JobExecution records
+            cutoff_time: Start of the reporting window
 
         Returns:
             List of failure details sorted by priority
         """
+        executions = (
+            self.db_session.query(JobExecution)
+            .filter(
+                JobExecution.started_at >= cutoff_time,
+                JobExecution.status.in_(FAILURE_STATUSES),
+            )
+            .order_by(JobExecution.started_at.desc())
+            .all()
+        )
+
         failures = []
 
         for execution in executions:
-            if execution.status not in ("failed", "timeout", "cancelled"):
-                continue
-
             # Get job config for priority
             try:
                 job_config = get_job_config(execution.job_name)
@@ -216,29 +298,58 @@ class JobMonitoringDigestService:
 
         return failures
 
-    def _get_slow_jobs(self, executions: List[JobExecution]) -> List[Dict[str, Any]]:
-        """Identify jobs that exceeded expected duration.
+    def _get_slow_jobs(
+        self, cutoff_time: datetime, job_stats: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Identify executions that exceeded expected duration.
+
+        The rollup max duration tells which jobs had a slow run at all, so
+        raw rows are only loaded for those jobs.
 
         Args:
-            executions: List of JobExecution records
+            cutoff_time: Start of the reporting window
+            job_stats: Per-job statistics from _get_job_stats()
 
         Returns:
             List of slow job details
         """
-        slow_jobs = []
-
-        for execution in executions:
-            if execution.status != "success" or not execution.duration_seconds:
-                continue
+        threshold = ALERT_CONFIG.get("slow_job_threshold", 1.5)
 
+        # Expected duration of each job that had at least one slow run
+        expected_by_job = {}
+        for job in job_stats:
             try:
-                job_config = get_job_config(execution.job_name)
-                expected_duration = job_config.expected_duration_seconds
+                expected_duration = get_job_config(
+                    job["job_name"]
+                ).expected_duration_seconds
             except KeyError:
                 continue
+            if job["max_duration"] and job["max_duration"] > (
+                expected_duration * threshold
+            ):
+                expected_by_job[job["job_name"]] = expected_duration
+
+        if not expected_by_job:
+            return []
+
+        executions = (
+            self.db_session.query(JobExecution)
+            .filter(
+                JobExecution.started_at >= cutoff_time,
+                JobExecution.status == "success",
+                JobExecution.job_name.in_(list(expected_by_job)),
+                JobExecution.duration_seconds
+                > min(expected_by_job.values()) * threshold,
+            )
+            .all()
+        )
+
+        slow_jobs = []
+
+        for execution in executions:
+            expected_duration = expected_by_job[execution.job_name]
 
             # Check if job took longer than expected
-            threshold = ALERT_CONFIG.get("slow_job_threshold", 1.5)
             if execution.duration_seconds > (expected_duration * threshold):
                 slow_job = {
                     "job_name": execution.job_name,
@@ -257,29 +368,32 @@ class JobMonitoringDigestService:
 
         return slow_jobs
 
-    def _get_all_jobs(self, executions: List[JobExecution]) -> List[Dict[str, Any]]:
-        """Get all jobs with their status for comprehensive listing.
+    def _get_all_jobs(self, job_stats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Summarize every job that ran in the window.
 
         Args:
-            executions: List of JobExecution records
+            job_stats: Per-job statistics from _get_job_stats()
 
         Returns:
-            List of all job details sorted by time
+            List of per-job summaries (average duration, run and failure
+            counts), most recently active first
         """
         all_jobs = []
 
-        for execution in executions:
-            job = {
-                "job_name": execution.job_name,
-                "category": execution.job_category,
-                "status": execution.status,
-                "started_at": execution.started_at.isoformat(),
-                "duration_seconds": execution.duration_seconds,
-                "retry_count": execution.retry_count,
-            }
-            all_jobs.append(job)
+        for job in job_stats:
+            all_jobs.append(
+                {
+                    "job_name": job["job_name"],
+                    "category": job["category"],
+                    "status": "failed" if job["failed"] else "success",
+                    "started_at": job["last_hour"].isoformat(),
+                    "duration_seconds": job["average_duration"],
+                    "executions": job["total"],
+                    "failed": job["failed"],
+                }
+            )
 
-        # Sort by started_at (most recent first)
+        # Sort by last active hour (most recent first)
         all_jobs.sort(key=lambda j: j["started_at"], reverse=True)
 
         return all_jobs
@@ -561,15 +675,16 @@ class JobMonitoringDigestService:
         if all_jobs:
             html += """
     <div class="section">
-        <div class="section-title">📋 All Job Executions</div>
+        <div class="section-title">📋 All Jobs</div>
         <table>
             <thead>
                 <tr>
                     <th>Job Name</th>
                     <th>Category</th>
                     <th>Status</th>
-                    <th>Duration</th>
-                    <th>Started At</th>
+                    <th>Runs</th>
+                    <th>Avg Duration</th>
+                    <th>Last Run (hour)</th>
                 </tr>
             </thead>
             <tbody>
@@ -594,6 +709,7 @@ class JobMonitoringDigestService:
                     <td><strong>{job['job_name']}</strong></td>
                     <td>{job['category']}</td>
                     <td style="color: {status_color};">{status_emoji} {job['status']}</td>
+                    <td>{job.get('executions', 1)}</td>
                     <td>{duration_display}</td>
                     <td style="font-size: 11px;">{job['started_at'][:19].replace('T', ' ')}</td>
                 </tr>
@@ -692,7 +808,7 @@ _{summary['period_start'][:10]} to {summary['period_end'][:10]} ({summary['perio
         # All jobs listing
         all_jobs = digest.get("all_jobs", [])
         if all_jobs:
-            message += f"*📋 All Job Executions ({len(all_jobs)}):*\n"
+            message += f"*📋 All Jobs ({len(all_jobs)}):*\n"
             for job in all_jobs[:20]:  # Show first 20 jobs
                 status_emoji = (
                     "✅"
@@ -702,7 +818,11 @@ _{summary['period_start'][:10]} to {summary['period_end'][:10]} ({summary['perio
                 duration = (
                     f" ({job['duration_seconds']}s)" if job["duration_seconds"] else ""
                 )
-                message += f"{status_emoji} `{job['job_name']}`{duration}\n"
+                runs = job.get("executions", 1)
+                runs_display = f" ×{runs}" if runs > 1 else ""
+                message += (
+                    f"{status_emoji} `{job['job_name']}`{runs_display}{duration}\n"
+                )
 
             if len(all_jobs) > 20:
                 message += f"   _...and {len(all_jobs) - 20} more jobs_\n"
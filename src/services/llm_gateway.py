@@ -0,0 +1,310 @@
+"""Shared gateway for LLM calls with a content-addressed response cache.
+
+Call sites describe a request (provider, model, messages and any sampling
+parameters that affect the output) and pass a function that performs it.
+Identical requests made within the call site's TTL are answered from Redis
+instead of the provider. Hit/miss counts are kept per call site and exposed
+at /api/health/llm-cache.
+
+Call sites that parse the response pass a ``validate`` callback (usually the
+parser itself); responses it rejects are returned to the caller but never
+cached, so a truncated or malformed answer isn't replayed for the whole TTL.
+
+TTLs can be overridden, or a call site opted out with 0, through the
+``llm_cache_ttls`` prompt setting; ``llm_cache_enabled: false`` turns the
+cache off everywhere. If Redis is unavailable every call goes straight to
+the provider.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Cache key prefix (keys are api_cache:llm:{call_site}:{sha256})
+CACHE_PREFIX = "llm"
+
+# Stats hash holding per-call-site hit/miss/bypass counters
+STATS_NAME = "llm"
+
+# Default response TTL (seconds) per call site
+CALL_SITE_TTLS = {
+    "context_summary": 6 * 60 * 60,
+    "search_rerank": 60 * 60,
+    "transcript_analysis": 7 * 24 * 60 * 60,
+    "epic_categorization": 30 * 24 * 60 * 60,
+    "ai_forecast": 7 * 24 * 60 * 60,
+}
+
+# TTL for call sites not listed above
+DEFAULT_TTL = 24 * 60 * 60
+
+# Chat model attributes that change the output and so belong in the key
+CHAT_MODEL_PARAMS = ("temperature", "max_tokens", "max_output_tokens", "top_p")
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build the content hash identifying an LLM request.
+
+    Args:
+        provider: Provider or client name (e.g. 'openai', 'ChatAnthropic')
+        model: Model name
+        messages: Chat messages as {"role": ..., "content": ...} dicts
+        params: Sampling/format parameters sent with the request
+
+    Returns:
+        Hex SHA-256 digest of the request
+    """
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "params": params or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_ttl(call_site: str) -> int:
+    """Return the response cache TTL for a call site (0 means don't cache).
+
+    Args:
+        call_site: Call site name
+
+    Returns:
+        TTL in seconds
+    """
+    try:
+        from src.utils.prompt_manager import get_prompt_manager
+
+        prompt_manager = get_prompt_manager()
+        if not prompt_manager.get_setting("llm_cache_enabled", True):
+            return 0
+        overrides = prompt_manager.get_setting("llm_cache_ttls", None) or {}
+        if call_site in overrides:
+            return int(overrides[call_site])
+    except Exception as e:
+        logger.debug(f"Could not load LLM cache settings: {e}")
+
+    return CALL_SITE_TTLS.get(call_site, DEFAULT_TTL)
+
+
+def _record(cache, call_site: str, outcome: str) -> None:
+    """Count a hit, miss or bypass for a call site."""
+    cache.increment(STATS_NAME, f"{call_site}:{outcome}")
+
+
+def _is_valid(
+    call_site: str, text: Optional[str], validate: Optional[Callable[[str], Any]]
+) -> bool:
+    """Whether a response is worth caching (non-empty and accepted by validate)."""
+    if not text:
+        return False
+    if validate is None:
+        return True
+    try:
+        return validate(text) is not False
+    except Exception as e:
+        logger.info(f"Not caching unparseable {call_site} response: {e}")
+        return False
+
+
+def _lookup(
+    call_site: str,
+    key: str,
+    ttl: int,
+    validate: Optional[Callable[[str], Any]] = None,
+):
+    """Return (cache manager, cached text or None), recording the outcome."""
+    from src.utils.cache_manager import get_cache_manager
+
+    cache = get_cache_manager()
+    if ttl <= 0:
+        _record(cache, call_site, "bypass")
+        return cache, None
+
+    try:
+        cached = cache.get(f"{CACHE_PREFIX}:{call_site}:{key}")
+        if cached is not None and _is_valid(call_site, cached["data"], validate):
+            _record(cache, call_site, "hit")
+            return cache, cached["data"]
+    except Exception as e:
+        logger.debug(f"LLM cache lookup failed for {call_site}: {e}")
+
+    _record(cache, call_site, "miss")
+    return cache, None
+
+
+def _store(
+    cache,
+    call_site: str,
+    key: str,
+    text: Optional[str],
+    ttl: int,
+    validate: Optional[Callable[[str], Any]] = None,
+) -> None:
+    """Cache a response (best effort; empty or rejected responses are skipped)."""
+    if ttl <= 0 or not _is_valid(call_site, text, validate):
+        return
+    try:
+        cache.set(text, f"{CACHE_PREFIX}:{call_site}:{key}", ttl)
+    except Exception as e:
+        logger.debug(f"LLM cache store failed for {call_site}: {e}")
+
+
+def complete(
+    call_site: str,
+    provider: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    call: Callable[[], str],
+    params: Optional[Dict[str, Any]] = None,
+    ttl: Optional[int] = None,
+    validate: Optional[Callable[[str], Any]] = None,
+) -> str:
+    """Return the response text for a request, calling the provider on a miss.
+
+    Args:
+        call_site: Call site name (selects the TTL and stats bucket)
+        provider: Provider name
+        model: Model name
+        messages: Chat messages as {"role": ..., "content": ...} dicts
+        call: Performs the request and returns the response text
+        params: Sampling/format parameters sent with the request
+        ttl: TTL override in seconds (0 skips the cache for this call)
+        validate: Raises (or returns False) if the response can't be used;
+            such responses are not cached
+
+    Returns:
+        Response text
+    """
+    ttl = get_ttl(call_site) if ttl is None else ttl
+    key = cache_key(provider, model, messages, params)
+    cache, cached = _lookup(call_site, key, ttl, validate)
+    if cached is not None:
+        return cached
+
+    text = call()
+    _store(cache, call_site, key, text, ttl, validate)
+    return text
+
+
+async def acomplete(
+    call_site: str,
+    provider: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    call: Callable[[], Awaitable[str]],
+    params: Optional[Dict[str, Any]] = None,
+    ttl: Optional[int] = None,
+    validate: Optional[Callable[[str], Any]] = None,
+) -> str:
+    """Async version of complete() for coroutine-based provider clients.
+
+    Args:
+        call_site: Call site name (selects the TTL and stats bucket)
+        provider: Provider name
+        model: Model name
+        messages: Chat messages as {"role": ..., "content": ...} dicts
+        call: Coroutine function that performs the request
+        params: Sampling/format parameters sent with the request
+        ttl: TTL override in seconds (0 skips the cache for this call)
+        validate: Raises (or returns False) if the response can't be used;
+            such responses are not cached
+
+    Returns:
+        Response text
+    """
+    ttl = get_ttl(call_site) if ttl is None else ttl
+    key = cache_key(provider, model, messages, params)
+    cache, cached = _lookup(call_site, key, ttl, validate)
+    if cached is not None:
+        return cached
+
+    text = await call()
+    _store(cache, call_site, key, text, ttl, validate)
+    return text
+
+
+def invoke_chat_model(
+    call_site: str,
+    llm: Any,
+    messages: List[Any],
+    invoke: Optional[Callable[[], Any]] = None,
+    ttl: Optional[int] = None,
+    validate: Optional[Callable[[str], Any]] = None,
+):
+    """Invoke a LangChain chat model through the response cache.
+
+    Args:
+        call_site: Call site name (selects the TTL and stats bucket)
+        llm: LangChain chat model
+        messages: LangChain messages
+        invoke: Performs the request (defaults to ``llm.invoke(messages)``),
+            e.g. to add retries
+        ttl: TTL override in seconds (0 skips the cache for this call)
+        validate: Raises (or returns False) if the response text can't be
+            used; such responses are not cached
+
+    Returns:
+        The model's response message, or an AIMessage holding the cached text
+    """
+    from langchain_core.messages import AIMessage
+
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", "")
+    params = {
+        name: getattr(llm, name)
+        for name in CHAT_MODEL_PARAMS
+        if getattr(llm, name, None) is not None
+    }
+    message_dicts = [
+        {"role": message.type, "content": message.content} for message in messages
+    ]
+
+    ttl = get_ttl(call_site) if ttl is None else ttl
+    key = cache_key(type(llm).__name__, str(model), message_dicts, params)
+    cache, cached = _lookup(call_site, key, ttl, validate)
+    if cached is not None:
+        return AIMessage(content=cached)
+
+    response = invoke() if invoke is not None else llm.invoke(messages)
+    content = getattr(response, "content", None)
+    if isinstance(content, str):
+        _store(cache, call_site, key, content, ttl, validate)
+    return response
+
+
+def get_stats() -> Dict[str, Dict[str, Any]]:
+    """Return per-call-site cache counters and hit rates.
+
+    Returns:
+        Dictionary keyed by call site with hits, misses, bypassed and
+        hit_rate (hits / cacheable calls, None before any cacheable call)
+    """
+    from src.utils.cache_manager import get_cache_manager
+
+    stats: Dict[str, Dict[str, Any]] = {}
+    for field, value in get_cache_manager().get_counters(STATS_NAME).items():
+        call_site, _, outcome = field.rpartition(":")
+        site = stats.setdefault(call_site, {"hits": 0, "misses": 0, "bypassed": 0})
+        if outcome == "hit":
+            site["hits"] = value
+        elif outcome == "miss":
+            site["misses"] = value
+        elif outcome == "bypass":
+            site["bypassed"] = value
+
+    for site in stats.values():
+        lookups = site["hits"] + site["misses"]
+        site["hit_rate"] = round(site["hits"] / lookups, 3) if lookups else None
+    return stats
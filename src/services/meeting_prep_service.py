@@ -2,15 +2,15 @@
 
 import logging
 from datetime import datetime, timezone, date
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-from src.models import User, UserNotificationPreferences
+from src.models import User, UserNotificationPreferences, UserWatchedProject
 from src.managers.notifications import NotificationManager
 from src.services.notification_preference_checker import NotificationPreferenceChecker
 from src.services.project_activity_aggregator import ProjectActivityAggregator
@@ -19,6 +19,9 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Watchers a project's digest is delivered to at once
+DELIVERY_CONCURRENCY = 10
+
 
 class MeetingPrepDeliveryService:
     """Service for generating and delivering meeting prep digests to users."""
@@ -46,7 +49,10 @@ class MeetingPrepDeliveryService:
     def send_meeting_prep_digests(self) -> Dict[str, Any]:
         """Send meeting prep digests to all users watching projects with meetings today.
 
-        This is the main entry point for the Celery task.
+        This is the main entry point for the Celery task. The digest content
+        doesn't depend on the recipient, so each project's activity is
+        aggregated and formatted once and then fanned out concurrently to
+        every watcher who hasn't received it today.
 
         Returns:
             Dictionary with delivery statistics
@@ -80,80 +86,108 @@ class MeetingPrepDeliveryService:
                 f"Found {len(projects_with_meetings)} projects with meetings today: {stats['projects_with_meetings_today']}"
             )
 
-            # For each project, get watchers and send digests
+            # Watchers, today's deliveries and preferences for all projects
+            # are loaded up front instead of per user
+            project_keys = stats["projects_with_meetings_today"]
+            watchers_by_project = self._get_watchers_by_project(project_keys)
+            delivered_today = self._get_deliveries_today(project_keys)
+
+            pref_checker = NotificationPreferenceChecker(self.db)
+            pref_checker.preload_preferences(
+                {
+                    user.id
+                    for watchers in watchers_by_project.values()
+                    for user in watchers
+                }
+            )
+
             for project in projects_with_meetings:
                 project_key = project["key"]
                 project_name = project.get("name", project_key)
 
                 try:
-                    # Get users watching this project
-                    watchers = self._get_project_watchers(project_key)
+                    # Deduplication: skip users who already got today's digest
+                    watchers = [
+                        user
+                        for user in watchers_by_project.get(project_key, [])
+                        if (user.id, project_key) not in delivered_today
+                    ]
 
                     if not watchers:
-                        logger.debug(f"No watchers for project {project_key}")
+                        logger.debug(
+                            f"No watchers awaiting meeting prep for {project_key}"
+                        )
+                        continue
+
+                    # Generate the digest once for all watchers
+                    digest_result = self._generate_project_digest(
+                        project_key, project_name
+                    )
+
+                    if not digest_result or not digest_result.get("formatted_agenda"):
+                        logger.warning(f"Failed to generate digest for {project_key}")
+                        stats["errors"].append(
+                            f"Project {project_key}: no digest generated"
+                        )
                         continue
 
                     logger.info(
                         f"Sending meeting prep for {project_key} to {len(watchers)} watchers"
                     )
 
-                    # Send digest to each watcher
-                    for user in watchers:
-                        try:
-                            # Check if already sent today (deduplication)
-                            if self._already_sent_today(user.id, project_key):
-                                logger.debug(
-                                    f"Already sent meeting prep for {project_key} to user {user.id} today"
-                                )
-                                continue
-
-                            # Generate digest for this user
-                            digest_result = self._generate_digest_for_user(
-                                user, project_key, project_name
-                            )
-
-                            if not digest_result or not digest_result.get(
-                                "formatted_agenda"
-                            ):
-                                logger.warning(
-                                    f"Failed to generate digest for {project_key} / user {user.id}"
-                                )
-                                continue
-
-                            # Send via Slack and Email based on preferences
-                            delivery_results = self._deliver_digest(
-                                user, project_key, project_name, digest_result
-                            )
+                    deliveries = [
+                        (
+                            user,
+                            pref_checker.should_send_notification(
+                                user, "meeting_prep", "slack"
+                            ),
+                            pref_checker.should_send_notification(
+                                user, "meeting_prep", "email"
+                            ),
+                        )
+                        for user in watchers
+                    ]
+                    delivery_results = asyncio.run(
+                        self._deliver_to_watchers(
+                            project_key, project_name, digest_result, deliveries
+                        )
+                    )
 
-                            # Track delivery
-                            if delivery_results["slack"] or delivery_results["email"]:
-                                self._record_delivery(
-                                    user.id,
-                                    project_key,
-                                    delivery_results["slack"],
-                                    delivery_results["email"],
-                                    digest_result.get("cache_id"),
-                                )
-                                stats["total_users_notified"].add(user.id)
-
-                                if delivery_results["slack"]:
-                                    stats["digests_sent_slack"] += 1
-                                if delivery_results["email"]:
-                                    stats["digests_sent_email"] += 1
-
-                                logger.info(
-                                    f"Delivered meeting prep for {project_key} to user {user.id} "
-                                    f"(slack={delivery_results['slack']}, email={delivery_results['email']})"
-                                )
-
-                        except Exception as e:
+                    # Track delivery
+                    delivered = []
+                    for user, result in zip(watchers, delivery_results):
+                        if isinstance(result, Exception):
                             logger.error(
-                                f"Error sending digest to user {user.id} for project {project_key}: {e}",
-                                exc_info=True,
+                                f"Error sending digest to user {user.id} for project {project_key}: {result}"
                             )
                             stats["errors"].append(
-                                f"User {user.id} / {project_key}: {str(e)}"
+                                f"User {user.id} / {project_key}: {str(result)}"
                             )
+                            continue
+
+                        if not (result["slack"] or result["email"]):
+                            continue
+
+                        delivered.append(
+                            {
+                                "user_id": user.id,
+                                "delivered_via_slack": result["slack"],
+                                "delivered_via_email": result["email"],
+                            }
+                        )
+                        stats["total_users_notified"].add(user.id)
+
+                        if result["slack"]:
+                            stats["digests_sent_slack"] += 1
+                        if result["email"]:
+                            stats["digests_sent_email"] += 1
+
+                    self._record_deliveries(
+                        project_key, delivered, digest_result.get("cache_id")
+                    )
+                    logger.info(
+                        f"Delivered meeting prep for {project_key} to {len(delivered)}/{len(watchers)} watchers"
+                    )
 
                 except Exception as e:
                     logger.error(
@@ -208,91 +242,76 @@ class MeetingPrepDeliveryService:
             )
             raise
 
-    def _get_project_watchers(self, project_key: str) -> List[User]:
-        """Get users watching a specific project.
+    def _get_watchers_by_project(
+        self, project_keys: List[str]
+    ) -> Dict[str, List[User]]:
+        """Get active users watching each of the given projects.
 
         Args:
-            project_key: Project key (e.g., "BIGO", "BEAU")
+            project_keys: Project keys (e.g., ["BIGO", "BEAU"])
 
         Returns:
-            List of User objects
-        """
-        query = text(
-            """
-            SELECT u.*
-            FROM users u
-            JOIN user_watched_projects uwp ON uwp.user_id = u.id
-            WHERE uwp.project_key = :project_key
-            AND u.is_active = TRUE
+            Dictionary mapping project key to its watchers
         """
+        rows = (
+            self.db.query(UserWatchedProject.project_key, User)
+            .join(User, User.id == UserWatchedProject.user_id)
+            .filter(
+                UserWatchedProject.project_key.in_(project_keys),
+                User.is_active.is_(True),
+            )
+            .all()
         )
 
-        result = self.db.execute(query, {"project_key": project_key})
-        user_ids = [row.id for row in result.fetchall()]
-
-        # Fetch full User objects
-        users = self.db.query(User).filter(User.id.in_(user_ids)).all()
-        return users
+        watchers: Dict[str, List[User]] = {key: [] for key in project_keys}
+        for project_key, user in rows:
+            watchers[project_key].append(user)
+        return watchers
 
-    def _already_sent_today(self, user_id: int, project_key: str) -> bool:
-        """Check if meeting prep was already sent to user for this project today.
+    def _get_deliveries_today(self, project_keys: List[str]) -> Set[Tuple[int, str]]:
+        """Get (user_id, project_key) pairs that already received today's digest.
 
         Args:
-            user_id: User ID
-            project_key: Project key
+            project_keys: Project keys to check
 
         Returns:
-            True if already sent today, False otherwise
+            Set of (user_id, project_key) tuples
         """
         try:
-            logger.info(
-                f"🔍 Checking if already sent to user {user_id} for project {project_key} today"
-            )
-
             query = text(
                 """
-                SELECT COUNT(*) as count
+                SELECT DISTINCT user_id, project_key
                 FROM meeting_prep_deliveries
-                WHERE user_id = :user_id
-                AND project_key = :project_key
+                WHERE project_key IN :project_keys
                 AND DATE(delivered_at) = :today
             """
-            )
+            ).bindparams(bindparam("project_keys", expanding=True))
 
             result = self.db.execute(
-                query,
-                {
-                    "user_id": user_id,
-                    "project_key": project_key,
-                    "today": date.today(),
-                },
+                query, {"project_keys": list(project_keys), "today": date.today()}
             )
 
-            count = result.fetchone().count
-            already_sent = count > 0
+            delivered = {(row.user_id, row.project_key) for row in result.fetchall()}
             logger.info(
-                f"✅ Deduplication check result: already_sent={already_sent} (count={count})"
+                f"✅ Deduplication check: {len(delivered)} digests already sent today"
             )
-            return already_sent
+            return delivered
         except Exception as e:
-            logger.error(
-                f"❌ ERROR in _already_sent_today for user {user_id}, project {project_key}: {e}",
-                exc_info=True,
-            )
+            logger.error(f"❌ ERROR in _get_deliveries_today: {e}", exc_info=True)
             raise
 
-    def _generate_digest_for_user(
-        self, user: User, project_key: str, project_name: str
+    def _generate_project_digest(
+        self, project_key: str, project_name: str
     ) -> Optional[Dict[str, Any]]:
-        """Generate weekly digest for a user with attendee context.
+        """Generate the weekly digest for a project, formatted for each channel.
 
         Args:
-            user: User to generate digest for
             project_key: Project key
             project_name: Project name
 
         Returns:
-            Dictionary with formatted_agenda, cache_id, and metadata
+            Dictionary with formatted_agenda, slack_message, email_html,
+            cache_id, and metadata
         """
         try:
             # Use aggregator to generate digest (uses cache if available)
@@ -307,9 +326,7 @@ class MeetingPrepDeliveryService:
             )
 
             if not activity:
-                logger.warning(
-                    f"No activity data generated for {project_key} / {user.email}"
-                )
+                logger.warning(f"No activity data generated for {project_key}")
                 return None
 
             # Format the ProjectActivity object into a digest string
@@ -318,69 +335,94 @@ class MeetingPrepDeliveryService:
             )
 
             if not formatted_agenda or not formatted_agenda.strip():
-                logger.warning(
-                    f"No formatted digest generated for {project_key} / {user.email}"
-                )
+                logger.warning(f"No formatted digest generated for {project_key}")
                 return None
 
             return {
                 "formatted_agenda": formatted_agenda,
+                "slack_message": self._format_slack_message(
+                    project_key, project_name, formatted_agenda
+                ),
+                "email_html": self._format_email_message(
+                    project_key, project_name, formatted_agenda
+                ),
                 "cache_id": None,  # TODO: Implement caching if needed
                 "project_name": project_name,
-                "user_email": user.email,
             }
 
         except Exception as e:
             logger.error(
-                f"Error generating digest for {project_key} / {user.email}: {e}",
-                exc_info=True,
+                f"Error generating digest for {project_key}: {e}", exc_info=True
             )
             return None
 
-    def _deliver_digest(
+    async def _deliver_to_watchers(
+        self,
+        project_key: str,
+        project_name: str,
+        digest_result: Dict[str, Any],
+        deliveries: List[Tuple[User, bool, bool]],
+    ) -> List[Any]:
+        """Deliver a project's digest to all watchers concurrently.
+
+        At most DELIVERY_CONCURRENCY watchers are handled at once.
+
+        Args:
+            project_key: Project key
+            project_name: Project name
+            digest_result: Output of _generate_project_digest
+            deliveries: (user, deliver_slack, deliver_email) per watcher
+
+        Returns:
+            Per watcher, in order: dict with slack and email delivery status,
+            or the exception raised while delivering
+        """
+        semaphore = asyncio.Semaphore(DELIVERY_CONCURRENCY)
+
+        async def deliver(user, deliver_slack, deliver_email):
+            async with semaphore:
+                return await self._deliver_digest(
+                    user,
+                    project_key,
+                    project_name,
+                    digest_result,
+                    deliver_slack,
+                    deliver_email,
+                )
+
+        return await asyncio.gather(
+            *[deliver(*delivery) for delivery in deliveries], return_exceptions=True
+        )
+
+    async def _deliver_digest(
         self,
         user: User,
         project_key: str,
         project_name: str,
         digest_result: Dict[str, Any],
+        deliver_slack: bool,
+        deliver_email: bool,
     ) -> Dict[str, bool]:
-        """Deliver digest to user via Slack and/or Email based on preferences.
+        """Deliver digest to user via Slack and/or Email.
 
         Args:
             user: User to deliver to
             project_key: Project key
             project_name: Project name
-            digest_result: Dictionary with formatted_agenda
+            digest_result: Dictionary with slack_message and email_html
+            deliver_slack: Whether the user opted in to Slack delivery
+            deliver_email: Whether the user opted in to email delivery
 
         Returns:
             Dictionary with slack and email delivery status
         """
         results = {"slack": False, "email": False}
 
-        # Get user preferences
-        # Check user preferences using NotificationPreferenceChecker
-        pref_checker = NotificationPreferenceChecker(self.db)
-
-        # Check both category toggle (enable_meeting_prep) AND channel preferences
-        deliver_slack = pref_checker.should_send_notification(
-            user, "meeting_prep", "slack"
-        )
-        deliver_email = pref_checker.should_send_notification(
-            user, "meeting_prep", "email"
-        )
-
-        formatted_agenda = digest_result["formatted_agenda"]
-
         # Deliver via Slack
         if deliver_slack and user.slack_user_id:
             try:
-                slack_message = self._format_slack_message(
-                    project_key, project_name, formatted_agenda
-                )
-                result = asyncio.run(
-                    self.notification_manager._send_slack_dm(
-                        user.slack_user_id, slack_message
-                    )
+                result = await self.notification_manager._send_slack_dm(
+                    user.slack_user_id, digest_result["slack_message"]
                 )
                 results["slack"] = result.get("success", False)
                 if results["slack"]:
@@ -396,18 +438,15 @@ class MeetingPrepDeliveryService:
                     f"Error delivering Slack digest for {project_key} to user {user.id}: {e}"
                 )
 
-        # Deliver via Email (only for user ID 1)
+        # Deliver via Email (SMTP is blocking, so it runs in a worker thread)
         if deliver_email:
             try:
-                email_html = self._format_email_message(
-                    project_key, project_name, formatted_agenda
-                )
-                result = self._send_email(
+                results["email"] = await asyncio.to_thread(
+                    self._send_email,
                     user.email,
                     f"📅 Meeting Prep: {project_name} ({project_key})",
-                    email_html,
+                    digest_result["email_html"],
                 )
-                results["email"] = result
                 if results["email"]:
                     logger.info(
                         f"Delivered email digest for {project_key} to {user.email}"
@@ -610,23 +649,23 @@ class MeetingPrepDeliveryService:
             logger.error(f"Error sending email to {to_email}: {e}", exc_info=True)
             return False
 
-    def _record_delivery(
+    def _record_deliveries(
         self,
-        user_id: int,
         project_key: str,
-        delivered_via_slack: bool,
-        delivered_via_email: bool,
+        deliveries: List[Dict[str, Any]],
         digest_cache_id: Optional[str] = None,
     ):
-        """Record delivery in database for deduplication.
+        """Record a project's deliveries in database for deduplication.
 
         Args:
-            user_id: User ID
             project_key: Project key
-            delivered_via_slack: Whether delivered via Slack
-            delivered_via_email: Whether delivered via Email
+            deliveries: Dicts with user_id, delivered_via_slack and
+                delivered_via_email
             digest_cache_id: Optional digest cache ID
         """
+        if not deliveries:
+            return
+
         try:
             import uuid
 
@@ -643,23 +682,25 @@ class MeetingPrepDeliveryService:
             """
             )
 
+            delivered_at = datetime.now(timezone.utc)
             self.db.execute(
                 query,
-                {
-                    "id": str(uuid.uuid4()),
-                    "user_id": user_id,
-                    "project_key": project_key,
-                    "delivered_at": datetime.now(timezone.utc),
-                    "delivered_via_slack": delivered_via_slack,
-                    "delivered_via_email": delivered_via_email,
-                    "digest_cache_id": digest_cache_id,
-                },
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "user_id": delivery["user_id"],
+                        "project_key": project_key,
+                        "delivered_at": delivered_at,
+                        "delivered_via_slack": delivery["delivered_via_slack"],
+                        "delivered_via_email": delivery["delivered_via_email"],
+                        "digest_cache_id": digest_cache_id,
+                    }
+                    for delivery in deliveries
+                ],
             )
             # Note: Do NOT commit here - let the caller/tracker manage the transaction
 
         except Exception as e:
-            logger.error(
-                f"Error recording delivery for user {user_id} / {project_key}: {e}"
-            )
+            logger.error(f"Error recording deliveries for {project_key}: {e}")
             # Note: Do NOT rollback here - let the caller/tracker handle transaction management
             raise  # Re-raise so the tracker knows to rollback
@@ -5,7 +5,7 @@ notification type via a specific channel (Slack or Email). It implements the opt
 notification system where all notifications default to OFF unless explicitly enabled.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from sqlalchemy.orm import Session
 
 from src.models.notification_preferences import UserNotificationPreferences
@@ -96,6 +96,29 @@ class NotificationPreferenceChecker:
             db: SQLAlchemy database session
         """
         self.db = db
+        self._preloaded: Dict[int, Optional[UserNotificationPreferences]] = {}
+
+    def preload_preferences(self, user_ids: Iterable[int]) -> None:
+        """Load preferences for many users with a single query.
+
+        Later checks for these users are answered without touching the
+        database, which keeps fan-out notifications to one query in total.
+
+        Args:
+            user_ids: IDs of users about to be checked
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+
+        self._preloaded.update({user_id: None for user_id in user_ids})
+        prefs = (
+            self.db.query(UserNotificationPreferences)
+            .filter(UserNotificationPreferences.user_id.in_(user_ids))
+            .all()
+        )
+        for pref in prefs:
+            self._preloaded[pref.user_id] = pref
 
     def should_send_notification(
         self, user: User, notification_type: str, channel: str
@@ -185,6 +208,9 @@ class NotificationPreferenceChecker:
         """
         from sqlalchemy.exc import IntegrityError
 
+        # Don't trust a preloaded "no preferences" answer here
+        self._preloaded.pop(user.id, None)
+
         # Check if preferences already exist
         existing_prefs = self._get_user_preferences(user)
         if existing_prefs:
@@ -252,6 +278,9 @@ class NotificationPreferenceChecker:
         Returns:
             UserNotificationPreferences object or None if not found
         """
+        if user.id in self._preloaded:
+            return self._preloaded[user.id]
+
         return (
             self.db.query(UserNotificationPreferences)
             .filter(UserNotificationPreferences.user_id == user.id)
@@ -301,32 +301,18 @@ class ProjectActivityAggregator:
                 f"Searching meetings for {activity.project_key} between {start_date} and {end_date}"
             )
 
-            # Query processed_meetings directly by matching keywords in title/summary
-            from src.utils.database import get_engine
-            from sqlalchemy import text
-
-            # Get project keywords for matching
-            keywords_result = None
-            try:
-                engine = get_engine()
-                with engine.connect() as conn:
-                    keywords_result = conn.execute(
-                        text(
-                            """
-                        SELECT keyword FROM project_keywords
-                        WHERE project_key = :project_key
-                    """
-                        ),
-                        {"project_key": activity.project_key},
-                    )
-                    keywords = [row[0].lower() for row in keywords_result]
-            except Exception as e:
-                logger.warning(
-                    f"Error loading keywords for {activity.project_key}: {e}"
-                )
-                keywords = [activity.project_key.lower()]
-
-            logger.info(f"Using keywords for {activity.project_key}: {keywords}")
+            # Match processed_meetings by project keywords (substrings of the
+            # title/summary) with the shared automaton, using the project key
+            # itself for projects without keywords
+            from src.services.project_keyword_matcher import get_project_keyword_matcher
+
+            matcher = get_project_keyword_matcher()
+            has_keywords = bool(matcher.keywords_for(activity.project_key))
+            project_key_lower = activity.project_key.lower()
+            logger.info(
+                f"Using keywords for {activity.project_key}: "
+                f"{matcher.keywords_for(activity.project_key) or [project_key_lower]}"
+            )
 
             # Get all analyzed meetings in date range
             all_analyzed_meetings = (
@@ -346,14 +332,16 @@ class ProjectActivityAggregator:
             # Filter by keyword matching in title or summary
             relevant_meetings = []
             for db_meeting in all_analyzed_meetings:
-                title_lower = (db_meeting.title or "").lower()
-                summary_lower = (db_meeting.summary or "").lower()
+                text = f"{db_meeting.title or ''}\n{db_meeting.summary or ''}"
 
-                # Check if any keyword matches title or summary
-                if any(
-                    keyword in title_lower or keyword in summary_lower
-                    for keyword in keywords
-                ):
+                if has_keywords:
+                    is_relevant = matcher.matches_project(
+                        text, activity.project_key, word_boundaries=False
+                    )
+                else:
+                    is_relevant = project_key_lower in text.lower()
+
+                if is_relevant:
                     # Parse topics from JSON if available
                     topics_data = []
                     if db_meeting.topics:
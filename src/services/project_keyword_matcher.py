@@ -0,0 +1,332 @@
+"""Compiled multi-pattern project keyword matcher.
+
+Project detection used to test every keyword of every project against every
+document with Python substring checks or one regex per keyword, so the cost
+grew with projects x keywords x documents. This module compiles all keywords
+from the ``project_keywords`` table into a single Aho-Corasick automaton that
+finds every keyword occurrence in one linear pass over the text, with
+regex-style ``\\b`` word-boundary handling.
+
+The shared matcher (``get_project_keyword_matcher``) is rebuilt only when the
+table changes. At most once per ``check_interval`` seconds each process
+compares a fingerprint: the row count and max id (which catch the
+delete-and-reinsert writes this app makes) plus a version number in Redis.
+Keyword writers call ``invalidate_project_keyword_matcher``, which bumps that
+version so every process rebuilds, including after in-place UPDATEs that
+leave count and max id unchanged.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Common company terms that appear in too many meetings to identify a project
+KEYWORD_BLACKLIST = {"syatt"}
+
+# Seconds between fingerprint checks of the project_keywords table
+DEFAULT_CHECK_INTERVAL = 60
+
+# Cache key of the keyword version bumped by invalidate_project_keyword_matcher
+VERSION_CACHE_KEY = "project_keywords_version"
+
+# Seconds the keyword version is kept in Redis
+VERSION_TTL = 30 * 24 * 60 * 60
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the definition of ``\\w`` used by Python's ``re`` module."""
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Return True if ``\\b`` would match at ``index`` in ``text``."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+class AhoCorasickAutomaton:
+    """Case-insensitive Aho-Corasick automaton over a set of keywords."""
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        """Build the automaton.
+
+        Args:
+            keywords: Keywords to match (case-insensitive, blanks ignored)
+        """
+        # Trie transitions, failure links and the keywords ending at each state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self._built = False
+
+        for keyword in keywords:
+            self.add(keyword)
+        self.build()
+
+    def add(self, keyword: str) -> None:
+        """Add a keyword to the trie (call ``build`` afterwards)."""
+        keyword = (keyword or "").strip().lower()
+        if not keyword:
+            return
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        if keyword not in self._output[state]:
+            self._output[state].append(keyword)
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links breadth-first."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+        self._built = True
+
+    def iter_matches(
+        self, text: str, word_boundaries: bool = True
+    ) -> Iterator[Tuple[int, str]]:
+        """Yield ``(start_index, keyword)`` for every occurrence in ``text``.
+
+        Args:
+            text: Text to scan
+            word_boundaries: Only report matches delimited like ``\\bkeyword\\b``
+        """
+        if not self._built:
+            self.build()
+        if not text:
+            return
+
+        text = text.lower()
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for keyword in self._output[state]:
+                start = index - len(keyword) + 1
+                if not word_boundaries or (
+                    _at_word_boundary(text, start)
+                    and _at_word_boundary(text, index + 1)
+                ):
+                    yield start, keyword
+
+
+class ProjectKeywordMatcher:
+    """Matches text against every project's keywords in a single pass."""
+
+    def __init__(self, keyword_map: Dict[str, List[str]]):
+        """Compile a matcher.
+
+        Args:
+            keyword_map: Dict mapping project_key to its keywords
+        """
+        self.keyword_map: Dict[str, List[str]] = {}
+        self._projects_by_keyword: Dict[str, List[str]] = {}
+
+        for project_key, keywords in keyword_map.items():
+            normalized = list(
+                dict.fromkeys(k.strip().lower() for k in keywords if k and k.strip())
+            )
+            self.keyword_map[project_key] = normalized
+            for keyword in normalized:
+                self._projects_by_keyword.setdefault(keyword, []).append(project_key)
+
+        self._automaton = AhoCorasickAutomaton(self._projects_by_keyword.keys())
+
+    @classmethod
+    def from_projects(cls, projects: List[Dict]) -> "ProjectKeywordMatcher":
+        """Compile a matcher from project dicts with ``key`` and ``keywords``."""
+        return cls({p["key"]: p.get("keywords") or [] for p in projects})
+
+    def keywords_for(self, project_key: str) -> List[str]:
+        """Return the (lowercased) keywords configured for a project."""
+        return self.keyword_map.get(project_key, [])
+
+    def match(
+        self,
+        text: str,
+        ignore_keywords: Optional[Set[str]] = None,
+        word_boundaries: bool = True,
+    ) -> Dict[str, List[str]]:
+        """Find every project whose keywords occur in the text.
+
+        Args:
+            text: Text to scan
+            ignore_keywords: Keywords to skip (e.g. KEYWORD_BLACKLIST)
+            word_boundaries: Require whole-word matches (default True)
+
+        Returns:
+            Dict mapping project_key to the keywords that matched, ordered by
+            the position of each project's first match in the text
+        """
+        matches: Dict[str, List[str]] = {}
+        for _, keyword in sorted(
+            self._automaton.iter_matches(text or "", word_boundaries=word_boundaries)
+        ):
+            if ignore_keywords and keyword in ignore_keywords:
+                continue
+            for project_key in self._projects_by_keyword.get(keyword, []):
+                project_matches = matches.setdefault(project_key, [])
+                if keyword not in project_matches:
+                    project_matches.append(keyword)
+        return matches
+
+    def match_projects(self, text: str, **kwargs) -> List[str]:
+        """Return the project keys whose keywords occur in the text."""
+        return list(self.match(text, **kwargs).keys())
+
+    def matches_project(self, text: str, project_key: str, **kwargs) -> bool:
+        """Return True if any of the project's keywords occur in the text."""
+        return project_key in self.match(text, **kwargs)
+
+    def first_match(
+        self, text: str, projects: List[Dict], **kwargs
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """Return the first project (in ``projects`` order) that matches the text.
+
+        Args:
+            text: Text to scan
+            projects: Candidate project dicts with a ``key`` entry
+
+        Returns:
+            Tuple of (matched project dict, matched keyword), or (None, None)
+        """
+        matches = self.match(text, **kwargs)
+        for project in projects:
+            keywords = matches.get(project["key"])
+            if keywords:
+                return project, keywords[0]
+        return None, None
+
+
+class ProjectKeywordMatcherService:
+    """Holds the shared matcher and rebuilds it when project_keywords changes."""
+
+    def __init__(self, check_interval: int = DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._matcher = ProjectKeywordMatcher({})
+        self._fingerprint = None
+        self._checked_at: Optional[float] = None
+
+    def _load_fingerprint(self, conn):
+        from sqlalchemy import text
+
+        count, max_id = conn.execute(
+            text("SELECT COUNT(*), MAX(id) FROM project_keywords")
+        ).one()
+        return count, max_id, _get_shared_version()
+
+    def _load_keyword_map(self, conn) -> Dict[str, List[str]]:
+        from sqlalchemy import text
+
+        keyword_map: Dict[str, List[str]] = {}
+        result = conn.execute(
+            text("SELECT project_key, keyword FROM project_keywords ORDER BY id")
+        )
+        for project_key, keyword in result:
+            keyword_map.setdefault(project_key, []).append(keyword)
+        return keyword_map
+
+    def get_matcher(self) -> ProjectKeywordMatcher:
+        """Return the current matcher, rebuilding it if the table changed."""
+        now = time.monotonic()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < self.check_interval
+        ):
+            return self._matcher
+
+        with self._lock:
+            if (
+                self._checked_at is not None
+                and now - self._checked_at < self.check_interval
+            ):
+                return self._matcher
+            try:
+                from src.utils.database import get_engine
+
+                with get_engine().connect() as conn:
+                    fingerprint = self._load_fingerprint(conn)
+                    if fingerprint != self._fingerprint:
+                        keyword_map = self._load_keyword_map(conn)
+                        self._matcher = ProjectKeywordMatcher(keyword_map)
+                        self._fingerprint = fingerprint
+                        logger.info(
+                            f"Compiled project keyword matcher: {len(keyword_map)} projects, "
+                            f"{fingerprint[0]} keywords"
+                        )
+            except Exception as e:
+                logger.error(f"Error loading project keywords: {e}")
+            self._checked_at = time.monotonic()
+            return self._matcher
+
+    def invalidate(self) -> None:
+        """Force the next ``get_matcher`` call to check the table again."""
+        with self._lock:
+            self._checked_at = None
+            self._fingerprint = None
+
+
+def _get_shared_version() -> Optional[str]:
+    """Read the keyword version shared by all processes (None without Redis)."""
+    try:
+        from src.utils.cache_manager import get_cache_manager
+
+        cached = get_cache_manager().get(VERSION_CACHE_KEY)
+        return cached["data"] if cached else None
+    except Exception as e:
+        logger.debug(f"Could not read project keyword version: {e}")
+        return None
+
+
+# Singleton instance
+_matcher_service: Optional[ProjectKeywordMatcherService] = None
+
+
+def get_project_keyword_matcher() -> ProjectKeywordMatcher:
+    """Get the shared ProjectKeywordMatcher compiled from project_keywords."""
+    global _matcher_service
+    if _matcher_service is None:
+        _matcher_service = ProjectKeywordMatcherService()
+    return _matcher_service.get_matcher()
+
+
+def invalidate_project_keyword_matcher() -> None:
+    """Rebuild the matcher on next use in every process (call after keyword writes)."""
+    try:
+        from src.utils.cache_manager import get_cache_manager
+
+        get_cache_manager().set(uuid.uuid4().hex, VERSION_CACHE_KEY, VERSION_TTL)
+    except Exception as e:
+        logger.warning(f"Could not publish project keyword version: {e}")
+
+    if _matcher_service is not None:
+        _matcher_service.invalidate()
@@ -121,6 +121,13 @@ class ProjectKeywordSync:
 
                 conn.commit()
 
+            # Recompile the shared project keyword matcher on next use
+            from src.services.project_keyword_matcher import (
+                invalidate_project_keyword_matcher,
+            )
+
+            invalidate_project_keyword_matcher()
+
             logger.info(
                 f"✅ Successfully synced {len(keywords_to_insert)} keywords from {len(projects)} Jira projects"
             )
@@ -2,8 +2,8 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
 import uuid
 
 from config.settings import settings
@@ -12,6 +12,25 @@ from src.integrations.jira_mcp import JiraMCPClient
 
 logger = logging.getLogger(__name__)
 
+# Projects searched at once; requests beyond Jira's rate limit are retried
+# by the client after the server's Retry-After delay
+MAX_CONCURRENT_PROJECTS = 4
+
+# Look-back for projects without a saved high-water mark
+DEFAULT_LOOKBACK = timedelta(hours=24)
+
+# Cap on the look-back when a project hasn't been polled for a long time
+MAX_LOOKBACK = timedelta(days=7)
+
+# Changes per INSERT statement in save_changes_to_db
+SAVE_BATCH_SIZE = 500
+
+# Issue fields read by _format_change
+CHANGE_FIELDS = (
+    "summary,status,priority,assignee,reporter,created,updated,"
+    "issuetype,project,labels"
+)
+
 
 class ProjectMonitor:
     """Service for monitoring Jira project changes."""
@@ -30,90 +49,112 @@ class ProjectMonitor:
         """Poll for changes in specified projects."""
         if not since_timestamp:
             # Default to last 24 hours
-            since_timestamp = datetime.now() - timedelta(hours=24)
+            since_timestamp = datetime.now() - DEFAULT_LOOKBACK
 
-        changes = []
+        changes, _ = await self._poll_projects(
+            {project_key: since_timestamp for project_key in project_keys}
+        )
 
-        async with self.jira_client as client:
-            for project_key in project_keys:
+        # Group changes by ticket to show distinct tickets with combined context
+        grouped_changes = self._group_changes_by_ticket(changes)
+        return grouped_changes
+
+    async def _poll_projects(
+        self, since_by_project: Dict[str, datetime]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Poll projects concurrently, at most MAX_CONCURRENT_PROJECTS at a time.
+
+        Args:
+            since_by_project: Project key -> earliest change to report
+
+        Returns:
+            Tuple of (ungrouped changes, keys of projects polled successfully)
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROJECTS)
+
+        async def poll(client, project_key, since):
+            async with semaphore:
                 try:
-                    project_changes = await self._detect_project_changes(
-                        client, project_key, since_timestamp
+                    return project_key, await self._detect_project_changes(
+                        client, project_key, since
                     )
-                    changes.extend(project_changes)
                 except Exception as e:
                     logger.error(
                         f"Error polling changes for project {project_key}: {e}"
                     )
-                    continue
+                    return project_key, None
 
-        # Group changes by ticket to show distinct tickets with combined context
-        grouped_changes = self._group_changes_by_ticket(changes)
-        return grouped_changes
+        async with self.jira_client as client:
+            results = await asyncio.gather(
+                *[
+                    poll(client, project_key, since)
+                    for project_key, since in since_by_project.items()
+                ]
+            )
+
+        changes = []
+        completed = []
+        for project_key, project_changes in results:
+            if project_changes is None:
+                continue
+            changes.extend(project_changes)
+            completed.append(project_key)
+
+        return changes, completed
 
     async def _detect_project_changes(
         self, client: JiraMCPClient, project_key: str, since: datetime
-    ) -> List[Dict[str, Any]]:
-        """Detect changes in a specific project."""
-        changes = []
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Detect changes in a specific project.
 
-        try:
-            # Format timestamp for JQL
-            since_jql = since.strftime("%Y-%m-%d %H:%M")
+        One paginated, changelog-expanded search covers both new tickets and
+        updates to existing ones (a newly created ticket is also "updated").
 
-            # Query for recently created tickets
-            created_jql = f'project = "{project_key}" AND created >= "{since_jql}" ORDER BY created DESC'
-            created_tickets = await client.search_tickets(created_jql, max_results=100)
+        Returns:
+            List of changes, or None if the Jira search failed
+        """
+        # Format timestamp for JQL
+        since_jql = since.strftime("%Y-%m-%d %H:%M")
+        jql = f'project = "{project_key}" AND updated >= "{since_jql}" ORDER BY updated ASC'
 
-            for ticket in created_tickets:
+        tickets = await client.search_tickets_with_changelog(
+            jql, fields=CHANGE_FIELDS, since=since
+        )
+        if tickets is None:
+            return None
+
+        changes = []
+        for ticket in tickets:
+            created_time = self._parse_jira_timestamp(ticket["fields"]["created"])
+            if created_time >= since:
                 changes.append(
                     self._format_change(
                         project_key=project_key,
                         change_type="created",
                         ticket=ticket,
-                        change_timestamp=self._parse_jira_timestamp(
-                            ticket["fields"]["created"]
-                        ),
+                        change_timestamp=created_time,
                     )
                 )
+                continue
 
-            # Query for recently updated tickets
-            updated_jql = f'project = "{project_key}" AND updated >= "{since_jql}" ORDER BY updated DESC'
-            updated_tickets = await client.search_tickets(updated_jql, max_results=100)
-
-            for ticket in updated_tickets:
-                # Skip if this was already captured as a new ticket
-                created_time = self._parse_jira_timestamp(ticket["fields"]["created"])
-                if created_time >= since:
-                    continue
-
-                # Get detailed change history
-                detailed_changes = await self._get_ticket_change_history(
-                    client, ticket, since
-                )
-                changes.extend(detailed_changes)
-
-        except Exception as e:
-            logger.error(f"Error detecting changes for project {project_key}: {e}")
+            changes.extend(self._get_ticket_change_history(ticket, since))
 
         return changes
 
-    async def _get_ticket_change_history(
-        self, client: JiraMCPClient, ticket: Dict[str, Any], since: datetime
+    def _get_ticket_change_history(
+        self, ticket: Dict[str, Any], since: datetime
     ) -> List[Dict[str, Any]]:
-        """Get detailed change history for a ticket."""
+        """Extract meaningful changes since ``since`` from a ticket's changelog."""
         changes = []
         ticket_key = ticket["key"]
         project_key = ticket["fields"]["project"]["key"]
 
         try:
-            # Get ticket with change history
-            changelog_ticket = await client.get_ticket_with_changelog(ticket_key)
-
-            if not changelog_ticket or "changelog" not in changelog_ticket:
+            changelog = ticket.get("changelog")
+            if not changelog:
                 return changes
 
-            for history in changelog_ticket["changelog"]["histories"]:
+            for history in changelog.get("histories", []):
                 change_time = self._parse_jira_timestamp(history["created"])
 
                 # Only include changes after our since timestamp
@@ -148,7 +189,7 @@ class ProjectMonitor:
                     )
 
         except Exception as e:
-            logger.error(f"Error getting change history for ticket {ticket_key}: {e}")
+            logger.error(f"Error reading change history for ticket {ticket_key}: {e}")
 
         return changes
 
@@ -367,58 +408,140 @@ class ProjectMonitor:
             logger.error(f"Error parsing Jira timestamp {timestamp_str}: {e}")
             return datetime.now()
 
-    async def save_changes_to_db(self, changes: List[Dict[str, Any]]):
-        """Save detected changes to the database."""
+    async def save_changes_to_db(self, changes: List[Dict[str, Any]]) -> bool:
+        """Save detected changes to the database.
+
+        Rows are written in batches of SAVE_BATCH_SIZE, each as a single
+        ``INSERT ... ON CONFLICT DO NOTHING`` against the natural key
+        (ticket_key, change_type, change_timestamp), so already-saved changes
+        are skipped without a lookup per row.
+
+        Returns:
+            True if the changes were saved (or there were none)
+        """
         if not changes:
-            return
+            return True
 
         try:
             from src.models import ProjectChange
-            from sqlalchemy.orm import sessionmaker
-            from sqlalchemy import create_engine
-
-            engine = create_engine(settings.agent.database_url)
-            Session = sessionmaker(bind=engine)
-            db_session = Session()
+            from src.utils.database import get_engine
 
-            for change_data in changes:
-                # Check if this change already exists (avoid duplicates)
-                existing = (
-                    db_session.query(ProjectChange)
-                    .filter_by(
-                        ticket_key=change_data["ticket_key"],
-                        change_type=change_data["change_type"],
-                        change_timestamp=change_data["change_timestamp"],
+            engine = get_engine()
+            if engine.dialect.name == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            rows = [
+                {
+                    "id": change_data["id"],
+                    "project_key": change_data["project_key"],
+                    "change_type": change_data["change_type"],
+                    "ticket_key": change_data["ticket_key"],
+                    "ticket_title": change_data["ticket_title"],
+                    "old_value": change_data["old_value"],
+                    "new_value": change_data["new_value"],
+                    "assignee": change_data["assignee"],
+                    "reporter": change_data["reporter"],
+                    "priority": change_data["priority"],
+                    "status": change_data["status"],
+                    "change_timestamp": change_data["change_timestamp"],
+                    "detected_at": change_data["detected_at"],
+                    "change_details": change_data["change_details"],
+                    "created_at": datetime.now(timezone.utc),
+                }
+                for change_data in changes
+            ]
+
+            inserted = 0
+            with engine.begin() as conn:
+                for start in range(0, len(rows), SAVE_BATCH_SIZE):
+                    stmt = (
+                        insert(ProjectChange)
+                        .values(rows[start : start + SAVE_BATCH_SIZE])
+                        .on_conflict_do_nothing(
+                            index_elements=[
+                                "ticket_key",
+                                "change_type",
+                                "change_timestamp",
+                            ]
+                        )
                     )
-                    .first()
+                    inserted += conn.execute(stmt).rowcount
+
+            logger.info(
+                f"Saved {inserted} new project changes to database "
+                f"({len(changes) - inserted} already recorded)"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving changes to database: {e}")
+            return False
+
+    def _load_high_water_marks(
+        self, project_keys: List[str], now: datetime
+    ) -> Dict[str, datetime]:
+        """Get the point each project's next poll should start from.
+
+        Args:
+            project_keys: Projects about to be polled
+            now: Start time of this poll
+
+        Returns:
+            Project key -> since timestamp (DEFAULT_LOOKBACK for projects never
+            polled, never further back than MAX_LOOKBACK)
+        """
+        since_by_project = {key: now - DEFAULT_LOOKBACK for key in project_keys}
+
+        try:
+            from src.models import ProjectChangePollState
+            from src.utils.database import close_session, get_session
+
+            db_session = get_session()
+            try:
+                states = (
+                    db_session.query(ProjectChangePollState)
+                    .filter(ProjectChangePollState.project_key.in_(project_keys))
+                    .all()
                 )
+            finally:
+                close_session(db_session)
 
-                if not existing:
-                    change = ProjectChange(
-                        id=change_data["id"],
-                        project_key=change_data["project_key"],
-                        change_type=change_data["change_type"],
-                        ticket_key=change_data["ticket_key"],
-                        ticket_title=change_data["ticket_title"],
-                        old_value=change_data["old_value"],
-                        new_value=change_data["new_value"],
-                        assignee=change_data["assignee"],
-                        reporter=change_data["reporter"],
-                        priority=change_data["priority"],
-                        status=change_data["status"],
-                        change_timestamp=change_data["change_timestamp"],
-                        detected_at=change_data["detected_at"],
-                        change_details=change_data["change_details"],
-                    )
-                    db_session.add(change)
+            earliest = now - MAX_LOOKBACK
+            for state in states:
+                since_by_project[state.project_key] = max(
+                    state.last_polled_at, earliest
+                )
 
-            db_session.commit()
-            db_session.close()
+        except Exception as e:
+            logger.error(f"Error loading project poll high-water marks: {e}")
+
+        return since_by_project
 
-            logger.info(f"Saved {len(changes)} project changes to database")
+    def _save_high_water_marks(self, project_keys: List[str], polled_at: datetime):
+        """Record that changes up to ``polled_at`` are saved for these projects."""
+        if not project_keys:
+            return
+
+        try:
+            from src.models import ProjectChangePollState
+            from src.utils.database import close_session, get_session
+
+            db_session = get_session()
+            try:
+                for project_key in project_keys:
+                    db_session.merge(
+                        ProjectChangePollState(
+                            project_key=project_key, last_polled_at=polled_at
+                        )
+                    )
+                db_session.commit()
+            finally:
+                close_session(db_session)
 
         except Exception as e:
-            logger.error(f"Error saving changes to database: {e}")
+            logger.error(f"Error saving project poll high-water marks: {e}")
 
     async def get_user_project_changes(
         self, email: str, since: Optional[datetime] = None
@@ -513,12 +636,18 @@ class ProjectMonitor:
                 f"Polling changes for {len(all_projects)} projects: {list(all_projects)}"
             )
 
-            # Poll for changes in the last 24 hours
-            since = datetime.now() - timedelta(hours=24)
-            changes = await self.poll_project_changes(list(all_projects), since)
+            # Each project picks up where its last saved poll ended
+            poll_started = datetime.now()
+            since_by_project = self._load_high_water_marks(
+                sorted(all_projects), poll_started
+            )
+            raw_changes, completed = await self._poll_projects(since_by_project)
+            changes = self._group_changes_by_ticket(raw_changes)
 
-            # Save changes to database
-            await self.save_changes_to_db(changes)
+            # Save changes to database, then advance the high-water marks of
+            # projects whose search succeeded
+            if await self.save_changes_to_db(changes):
+                self._save_high_water_marks(completed, poll_started)
 
             logger.info(f"Daily poll completed: found {len(changes)} changes")
 
@@ -0,0 +1,320 @@
+"""Local directory of external resources for typeahead search.
+
+The project resource mapping UI searches Slack channels, Notion pages,
+GitHub repos and Jira projects as the user types. Instead of calling each
+provider's API per keystroke, ``refresh_directory`` (run periodically by
+``src.tasks.directory_tasks`` and on demand) copies every resource into the
+``external_resources`` table, and ``search_resources`` answers typeahead
+with a single indexed query.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, select
+
+from src.models import ExternalResource
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = ("slack", "notion", "github", "jira")
+
+# Maximum typeahead results returned per search
+SEARCH_LIMIT = 100
+
+# Resources not seen by a refresh for this long are dropped; a grace period
+# keeps a partially failed listing from deleting rows that still exist
+PRUNE_AFTER = timedelta(days=3)
+
+# Rows per INSERT ... ON CONFLICT statement during a refresh
+UPSERT_BATCH_SIZE = 500
+
+# Page size for the Jira project listing API
+JIRA_PAGE_SIZE = 50
+
+
+def _entry(
+    resource_id: str, name: str, search_text: Optional[str] = None, **attributes
+) -> Dict[str, Any]:
+    return {
+        "resource_id": str(resource_id),
+        "name": name,
+        "search_text": (search_text or name).strip().lower(),
+        "attributes": attributes,
+    }
+
+
+def _fetch_slack_channels() -> Optional[List[Dict[str, Any]]]:
+    """List public Slack channels from the shared SlackDirectory.
+
+    The directory's own refresh task already crawls ``conversations_list``;
+    reading its (Redis-shared) copy avoids a second crawl here.
+    """
+    from src.services.slack_directory import get_slack_directory
+
+    directory = get_slack_directory()
+    if directory is None:
+        return None
+
+    # Only public channels are offered in typeahead
+    return [
+        _entry(
+            channel["id"],
+            channel["name"],
+            is_private=False,
+            num_members=channel.get("num_members", 0),
+        )
+        for channel in directory.list_channels()
+        if channel.get("type") == "public_channel"
+    ]
+
+
+def _fetch_notion_pages() -> Optional[List[Dict[str, Any]]]:
+    """List every Notion page shared with the integration."""
+    from src.integrations.notion_api import NotionAPIClient
+
+    notion_api_key = os.getenv("NOTION_API_KEY")
+    if not notion_api_key:
+        return None
+
+    notion_client = NotionAPIClient(api_key=notion_api_key)
+
+    entries = []
+    start_cursor = None
+    while True:
+        result = notion_client.search(
+            filter_type="page", page_size=100, start_cursor=start_cursor
+        )
+        for page in result.get("results", []):
+            parent = page.get("parent", {})
+            parent_type = parent.get("type", "workspace")
+
+            # Extract parent ID based on type
+            parent_id = None
+            if parent_type == "page_id":
+                parent_id = parent.get("page_id")
+            elif parent_type == "database_id":
+                parent_id = parent.get("database_id")
+
+            entries.append(
+                _entry(
+                    page["id"],
+                    notion_client.get_page_title(page),
+                    url=page.get("url", ""),
+                    parent=parent,
+                    parent_type=parent_type,
+                    parent_id=parent_id,
+                )
+            )
+
+        start_cursor = result.get("next_cursor")
+        if not result.get("has_more") or not start_cursor:
+            return entries
+
+
+def _fetch_github_repos() -> Optional[List[Dict[str, Any]]]:
+    """List every repository the GitHub App (or token) can access."""
+    import asyncio
+    from config.settings import settings
+    from src.integrations.github_client import GitHubClient
+
+    has_app_auth = all(
+        [
+            settings.github.app_id,
+            settings.github.private_key,
+            settings.github.installation_id,
+        ]
+    )
+    if not (has_app_auth or settings.github.api_token):
+        return None
+
+    github_client = GitHubClient(
+        api_token=settings.github.api_token,
+        organization=settings.github.organization,
+        app_id=settings.github.app_id,
+        private_key=settings.github.private_key,
+        installation_id=settings.github.installation_id,
+    )
+    repos = asyncio.run(github_client.list_accessible_repos())
+    return [_entry(repo, repo) for repo in repos]
+
+
+def _fetch_jira_projects() -> Optional[List[Dict[str, Any]]]:
+    """List every Jira project, paging through /project/search."""
+    import requests
+    from requests.auth import HTTPBasicAuth
+    from config.settings import settings
+
+    if not all([settings.jira.url, settings.jira.username, settings.jira.api_token]):
+        return None
+
+    url = f"{settings.jira.url}/rest/api/3/project/search"
+    auth = HTTPBasicAuth(settings.jira.username, settings.jira.api_token)
+    headers = {"Accept": "application/json"}
+
+    entries = []
+    start_at = 0
+    with requests.Session() as session:
+        while True:
+            response = session.get(
+                url,
+                params={"startAt": start_at, "maxResults": JIRA_PAGE_SIZE},
+                auth=auth,
+                headers=headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            projects = data.get("values", [])
+            for project in projects:
+                key, name = project.get("key"), project.get("name") or ""
+                # Key first so typing a key prefix matches
+                entries.append(_entry(key, name, search_text=f"{key} {name}"))
+
+            start_at += len(projects)
+            if data.get("isLast", True) or not projects:
+                return entries
+
+
+FETCHERS: Dict[str, Callable[[], Optional[List[Dict[str, Any]]]]] = {
+    "slack": _fetch_slack_channels,
+    "notion": _fetch_notion_pages,
+    "github": _fetch_github_repos,
+    "jira": _fetch_jira_projects,
+}
+
+
+def store_resources(
+    engine, provider: str, entries: List[Dict[str, Any]], now: datetime
+) -> int:
+    """
+    Upsert a provider's resources and drop ones not seen for PRUNE_AFTER.
+
+    Args:
+        engine: SQLAlchemy engine
+        provider: Provider name (see PROVIDERS)
+        entries: Resources from the provider's fetcher
+        now: Refresh timestamp recorded on every upserted row
+
+    Returns:
+        Number of resources upserted
+    """
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    # One row per resource; ON CONFLICT can't touch the same row twice
+    rows = list(
+        {
+            entry["resource_id"]: {**entry, "provider": provider, "refreshed_at": now}
+            for entry in entries
+        }.values()
+    )
+
+    with engine.begin() as conn:
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = insert(ExternalResource).values(
+                rows[start : start + UPSERT_BATCH_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["provider", "resource_id"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "search_text": stmt.excluded.search_text,
+                    "attributes": stmt.excluded.attributes,
+                    "refreshed_at": stmt.excluded.refreshed_at,
+                },
+            )
+            conn.execute(stmt)
+
+        pruned = conn.execute(
+            delete(ExternalResource).where(
+                ExternalResource.provider == provider,
+                ExternalResource.refreshed_at < now - PRUNE_AFTER,
+            )
+        ).rowcount
+
+    if pruned:
+        logger.info(f"Pruned {pruned} stale {provider} resources")
+    return len(rows)
+
+
+def refresh_directory(
+    providers: Optional[Iterable[str]] = None, engine=None
+) -> Dict[str, Optional[int]]:
+    """
+    Refresh the resource directory from the providers' APIs.
+
+    A provider that isn't configured or whose listing fails is skipped and
+    keeps its existing rows.
+
+    Args:
+        providers: Providers to refresh (default: all of PROVIDERS)
+        engine: SQLAlchemy engine (default: the app engine)
+
+    Returns:
+        Resources stored per provider (None if skipped)
+    """
+    if engine is None:
+        from src.utils.database import get_engine
+
+        engine = get_engine()
+
+    results: Dict[str, Optional[int]] = {}
+    for provider in providers or PROVIDERS:
+        if provider not in FETCHERS:
+            logger.warning(f"Unknown resource provider: {provider}")
+            results[provider] = None
+            continue
+
+        try:
+            entries = FETCHERS[provider]()
+            if entries is None:
+                logger.info(f"{provider} not configured, skipping directory refresh")
+                results[provider] = None
+                continue
+
+            results[provider] = store_resources(
+                engine, provider, entries, datetime.now(timezone.utc)
+            )
+            logger.info(f"Refreshed {results[provider]} {provider} resources")
+        except Exception as e:
+            logger.error(f"Error refreshing {provider} resources: {e}", exc_info=True)
+            results[provider] = None
+
+    return results
+
+
+def search_resources(
+    session, provider: str, query: str = "", limit: int = SEARCH_LIMIT
+) -> List[ExternalResource]:
+    """
+    Typeahead search over one provider's resources.
+
+    Matches ``query`` anywhere in the resource's search text (indexed by the
+    trigram index on PostgreSQL), ranking prefix matches first.
+
+    Args:
+        session: SQLAlchemy session
+        provider: Provider name (see PROVIDERS)
+        query: Text typed by the user (case-insensitive)
+        limit: Maximum results
+
+    Returns:
+        Matching resources, prefix matches first, then alphabetically
+    """
+    query = query.strip().lower()
+    search_text = ExternalResource.search_text
+
+    stmt = select(ExternalResource).where(ExternalResource.provider == provider)
+    if query:
+        stmt = stmt.where(search_text.contains(query, autoescape=True)).order_by(
+            search_text.startswith(query, autoescape=True).desc()
+        )
+    stmt = stmt.order_by(search_text).limit(limit)
+
+    return list(session.scalars(stmt))
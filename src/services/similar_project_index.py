@@ -0,0 +1,205 @@
+"""Precomputed characteristic matrix for similar-project lookups.
+
+Intelligent forecasting ranks historical projects by Euclidean distance in
+the six-dimensional characteristic space. Rather than rebuilding that space
+row by row on every forecast, this module keeps a NumPy matrix of every
+project included in forecasting and answers nearest-neighbour queries with a
+single vectorized distance computation.
+
+The shared index (``get_similar_project_index``) is rebuilt only when its
+source tables change: a cheap fingerprint query (row counts + latest
+``updated_at``) is checked at most once per ``check_interval`` seconds, and
+baseline rebuilds call ``invalidate_similar_project_index`` to force a
+rebuild.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Characteristic dimensions (1-5 scale, 3 when unset)
+CHARACTERISTIC_KEYS = (
+    "be_integrations",
+    "custom_theme",
+    "custom_designs",
+    "ux_research",
+    "extensive_customizations",
+    "project_oversight",
+)
+DEFAULT_CHARACTERISTIC = 3
+
+# Max possible distance = sqrt(6 * 4^2) = sqrt(96) ≈ 9.8
+MAX_DISTANCE = 9.8
+
+# Seconds between fingerprint checks of the source tables
+DEFAULT_CHECK_INTERVAL = 60
+
+
+class SimilarProjectIndex:
+    """Nearest-neighbour lookup over project characteristic vectors."""
+
+    def __init__(self, characteristics: Dict[str, Dict[str, int]]):
+        """Build the index.
+
+        Args:
+            characteristics: Dict mapping project_key to its characteristics
+        """
+        self.project_keys: List[str] = list(characteristics)
+        self.characteristics = characteristics
+        self.matrix = np.array(
+            [
+                [
+                    characteristics[key].get(dim, DEFAULT_CHARACTERISTIC)
+                    for dim in CHARACTERISTIC_KEYS
+                ]
+                for key in self.project_keys
+            ],
+            dtype=float,
+        ).reshape(len(self.project_keys), len(CHARACTERISTIC_KEYS))
+
+    def __len__(self) -> int:
+        return len(self.project_keys)
+
+    @staticmethod
+    def vector(target_characteristics: Dict[str, int]) -> np.ndarray:
+        """Convert a characteristics dict into a feature vector."""
+        return np.array(
+            [
+                target_characteristics.get(dim, DEFAULT_CHARACTERISTIC)
+                for dim in CHARACTERISTIC_KEYS
+            ],
+            dtype=float,
+        )
+
+    def nearest(
+        self, target_characteristics: Dict[str, int], limit: int = 5
+    ) -> List[Tuple[str, float]]:
+        """Find the projects closest to the target characteristics.
+
+        Args:
+            target_characteristics: Characteristics of the new project
+            limit: Maximum number of projects to return
+
+        Returns:
+            List of (project_key, similarity_score) tuples, most similar
+            first; similarity is 1 - distance / MAX_DISTANCE, floored at 0
+        """
+        if not self.project_keys:
+            return []
+
+        distances = np.linalg.norm(
+            self.matrix - self.vector(target_characteristics), axis=1
+        )
+        similarities = np.maximum(0.0, 1.0 - distances / MAX_DISTANCE).round(3)
+
+        # Stable sort keeps table order among equally similar projects
+        order = np.argsort(-similarities, kind="stable")[:limit]
+        return [(self.project_keys[i], float(similarities[i])) for i in order]
+
+
+def _load_characteristics(session) -> Dict[str, Dict[str, int]]:
+    """Load characteristics of every project included in forecasting."""
+    from src.models import ProjectCharacteristics, ProjectForecastingConfig
+
+    rows = (
+        session.query(ProjectCharacteristics)
+        .join(
+            ProjectForecastingConfig,
+            ProjectCharacteristics.project_key == ProjectForecastingConfig.project_key,
+        )
+        .filter(ProjectForecastingConfig.include_in_forecasting == True)
+        .order_by(ProjectCharacteristics.id)
+        .all()
+    )
+    return {
+        row.project_key: {dim: getattr(row, dim) for dim in CHARACTERISTIC_KEYS}
+        for row in rows
+    }
+
+
+def _load_fingerprint(session) -> tuple:
+    """Cheap change detector for the tables the index is built from."""
+    from sqlalchemy import func
+    from src.models import ProjectCharacteristics, ProjectForecastingConfig
+
+    characteristics = session.query(
+        func.count(ProjectCharacteristics.id),
+        func.max(ProjectCharacteristics.updated_at),
+    ).one()
+    configs = session.query(
+        func.count(ProjectForecastingConfig.project_key),
+        func.max(ProjectForecastingConfig.updated_at),
+    ).one()
+    return tuple(characteristics) + tuple(configs)
+
+
+class SimilarProjectIndexService:
+    """Holds the shared index and rebuilds it when its source data changes."""
+
+    def __init__(self, check_interval: int = DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._index = SimilarProjectIndex({})
+        self._fingerprint = None
+        self._checked_at: Optional[float] = None
+
+    def _is_fresh(self, now: float) -> bool:
+        return (
+            self._checked_at is not None
+            and now - self._checked_at < self.check_interval
+        )
+
+    def get_index(self, session) -> SimilarProjectIndex:
+        """Return the current index, rebuilding it if the tables changed.
+
+        Args:
+            session: SQLAlchemy session used for the fingerprint/rebuild
+        """
+        now = time.monotonic()
+        if self._is_fresh(now):
+            return self._index
+
+        with self._lock:
+            if self._is_fresh(now):
+                return self._index
+            try:
+                fingerprint = _load_fingerprint(session)
+                if fingerprint != self._fingerprint:
+                    self._index = SimilarProjectIndex(_load_characteristics(session))
+                    self._fingerprint = fingerprint
+                    logger.info(
+                        f"Built similar-project index: {len(self._index)} projects"
+                    )
+            except Exception as e:
+                logger.error(f"Error building similar-project index: {e}")
+            self._checked_at = time.monotonic()
+            return self._index
+
+    def invalidate(self) -> None:
+        """Force the next ``get_index`` call to rebuild the index."""
+        with self._lock:
+            self._checked_at = None
+            self._fingerprint = None
+
+
+# Singleton instance
+_index_service: Optional[SimilarProjectIndexService] = None
+
+
+def get_similar_project_index(session) -> SimilarProjectIndex:
+    """Get the shared SimilarProjectIndex built from project characteristics."""
+    global _index_service
+    if _index_service is None:
+        _index_service = SimilarProjectIndexService()
+    return _index_service.get_index(session)
+
+
+def invalidate_similar_project_index() -> None:
+    """Rebuild the shared index on next use (call after baseline rebuilds)."""
+    if _index_service is not None:
+        _index_service.invalidate()
@@ -0,0 +1,623 @@
+"""Shared, paginated cache of the Slack workspace directory (channels and users).
+
+Resolving a ``#channel-name`` to an ID used to cost a ``conversations.list``
+call per notification, and only the first page of results was ever checked.
+This module keeps a directory that is loaded with full cursor pagination and
+patched incrementally from Slack events (``channel_created``/``channel_deleted``).
+
+The channel list is shared through Redis: the ``refresh_slack_directory``
+Celery beat task reloads it from Slack, and every other process only re-reads
+the shared copy. A process loads channels from Slack itself only when there is
+no shared copy (Redis down or the beat task not running) or after a lookup
+miss.
+
+Users live in a ``SlackUserDirectory`` that is bulk-loaded with ``users.list``
+and persisted to Redis with a TTL per entry, so every worker process shares one
+copy and rewriting ``<@U...>`` mentions costs no API calls once it is warm.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+logger = logging.getLogger(__name__)
+
+# Seconds between scheduled refreshes of the shared directory, and how long a
+# process without Redis keeps its own channel list before reloading it
+DEFAULT_REFRESH_INTERVAL = 900
+
+# Seconds a process serves its in-memory channel list before re-reading the
+# shared copy from Redis
+SHARED_RELOAD_INTERVAL = 60
+
+# Seconds the shared channel list stays in Redis without a refresh
+SHARED_CHANNELS_TTL = 3600
+
+# Minimum seconds between on-demand refreshes triggered by cache misses,
+# so repeated lookups of a missing channel can't hammer the Slack API
+MIN_MISS_REFRESH_INTERVAL = 60
+
+# Page size for conversations.list / users.list (Slack maximum is 1000)
+PAGE_LIMIT = 1000
+
+# Seconds a cached Slack user entry stays valid (in memory and in Redis)
+DEFAULT_USER_TTL = 86400
+
+# Seconds a "user not found" result is remembered before asking Slack again
+MISSING_USER_TTL = 600
+
+CHANNEL_ID_PATTERN = re.compile(r"^[CGD][A-Z0-9]{8,}$")
+SLACK_MENTION_PATTERN = re.compile(r"<@([A-Z0-9]+)(?:\|[^>]*)?>")
+
+# Redis clients by URL, connected once per process (None if unreachable)
+_redis_clients: Dict[str, Optional[redis.Redis]] = {}
+_redis_clients_lock = threading.Lock()
+
+
+def _get_redis(redis_url: str) -> Optional[redis.Redis]:
+    """Get the process-wide Redis client for a URL, or None if unavailable."""
+    with _redis_clients_lock:
+        if redis_url not in _redis_clients:
+            client = None
+            try:
+                client = redis.from_url(
+                    redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                    retry_on_timeout=True,
+                    health_check_interval=30,
+                )
+                client.ping()
+            except Exception as e:
+                logger.warning(
+                    f"Redis unavailable for Slack directory (memory only): {e}"
+                )
+                client = None
+            _redis_clients[redis_url] = client
+        return _redis_clients[redis_url]
+
+
+def _token_namespace(client: WebClient) -> str:
+    """Namespace Redis keys per workspace token without storing the token."""
+    token = getattr(client, "token", None) or ""
+    return hashlib.sha256(token.encode()).hexdigest()[:12]
+
+
+def _paginate(
+    client: WebClient, method: str, key: str, **params
+) -> List[Dict[str, Any]]:
+    """Call a cursor-paginated Slack list method and return all items."""
+    items: List[Dict[str, Any]] = []
+    cursor = None
+    while True:
+        if cursor:
+            params["cursor"] = cursor
+        response = getattr(client, method)(limit=PAGE_LIMIT, **params)
+        items.extend(response.get(key, []))
+        cursor = (response.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return items
+
+
+def _user_entry(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Slack user object to the fields the app uses."""
+    profile = user.get("profile") or {}
+    return {
+        "id": user["id"],
+        "name": user.get("name"),
+        "real_name": user.get("real_name") or profile.get("real_name"),
+        "display_name": profile.get("display_name"),
+        "email": profile.get("email"),
+        "is_bot": user.get("is_bot", False),
+        "deleted": user.get("deleted", False),
+    }
+
+
+def user_display_name(entry: Optional[Dict[str, Any]], user_id: str) -> str:
+    """Return the best display name for a user entry, falling back to the ID."""
+    if not entry:
+        return user_id
+    return (
+        entry.get("display_name")
+        or entry.get("real_name")
+        or entry.get("name")
+        or user_id
+    )
+
+
+class SlackUserDirectory:
+    """Bulk-loaded Slack user directory shared across processes through Redis.
+
+    Lookups go memory -> Redis -> one paginated ``users.list`` bulk load, and
+    only fall back to ``users.info`` for users created since the last bulk
+    load. Every entry carries its own expiry, so entries age out individually
+    instead of the whole cache expiring at once.
+    """
+
+    def __init__(
+        self,
+        client: WebClient,
+        redis_url: Optional[str] = None,
+        ttl: int = DEFAULT_USER_TTL,
+    ):
+        """Initialize the user directory.
+
+        Args:
+            client: Slack WebClient used for users.list / users.info
+            redis_url: Redis connection URL (defaults to REDIS_URL env var)
+            ttl: Seconds each user entry stays cached
+        """
+        self.client = client
+        self.ttl = ttl
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+        self._namespace = _token_namespace(client)
+
+        self._lock = threading.RLock()
+        # user_id -> (entry or None for "not found", expires_at monotonic)
+        self._entries: Dict[str, Tuple[Optional[Dict[str, Any]], float]] = {}
+        self._bulk_loaded_at: Optional[float] = None
+
+        self._redis = _get_redis(self.redis_url)
+
+    def _key(self, user_id: str) -> str:
+        return f"slack_user:{self._namespace}:{user_id}"
+
+    @property
+    def _loaded_key(self) -> str:
+        return f"slack_user:{self._namespace}:_bulk_loaded"
+
+    def _remember(self, user_id: str, entry: Optional[Dict[str, Any]]) -> None:
+        ttl = self.ttl if entry else MISSING_USER_TTL
+        with self._lock:
+            self._entries[user_id] = (entry, time.monotonic() + ttl)
+
+    def _from_memory(self, user_id: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Return (hit, entry) for an unexpired in-memory entry."""
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached and cached[1] > time.monotonic():
+                return True, cached[0]
+            if cached:
+                del self._entries[user_id]
+        return False, None
+
+    def _from_redis(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch entries for several users from Redis in one MGET."""
+        if not self._redis or not user_ids:
+            return {}
+        try:
+            values = self._redis.mget([self._key(uid) for uid in user_ids])
+        except Exception as e:
+            logger.warning(f"Error reading Slack users from Redis: {e}")
+            return {}
+
+        found = {}
+        for user_id, value in zip(user_ids, values):
+            if value:
+                entry = json.loads(value)
+                found[user_id] = entry
+                self._remember(user_id, entry)
+        return found
+
+    def _store(self, entries: List[Dict[str, Any]]) -> None:
+        """Write entries to memory and (pipelined, with per-key TTL) to Redis."""
+        for entry in entries:
+            self._remember(entry["id"], entry)
+        if not self._redis or not entries:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for entry in entries:
+                pipe.setex(self._key(entry["id"]), self.ttl, json.dumps(entry))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error writing Slack users to Redis: {e}")
+
+    def refresh(self) -> int:
+        """Bulk-load every workspace user with paginated ``users.list``.
+
+        Returns:
+            Number of users loaded
+        """
+        members = _paginate(self.client, "users_list", "members")
+        entries = [_user_entry(member) for member in members if "id" in member]
+        self._store(entries)
+
+        with self._lock:
+            self._bulk_loaded_at = time.monotonic()
+        if self._redis:
+            try:
+                self._redis.setex(self._loaded_key, self.ttl, "1")
+            except Exception as e:
+                logger.warning(f"Error marking Slack user directory loaded: {e}")
+
+        logger.info(f"Slack user directory loaded {len(entries)} users")
+        return len(entries)
+
+    def _bulk_load_if_needed(self) -> bool:
+        """Bulk-load unless this process or another worker did so recently."""
+        with self._lock:
+            loaded_at = self._bulk_loaded_at
+        if (
+            loaded_at is not None
+            and time.monotonic() - loaded_at < MIN_MISS_REFRESH_INTERVAL
+        ):
+            return False
+        if loaded_at is None and self._redis:
+            try:
+                if self._redis.exists(self._loaded_key):
+                    # Another worker already populated Redis
+                    with self._lock:
+                        self._bulk_loaded_at = time.monotonic()
+                    return False
+            except Exception:
+                pass
+        self.refresh()
+        return True
+
+    def _fetch_single(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Look up one user created since the last bulk load."""
+        try:
+            response = self.client.users_info(user=user_id)
+            if response.get("ok") and response.get("user"):
+                entry = _user_entry(response["user"])
+                self._store([entry])
+                return entry
+        except SlackApiError as e:
+            logger.warning(f"Could not look up Slack user {user_id}: {e}")
+        self._remember(user_id, None)
+        return None
+
+    def get_users(self, user_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve several user IDs at once.
+
+        Returns:
+            Dict mapping each requested ID to its entry (None if unknown)
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        for user_id in dict.fromkeys(user_ids):
+            hit, entry = self._from_memory(user_id)
+            if hit:
+                results[user_id] = entry
+            else:
+                missing.append(user_id)
+
+        if missing:
+            results.update(self._from_redis(missing))
+            missing = [uid for uid in missing if uid not in results]
+
+        if missing:
+            try:
+                self._bulk_load_if_needed()
+            except Exception as e:
+                logger.warning(f"Slack user directory bulk load failed: {e}")
+            for user_id in missing:
+                hit, entry = self._from_memory(user_id)
+                results[user_id] = entry if hit else self._fetch_single(user_id)
+
+        return results
+
+    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a user ID, or None if unknown."""
+        return self.get_users([user_id]).get(user_id)
+
+    def get_display_name(self, user_id: str) -> str:
+        """Return the best display name for a user, falling back to the ID."""
+        return user_display_name(self.get_user(user_id), user_id)
+
+    def get_email(self, user_id: str) -> Optional[str]:
+        """Return a user's email address, if visible to the bot."""
+        entry = self.get_user(user_id)
+        return entry.get("email") if entry else None
+
+    def replace_mentions(self, text: str, prefix: str = "@") -> str:
+        """Rewrite every ``<@U...>`` mention in the text to a display name.
+
+        All mentioned IDs are resolved in a single batched lookup.
+        """
+        if not text:
+            return text
+        user_ids = SLACK_MENTION_PATTERN.findall(text)
+        if not user_ids:
+            return text
+
+        users = self.get_users(user_ids)
+        return SLACK_MENTION_PATTERN.sub(
+            lambda match: prefix
+            + user_display_name(users.get(match.group(1)), match.group(1)),
+            text,
+        )
+
+
+class SlackDirectory:
+    """Directory of Slack channels and users for one bot token."""
+
+    def __init__(
+        self,
+        client: WebClient,
+        refresh_interval: int = DEFAULT_REFRESH_INTERVAL,
+        redis_url: Optional[str] = None,
+    ):
+        """Initialize the directory.
+
+        Args:
+            client: Slack WebClient used for directory API calls
+            refresh_interval: Seconds before a process without a shared copy
+                reloads channels from Slack
+            redis_url: Redis connection URL (defaults to REDIS_URL env var)
+        """
+        self.client = client
+        self.refresh_interval = refresh_interval
+        redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+        self._lock = threading.RLock()
+        self._channels_by_id: Dict[str, Dict[str, Any]] = {}
+        self._channel_ids_by_name: Dict[str, str] = {}
+        # When channels were last fetched from Slack / last replaced from any source
+        self._channels_loaded_at: Optional[float] = None
+        self._channels_synced_at: Optional[float] = None
+        self.users = SlackUserDirectory(client, redis_url=redis_url)
+
+        self._namespace = _token_namespace(client)
+        self._redis = _get_redis(redis_url)
+
+    @property
+    def _channels_key(self) -> str:
+        return f"slack_directory:{self._namespace}:channels"
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def refresh_channels(self) -> int:
+        """Reload every non-archived public and private channel the bot can see.
+
+        Returns:
+            Number of channels loaded
+        """
+        channels = _paginate(
+            self.client,
+            "conversations_list",
+            "channels",
+            types="public_channel,private_channel",
+            exclude_archived=True,
+        )
+
+        entries = [self._channel_entry(channel) for channel in channels]
+        self._set_channels(entries)
+        with self._lock:
+            self._channels_loaded_at = self._channels_synced_at
+        self._publish_channels()
+
+        logger.info(f"Slack directory loaded {len(entries)} channels")
+        return len(entries)
+
+    def refresh(self) -> Dict[str, Optional[int]]:
+        """Reload channels and users, logging (not raising) API failures.
+
+        Returns:
+            Channels and users loaded (None for a loader that failed)
+        """
+        counts: Dict[str, Optional[int]] = {}
+        for name, loader in (
+            ("channels", self.refresh_channels),
+            ("users", self.users.refresh),
+        ):
+            counts[name] = None
+            try:
+                counts[name] = loader()
+            except SlackApiError as e:
+                logger.warning(f"Slack directory refresh failed ({name}): {e}")
+            except Exception as e:
+                logger.error(f"Error refreshing Slack directory: {e}")
+        return counts
+
+    def _set_channels(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the in-memory channel list."""
+        with self._lock:
+            self._channels_by_id = {entry["id"]: entry for entry in entries}
+            self._channel_ids_by_name = {
+                entry["name"]: entry["id"] for entry in entries
+            }
+            self._channels_synced_at = time.monotonic()
+
+    def _publish_channels(self) -> None:
+        """Write the in-memory channel list to Redis for other processes."""
+        if not self._redis:
+            return
+        with self._lock:
+            if self._channels_synced_at is None:
+                return  # never publish a partial list
+            payload = json.dumps(list(self._channels_by_id.values()))
+        try:
+            self._redis.setex(self._channels_key, SHARED_CHANNELS_TTL, payload)
+        except Exception as e:
+            logger.warning(f"Error writing Slack channels to Redis: {e}")
+
+    def _load_shared_channels(self) -> bool:
+        """Replace the in-memory channel list with the shared copy, if any."""
+        if not self._redis:
+            return False
+        try:
+            payload = self._redis.get(self._channels_key)
+        except Exception as e:
+            logger.warning(f"Error reading Slack channels from Redis: {e}")
+            return False
+        if not payload:
+            return False
+        self._set_channels(json.loads(payload))
+        return True
+
+    def _ensure_channels_loaded(self) -> None:
+        """Keep the in-memory channel list in step with the shared copy.
+
+        Slack is only asked directly when there is no shared copy and the
+        local list is missing or older than ``refresh_interval``.
+        """
+        synced_at = self._channels_synced_at
+        now = time.monotonic()
+        if synced_at is not None and now - synced_at < SHARED_RELOAD_INTERVAL:
+            return
+        if self._load_shared_channels():
+            return
+        if synced_at is None or now - synced_at >= self.refresh_interval:
+            self.refresh_channels()
+
+    def _refresh_channels_on_miss(self) -> bool:
+        """Refresh channels after a lookup miss, at most once per interval."""
+        loaded_at = self._channels_loaded_at
+        if (
+            loaded_at is not None
+            and time.monotonic() - loaded_at < MIN_MISS_REFRESH_INTERVAL
+        ):
+            return False
+        self.refresh_channels()
+        return True
+
+    # ------------------------------------------------------------------
+    # Channels
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _channel_entry(channel: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a Slack channel object into a directory entry."""
+        return {
+            "id": channel["id"],
+            "name": channel.get("name", ""),
+            "type": (
+                "private_channel" if channel.get("is_private") else "public_channel"
+            ),
+            "is_member": channel.get("is_member", False),
+            "num_members": channel.get("num_members", 0),
+        }
+
+    @staticmethod
+    def looks_like_channel_id(value: str) -> bool:
+        """Return True if the value is shaped like a Slack conversation ID."""
+        return bool(CHANNEL_ID_PATTERN.match(value or ""))
+
+    def list_channels(self) -> List[Dict[str, Any]]:
+        """Return all cached channels (loading them on first use)."""
+        self._ensure_channels_loaded()
+        with self._lock:
+            return list(self._channels_by_id.values())
+
+    def get_channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached channel entry for an ID, if known."""
+        self._ensure_channels_loaded()
+        with self._lock:
+            return self._channels_by_id.get(channel_id)
+
+    def resolve_channel(self, channel: str) -> Optional[str]:
+        """Resolve ``#name``, ``name`` or a channel ID to a channel ID.
+
+        Channel IDs are returned as-is without an API call. Names are looked up
+        in the cache; on a miss the channel list is refreshed once (rate
+        limited) before giving up.
+
+        Returns:
+            Channel ID, or None if the name is unknown
+        """
+        clean_name = (channel or "").strip().lstrip("#")
+        if not clean_name:
+            return None
+        if self.looks_like_channel_id(clean_name):
+            return clean_name
+
+        self._ensure_channels_loaded()
+        with self._lock:
+            channel_id = self._channel_ids_by_name.get(clean_name)
+        if channel_id:
+            return channel_id
+
+        if self._refresh_channels_on_miss():
+            with self._lock:
+                return self._channel_ids_by_name.get(clean_name)
+        return None
+
+    def add_channel(self, channel: Dict[str, Any]) -> None:
+        """Add or update a channel (e.g. from a ``channel_created`` event)."""
+        if not channel or "id" not in channel:
+            return
+        entry = self._channel_entry(channel)
+        with self._lock:
+            previous = self._channels_by_id.get(entry["id"])
+            if previous and previous["name"] != entry["name"]:
+                self._channel_ids_by_name.pop(previous["name"], None)
+            self._channels_by_id[entry["id"]] = entry
+            self._channel_ids_by_name[entry["name"]] = entry["id"]
+        self._publish_channels()
+
+    def remove_channel(self, channel_id: str) -> None:
+        """Remove a channel (e.g. from a ``channel_deleted`` event)."""
+        with self._lock:
+            entry = self._channels_by_id.pop(channel_id, None)
+            if entry and self._channel_ids_by_name.get(entry["name"]) == channel_id:
+                del self._channel_ids_by_name[entry["name"]]
+        if entry:
+            self._publish_channels()
+
+    # ------------------------------------------------------------------
+    # Users
+    # ------------------------------------------------------------------
+
+    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached Slack user entry for an ID, if known."""
+        return self.users.get_user(user_id)
+
+    def get_user_display_name(self, user_id: str) -> str:
+        """Return the best display name for a user, falling back to the ID."""
+        return self.users.get_display_name(user_id)
+
+
+# Directories keyed by bot token so workspaces never share a cache
+_directories: Dict[str, SlackDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+def get_slack_directory(
+    token: Optional[str] = None, client: Optional[WebClient] = None
+) -> Optional[SlackDirectory]:
+    """Get the shared SlackDirectory for a bot token.
+
+    The first call for a token creates the directory; channels are read from
+    the shared copy (kept fresh by the ``refresh_slack_directory`` task) on
+    first lookup.
+
+    Args:
+        token: Slack bot token (defaults to SLACK_BOT_TOKEN)
+        client: Optional existing WebClient to reuse for API calls
+
+    Returns:
+        SlackDirectory instance, or None if no token is configured
+    """
+    token = token or (client.token if client else None) or os.getenv("SLACK_BOT_TOKEN")
+    if not token:
+        return None
+
+    with _directories_lock:
+        directory = _directories.get(token)
+        if directory is None:
+            directory = SlackDirectory(client or WebClient(token=token))
+            _directories[token] = directory
+        return directory
+
+
+def get_slack_user_directory(
+    token: Optional[str] = None, client: Optional[WebClient] = None
+) -> Optional[SlackUserDirectory]:
+    """Get the shared SlackUserDirectory for a bot token (see get_slack_directory)."""
+    directory = get_slack_directory(token, client=client)
+    return directory.users if directory else None
@@ -366,6 +366,31 @@ class VectorIngestService:
         """
         documents = []
 
+        # Shared Slack user directory: resolves authors and <@U...> mentions
+        # without per-message users.info calls
+        from src.services.slack_directory import (
+            get_slack_user_directory,
+            user_display_name,
+        )
+
+        user_directory = get_slack_user_directory(
+            self.settings.notifications.slack_bot_token
+        )
+        user_names = {}
+        if user_directory:
+            try:
+                user_names = {
+                    user_id: entry
+                    for user_id, entry in user_directory.get_users(
+                        [msg["user"] for msg in messages if msg.get("user")]
+                    ).items()
+                    if entry
+                }
+            except Exception as e:
+                logger.warning(
+                    f"Could not resolve Slack users for #{channel_name}: {e}"
+                )
+
         for msg in messages:
             try:
                 # Generate unique ID
@@ -380,6 +405,11 @@ class VectorIngestService:
                 text = msg.get("text", "")
                 if not text:
                     continue
+                if user_directory:
+                    text = user_directory.replace_mentions(text)
+
+                user_id = msg.get("user", "unknown")
+                author = user_names.get(user_id)
 
                 # Create document
                 doc = VectorDocument(
@@ -391,7 +421,10 @@ class VectorIngestService:
                         "channel_id": channel_id,
                         "channel_name": channel_name,
                         "is_private": is_private,
-                        "user_id": msg.get("user", "unknown"),
+                        "user_id": user_id,
+                        "user_name": (
+                            user_display_name(author, user_id) if author else user_id
+                        ),
                         "timestamp": msg_date.isoformat(),
                         "timestamp_epoch": int(
                             msg_date.timestamp()
@@ -1041,39 +1074,16 @@ class VectorIngestService:
             List of project keys whose keywords match the title
         """
         try:
-            from src.utils.database import get_engine
-            from sqlalchemy import text
-
-            # Normalize title for case-insensitive matching
-            title_lower = title.lower()
-
-            engine = get_engine()
-            matched_projects = []
-
-            with engine.connect() as conn:
-                # Get all project keywords
-                result = conn.execute(
-                    text("SELECT DISTINCT project_key, keyword FROM project_keywords")
-                )
-
-                # Group keywords by project
-                project_keywords = {}
-                for row in result:
-                    project_key, keyword = row
-                    if project_key not in project_keywords:
-                        project_keywords[project_key] = []
-                    project_keywords[project_key].append(keyword.lower())
-
-                # Check each project's keywords against title
-                for project_key, keywords in project_keywords.items():
-                    for keyword in keywords:
-                        if keyword in title_lower:
-                            matched_projects.append(project_key)
-                            logger.debug(
-                                f"Matched '{title}' to project {project_key} via keyword '{keyword}'"
-                            )
-                            break  # Only add project once even if multiple keywords match
+            from src.services.project_keyword_matcher import (
+                get_project_keyword_matcher,
+            )
 
+            # Substring matching: a keyword may appear inside a longer word
+            matched_projects = get_project_keyword_matcher().match_projects(
+                title, word_boundaries=False
+            )
+            if matched_projects:
+                logger.debug(f"Matched '{title}' to projects {matched_projects}")
             return matched_projects
 
         except Exception as e:
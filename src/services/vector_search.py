@@ -195,6 +195,7 @@ class VectorSearchService:
                     date=result_date,
                     url=metadata.get("url") or metadata.get("permalink"),
                     author=metadata.get("assignee")
+                    or metadata.get("user_name")
                     or metadata.get("user_id", "Unknown"),
                     relevance_score=boosted_score,
                     # Jira-specific metadata (only populated for Jira sources)
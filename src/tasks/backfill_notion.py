@@ -48,24 +48,13 @@ def backfill_notion_pages(days_back: int = 2555):
 
     # Fetch full content for each page
     logger.info("📝 Fetching full content for each page...")
-    full_content_map = {}
-    failed_count = 0
-
-    for i, page in enumerate(pages, 1):
-        try:
-            if i % 10 == 0:
-                logger.info(f"   Progress: {i}/{len(pages)} pages processed...")
-
-            page_id = page.get("id", "")
-            if page_id:
-                full_content = notion_client.get_full_page_content(page_id)
-                if full_content and full_content.strip():
-                    full_content_map[page_id] = full_content
-                else:
-                    failed_count += 1
-        except Exception as e:
-            logger.error(f"Error fetching content for page {page_id}: {e}")
-            failed_count += 1
+    page_ids = [page["id"] for page in pages if page.get("id")]
+    full_content_map = {
+        page_id: content
+        for page_id, content in notion_client.get_full_pages_content(page_ids).items()
+        if content and content.strip()
+    }
+    failed_count = len(page_ids) - len(full_content_map)
 
     logger.info(f"✅ Fetched content for {len(full_content_map)} pages")
     if failed_count > 0:
@@ -88,6 +88,7 @@ celery_app = Celery(
         "src.tasks.backfill_tasks",  # Include backfill tasks for data synchronization
         "src.tasks.template_import_tasks",  # Include Jira template import tasks
         "src.tasks.cleanup_tasks",  # Include cleanup tasks for maintenance
+        "src.tasks.directory_tasks",  # Include resource and Slack directory refreshes
         "src.webhooks.fireflies_webhook",  # Include webhook task for Fireflies meeting processing
     ],
 )
@@ -292,6 +293,17 @@ celery_app.conf.beat_schedule = {
     #     'task': 'src.tasks.notification_tasks.celery_health_check',
     #     'schedule': crontab(minute=0)  # Every hour at :00
     # },
+    # ========== Resource Directory ==========
+    # Refresh the local Slack/Notion/GitHub/Jira typeahead index every 4 hours
+    "refresh-resource-directory": {
+        "task": "src.tasks.directory_tasks.refresh_resource_directory",
+        "schedule": crontab(hour="*/4", minute=40),
+    },
+    # Refresh the shared Slack channel/user directory every 15 minutes
+    "refresh-slack-directory": {
+        "task": "src.tasks.directory_tasks.refresh_slack_directory",
+        "schedule": crontab(minute="*/15"),
+    },
     # ========== Cleanup Tasks ==========
     # Cleanup stuck job executions - every 6 hours
     "cleanup-stuck-jobs": {
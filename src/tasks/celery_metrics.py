@@ -0,0 +1,392 @@
+"""
+Event-driven Celery queue metrics.
+
+Builds queue health numbers from Celery signals instead of broadcasting
+``inspect()`` calls to every worker (which block on replies and time out
+under load, exactly when the numbers are needed):
+
+- Queue depth: a per-queue sorted set of published task ids, added on
+  ``after_task_publish`` and removed on ``task_prerun``. Entries older than
+  ``QUEUED_MAX_AGE_SECONDS`` (revoked or expired tasks, tasks lost with a
+  worker) are dropped when read, so the depth can't drift upward.
+- In-flight tasks: a per-worker hash maintained by ``task_prerun`` /
+  ``task_postrun``. It expires with the worker heartbeat, so tasks on a
+  crashed worker drop out on their own.
+- Latency, runtime and failure rates: per-minute Redis hashes written on
+  ``task_postrun`` / ``task_failure``, summed over a window when read.
+- Worker liveness: each worker refreshes a heartbeat key from a daemon
+  thread started on ``worker_ready``.
+
+All counters live in Redis. If Redis is unavailable, recording is a no-op
+and ``CeleryMetricsCollector.available`` is False.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import redis
+from celery import signals
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "celery_metrics"
+
+# Per-minute buckets are kept a little longer than the longest read window
+BUCKET_TTL_SECONDS = 3 * 60 * 60
+# Publish timestamps used to measure queue wait (tasks with long countdowns
+# simply report no wait time)
+PUBLISHED_AT_TTL_SECONDS = 24 * 60 * 60
+# Tasks published longer ago than this without starting are treated as lost
+# and no longer count toward queue depth
+QUEUED_MAX_AGE_SECONDS = 6 * 60 * 60
+# Worker heartbeat interval and expiry
+HEARTBEAT_INTERVAL_SECONDS = 30
+HEARTBEAT_TTL_SECONDS = 90
+
+DEFAULT_QUEUE = "celery"
+
+
+def _minute(timestamp: float) -> int:
+    return int(timestamp // 60)
+
+
+class CeleryMetricsCollector:
+    """Records Celery task events into Redis counters and reads them back."""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        """Initialize the collector.
+
+        Args:
+            redis_url: Redis connection URL (defaults to REDIS_URL env var)
+        """
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._redis = None
+        self._started_at: Dict[str, float] = {}
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+        try:
+            self._redis = redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+                health_check_interval=30,
+            )
+            self._redis.ping()
+        except Exception as e:
+            logger.warning(f"Redis unavailable for Celery metrics (disabled): {e}")
+            self._redis = None
+
+    @property
+    def available(self) -> bool:
+        """Whether metrics are being recorded."""
+        return self._redis is not None
+
+    # ---------- Keys ----------
+
+    @staticmethod
+    def _pending_key(queue: Optional[str]) -> str:
+        return f"{KEY_PREFIX}:pending:{queue or DEFAULT_QUEUE}"
+
+    @staticmethod
+    def _published_key(task_id: str) -> str:
+        return f"{KEY_PREFIX}:published:{task_id}"
+
+    @staticmethod
+    def _inflight_key(hostname: str) -> str:
+        return f"{KEY_PREFIX}:inflight:{hostname}"
+
+    @staticmethod
+    def _worker_key(hostname: str) -> str:
+        return f"{KEY_PREFIX}:worker:{hostname}"
+
+    @staticmethod
+    def _bucket_key(minute: int) -> str:
+        return f"{KEY_PREFIX}:minute:{minute}"
+
+    # ---------- Recording (signal side) ----------
+
+    def record_published(self, task_id: str, queue: Optional[str]) -> None:
+        """Add a task to its queue's pending set."""
+        if not self._redis or not task_id:
+            return
+        try:
+            now = time.time()
+            pending_key = self._pending_key(queue)
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.zadd(pending_key, {task_id: now})
+            pipe.expire(pending_key, PUBLISHED_AT_TTL_SECONDS)
+            pipe.setex(self._published_key(task_id), PUBLISHED_AT_TTL_SECONDS, now)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Could not record Celery publish metric: {e}")
+
+    def record_started(
+        self,
+        task_id: str,
+        task_name: str,
+        queue: Optional[str],
+        hostname: Optional[str],
+    ) -> None:
+        """Move a task from its queue to the worker's in-flight set."""
+        now = time.time()
+        self._started_at[task_id] = now
+        if not self._redis:
+            return
+        try:
+            published_key = self._published_key(task_id)
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.get(published_key)
+            pipe.delete(published_key)
+            # A no-op for redeliveries, which were already removed
+            pipe.zrem(self._pending_key(queue), task_id)
+            if hostname:
+                inflight_key = self._inflight_key(hostname)
+                pipe.hincrby(inflight_key, task_name, 1)
+                pipe.expire(inflight_key, HEARTBEAT_TTL_SECONDS)
+            published_at = pipe.execute()[0]
+
+            # Only the first delivery of a task has a publish timestamp
+            if published_at is not None:
+                wait_ms = max(0, int((now - float(published_at)) * 1000))
+                bucket = self._bucket_key(_minute(now))
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.hincrby(bucket, f"{task_name}|waited", 1)
+                pipe.hincrby(bucket, f"{task_name}|wait_ms", wait_ms)
+                pipe.expire(bucket, BUCKET_TTL_SECONDS)
+                pipe.execute()
+        except Exception as e:
+            logger.debug(f"Could not record Celery start metric: {e}")
+
+    def record_finished(
+        self, task_id: str, task_name: str, hostname: Optional[str]
+    ) -> None:
+        """Record completion (success or failure) and runtime of a task."""
+        now = time.time()
+        started_at = self._started_at.pop(task_id, None)
+        if not self._redis:
+            return
+        try:
+            bucket = self._bucket_key(_minute(now))
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.hincrby(bucket, f"{task_name}|completed", 1)
+            if started_at is not None:
+                runtime_ms = max(0, int((now - started_at) * 1000))
+                pipe.hincrby(bucket, f"{task_name}|runtime_ms", runtime_ms)
+            pipe.expire(bucket, BUCKET_TTL_SECONDS)
+            if hostname:
+                pipe.hincrby(self._inflight_key(hostname), task_name, -1)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Could not record Celery finish metric: {e}")
+
+    def record_failed(self, task_name: str) -> None:
+        """Count a task failure."""
+        if not self._redis:
+            return
+        try:
+            bucket = self._bucket_key(_minute(time.time()))
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.hincrby(bucket, f"{task_name}|failed", 1)
+            pipe.expire(bucket, BUCKET_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Could not record Celery failure metric: {e}")
+
+    def heartbeat(self, hostname: str) -> None:
+        """Mark a worker as alive and keep its in-flight hash from expiring."""
+        if not self._redis:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.setex(self._worker_key(hostname), HEARTBEAT_TTL_SECONDS, time.time())
+            pipe.expire(self._inflight_key(hostname), HEARTBEAT_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Could not record Celery worker heartbeat: {e}")
+
+    def start_heartbeat(self, hostname: str) -> None:
+        """Start refreshing this worker's heartbeat in a daemon thread."""
+        if not self._redis or self._heartbeat_thread is not None:
+            return
+
+        # A restarted worker has nothing in flight
+        try:
+            self._redis.delete(self._inflight_key(hostname))
+        except Exception as e:
+            logger.debug(f"Could not reset Celery in-flight metrics: {e}")
+
+        def beat():
+            while True:
+                self.heartbeat(hostname)
+                time.sleep(HEARTBEAT_INTERVAL_SECONDS)
+
+        self._heartbeat_thread = threading.Thread(
+            target=beat, name="celery-metrics-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    # ---------- Reading (alert side) ----------
+
+    def _scan(self, pattern: str):
+        return list(self._redis.scan_iter(match=pattern, count=500))
+
+    def get_metrics(self, window_minutes: int = 15) -> Dict[str, Any]:
+        """Summarize queue health from the recorded counters.
+
+        Args:
+            window_minutes: Minutes of task history to aggregate
+
+        Returns:
+            Dict with worker, queue depth, in-flight, throughput, failure
+            rate and latency metrics
+        """
+        if not self._redis:
+            raise RuntimeError("Celery metrics store (Redis) is unavailable")
+
+        now = time.time()
+        now_minute = _minute(now)
+        worker_keys = self._scan(f"{KEY_PREFIX}:worker:*")
+        inflight_keys = self._scan(f"{KEY_PREFIX}:inflight:*")
+        pending_keys = self._scan(f"{KEY_PREFIX}:pending:*")
+
+        pipe = self._redis.pipeline(transaction=False)
+        for key in pending_keys:
+            # Drop tasks that will never start, then count what's left
+            pipe.zremrangebyscore(key, "-inf", now - QUEUED_MAX_AGE_SECONDS)
+            pipe.zcard(key)
+        for key in inflight_keys:
+            pipe.hgetall(key)
+        for minute in range(now_minute - window_minutes + 1, now_minute + 1):
+            pipe.hgetall(self._bucket_key(minute))
+        results = pipe.execute()
+
+        queued = {
+            key.split(":", 2)[2]: int(count)
+            for key, count in zip(pending_keys, results[1 : 2 * len(pending_keys) : 2])
+        }
+        results = results[2 * len(pending_keys) :]
+
+        in_flight_by_task: Dict[str, int] = {}
+        for counts in results[: len(inflight_keys)]:
+            for task_name, count in (counts or {}).items():
+                if int(count) > 0:
+                    in_flight_by_task[task_name] = in_flight_by_task.get(
+                        task_name, 0
+                    ) + int(count)
+
+        per_task: Dict[str, Dict[str, int]] = {}
+        for bucket in results[len(inflight_keys) :]:
+            for field, value in (bucket or {}).items():
+                task_name, _, metric = field.rpartition("|")
+                stats = per_task.setdefault(task_name, {})
+                stats[metric] = stats.get(metric, 0) + int(value)
+
+        completed = sum(s.get("completed", 0) for s in per_task.values())
+        failed = sum(s.get("failed", 0) for s in per_task.values())
+        runtime_ms = sum(s.get("runtime_ms", 0) for s in per_task.values())
+        waited = sum(s.get("waited", 0) for s in per_task.values())
+        wait_ms = sum(s.get("wait_ms", 0) for s in per_task.values())
+
+        failing_tasks = {
+            task_name: {
+                "failed": s.get("failed", 0),
+                "completed": s.get("completed", 0),
+            }
+            for task_name, s in per_task.items()
+            if s.get("failed")
+        }
+
+        return {
+            "window_minutes": window_minutes,
+            "workers": sorted(k.rsplit(":", 1)[-1] for k in worker_keys),
+            "queued_tasks": sum(queued.values()),
+            "queue_depth": queued,
+            "active_tasks": sum(in_flight_by_task.values()),
+            "active_by_task": in_flight_by_task,
+            "completed_tasks": completed,
+            "failed_tasks": failed,
+            "failure_rate": round(failed / completed, 3) if completed else 0.0,
+            "avg_runtime_seconds": (
+                round(runtime_ms / completed / 1000, 2) if completed else None
+            ),
+            "avg_queue_wait_seconds": (
+                round(wait_ms / waited / 1000, 2) if waited else None
+            ),
+            "failing_tasks": failing_tasks,
+        }
+
+
+# Singleton instance
+_collector: Optional[CeleryMetricsCollector] = None
+
+
+def get_metrics_collector() -> CeleryMetricsCollector:
+    """Get the per-process Celery metrics collector."""
+    global _collector
+    if _collector is None:
+        _collector = CeleryMetricsCollector()
+    return _collector
+
+
+def _queue_of(task) -> Optional[str]:
+    request = getattr(task, "request", None)
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    return delivery_info.get("routing_key")
+
+
+def _hostname_of(task) -> Optional[str]:
+    request = getattr(task, "request", None)
+    return getattr(request, "hostname", None)
+
+
+# ========== Celery Signal Handlers ==========
+
+
+@signals.after_task_publish.connect
+def metrics_after_publish_handler(
+    sender=None, headers=None, body=None, routing_key=None, **kwargs
+):
+    """Count published tasks per queue (runs in the publishing process)."""
+    task_id = (headers or {}).get("id")
+    if task_id is None and isinstance(body, dict):
+        task_id = body.get("id")  # Task message protocol v1
+    get_metrics_collector().record_published(task_id, routing_key)
+
+
+@signals.task_prerun.connect
+def metrics_prerun_handler(sender=None, task_id=None, task=None, **kwargs):
+    """Move a task from queued to in-flight and record its queue wait."""
+    task = task or sender
+    get_metrics_collector().record_started(
+        task_id,
+        getattr(task, "name", "unknown"),
+        _queue_of(task),
+        _hostname_of(task),
+    )
+
+
+@signals.task_postrun.connect
+def metrics_postrun_handler(sender=None, task_id=None, task=None, **kwargs):
+    """Record task completion and runtime."""
+    task = task or sender
+    get_metrics_collector().record_finished(
+        task_id, getattr(task, "name", "unknown"), _hostname_of(task)
+    )
+
+
+@signals.task_failure.connect
+def metrics_failure_handler(sender=None, **kwargs):
+    """Count task failures."""
+    get_metrics_collector().record_failed(getattr(sender, "name", "unknown"))
+
+
+@signals.worker_ready.connect
+def metrics_worker_ready_handler(sender=None, **kwargs):
+    """Start the worker heartbeat used for liveness checks."""
+    hostname = getattr(sender, "hostname", None)
+    if hostname:
+        get_metrics_collector().start_heartbeat(hostname)
@@ -18,6 +18,9 @@ from celery.exceptions import SoftTimeLimitExceeded
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+# Registers the signal handlers that record queue metrics
+import src.tasks.celery_metrics  # noqa: F401
+
 logger = logging.getLogger(__name__)
 
 
@@ -345,37 +348,92 @@ def worker_ready_handler(sender, **kwargs):
 # ========== Helper Functions ==========
 
 
-def check_queue_health() -> Dict[str, Any]:
-    """
-    Check Celery queue health metrics.
+def _alert_thresholds() -> Dict[str, float]:
+    """Queue health alert thresholds (overridable via env vars)."""
+    return {
+        "queue_depth": int(os.getenv("CELERY_ALERT_QUEUE_DEPTH", "500")),
+        "failure_rate": float(os.getenv("CELERY_ALERT_FAILURE_RATE", "0.25")),
+        "min_completed": int(os.getenv("CELERY_ALERT_MIN_COMPLETED", "10")),
+        "queue_wait_seconds": float(
+            os.getenv("CELERY_ALERT_QUEUE_WAIT_SECONDS", "600")
+        ),
+    }
 
-    Returns metrics about queue depth, worker status, etc.
-    This is meant to be called by a health check endpoint.
+
+def _inspect_queue_health() -> Dict[str, Any]:
+    """Fallback health check that broadcasts to workers.
+
+    Only used when the metrics store is unavailable; the broadcast blocks on
+    worker replies, so it is bounded by a short timeout.
     """
     from src.tasks.celery_app import celery_app
 
-    try:
-        # Get active tasks
-        inspect = celery_app.control.inspect()
+    inspect = celery_app.control.inspect(timeout=2.0)
+    active_tasks = inspect.active()
+    workers_available = bool(active_tasks is not None)
+
+    return {
+        "healthy": workers_available,
+        "workers_available": workers_available,
+        "active_tasks": sum(len(tasks) for tasks in (active_tasks or {}).values()),
+        "source": "inspect",
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def check_queue_health(window_minutes: int = 15) -> Dict[str, Any]:
+    """
+    Check Celery queue health metrics.
 
-        active_tasks = inspect.active()
-        scheduled_tasks = inspect.scheduled()
-        reserved_tasks = inspect.reserved()
+    Reads the counters maintained by the task signal handlers in
+    src.tasks.celery_metrics (queue depth, in-flight tasks, latency, failure
+    rate, worker heartbeats) instead of broadcasting to workers.
+    This is meant to be called by a health check endpoint.
 
-        # Calculate metrics
-        total_active = sum(len(tasks) for tasks in (active_tasks or {}).values())
-        total_scheduled = sum(len(tasks) for tasks in (scheduled_tasks or {}).values())
-        total_reserved = sum(len(tasks) for tasks in (reserved_tasks or {}).values())
+    Args:
+        window_minutes: Minutes of task history for rates and latencies
+
+    Returns:
+        Dict with health status, metrics and any threshold warnings
+    """
+    from src.tasks.celery_metrics import get_metrics_collector
 
-        # Check if any workers are available
-        workers_available = bool(active_tasks is not None)
+    try:
+        collector = get_metrics_collector()
+        if not collector.available:
+            return _inspect_queue_health()
+
+        metrics = collector.get_metrics(window_minutes=window_minutes)
+        thresholds = _alert_thresholds()
+
+        workers_available = bool(metrics["workers"])
+        warnings = []
+        if metrics["queued_tasks"] > thresholds["queue_depth"]:
+            warnings.append(
+                f"{metrics['queued_tasks']} tasks queued "
+                f"(threshold {thresholds['queue_depth']})"
+            )
+        if (
+            metrics["completed_tasks"] >= thresholds["min_completed"]
+            and metrics["failure_rate"] > thresholds["failure_rate"]
+        ):
+            warnings.append(
+                f"{metrics['failure_rate']:.0%} of tasks failed in the last "
+                f"{window_minutes} minutes"
+            )
+        if (metrics["avg_queue_wait_seconds"] or 0) > thresholds["queue_wait_seconds"]:
+            warnings.append(
+                f"Tasks waited {metrics['avg_queue_wait_seconds']}s on average "
+                f"before starting"
+            )
 
         return {
-            "healthy": workers_available,
+            "healthy": workers_available and not warnings,
             "workers_available": workers_available,
-            "active_tasks": total_active,
-            "scheduled_tasks": total_scheduled,
-            "reserved_tasks": total_reserved,
+            "worker_count": len(metrics["workers"]),
+            **metrics,
+            "warnings": warnings,
+            "source": "metrics",
             "timestamp": datetime.now().isoformat(),
         }
 
@@ -395,9 +453,20 @@ def send_health_check_alert(health_status: Dict[str, Any]):
         message += (
             f"• *Workers Available*: {health_status.get('workers_available', False)}\n"
         )
-        message += f"• *Error*: {health_status.get('error', 'Unknown')}\n"
+        if "queued_tasks" in health_status:
+            message += f"• *Queued Tasks*: {health_status['queued_tasks']}\n"
+            message += f"• *Active Tasks*: {health_status.get('active_tasks', 0)}\n"
+            message += (
+                f"• *Failure Rate*: {health_status.get('failure_rate', 0):.0%} "
+                f"({health_status.get('failed_tasks', 0)}/"
+                f"{health_status.get('completed_tasks', 0)})\n"
+            )
+        for warning in health_status.get("warnings", []):
+            message += f"• *Warning*: {warning}\n"
+        if health_status.get("error"):
+            message += f"• *Error*: {health_status['error']}\n"
         message += f"• *Time*: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-        message += f"\n🚨 *Action Required*: Celery workers may be down - investigate immediately"
+        message += f"\n🚨 *Action Required*: Celery workers may be down or falling behind - investigate immediately"
 
         monitor.send_slack_alert(message, priority="critical")
 
@@ -25,7 +25,10 @@ def cleanup_stuck_job_executions(self, hours_threshold: int = 6) -> Dict[str, An
     Returns:
         Dict with cleanup statistics
     """
-    from src.services.job_execution_tracker import track_celery_task
+    from src.services.job_execution_tracker import (
+        record_execution_rollup,
+        track_celery_task,
+    )
     from src.utils.database import get_db
     from src.models.job_execution import JobExecution
     from src.config.job_monitoring_config import get_job_config
@@ -111,6 +114,8 @@ def cleanup_stuck_job_executions(self, hours_threshold: int = 6) -> Dict[str, An
                             f"(duration: {duration}s)"
                         )
 
+                    record_execution_rollup(db, job)
+
                 except Exception as e:
                     logger.error(
                         f"  ❌ Error cleaning up job {job.job_name} (id={job.id}): {e}"
@@ -143,41 +148,70 @@ def cleanup_stuck_job_executions(self, hours_threshold: int = 6) -> Dict[str, An
 
 
 @shared_task(name="src.tasks.cleanup_tasks.cleanup_old_job_executions", bind=True)
-def cleanup_old_job_executions(self, days_to_keep: int = 90) -> Dict[str, Any]:
+def cleanup_old_job_executions(
+    self,
+    days_to_keep: int = 90,
+    failed_days_to_keep: int = 180,
+    rollup_days_to_keep: int = 365,
+) -> Dict[str, Any]:
     """
     Delete old job execution records to prevent database bloat.
 
-    Keeps recent records for monitoring and keeps all failed executions
-    for debugging, but removes old successful executions.
+    Successful executions are pruned first; failures are kept longer for
+    debugging. Per-hour aggregates live in job_execution_rollups, so digests
+    and success rates keep working after the raw rows are gone.
 
     Args:
         days_to_keep: Number of days of successful executions to keep (default: 90)
+        failed_days_to_keep: Number of days of failed/timed out/cancelled
+            executions to keep (default: 180)
+        rollup_days_to_keep: Number of days of hourly rollups to keep (default: 365)
 
     Returns:
         Dict with cleanup statistics
     """
-    from src.services.job_execution_tracker import track_celery_task
+    from src.services.job_execution_tracker import FAILURE_STATUSES, track_celery_task
     from src.utils.database import get_db
-    from src.models.job_execution import JobExecution
+    from src.models.job_execution import JobExecution, JobExecutionRollup
 
     logger.info(
-        f"🗑️  Starting cleanup of old job executions (keeping {days_to_keep} days)..."
+        f"🗑️  Starting cleanup of old job executions (keeping {days_to_keep} days, "
+        f"{failed_days_to_keep} days of failures)..."
     )
     db = next(get_db())
 
     try:
         tracker = track_celery_task(self, db, "cleanup-old-jobs")
         with tracker:
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
+            now = datetime.now(timezone.utc)
+            cutoff_date = now - timedelta(days=days_to_keep)
+            failed_cutoff_date = now - timedelta(days=failed_days_to_keep)
+            rollup_cutoff_date = now - timedelta(days=rollup_days_to_keep)
 
-            # Delete old successful executions only (keep failures for debugging)
+            # Delete old successful executions
             deleted_count = (
                 db.query(JobExecution)
                 .filter(
                     JobExecution.status == "success",
                     JobExecution.completed_at < cutoff_date,
                 )
-                .delete()
+                .delete(synchronize_session=False)
+            )
+
+            # Failures are kept longer for debugging, but not forever
+            deleted_failed_count = (
+                db.query(JobExecution)
+                .filter(
+                    JobExecution.status.in_(FAILURE_STATUSES),
+                    JobExecution.completed_at < failed_cutoff_date,
+                )
+                .delete(synchronize_session=False)
+            )
+
+            deleted_rollup_count = (
+                db.query(JobExecutionRollup)
+                .filter(JobExecutionRollup.hour_start < rollup_cutoff_date)
+                .delete(synchronize_session=False)
             )
 
             db.commit()
@@ -185,11 +219,16 @@ def cleanup_old_job_executions(self, days_to_keep: int = 90) -> Dict[str, Any]:
             result = {
                 "success": True,
                 "deleted_count": deleted_count,
+                "deleted_failed_count": deleted_failed_count,
+                "deleted_rollup_count": deleted_rollup_count,
                 "days_kept": days_to_keep,
+                "failed_days_kept": failed_days_to_keep,
+                "rollup_days_kept": rollup_days_to_keep,
             }
 
             logger.info(
-                f"✅ Deleted {deleted_count} old successful job execution records"
+                f"✅ Deleted {deleted_count} successful and {deleted_failed_count} "
+                f"failed job execution records, {deleted_rollup_count} rollups"
             )
 
             tracker.set_result(result)
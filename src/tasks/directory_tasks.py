@@ -0,0 +1,71 @@
+"""Resource directory refresh tasks (typeahead index for external resources)."""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="src.tasks.directory_tasks.refresh_resource_directory", bind=True)
+def refresh_resource_directory(
+    self, providers: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Refresh the local directory of Slack channels, Notion pages, GitHub repos
+    and Jira projects used by the resource typeahead.
+
+    Scheduled every 4 hours; also queued by POST /api/search/refresh.
+
+    Args:
+        providers: Providers to refresh (default: all)
+
+    Returns:
+        Dict with resources stored per provider (None if skipped)
+    """
+    from src.services.job_execution_tracker import track_celery_task
+    from src.services.resource_directory import refresh_directory
+    from src.utils.database import get_db
+
+    logger.info(f"📇 Refreshing resource directory ({providers or 'all providers'})...")
+    db = next(get_db())
+
+    try:
+        tracker = track_celery_task(self, db, "refresh-resource-directory")
+        with tracker:
+            counts = refresh_directory(providers)
+            result = {"success": True, "resources": counts}
+
+            logger.info(f"✅ Resource directory refreshed: {counts}")
+            tracker.set_result(result)
+            return result
+
+    except Exception as e:
+        logger.error(f"❌ Error refreshing resource directory: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
+@shared_task(name="src.tasks.directory_tasks.refresh_slack_directory")
+def refresh_slack_directory() -> Dict[str, Any]:
+    """
+    Reload Slack channels and users into the shared (Redis) Slack directory.
+
+    Scheduled every 15 minutes. This is the only process that refreshes the
+    directory on a timer; web and worker processes read the shared copy.
+
+    Returns:
+        Dict with channels and users loaded
+    """
+    from src.services.slack_directory import get_slack_directory
+
+    directory = get_slack_directory()
+    if directory is None:
+        logger.info("SLACK_BOT_TOKEN not set, skipping Slack directory refresh")
+        return {"success": False, "skipped": True}
+
+    counts = directory.refresh()
+    logger.info(f"✅ Slack directory refreshed: {counts}")
+    return {"success": True, **counts}
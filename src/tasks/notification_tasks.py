@@ -428,6 +428,7 @@ def sync_project_epic_hours(self, project_key):
         from src.integrations.tempo import TempoAPIClient
         from src.models import EpicHours, EpicCategoryMapping
         from src.utils.database import get_session
+        from src.services.epic_budget_summary import invalidate_project_budget_summary
         from sqlalchemy.dialects.postgresql import insert
         from sqlalchemy import text
 
@@ -654,6 +655,9 @@ def sync_project_epic_hours(self, project_key):
                 f"✅ Successfully synced {records_inserted} epic hours records for {project_key}"
             )
 
+            # Budget table shows these actuals
+            invalidate_project_budget_summary(project_key)
+
             return {
                 "success": True,
                 "project_key": project_key,
@@ -732,6 +736,7 @@ def import_historical_epic_hours(
         from src.models.project import ProjectCharacteristics
         from src.utils.database import get_session
         from src.services.epic_categorizer import EpicCategorizer
+        from src.services.epic_budget_summary import invalidate_project_budget_summary
         from sqlalchemy.dialects.postgresql import insert
         from sqlalchemy import text, func
 
@@ -914,15 +919,15 @@ def import_historical_epic_hours(
 
             # Categorize epics with AI
             logger.info(f"Categorizing {epic_count} epics with AI")
-            epic_categories = {}
-            for epic_key in epic_month_team_hours.keys():
-                if epic_key == "NO_EPIC":
-                    epic_categories[epic_key] = "Uncategorized"
-                else:
-                    epic_summary = epic_summaries.get(epic_key, epic_key)
-                    category = categorizer.categorize_epic(epic_key, epic_summary)
-                    epic_categories[epic_key] = category
-                    logger.debug(f"Categorized {epic_key} as '{category}'")
+            epic_categories = categorizer.categorize_batch(
+                [
+                    (epic_key, epic_summaries.get(epic_key, epic_key))
+                    for epic_key in epic_month_team_hours.keys()
+                    if epic_key != "NO_EPIC"
+                ]
+            )
+            if "NO_EPIC" in epic_month_team_hours:
+                epic_categories["NO_EPIC"] = "Uncategorized"
 
             # Update progress: saving to database
             self.update_state(
@@ -975,6 +980,7 @@ def import_historical_epic_hours(
             logger.info(
                 f"Inserted/updated {records_inserted} epic hours records for {project_key}"
             )
+            invalidate_project_budget_summary(project_key)
 
             # Ensure project exists in projects table before saving characteristics
             from src.models.project import Project
@@ -1122,10 +1128,16 @@ def import_historical_epic_hours(
             )
 
             from scripts.generate_epic_baselines import generate_baselines
+            from src.services.forecasting_baselines import rebuild_baseline_snapshot
+            from src.services.similar_project_index import (
+                invalidate_similar_project_index,
+            )
 
             try:
                 baseline_result = generate_baselines()
                 logger.info(f"✅ Generated {len(baseline_result)} epic baselines")
+                invalidate_similar_project_index()
+                rebuild_baseline_snapshot(session)
                 baseline_count = len(baseline_result)
             except Exception as baseline_error:
                 logger.error(
@@ -1281,6 +1293,8 @@ def regenerate_epic_baselines_monthly(self):
     from src.services.epic_enrichment_service import EpicEnrichmentService
     from src.services.epic_analysis_service import EpicAnalysisService
     from scripts.generate_epic_baselines import generate_baselines
+    from src.services.forecasting_baselines import rebuild_baseline_snapshot
+    from src.services.similar_project_index import invalidate_similar_project_index
     from src.integrations.slack import SlackBot
 
     retry_info = (
@@ -1345,9 +1359,12 @@ def regenerate_epic_baselines_monthly(self):
         try:
             baseline_result = generate_baselines()
             logger.info(f"✅ Generated {len(baseline_result)} epic baselines")
+            invalidate_similar_project_index()
+            snapshot = rebuild_baseline_snapshot(session)
             results["baselines"] = {
                 "success": True,
                 "count": len(baseline_result),
+                "snapshot_version": snapshot["version"] if snapshot else None,
             }
         except Exception as baseline_error:
             logger.error(
@@ -1566,8 +1583,8 @@ def send_meeting_prep_digests(self):
     Scheduled to run at 9 AM EST (before daily brief).
 
     Checks projects with meetings scheduled for today (based on weekly_meeting_day),
-    generates personalized weekly digests for each project, and delivers via Slack/Email
-    to users watching those projects.
+    generates each project's weekly digest once, and delivers it via Slack/Email
+    to all users watching that project.
     """
     from src.services.job_execution_tracker import track_celery_task
     from src.utils.database import get_db
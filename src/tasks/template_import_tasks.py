@@ -33,178 +33,148 @@ def import_jira_templates_task(
     """
 
     async def process_imports():
-        """Async function to handle all Jira API calls."""
+        """Async function to handle all Jira API calls.
+
+        Epics are created first, then every ticket of the successfully created
+        epics, both through Jira's bulk-create endpoint; progress is reported
+        once per chunk.
+        """
         details = []
         errors = []
-        total_epics_created = 0
-        total_tickets_created = 0
 
-        # Calculate total items for progress tracking
-        total_items = len(epics)
+        # Load all tickets for the selected epics in one query
+        tickets_by_epic: Dict[int, List[TemplateTicket]] = {
+            epic.id: [] for epic in epics
+        }
         if import_tickets:
-            total_tickets = sum(
-                len(
-                    session.query(TemplateTicket)
-                    .filter(TemplateTicket.template_epic_id == epic.id)
-                    .all()
+            tickets = (
+                session.query(TemplateTicket)
+                .filter(TemplateTicket.template_epic_id.in_(list(tickets_by_epic)))
+                .order_by(TemplateTicket.sort_order)
+                .all()
+            )
+            for ticket in tickets:
+                tickets_by_epic[ticket.template_epic_id].append(ticket)
+
+        total_items = len(epics) + sum(len(t) for t in tickets_by_epic.values())
+        progress = {"processed": 0, "epics_created": 0, "tickets_created": 0}
+
+        def report(status: str) -> None:
+            self.update_state(
+                state="PROGRESS",
+                meta={
+                    "current": progress["processed"],
+                    "total": total_items,
+                    "status": status,
+                    "epics_created": progress["epics_created"],
+                    "tickets_created": progress["tickets_created"],
+                },
+            )
+
+        report("Starting import...")
+
+        def on_epic_chunk(results: List[Dict[str, Any]], total: int) -> None:
+            progress["processed"] = len(results)
+            progress["epics_created"] = sum(1 for r in results if r["success"])
+            report(f"Created epics {len(results)}/{total}")
+
+        # Phase 1: epics
+        logger.info(f"Creating {len(epics)} epics in project {project_key}")
+        epic_results = await jira_client.bulk_create_issues(
+            [
+                jira_client.build_issue_fields(
+                    project_key,
+                    "Epic",
+                    epic.summary or epic.epic_name,
+                    epic.description or "",
                 )
                 for epic in epics
-            )
-            total_items += total_tickets
-
-        processed_items = 0
-
-        # Update initial progress
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "current": 0,
-                "total": total_items,
-                "status": "Starting import...",
-                "epics_created": 0,
-                "tickets_created": 0,
-            },
+            ],
+            on_chunk=on_epic_chunk,
         )
 
-        # Process each epic
-        for epic_idx, epic in enumerate(epics, 1):
-            try:
+        created_epics = []
+        for epic, epic_result in zip(epics, epic_results):
+            if epic_result.get("success"):
+                created_epics.append((epic, epic_result.get("key")))
                 logger.info(
-                    f"Creating epic '{epic.epic_name}' in project {project_key}"
+                    f"✓ Created epic '{epic.epic_name}' as {epic_result.get('key')}"
                 )
-
-                # Update progress
-                self.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "current": processed_items,
-                        "total": total_items,
-                        "status": f"Creating epic {epic_idx}/{len(epics)}: {epic.epic_name}",
-                        "epics_created": total_epics_created,
-                        "tickets_created": total_tickets_created,
-                    },
-                )
-
-                # Create epic in Jira
-                epic_result = await jira_client.create_epic(
-                    project_key=project_key,
-                    epic_name=epic.epic_name,
-                    summary=epic.summary or epic.epic_name,
-                    description=epic.description or "",
-                    color=epic.epic_color or "#6554C0",
-                )
-
-                if not epic_result.get("success"):
-                    error_msg = epic_result.get("error", "Unknown error")
-                    logger.error(
-                        f"Failed to create epic '{epic.epic_name}': {error_msg}"
-                    )
-                    errors.append({"epic_name": epic.epic_name, "error": error_msg})
-                    processed_items += 1
-                    continue
-
-                epic_key = epic_result.get("key")
-                total_epics_created += 1
-                processed_items += 1
-                logger.info(f"✓ Created epic '{epic.epic_name}' as {epic_key}")
-
-                # Import tickets if requested
-                tickets_created = 0
-                ticket_errors = []
-                if import_tickets:
-                    tickets = (
-                        session.query(TemplateTicket)
-                        .filter(TemplateTicket.template_epic_id == epic.id)
-                        .order_by(TemplateTicket.sort_order)
-                        .all()
-                    )
-
-                    logger.info(
-                        f"Creating {len(tickets)} tickets for epic '{epic.epic_name}'"
-                    )
-
-                    for ticket_idx, ticket in enumerate(tickets, 1):
-                        try:
-                            # Update progress
-                            self.update_state(
-                                state="PROGRESS",
-                                meta={
-                                    "current": processed_items,
-                                    "total": total_items,
-                                    "status": f"Creating ticket {ticket_idx}/{len(tickets)} for epic {epic.epic_name}",
-                                    "epics_created": total_epics_created,
-                                    "tickets_created": total_tickets_created,
-                                },
-                            )
-
-                            ticket_result = (
-                                await jira_client.create_issue_with_epic_link(
-                                    project_key=project_key,
-                                    issue_type=ticket.issue_type,
-                                    summary=ticket.summary,
-                                    description=ticket.description or "",
-                                    epic_key=epic_key,
-                                )
-                            )
-
-                            if ticket_result.get("success"):
-                                tickets_created += 1
-                                total_tickets_created += 1
-                                ticket_key = ticket_result.get("key", "")
-                                logger.info(
-                                    f"  ✓ Created ticket {ticket_idx}/{len(tickets)}: {ticket_key} - {ticket.summary}"
-                                )
-                            else:
-                                error_msg = ticket_result.get("error", "Unknown error")
-                                logger.warning(
-                                    f"  ✗ Failed to create ticket '{ticket.summary}': {error_msg}"
-                                )
-                                ticket_errors.append(
-                                    {"summary": ticket.summary, "error": error_msg}
-                                )
-
-                            processed_items += 1
-
-                            # Rate limiting: 0.5 seconds between ticket creations
-                            await asyncio.sleep(0.5)
-
-                        except Exception as ticket_error:
-                            logger.error(
-                                f"  ✗ Exception creating ticket '{ticket.summary}': {ticket_error}"
-                            )
-                            ticket_errors.append(
-                                {"summary": ticket.summary, "error": str(ticket_error)}
-                            )
-                            processed_items += 1
-
-                    logger.info(
-                        f"Completed epic '{epic.epic_name}': {tickets_created}/{len(tickets)} tickets created"
+            else:
+                error_msg = epic_result.get("error", "Unknown error")
+                logger.error(f"Failed to create epic '{epic.epic_name}': {error_msg}")
+                errors.append({"epic_name": epic.epic_name, "error": error_msg})
+                # Its tickets won't be created; count them as processed
+                progress["processed"] += len(tickets_by_epic[epic.id])
+        progress["epics_created"] = len(created_epics)
+
+        # Phase 2: tickets of every created epic, linked to their parent
+        ticket_jobs = [
+            (epic, ticket)
+            for epic, epic_key in created_epics
+            for ticket in tickets_by_epic[epic.id]
+        ]
+        epic_keys = {epic.id: epic_key for epic, epic_key in created_epics}
+        ticket_results = []
+        if ticket_jobs:
+            logger.info(f"Creating {len(ticket_jobs)} tickets")
+            processed_before_tickets = progress["processed"]
+
+            def on_ticket_chunk(results: List[Dict[str, Any]], total: int) -> None:
+                progress["processed"] = processed_before_tickets + len(results)
+                progress["tickets_created"] = sum(1 for r in results if r["success"])
+                report(f"Created tickets {len(results)}/{total}")
+
+            ticket_results = await jira_client.bulk_create_issues(
+                [
+                    jira_client.build_issue_fields(
+                        project_key,
+                        ticket.issue_type,
+                        ticket.summary,
+                        ticket.description or "",
+                        epic_key=epic_keys[epic.id],
                     )
+                    for epic, ticket in ticket_jobs
+                ],
+                on_chunk=on_ticket_chunk,
+            )
 
-                details.append(
-                    {
-                        "template_epic_id": epic.id,
-                        "epic_name": epic.epic_name,
-                        "epic_key": epic_key,
-                        "status": "created",
-                        "tickets_created": tickets_created,
-                        "ticket_errors": ticket_errors if ticket_errors else None,
-                    }
+        outcomes: Dict[int, Dict[str, Any]] = {
+            epic.id: {"created": 0, "errors": []} for epic, _ in created_epics
+        }
+        for (epic, ticket), ticket_result in zip(ticket_jobs, ticket_results):
+            outcome = outcomes[epic.id]
+            if ticket_result.get("success"):
+                outcome["created"] += 1
+            else:
+                error_msg = ticket_result.get("error", "Unknown error")
+                logger.warning(
+                    f"  ✗ Failed to create ticket '{ticket.summary}': {error_msg}"
                 )
-
-                # Rate limiting between epics (1 second)
-                await asyncio.sleep(1.0)
-
-            except Exception as epic_error:
-                logger.error(
-                    f"Exception creating epic '{epic.epic_name}': {epic_error}"
+                outcome["errors"].append(
+                    {"summary": ticket.summary, "error": error_msg}
                 )
-                errors.append({"epic_name": epic.epic_name, "error": str(epic_error)})
-                processed_items += 1
+
+        for epic, epic_key in created_epics:
+            outcome = outcomes[epic.id]
+            logger.info(
+                f"Completed epic '{epic.epic_name}': "
+                f"{outcome['created']}/{len(tickets_by_epic[epic.id])} tickets created"
+            )
+            details.append(
+                {
+                    "template_epic_id": epic.id,
+                    "epic_name": epic.epic_name,
+                    "epic_key": epic_key,
+                    "status": "created",
+                    "tickets_created": outcome["created"],
+                    "ticket_errors": outcome["errors"] or None,
+                }
+            )
 
         return {
-            "total_epics": total_epics_created,
-            "total_tickets": total_tickets_created,
+            "total_epics": progress["epics_created"],
+            "total_tickets": progress["tickets_created"],
             "details": details,
             "errors": errors,
         }
@@ -245,6 +215,11 @@ def import_jira_templates_task(
 
         session.close()
 
+        if result["total_epics"]:
+            from src.services.jira_metadata_cache import invalidate_jira_metadata
+
+            invalidate_jira_metadata("epics", project_key)
+
         logger.info(
             f"Template import completed: {result['total_epics']} epics, {result['total_tickets']} tickets"
         )
@@ -416,18 +416,12 @@ def ingest_notion_pages(self) -> Dict[str, Any]:
                 tracker.set_result(result)
                 return result
 
-            # Fetch full content for each page (this can be slow)
-            full_content_map = {}
-            for page in pages:
-                try:
-                    page_id = page["id"]
-                    content = notion_client.get_full_page_content(page_id)
-                    full_content_map[page_id] = content
-                except Exception as e:
-                    logger.error(
-                        f"Error fetching content for page {page.get('id')}: {e}"
-                    )
-                    full_content_map[page_id] = ""  # Store empty content
+            # Fetch full content for all pages (concurrent, rate limited)
+            fetched = notion_client.get_full_pages_content(page["id"] for page in pages)
+            # Pages that failed to fetch are stored with empty content
+            full_content_map = {
+                page["id"]: fetched.get(page["id"], "") for page in pages
+            }
 
             # Ingest pages
             total_ingested = ingest_service.ingest_notion_pages(
@@ -745,18 +739,13 @@ def backfill_all_sources(days: int = 90) -> Dict[str, Any]:
                 pages = notion_client.get_all_pages(days_back=days)
                 logger.info(f"Found {len(pages)} Notion pages")
 
-                # Fetch full content for each page
-                full_content_map = {}
-                for page in pages:
-                    try:
-                        page_id = page["id"]
-                        content = notion_client.get_full_page_content(page_id)
-                        full_content_map[page_id] = content
-                    except Exception as e:
-                        logger.error(
-                            f"Error fetching content for page {page.get('id')}: {e}"
-                        )
-                        full_content_map[page_id] = ""
+                # Fetch full content for all pages (concurrent, rate limited)
+                fetched = notion_client.get_full_pages_content(
+                    page["id"] for page in pages
+                )
+                full_content_map = {
+                    page["id"]: fetched.get(page["id"], "") for page in pages
+                }
 
                 # Ingest pages
                 total_ingested = ingest_service.ingest_notion_pages(
@@ -824,24 +813,15 @@ def backfill_notion(days_back: int = 365) -> Dict[str, Any]:
 
         # Fetch full content for each page
         logger.info("📝 Fetching full content for each page...")
-        full_content_map = {}
-        failed_count = 0
-
-        for i, page in enumerate(pages, 1):
-            try:
-                if i % 10 == 0:
-                    logger.info(f"   Progress: {i}/{len(pages)} pages processed...")
-
-                page_id = page.get("id", "")
-                if page_id:
-                    full_content = notion_client.get_full_page_content(page_id)
-                    if full_content and full_content.strip():
-                        full_content_map[page_id] = full_content
-                    else:
-                        failed_count += 1
-            except Exception as e:
-                logger.error(f"Error fetching content for page {page_id}: {e}")
-                failed_count += 1
+        page_ids = [page["id"] for page in pages if page.get("id")]
+        full_content_map = {
+            page_id: content
+            for page_id, content in notion_client.get_full_pages_content(
+                page_ids
+            ).items()
+            if content and content.strip()
+        }
+        failed_count = len(page_ids) - len(full_content_map)
 
         logger.info(f"✅ Fetched content for {len(full_content_map)} pages")
         if failed_count > 0:
@@ -192,6 +192,95 @@ class CacheManager:
             logger.error(f"Error invalidating cache: {e}")
             return 0
 
+    def acquire_lock(self, name: str, ttl: int) -> bool:
+        """Try to take a short-lived cross-process lock (SET NX with expiry).
+
+        Args:
+            name: Lock name
+            ttl: Seconds before the lock expires on its own
+
+        Returns:
+            True if acquired, or if Redis is unavailable (nothing to
+            coordinate with); False if another process holds the lock
+        """
+        if not self._enabled:
+            return True
+
+        try:
+            if self._client is None:
+                self._connect()
+
+            return bool(
+                self._client.set(f"api_cache_lock:{name}", "1", nx=True, ex=ttl)
+            )
+
+        except Exception as e:
+            logger.error(f"Error acquiring cache lock: {e}")
+            return True
+
+    def release_lock(self, name: str) -> None:
+        """Release a lock taken with acquire_lock.
+
+        Args:
+            name: Lock name
+        """
+        if not self._enabled:
+            return
+
+        try:
+            if self._client is None:
+                self._connect()
+
+            self._client.delete(f"api_cache_lock:{name}")
+
+        except Exception as e:
+            logger.error(f"Error releasing cache lock: {e}")
+
+    def increment(self, name: str, field: str, amount: int = 1) -> None:
+        """Increment a counter in a named stats hash (e.g. cache hit/miss counts).
+
+        Stats live outside the api_cache namespace, so clear_all() keeps them.
+
+        Args:
+            name: Stats hash name
+            field: Counter within the hash
+            amount: Amount to add
+        """
+        if not self._enabled:
+            return
+
+        try:
+            if self._client is None:
+                self._connect()
+
+            self._client.hincrby(f"api_cache_stats:{name}", field, amount)
+
+        except Exception as e:
+            logger.debug(f"Error incrementing cache counter: {e}")
+
+    def get_counters(self, name: str) -> Dict[str, int]:
+        """Read all counters in a named stats hash.
+
+        Args:
+            name: Stats hash name
+
+        Returns:
+            Dictionary of counter name to value (empty if Redis is unavailable)
+        """
+        if not self._enabled:
+            return {}
+
+        try:
+            if self._client is None:
+                self._connect()
+
+            counters = self._client.hgetall(f"api_cache_stats:{name}") or {}
+            return {field: int(value) for field, value in counters.items()}
+
+        except Exception as e:
+            logger.error(f"Error reading cache counters: {e}")
+            return {}
+
     def clear_all(self) -> bool:
         """Clear all API cache entries.
 
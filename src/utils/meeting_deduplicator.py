@@ -5,14 +5,23 @@ Provides comprehensive deduplication logic for Fireflies meetings:
 - Exact ID matching (same Fireflies ID)
 - Fuzzy matching (similar title, date, and duration)
 - Selection strategy: keep most complete meeting
+
+Fuzzy matching only compares meetings that share a normalized title and
+start within the date window of each other (blocking), so deduplicating a
+wide date range stays close to linear instead of comparing every pair.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Meetings starting further apart than this are never duplicates (seconds)
+DATE_WINDOW_SECONDS = 300
+
 
 class MeetingDeduplicator:
     """Deduplicates meetings using exact and fuzzy matching strategies."""
@@ -120,6 +129,8 @@ class MeetingDeduplicator:
         if not meetings:
             return []
 
+        candidates = self._build_candidate_index(meetings)
+
         # Track which meetings have been grouped
         processed_indices: Set[int] = set()
         final_meetings = []
@@ -128,11 +139,12 @@ class MeetingDeduplicator:
             if i in processed_indices:
                 continue
 
-            # Find all meetings similar to this one
+            # Find all meetings similar to this one (only later meetings in
+            # the same title/date block can match)
             similar_group = [meeting]
             similar_indices = {i}
 
-            for j in range(i + 1, len(meetings)):
+            for j in self._candidate_indices(candidates, meeting, i):
                 if j in processed_indices:
                     continue
 
@@ -169,6 +181,84 @@ class MeetingDeduplicator:
 
         return final_meetings
 
+    @staticmethod
+    def _normalize_title(meeting: Dict[str, Any]) -> str:
+        """Lowercase the title and collapse whitespace."""
+        return " ".join(str(meeting.get("title", "")).lower().split())
+
+    @staticmethod
+    def _meeting_timestamp(meeting: Dict[str, Any]) -> Optional[float]:
+        """Meeting start as epoch seconds, or None if missing/unparseable."""
+        date = meeting.get("date")
+        if date is None:
+            return None
+        try:
+            if isinstance(date, datetime):
+                return date.timestamp()
+            # Fireflies returns milliseconds, convert to seconds
+            return float(date) / 1000
+        except (TypeError, ValueError):
+            return None
+
+    def _build_candidate_index(
+        self, meetings: List[Dict[str, Any]]
+    ) -> Dict[str, Tuple[List[float], List[int]]]:
+        """
+        Bucket meetings by normalized title, sorted by start time.
+
+        Meetings without a usable date can never match (see
+        _are_meetings_similar) and are left out.
+
+        Args:
+            meetings: List of meetings
+
+        Returns:
+            Dict mapping normalized title to (sorted timestamps, meeting indices)
+        """
+        buckets: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+        for index, meeting in enumerate(meetings):
+            timestamp = self._meeting_timestamp(meeting)
+            if timestamp is not None:
+                buckets[self._normalize_title(meeting)].append((timestamp, index))
+
+        candidates = {}
+        for title, entries in buckets.items():
+            if len(entries) > 1:
+                entries.sort()
+                candidates[title] = (
+                    [timestamp for timestamp, _ in entries],
+                    [index for _, index in entries],
+                )
+        return candidates
+
+    def _candidate_indices(
+        self,
+        candidates: Dict[str, Tuple[List[float], List[int]]],
+        meeting: Dict[str, Any],
+        index: int,
+    ) -> List[int]:
+        """
+        Indices of later meetings that could be duplicates of ``meeting``.
+
+        Args:
+            candidates: Output of _build_candidate_index
+            meeting: Meeting to find candidates for
+            index: Position of ``meeting`` in the input list
+
+        Returns:
+            Ascending indices (> index) with the same title, within the date window
+        """
+        bucket = candidates.get(self._normalize_title(meeting))
+        timestamp = self._meeting_timestamp(meeting)
+        if bucket is None or timestamp is None:
+            return []
+
+        timestamps, indices = bucket
+        # Pad the window by a second; _are_meetings_similar makes the exact call
+        lo = bisect_left(timestamps, timestamp - DATE_WINDOW_SECONDS - 1)
+        hi = bisect_right(timestamps, timestamp + DATE_WINDOW_SECONDS + 1)
+        return sorted(j for j in indices[lo:hi] if j > index)
+
     def _are_meetings_similar(self, m1: Dict[str, Any], m2: Dict[str, Any]) -> bool:
         """
         Determine if two meetings are similar enough to be considered duplicates.
@@ -148,6 +148,9 @@ class PromptManager:
             "prompt_settings": {
                 "summary_max_length": 500,
                 "transcript_max_chars": 8000,
+                "transcript_chunking_enabled": True,
+                "transcript_chunk_concurrency": 4,
+                "transcript_chunk_cache_ttl": 604800,
                 "slack_messages_max_chars": 3000,
                 "max_key_discussions": 10,
             },
@@ -330,6 +330,7 @@ from src.routes.feedback import feedback_bp
 from src.api.backfill import backfill_bp
 from src.routes.admin_settings import admin_settings_bp
 from src.routes.insights import insights_bp
+from src.routes.context_search import context_search_bp
 from src.routes.escalation import escalation_bp
 from src.api.analytics import analytics_bp
 from src.api.historical_import import historical_import_bp
@@ -456,6 +457,7 @@ app.register_blueprint(feedback_bp)
 app.register_blueprint(backfill_bp)
 app.register_blueprint(admin_settings_bp)
 app.register_blueprint(insights_bp)
+app.register_blueprint(context_search_bp)
 app.register_blueprint(escalation_bp)
 app.register_blueprint(analytics_bp)
 app.register_blueprint(forecasts_bp)
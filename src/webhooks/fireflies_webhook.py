@@ -235,7 +235,7 @@ def process_fireflies_meeting(self, meeting_id: str):
             # Match meeting to active projects via keywords
             logger.info(f"Matching meeting '{meeting_title}' to active projects")
 
-            # Get active projects with keywords
+            # Get active projects
             result = session.execute(
                 text("SELECT key, name FROM projects WHERE is_active = true")
             )
@@ -249,61 +249,29 @@ def process_fireflies_meeting(self, meeting_id: str):
                     "meeting_id": meeting_id,
                 }
 
-            # Get keywords for each project
-            for project in projects:
-                keyword_result = session.execute(
-                    text(
-                        "SELECT keyword FROM project_keywords WHERE project_key = :project_key"
-                    ),
-                    {"project_key": project["key"]},
-                )
-                project["keywords"] = [row[0].lower() for row in keyword_result]
-
-            # Find matching project using sophisticated matching logic
-            # (same as web app and nightly job for consistency)
-            import re
-
-            # Blacklist of common company terms that should be ignored for project matching
-            KEYWORD_BLACKLIST = {"syatt"}
+            # Find matching project with the shared project keyword matcher
+            # (same word-boundary logic as the web app and nightly job)
+            from src.services.project_keyword_matcher import (
+                KEYWORD_BLACKLIST,
+                get_project_keyword_matcher,
+            )
 
-            matched_project = None
             title_lower = meeting_title.lower()
             summary_lower = transcript_data.get("summary", "").lower()
 
-            for project in projects:
-                if not project.get("keywords"):
-                    continue
-
-                # Filter out blacklisted keywords
-                filtered_keywords = [
-                    kw
-                    for kw in project["keywords"]
-                    if kw.lower() not in KEYWORD_BLACKLIST
-                ]
-
-                if not filtered_keywords:
-                    continue
-
-                # Use word boundary regex matching to prevent false positives
-                def matches_keyword(text, keyword):
-                    escaped_keyword = re.escape(keyword)
-                    pattern = r"\b" + escaped_keyword + r"\b"
-                    return bool(re.search(pattern, text, re.IGNORECASE))
-
-                # Check if any keyword appears in title or summary
-                for keyword in filtered_keywords:
-                    if matches_keyword(title_lower, keyword) or matches_keyword(
-                        summary_lower, keyword
-                    ):
-                        matched_project = project
-                        logger.info(
-                            f"Matched meeting '{meeting_title}' to project {project['key']} "
-                            f"via keyword '{keyword}'"
-                        )
-                        break
-
-                if matched_project:
-                    break
+            (
+                matched_project,
+                matched_keyword,
+            ) = get_project_keyword_matcher().first_match(
+                f"{title_lower}\n{summary_lower}",
+                projects,
+                ignore_keywords=KEYWORD_BLACKLIST,
+            )
+            if matched_project:
+                logger.info(
+                    f"Matched meeting '{meeting_title}' to project {matched_project['key']} "
+                    f"via keyword '{matched_keyword}'"
+                )
 
             if not matched_project:
                 logger.info(
@@ -5,7 +5,7 @@ import os
 import tempfile
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
 # Set test environment variables before importing app
@@ -70,6 +70,19 @@ def db_session(db_engine):
     connection.close()
 
 
+@pytest.fixture
+def db_statements(db_engine):
+    """Record the SQL statements run on the test database during a test."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def mock_user(db_session):
     """Create a mock user for testing."""
@@ -0,0 +1,215 @@
+"""In-process fake of the Jira Cloud REST API for integration tests.
+
+Mount it on an httpx client with ``httpx.MockTransport(FakeJiraServer())``.
+It implements enough of issue creation (single and bulk) and changelog
+search to exercise ``JiraMCPClient`` without a real Jira site, including
+Jira's 50-issue bulk limit, per-element validation errors, token-based
+search pagination, truncated embedded changelogs (and paging the rest from
+``/issue/{key}/changelog``) and 429 rate limiting.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+BULK_LIMIT = 50
+
+
+class FakeJiraServer:
+    """Minimal stateful Jira REST API."""
+
+    def __init__(
+        self,
+        issue_types: Optional[List[str]] = None,
+        rate_limit_responses: int = 0,
+        retry_after: Optional[str] = "0",
+        embedded_changelog_limit: int = 100,
+        failing_changelogs: Optional[List[str]] = None,
+    ):
+        """Create the fake.
+
+        Args:
+            issue_types: Issue type names accepted on create
+            rate_limit_responses: Number of initial requests answered with 429
+            retry_after: Retry-After header sent with 429s (None to omit)
+            embedded_changelog_limit: Histories embedded per issue in search
+                results before the changelog is reported as truncated
+            failing_changelogs: Issue keys whose /changelog requests fail
+        """
+        self.issue_types = set(issue_types or ["Epic", "Task", "Story", "Bug"])
+        self.rate_limit_responses = rate_limit_responses
+        self.retry_after = retry_after
+        self.embedded_changelog_limit = embedded_changelog_limit
+        self.failing_changelogs = set(failing_changelogs or [])
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[httpx.Request] = []
+        self._counters: Dict[str, int] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+
+        if self.rate_limit_responses > 0:
+            self.rate_limit_responses -= 1
+            headers = {"Retry-After": self.retry_after} if self.retry_after else {}
+            return httpx.Response(429, headers=headers, json={"errorMessages": []})
+
+        path = request.url.path
+        if request.method == "POST" and path == "/rest/api/3/issue/bulk":
+            return self._bulk_create(json.loads(request.content))
+        if request.method == "POST" and path == "/rest/api/3/issue":
+            return self._create(json.loads(request.content))
+        if request.method == "GET" and path == "/rest/api/3/search/jql":
+            return self._search(request.url.params)
+        if request.method == "GET" and path.endswith("/changelog"):
+            return self._changelog(path.split("/")[-2], request.url.params)
+        if request.method == "GET" and path.startswith("/rest/api/3/issue/"):
+            return self._get(path.rsplit("/", 1)[-1])
+        return httpx.Response(404, json={"errorMessages": ["Not found"]})
+
+    def calls_to(self, path: str) -> int:
+        """Count requests made to a path."""
+        return sum(1 for r in self.requests if r.url.path == path)
+
+    def add_issue(
+        self,
+        key: str,
+        fields: Dict[str, Any],
+        histories: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """Seed an existing issue with its change history."""
+        self.issues[key] = {
+            "id": str(10000 + len(self.issues)),
+            "key": key,
+            "fields": fields,
+            "changelog": {"histories": list(histories or [])},
+        }
+
+    def _with_changelog(self, issue: Dict[str, Any], limit: int) -> Dict[str, Any]:
+        histories = issue.get("changelog", {}).get("histories", [])
+        return {
+            "id": issue["id"],
+            "key": issue["key"],
+            "fields": issue["fields"],
+            "changelog": {
+                "startAt": 0,
+                "maxResults": limit,
+                "total": len(histories),
+                "histories": histories[:limit],
+            },
+        }
+
+    def _search(self, params: httpx.QueryParams) -> httpx.Response:
+        """GET /search/jql supporting ``project = "X"`` and nextPageToken."""
+        match = re.search(r'project = "([^"]+)"', params.get("jql", ""))
+        project_key = match.group(1) if match else None
+        matching = [
+            issue
+            for key, issue in self.issues.items()
+            if project_key is None or key.startswith(f"{project_key}-")
+        ]
+
+        start = int(params.get("nextPageToken") or 0)
+        page_size = int(params.get("maxResults", 50))
+        page = matching[start : start + page_size]
+        is_last = start + page_size >= len(matching)
+
+        body: Dict[str, Any] = {
+            "issues": [
+                self._with_changelog(issue, self.embedded_changelog_limit)
+                for issue in page
+            ],
+            "isLast": is_last,
+        }
+        if not is_last:
+            body["nextPageToken"] = str(start + page_size)
+        return httpx.Response(200, json=body)
+
+    def _get(self, key: str) -> httpx.Response:
+        issue = self.issues.get(key)
+        if issue is None:
+            return httpx.Response(404, json={"errorMessages": ["Not found"]})
+        return httpx.Response(
+            200, json=self._with_changelog(issue, self.embedded_changelog_limit)
+        )
+
+    def _changelog(self, key: str, params: httpx.QueryParams) -> httpx.Response:
+        """GET /issue/{key}/changelog, oldest first, paged by startAt."""
+        issue = self.issues.get(key)
+        if issue is None:
+            return httpx.Response(404, json={"errorMessages": ["Not found"]})
+        if key in self.failing_changelogs:
+            return httpx.Response(500, json={"errorMessages": ["Internal error"]})
+
+        histories = issue.get("changelog", {}).get("histories", [])
+        start = int(params.get("startAt", 0))
+        page_size = min(int(params.get("maxResults", 100)), 100)
+        values = histories[start : start + page_size]
+        return httpx.Response(
+            200,
+            json={
+                "startAt": start,
+                "maxResults": page_size,
+                "total": len(histories),
+                "isLast": start + page_size >= len(histories),
+                "values": values,
+            },
+        )
+
+    def _validate(self, fields: Dict[str, Any]) -> Dict[str, str]:
+        errors = {}
+        if not fields.get("summary"):
+            errors["summary"] = "You must specify a summary of the issue."
+        if fields.get("issuetype", {}).get("name") not in self.issue_types:
+            errors["issuetype"] = "Specify a valid issue type"
+        parent = fields.get("parent")
+        if parent and parent.get("key") not in self.issues:
+            errors["parent"] = f"Issue '{parent.get('key')}' does not exist"
+        return errors
+
+    def _store(self, fields: Dict[str, Any]) -> Dict[str, str]:
+        project_key = fields["project"]["key"]
+        self._counters[project_key] = self._counters.get(project_key, 0) + 1
+        key = f"{project_key}-{self._counters[project_key]}"
+        issue_id = str(10000 + len(self.issues))
+        self.issues[key] = {"id": issue_id, "key": key, "fields": fields}
+        return {
+            "id": issue_id,
+            "key": key,
+            "self": f"https://fake.atlassian.net/rest/api/3/issue/{issue_id}",
+        }
+
+    def _create(self, payload: Dict[str, Any]) -> httpx.Response:
+        errors = self._validate(payload.get("fields", {}))
+        if errors:
+            return httpx.Response(400, json={"errorMessages": [], "errors": errors})
+        return httpx.Response(201, json=self._store(payload["fields"]))
+
+    def _bulk_create(self, payload: Dict[str, Any]) -> httpx.Response:
+        updates = payload.get("issueUpdates", [])
+        if len(updates) > BULK_LIMIT:
+            return httpx.Response(
+                400,
+                json={"errorMessages": [f"Maximum {BULK_LIMIT} issues per request"]},
+            )
+
+        issues, errors = [], []
+        for index, update in enumerate(updates):
+            element_errors = self._validate(update.get("fields", {}))
+            if element_errors:
+                errors.append(
+                    {
+                        "status": 400,
+                        "elementErrors": {
+                            "errorMessages": [],
+                            "errors": element_errors,
+                        },
+                        "failedElementNumber": index,
+                    }
+                )
+            else:
+                issues.append(self._store(update["fields"]))
+
+        status = 400 if updates and not issues else 201
+        return httpx.Response(status, json={"issues": issues, "errors": errors})
@@ -0,0 +1,192 @@
+"""Unit tests for the GitHub client's shared connection and response caches."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.integrations import github_client
+from src.integrations.github_client import GitHubClient
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Isolate module-level caches between tests."""
+    github_client.clear_response_caches()
+    github_client.close_http_client()
+    yield
+    github_client.clear_response_caches()
+    github_client.close_http_client()
+
+
+def mock_transport(handler):
+    """Patch the shared client factory to route requests to ``handler``."""
+    return patch.object(
+        github_client,
+        "_create_http_client",
+        lambda: httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def search_item(number):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": "",
+        "state": "open",
+        "html_url": f"https://github.com/org/repo/pull/{number}",
+        "repository_url": "https://api.github.com/repos/org/repo",
+        "user": {"login": "dev"},
+    }
+
+
+class TestSharedHttpClient:
+    def test_client_reused_across_event_loops(self):
+        async def run():
+            return github_client.get_http_client()
+
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+        assert first is second
+
+    def test_closed_client_is_recreated(self):
+        first = github_client.get_http_client()
+        github_client.close_http_client()
+
+        assert first.is_closed
+        assert github_client.get_http_client() is not first
+
+
+class TestConditionalRequests:
+    def test_304_served_from_etag_cache(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"items": [search_item(1)]}, headers={"ETag": '"v1"'}
+            )
+
+        client = GitHubClient(api_token="token", organization="org")
+
+        async def run():
+            first = await client.get_prs_by_date_range(
+                "repo", "2024-01-01", "2024-01-31"
+            )
+            second = await client.get_prs_by_date_range(
+                "repo", "2024-01-01", "2024-01-31"
+            )
+            return first, second
+
+        with mock_transport(handler):
+            first, second = asyncio.run(run())
+
+        assert [pr["number"] for pr in first] == [1]
+        assert second == first
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    def test_etag_cache_is_per_credential(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            return httpx.Response(200, json={"items": []}, headers={"ETag": '"v1"'})
+
+        async def run():
+            for token in ("token-a", "token-b"):
+                client = GitHubClient(api_token=token)
+                await client.get_prs_by_date_range("repo", "2024-01-01", "2024-01-31")
+
+        with mock_transport(handler):
+            asyncio.run(run())
+
+        assert seen == [None, None]
+
+
+class TestAccessibleRepos:
+    def test_repo_list_cached_with_ttl(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.params["page"])
+            return httpx.Response(
+                200,
+                json={"total_count": 2, "repositories": [{"name": "a"}, {"name": "b"}]},
+            )
+
+        client = GitHubClient(api_token="token")
+
+        async def run():
+            return (
+                await client.list_accessible_repos(),
+                await client.list_accessible_repos(),
+            )
+
+        with mock_transport(handler):
+            first, second = asyncio.run(run())
+            assert first == second == ["a", "b"]
+            assert len(calls) == 1
+
+            with patch.object(github_client, "REPO_LIST_TTL", 0):
+                github_client.clear_response_caches()
+                asyncio.run(client.list_accessible_repos())
+                asyncio.run(client.list_accessible_repos())
+            assert len(calls) == 3
+
+    def test_failed_listing_not_cached(self):
+        responses = [
+            httpx.Response(500),
+            httpx.Response(
+                200, json={"total_count": 1, "repositories": [{"name": "a"}]}
+            ),
+        ]
+
+        client = GitHubClient(api_token="token")
+        with mock_transport(lambda request: responses.pop(0)):
+            assert asyncio.run(client.list_accessible_repos()) == []
+            assert asyncio.run(client.list_accessible_repos()) == ["a"]
+
+
+class TestPrsByState:
+    def test_state_queries_run_concurrently(self):
+        in_flight = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        class SlowTransport(httpx.BaseTransport):
+            def handle_request(self, request):
+                nonlocal in_flight, max_in_flight
+                with lock:
+                    in_flight += 1
+                    max_in_flight = max(max_in_flight, in_flight)
+                time.sleep(0.05)
+                with lock:
+                    in_flight -= 1
+                query = request.url.params["q"]
+                number = (
+                    1
+                    if "is:merged" in query
+                    else 2 if "review:approved," in query else 3
+                )
+                return httpx.Response(200, json={"items": [search_item(number)]})
+
+        client = GitHubClient(api_token="token", organization="org")
+        with patch.object(
+            github_client,
+            "_create_http_client",
+            lambda: httpx.Client(transport=SlowTransport()),
+        ):
+            result = asyncio.run(
+                client.get_prs_by_date_and_state("REPO", [], repo_name="repo")
+            )
+
+        assert max_in_flight == 3
+        assert [pr["number"] for pr in result["merged"]] == [1]
+        assert [pr["number"] for pr in result["in_review"]] == [2]
+        assert [pr["number"] for pr in result["open"]] == [3]
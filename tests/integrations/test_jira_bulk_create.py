@@ -0,0 +1,123 @@
+"""Tests for bulk Jira issue creation against the fake Jira server."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from src.integrations import jira_mcp
+from src.integrations.jira_mcp import JiraMCPClient
+from tests.integrations.fake_jira import FakeJiraServer
+
+
+def make_client(server):
+    client = JiraMCPClient(
+        jira_url="https://fake.atlassian.net",
+        username="bot@example.com",
+        api_token="token",
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return client
+
+
+def task_fields(summary, issue_type="Task", epic_key=None):
+    return JiraMCPClient.build_issue_fields("SUBS", issue_type, summary, "", epic_key)
+
+
+class TestBulkCreateIssues:
+    def test_chunks_at_jira_limit_and_reports_progress(self):
+        server = FakeJiraServer()
+        client = make_client(server)
+        progress = []
+
+        results = asyncio.run(
+            client.bulk_create_issues(
+                [task_fields(f"Ticket {i}") for i in range(120)],
+                on_chunk=lambda done, total: progress.append((len(done), total)),
+            )
+        )
+
+        assert server.calls_to("/rest/api/3/issue/bulk") == 3
+        assert progress == [(50, 120), (100, 120), (120, 120)]
+        assert all(r["success"] for r in results)
+        assert [r["key"] for r in results[:2]] == ["SUBS-1", "SUBS-2"]
+        assert results[-1]["key"] == "SUBS-120"
+
+    def test_per_item_errors_map_to_input_positions(self):
+        server = FakeJiraServer()
+        client = make_client(server)
+
+        results = asyncio.run(
+            client.bulk_create_issues(
+                [
+                    task_fields("First"),
+                    task_fields("Bad type", issue_type="Nope"),
+                    task_fields("Third"),
+                    task_fields("Orphan", epic_key="SUBS-999"),
+                ]
+            )
+        )
+
+        assert [r["success"] for r in results] == [True, False, True, False]
+        assert results[0]["key"] == "SUBS-1"
+        assert results[2]["key"] == "SUBS-2"
+        assert "issuetype" in results[1]["error"]
+        assert "SUBS-999" in results[3]["error"]
+
+    def test_all_failed_chunk_reports_each_item(self):
+        client = make_client(FakeJiraServer())
+
+        results = asyncio.run(
+            client.bulk_create_issues([task_fields(""), task_fields("")])
+        )
+
+        assert [r["success"] for r in results] == [False, False]
+        assert all("summary" in r["error"] for r in results)
+
+    def test_retries_after_429(self):
+        server = FakeJiraServer(rate_limit_responses=2, retry_after="0")
+        client = make_client(server)
+
+        results = asyncio.run(client.bulk_create_issues([task_fields("One")]))
+
+        assert results[0]["success"] is True
+        assert server.calls_to("/rest/api/3/issue/bulk") == 3
+
+    def test_429_without_retry_after_backs_off_exponentially(self):
+        server = FakeJiraServer(rate_limit_responses=3, retry_after=None)
+        client = make_client(server)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        with patch.object(jira_mcp.asyncio, "sleep", fake_sleep):
+            results = asyncio.run(client.bulk_create_issues([task_fields("One")]))
+
+        assert results[0]["success"] is True
+        assert sleeps == [1.0, 2.0, 4.0]
+
+    def test_gives_up_after_max_retries(self):
+        server = FakeJiraServer(rate_limit_responses=100, retry_after="0")
+        client = make_client(server)
+
+        with patch.object(jira_mcp, "RATE_LIMIT_MAX_RETRIES", 2):
+            results = asyncio.run(
+                client.bulk_create_issues([task_fields("One"), task_fields("Two")])
+            )
+
+        assert server.calls_to("/rest/api/3/issue/bulk") == 3
+        assert [r["success"] for r in results] == [False, False]
+        assert "429" in results[0]["error"]
+
+    def test_missing_credentials(self):
+        client = JiraMCPClient()
+
+        results = asyncio.run(client.bulk_create_issues([task_fields("One")]))
+
+        assert results == [
+            {
+                "success": False,
+                "error": "Jira credentials not configured for direct API",
+            }
+        ]
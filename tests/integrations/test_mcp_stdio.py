@@ -0,0 +1,171 @@
+"""Tests for pooled stdio MCP sessions against the local stub server."""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from src.integrations import google_workspace
+from src.integrations.google_workspace import GoogleWorkspaceClient
+from src.integrations.mcp_stdio import (
+    MCPError,
+    MCPSessionPool,
+    MCPStdioSession,
+    tool_result_to_dict,
+)
+
+STUB_SERVER = os.path.join(
+    os.path.dirname(__file__), "..", "..", "scripts", "mcp_stub_server.py"
+)
+STUB_COMMAND = [sys.executable, STUB_SERVER]
+
+
+@pytest.fixture
+def pool(mocker):
+    pool = MCPSessionPool(max_sessions=2)
+    mocker.patch.object(google_workspace, "get_mcp_session_pool", return_value=pool)
+    yield pool
+    pool.close_all()
+
+
+def make_client(token="token-a"):
+    return GoogleWorkspaceClient(
+        {"access_token": token, "refresh_token": "refresh"},
+        server_command=STUB_COMMAND,
+    )
+
+
+def test_calls_reuse_one_server_per_credential_set(pool):
+    client = make_client()
+
+    files = client.list_files(query="Roadmap", limit=3)
+    first = client._call_mcp_tool("whoami", {})
+    # A second client object with the same token shares the session
+    second = make_client()._call_mcp_tool("whoami", {})
+
+    assert [f["name"] for f in files] == ["Roadmap 0", "Roadmap 1", "Roadmap 2"]
+    assert first == second == {"pid": first["pid"], "token": "token-a"}
+    assert make_client("token-b")._call_mcp_tool("whoami", {})["pid"] != first["pid"]
+
+
+def test_dead_server_is_restarted(pool):
+    client = make_client()
+    first_pid = client._call_mcp_tool("whoami", {})["pid"]
+
+    with pytest.raises(MCPError):
+        client._call_mcp_tool("crash", {})
+
+    assert client._call_mcp_tool("whoami", {})["pid"] != first_pid
+
+
+def test_tool_errors_keep_the_session(pool):
+    client = make_client()
+    pid = client._call_mcp_tool("whoami", {})["pid"]
+
+    with pytest.raises(MCPError, match="stub failure"):
+        client._call_mcp_tool("fail", {})
+
+    assert client._call_mcp_tool("whoami", {})["pid"] == pid
+
+
+def test_pool_cap_stops_least_recently_used_server(pool):
+    sessions = {}
+
+    def factory(key):
+        def build():
+            sessions[key] = MCPStdioSession(STUB_COMMAND)
+            return sessions[key]
+
+        return build
+
+    for key in ["a", "b", "a", "c"]:
+        pool.call_tool(key, factory(key), "whoami", {})
+
+    assert not sessions["b"].is_alive()
+    assert sessions["a"].is_alive()
+    assert sessions["c"].is_alive()
+
+
+def test_token_refresh_replaces_the_users_server(pool):
+    old = make_client("token-a")._call_mcp_tool("whoami", {})
+    new = make_client("token-a2")._call_mcp_tool("whoami", {})
+
+    assert new["token"] == "token-a2"
+    assert new["pid"] != old["pid"]
+    assert len(pool._sessions) == 1  # the old server was stopped, not kept
+
+
+def test_concurrent_callers_restart_a_dead_server_once(pool, mocker):
+    session = MCPStdioSession(STUB_COMMAND)
+    pool.get_session("a", lambda: session)
+    session._process.kill()
+    session._process.wait()
+    start = mocker.spy(session, "start")
+
+    threads = [
+        threading.Thread(target=pool.get_session, args=("a", lambda: session))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert start.call_count == 1
+    assert session.is_alive()
+
+
+def test_idle_sessions_are_stopped():
+    pool = MCPSessionPool(idle_ttl=0.05)
+    session = MCPStdioSession(STUB_COMMAND)
+    try:
+        pool.call_tool("a", lambda: session, "whoami", {})
+        assert pool.reap_idle() == 0
+
+        time.sleep(0.1)
+
+        assert pool.reap_idle() == 1
+        assert not session.is_alive()
+        assert pool._sessions == {}
+    finally:
+        pool.close_all()
+
+
+def test_evicted_session_is_stopped_after_its_running_call(mocker):
+    pool = MCPSessionPool(max_sessions=1)
+    busy = MCPStdioSession(STUB_COMMAND)
+    started, release = threading.Event(), threading.Event()
+    real_call = busy.call_tool
+
+    def slow_call(name, arguments):
+        started.set()
+        release.wait(5)
+        return real_call(name, arguments)
+
+    mocker.patch.object(busy, "call_tool", side_effect=slow_call)
+    results = []
+    try:
+        caller = threading.Thread(
+            target=lambda: results.append(
+                pool.call_tool("a", lambda: busy, "whoami", {})
+            )
+        )
+        caller.start()
+        assert started.wait(5)
+        busy_pid = busy.pid
+
+        # Needing a server for "b" evicts "a" while its call is in flight
+        pool.call_tool("b", lambda: MCPStdioSession(STUB_COMMAND), "whoami", {})
+        assert busy.is_alive()
+        assert list(pool._sessions) == ["b"]
+
+        release.set()
+        caller.join(5)
+
+        assert tool_result_to_dict(results[0])["pid"] == busy_pid
+        assert not busy.is_alive()
+    finally:
+        release.set()
+        pool.close_all()
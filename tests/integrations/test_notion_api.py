@@ -0,0 +1,140 @@
+"""Tests for the pooled, rate-limited Notion client and block tree walk."""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from src.integrations import notion_api
+from src.integrations.notion_api import NotionAPIClient, TokenBucket
+
+
+def paragraph(block_id, text, has_children=False, block_type="paragraph"):
+    if block_type == "child_page":
+        data = {"title": text}
+    else:
+        data = {"rich_text": [{"plain_text": text}]}
+    return {
+        "id": block_id,
+        "type": block_type,
+        "has_children": has_children,
+        block_type: data,
+    }
+
+
+# page -> blocks; nested lists, a child page that must not be descended into,
+# and a second page of results for "page-a"
+TREE = {
+    "page-a": [
+        [
+            paragraph("a1", "Intro"),
+            paragraph("a2", "Toggle", has_children=True),
+        ],
+        [paragraph("a3", "Outro")],
+    ],
+    "a2": [[paragraph("a2.1", "Nested", has_children=True)]],
+    "a2.1": [[paragraph("a2.1.1", "Deeper")]],
+    "page-b": [
+        [
+            paragraph("b1", "Other page"),
+            paragraph("b2", "Sub page", has_children=True, block_type="child_page"),
+        ]
+    ],
+}
+
+
+class FakeNotionSession:
+    """Serves TREE from blocks/{id}/children and tracks requests in flight."""
+
+    def __init__(self, latency=0.0, fail=()):
+        self.latency = latency
+        self.fail = set(fail)
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        block_id = url.split("/blocks/")[1].split("/")[0]
+        with self._lock:
+            self.requested.append(block_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            response = requests.Response()
+            if block_id in self.fail:
+                response.status_code = 404
+                return response
+
+            pages = TREE[block_id]
+            index = int((params or {}).get("start_cursor") or 0)
+            has_more = index + 1 < len(pages)
+            response.status_code = 200
+            response._content = requests.compat.json.dumps(
+                {
+                    "results": pages[index],
+                    "has_more": has_more,
+                    "next_cursor": str(index + 1) if has_more else None,
+                }
+            ).encode()
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def make_client():
+    def make(session):
+        client = NotionAPIClient("secret_test")
+        client.session = session
+        client.rate_limiter = TokenBucket(rate=1000, capacity=1000)
+        return client
+
+    return make
+
+
+def test_full_page_content_includes_nested_blocks_in_order(make_client):
+    session = FakeNotionSession()
+
+    content = make_client(session).get_full_page_content("page-a")
+
+    assert content.split("\n\n") == ["Intro", "Toggle", "Nested", "Deeper", "Outro"]
+    assert sorted(session.requested) == ["a2", "a2.1", "page-a", "page-a"]
+
+
+def test_pages_fetched_concurrently_and_failures_isolated(make_client):
+    session = FakeNotionSession(latency=0.05, fail={"a2.1"})
+
+    contents = make_client(session).get_full_pages_content(
+        ["page-a", "page-b"], max_workers=2
+    )
+
+    # page-a's deepest level failed; child pages aren't descended into
+    assert contents == {"page-b": "Other page\n\n[Child Page: Sub page]"}
+    assert "b2" not in session.requested
+    assert session.max_in_flight == 2
+
+
+def test_token_bucket_enforces_rate():
+    bucket = TokenBucket(rate=50, capacity=2)
+
+    started = time.monotonic()
+    for _ in range(7):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    # Two burst tokens, then five more at 50/s
+    assert elapsed == pytest.approx(0.1, abs=0.05)
+
+
+def test_clients_share_pooled_session_and_limiter_per_token():
+    first = NotionAPIClient("secret_one")
+
+    assert NotionAPIClient("secret_one").session is first.session
+    assert NotionAPIClient("secret_one").rate_limiter is first.rate_limiter
+    assert NotionAPIClient("secret_two").rate_limiter is not first.rate_limiter
+    assert isinstance(first.session, requests.Session)
+    assert notion_api.get_http_session() is first.session
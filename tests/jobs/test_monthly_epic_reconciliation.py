@@ -0,0 +1,117 @@
+"""Unit tests for the monthly epic reconciliation job's data fetch."""
+
+from datetime import date, datetime, timezone
+
+import pytest
+from src.jobs.monthly_epic_reconciliation import MonthlyEpicReconciliationJob
+from src.models import EpicForecast, EpicHours
+from src.models.project import Project
+
+
+def breakdown(*hours):
+    return {
+        "monthly_breakdown": [
+            {"month": i + 1, "phase": "Busy", "hours": h} for i, h in enumerate(hours)
+        ]
+    }
+
+
+def make_forecast(project_key, epic_name, forecast_data, created_at):
+    return EpicForecast(
+        project_key=project_key,
+        epic_name=epic_name,
+        estimated_months=3,
+        teams_selected=list(forecast_data),
+        forecast_data=forecast_data,
+        total_hours=0.0,
+        created_at=created_at,
+    )
+
+
+@pytest.fixture
+def job(db_session):
+    """Job wired to the test database without its other services."""
+    job = MonthlyEpicReconciliationJob.__new__(MonthlyEpicReconciliationJob)
+    job.Session = lambda: db_session
+    return job
+
+
+def seed(session, epic_count):
+    session.add_all(
+        [
+            Project(key="SUBS", name="Subscriptions", is_active=True),
+            Project(key="OLD", name="Old", is_active=False),
+        ]
+    )
+    for i in range(epic_count):
+        session.add(
+            make_forecast(
+                "SUBS",
+                f"Epic {i}",
+                {"FE Devs": breakdown(10.0, 20.0, 5.0), "BE Devs": breakdown(4.0)},
+                datetime(2025, 9, 15, tzinfo=timezone.utc),
+            )
+        )
+        for team in ("FE Devs", "BE Devs"):
+            session.add(
+                EpicHours(
+                    project_key="SUBS",
+                    epic_key=f"SUBS-{i}",
+                    epic_summary=f"Epic {i}",
+                    month=date(2025, 10, 1),
+                    team=team,
+                    hours=25.0,
+                )
+            )
+    session.add(
+        EpicHours(
+            project_key="OLD",
+            epic_key="OLD-1",
+            epic_summary="Epic 0",
+            month=date(2025, 10, 1),
+            team="FE Devs",
+            hours=1.0,
+        )
+    )
+    session.commit()
+
+
+def test_fetch_epic_data_uses_target_month(job, db_session):
+    seed(db_session, 1)
+
+    epic_data = job.fetch_epic_data("2025-10")
+
+    by_team = {row["team"]: row for row in epic_data}
+    assert set(by_team) == {"FE Devs", "BE Devs"}
+    # October is month 2 of a forecast created in September
+    assert by_team["FE Devs"]["forecast_hours"] == 20.0
+    assert by_team["FE Devs"]["variance_hours"] == 5.0
+    # BE Devs only forecast hours in month 1
+    assert by_team["BE Devs"]["forecast_hours"] == 0.0
+
+
+def test_fetch_epic_data_query_count_is_constant(job, db_session, db_statements):
+    seed(db_session, 25)
+    db_statements.clear()
+
+    epic_data = job.fetch_epic_data("2025-10")
+
+    assert len(epic_data) == 50
+    # Active projects, epic hours and one batched forecast lookup
+    assert len(db_statements) == 3
+
+
+def test_project_forecast_hours_prefers_explicit_start_date():
+    forecast = make_forecast(
+        "SUBS",
+        "Epic",
+        {"start_date": "2025-08-20", "FE Devs": breakdown(1.0, 2.0, 3.0)},
+        datetime(2025, 10, 2, tzinfo=timezone.utc),
+    )
+
+    project = MonthlyEpicReconciliationJob.project_forecast_hours
+    assert project(forecast, "FE Devs", date(2025, 8, 1)) == 1.0
+    assert project(forecast, "FE Devs", date(2025, 10, 1)) == 3.0
+    assert project(forecast, "FE Devs", date(2025, 11, 1)) == 0.0
+    assert project(forecast, "FE Devs", date(2025, 7, 1)) == 0.0
+    assert project(forecast, "Design", date(2025, 8, 1)) == 0.0
@@ -0,0 +1,65 @@
+"""Tests for progressive /find-context summary updates in Slack."""
+
+from unittest.mock import MagicMock
+
+from src.managers import slack_bot
+from src.managers.slack_bot import FindContextStream
+
+HEADER = {"type": "header", "text": {"type": "plain_text", "text": "🔍 Context"}}
+
+
+def make_stream(mocker, clock):
+    client = MagicMock()
+    client.chat_postMessage.side_effect = [{"ts": "1.0"}, {"ts": "1.1"}]
+    mocker.patch.object(slack_bot, "time").monotonic.side_effect = clock
+    return client, FindContextStream(client, "C1", HEADER, format_text=str.upper)
+
+
+def test_first_token_posts_thread_and_updates_are_throttled(mocker):
+    client, stream = make_stream(mocker, [100.0, 100.5, 101.6])
+
+    for text in ["checkout ", "moved ", "to stripe"]:
+        stream.on_token(text)
+
+    header, reply = client.chat_postMessage.call_args_list
+    assert header.kwargs["blocks"] == [HEADER]
+    assert reply.kwargs["thread_ts"] == "1.0"
+    updates = [call.kwargs["text"] for call in client.chat_update.call_args_list]
+    assert updates == [
+        "CHECKOUT \n\n_Generating..._",
+        "CHECKOUT MOVED TO STRIPE\n\n_Generating..._",
+    ]
+    assert {call.kwargs["ts"] for call in client.chat_update.call_args_list} == {"1.1"}
+
+
+def test_finish_replaces_preview_with_final_blocks(mocker):
+    client, stream = make_stream(mocker, [100.0])
+    body = [{"type": "section", "text": {"type": "mrkdwn", "text": "Done"}}]
+
+    assert stream.finish({"blocks": [HEADER] + body}) is False  # nothing streamed
+
+    stream.on_token("partial")
+    assert stream.finish({"blocks": [HEADER] + body}) is True
+    assert client.chat_update.call_args.kwargs["blocks"] == body
+    assert client.chat_update.call_args.kwargs["ts"] == "1.1"
+
+
+def test_failed_reply_post_stops_the_preview(mocker):
+    client, stream = make_stream(mocker, [100.0])
+    client.chat_postMessage.side_effect = [{"ts": "1.0"}, Exception("ratelimited")]
+
+    for text in ["checkout ", "moved ", "to stripe"]:
+        stream.on_token(text)
+
+    assert client.chat_postMessage.call_count == 2  # header posted once
+    assert stream.disabled
+    assert stream.text == "checkout moved to stripe"
+
+    client.chat_postMessage.side_effect = None
+    assert stream.finish({"text": "Done"}) is True
+    assert client.chat_postMessage.call_args.kwargs == {
+        "channel": "C1",
+        "thread_ts": "1.0",
+        "text": "Done",
+    }
+    client.chat_update.assert_not_called()
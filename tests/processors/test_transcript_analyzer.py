@@ -0,0 +1,203 @@
+"""Unit tests for chunked (map-reduce) transcript analysis."""
+
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.processors.transcript_analyzer import (
+    ActionItem,
+    MeetingAnalysis,
+    TopicSection,
+    TranscriptAnalyzer,
+)
+
+
+def _speaker_transcript(turns):
+    """Build a transcript in the Fireflies format ("\\nSpeaker:\\n  text")."""
+    lines = []
+    for speaker, text in turns:
+        lines.append(f"\n{speaker}:")
+        lines.append(f"  {text}")
+    return "\n".join(lines)
+
+
+class FakeLLM:
+    """LLM stub returning one topic and action item per analyzed segment."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, messages):
+        with self._lock:
+            self.calls += 1
+        human = messages[-1].content
+        segment = human.split("Segment: ")[1].split(" of ")[0]
+        payload = {
+            "topics": [{"title": "Launch Plan", "content_items": [f"Point {segment}"]}],
+            "action_items": [
+                {
+                    "title": "Send launch checklist",
+                    "description": f"Checklist from segment {segment}",
+                    "assignee": "Jane",
+                    "context": "launch",
+                },
+                {
+                    "title": f"Unique task {segment}",
+                    "description": "Do it",
+                    "assignee": None,
+                    "context": "misc",
+                },
+            ],
+        }
+        return SimpleNamespace(content=json.dumps(payload))
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer with a fake LLM and an in-memory chunk cache."""
+    with patch.object(TranscriptAnalyzer, "_default_llm", return_value=None):
+        instance = TranscriptAnalyzer(llm=FakeLLM())
+
+    store = {}
+    cache = MagicMock()
+    cache.get.side_effect = lambda prefix, **kw: store.get(prefix)
+    cache.set.side_effect = lambda data, prefix, ttl, **kw: store.__setitem__(
+        prefix, {"data": data}
+    )
+    instance.chunk_store = store
+    with patch("src.utils.cache_manager.get_cache_manager", return_value=cache):
+        yield instance
+
+
+class TestSplitTranscript:
+    """Tests for speaker-aligned transcript splitting."""
+
+    def test_short_transcript_is_single_chunk(self):
+        transcript = _speaker_transcript([("Jane", "Hello")])
+        assert TranscriptAnalyzer.split_transcript(transcript, 1000) == [transcript]
+
+    def test_splits_on_speaker_boundaries(self):
+        transcript = _speaker_transcript(
+            [(f"Speaker {i}", "x" * 50) for i in range(10)]
+        )
+        chunks = TranscriptAnalyzer.split_transcript(transcript, 200)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        for chunk in chunks:
+            assert chunk.lstrip().startswith("Speaker ")
+        # No content is lost
+        assert sum(chunk.count("x" * 50) for chunk in chunks) == 10
+
+    def test_splits_overlong_turn(self):
+        transcript = _speaker_transcript([("Jane", "y" * 500)])
+        chunks = TranscriptAnalyzer.split_transcript(transcript, 120)
+
+        assert all(len(chunk) <= 120 for chunk in chunks)
+        assert "".join(chunks).count("y") == 500
+
+
+class TestMergeAnalyses:
+    """Tests for the reduce step."""
+
+    def test_merges_topics_and_dedupes_action_items(self):
+        first = MeetingAnalysis(
+            topics=[TopicSection(title="Japan Launch", content_items=["Go live"])],
+            action_items=[
+                ActionItem(
+                    title="Update DNS records",
+                    description="Update",
+                    assignee="Bob",
+                    context="c",
+                )
+            ],
+        )
+        second = MeetingAnalysis(
+            topics=[
+                TopicSection(title="japan launch", content_items=["go live", "QA"])
+            ],
+            action_items=[
+                ActionItem(
+                    title="Update the DNS records",
+                    description="Update DNS records before launch",
+                    assignee=None,
+                    due_date="2024-01-05",
+                    context="c",
+                ),
+                ActionItem(
+                    title="Update DNS records",
+                    description="Different owner",
+                    assignee="Alice",
+                    context="c",
+                ),
+            ],
+        )
+
+        merged = TranscriptAnalyzer.merge_analyses([first, second])
+
+        assert len(merged.topics) == 1
+        assert merged.topics[0].content_items == ["Go live", "QA"]
+        assert len(merged.action_items) == 2
+        bob_item = merged.action_items[0]
+        assert bob_item.assignee == "Bob"
+        assert bob_item.due_date == "2024-01-05"
+        assert bob_item.description == "Update DNS records before launch"
+
+
+class TestChunkedAnalysis:
+    """Tests for the map-reduce analysis flow."""
+
+    def test_long_transcript_covers_every_chunk(self, analyzer):
+        transcript = _speaker_transcript(
+            [(f"Speaker {i}", "z" * 80) for i in range(12)]
+        )
+
+        analysis = analyzer.analyze_transcript_chunked(transcript, max_chars=300)
+
+        chunk_count = len(TranscriptAnalyzer.split_transcript(transcript, 300))
+        assert analyzer.llm.calls == chunk_count
+        assert len(analysis.topics) == 1
+        assert len(analysis.topics[0].content_items) == chunk_count
+        # Shared action item deduplicated, unique ones kept
+        titles = [item.title for item in analysis.action_items]
+        assert titles.count("Send launch checklist") == 1
+        assert len(titles) == chunk_count + 1
+
+    def test_chunk_results_are_cached(self, analyzer):
+        transcript = _speaker_transcript(
+            [(f"Speaker {i}", "z" * 80) for i in range(12)]
+        )
+
+        first = analyzer.analyze_transcript_chunked(transcript, max_chars=300)
+        calls_after_first = analyzer.llm.calls
+        second = analyzer.analyze_transcript_chunked(transcript, max_chars=300)
+
+        assert analyzer.llm.calls == calls_after_first
+        assert first.model_dump() == second.model_dump()
+        # One entry per distinct chunk, keyed by the full content hash
+        assert analyzer.chunk_store
+        assert all(
+            len(key) == len("transcript_chunk:") + 64 for key in analyzer.chunk_store
+        )
+
+    def test_failed_chunk_does_not_drop_others(self, analyzer):
+        transcript = _speaker_transcript(
+            [(f"Speaker {i}", "z" * 80) for i in range(12)]
+        )
+        real_invoke = analyzer.llm.invoke
+
+        def flaky(messages, **kwargs):
+            if "Segment: 1 of" in messages[-1].content:
+                raise RuntimeError("boom")
+            return real_invoke(messages)
+
+        with patch.object(analyzer, "_invoke_llm_with_retry", side_effect=flaky):
+            analysis = analyzer.analyze_transcript_chunked(transcript, max_chars=300)
+
+        assert analysis.topics
+        assert "Point 1" not in analysis.topics[0].content_items
+        assert "Point 2" in analysis.topics[0].content_items
@@ -0,0 +1,104 @@
+"""Tests for the streamed context search route."""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from src.routes.context_search import context_search_bp
+from src.services.context_search import ContextSearchResults, SearchResult
+
+
+@pytest.fixture
+def app():
+    """Create test Flask app."""
+    app = Flask(__name__)
+    app.register_blueprint(context_search_bp)
+    app.config["TESTING"] = True
+
+    mock_auth_service = MagicMock()
+    mock_user = MagicMock()
+    mock_user.id = 123
+    mock_auth_service.get_current_user.return_value = mock_user
+    app.auth_service = mock_auth_service
+
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers():
+    return {"Authorization": "Bearer test-token-123"}
+
+
+def parse_events(body):
+    events = []
+    for raw in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in raw.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@patch("src.services.context_search.ContextSearchService.search")
+def test_stream_sends_tokens_then_result(mock_search, client, auth_headers):
+    async def search(**kwargs):
+        for text in ["Checkout ", "moved [1]."]:
+            kwargs["on_summary_token"](text)
+        return ContextSearchResults(
+            query=kwargs["query"],
+            results=[
+                SearchResult(
+                    source="jira",
+                    title="SUBS-1",
+                    content="Stripe",
+                    date=datetime(2025, 3, 1),
+                )
+            ],
+            summary="Checkout moved [1].",
+            citations=[],
+        )
+
+    mock_search.side_effect = search
+
+    response = client.get(
+        "/api/context-search/stream?q=checkout&days=30&project=subs",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = parse_events(response.get_data(as_text=True))
+    assert events[:2] == [
+        ("token", {"text": "Checkout "}),
+        ("token", {"text": "moved [1]."}),
+    ]
+    assert events[2][0] == "result"
+    assert events[2][1]["summary"] == "Checkout moved [1]."
+    assert events[2][1]["results"][0]["date"] == "2025-03-01T00:00:00"
+    kwargs = mock_search.call_args.kwargs
+    assert (kwargs["user_id"], kwargs["days_back"], kwargs["project"]) == (
+        123,
+        30,
+        "SUBS",
+    )
+
+
+@patch("src.services.context_search.ContextSearchService.search")
+def test_stream_reports_errors_and_validates_query(mock_search, client, auth_headers):
+    mock_search.side_effect = RuntimeError("vector store down")
+
+    response = client.get("/api/context-search/stream?q=checkout", headers=auth_headers)
+    assert parse_events(response.get_data(as_text=True)) == [
+        ("error", {"error": "vector store down"})
+    ]
+
+    assert (
+        client.get("/api/context-search/stream", headers=auth_headers).status_code
+        == 400
+    )
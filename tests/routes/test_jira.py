@@ -3,6 +3,24 @@
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 
+from src.services.jira_metadata_cache import JiraClientRunner, JiraMetadataCache
+
+
+@pytest.fixture
+def shared_jira(mocker):
+    """Mock the shared metadata client and bypass the Redis cache."""
+    mock_jira = mocker.patch("src.services.jira_metadata_cache.JiraMCPClient")
+    cache = Mock()
+    cache.get.return_value = None
+    cache.acquire_lock.return_value = True
+    mocker.patch(
+        "src.services.jira_metadata_cache.get_cache_manager", return_value=cache
+    )
+    metadata_cache = JiraMetadataCache(runner=JiraClientRunner())
+    mocker.patch("src.services.jira_metadata_cache._metadata_cache", metadata_cache)
+    yield mock_jira.return_value
+    metadata_cache.runner.close()
+
 
 def test_get_jira_projects_success(client, mocker):
     """Test successfully getting Jira projects."""
@@ -99,14 +117,13 @@ def test_get_jira_projects_with_database_enhancement(client, mocker):
     assert project["weekly_meeting_day"] == "Monday"
 
 
-def test_get_issue_types(client, mocker):
+def test_get_issue_types(client, mocker, shared_jira):
     """Test getting Jira issue types."""
     mocker.patch("src.routes.jira.settings.jira.url", "https://test.atlassian.net")
     mocker.patch("src.routes.jira.settings.jira.username", "test@example.com")
     mocker.patch("src.routes.jira.settings.jira.api_token", "test-token")
 
-    mock_jira = mocker.patch("src.routes.jira.JiraMCPClient")
-    mock_instance = mock_jira.return_value.__aenter__.return_value
+    mock_instance = shared_jira
     mock_instance.get_issue_types = AsyncMock(
         return_value=[{"id": "1", "name": "Task"}, {"id": "2", "name": "Bug"}]
     )
@@ -118,14 +135,13 @@ def test_get_issue_types(client, mocker):
     assert len(data["data"]["issue_types"]) == 2
 
 
-def test_get_users(client, mocker):
+def test_get_users(client, mocker, shared_jira):
     """Test getting assignable Jira users."""
     mocker.patch("src.routes.jira.settings.jira.url", "https://test.atlassian.net")
     mocker.patch("src.routes.jira.settings.jira.username", "test@example.com")
     mocker.patch("src.routes.jira.settings.jira.api_token", "test-token")
 
-    mock_jira = mocker.patch("src.routes.jira.JiraMCPClient")
-    mock_instance = mock_jira.return_value.__aenter__.return_value
+    mock_instance = shared_jira
     mock_instance.get_users = AsyncMock(
         return_value=[{"accountId": "user1", "displayName": "John Doe"}]
     )
@@ -137,14 +153,13 @@ def test_get_users(client, mocker):
     assert len(data["data"]["users"]) == 1
 
 
-def test_search_users(client, mocker):
+def test_search_users(client, mocker, shared_jira):
     """Test searching Jira users."""
     mocker.patch("src.routes.jira.settings.jira.url", "https://test.atlassian.net")
     mocker.patch("src.routes.jira.settings.jira.username", "test@example.com")
     mocker.patch("src.routes.jira.settings.jira.api_token", "test-token")
 
-    mock_jira = mocker.patch("src.routes.jira.JiraMCPClient")
-    mock_instance = mock_jira.return_value.__aenter__.return_value
+    mock_instance = shared_jira
     mock_instance.search_users = AsyncMock(
         return_value=[{"accountId": "user1", "displayName": "John Doe"}]
     )
@@ -165,14 +180,13 @@ def test_search_users_minimum_chars(client, mocker):
     assert data["data"]["users"] == []
 
 
-def test_get_priorities(client, mocker):
+def test_get_priorities(client, mocker, shared_jira):
     """Test getting Jira priorities."""
     mocker.patch("src.routes.jira.settings.jira.url", "https://test.atlassian.net")
     mocker.patch("src.routes.jira.settings.jira.username", "test@example.com")
     mocker.patch("src.routes.jira.settings.jira.api_token", "test-token")
 
-    mock_jira = mocker.patch("src.routes.jira.JiraMCPClient")
-    mock_instance = mock_jira.return_value.__aenter__.return_value
+    mock_instance = shared_jira
     mock_instance.get_priorities = AsyncMock(
         return_value=[{"id": "1", "name": "High"}, {"id": "2", "name": "Low"}]
     )
@@ -184,14 +198,13 @@ def test_get_priorities(client, mocker):
     assert len(data["data"]["priorities"]) == 2
 
 
-def test_get_metadata(client, mocker):
+def test_get_metadata(client, mocker, shared_jira):
     """Test getting comprehensive Jira metadata."""
     mocker.patch("src.routes.jira.settings.jira.url", "https://test.atlassian.net")
     mocker.patch("src.routes.jira.settings.jira.username", "test@example.com")
     mocker.patch("src.routes.jira.settings.jira.api_token", "test-token")
 
-    mock_jira = mocker.patch("src.routes.jira.JiraMCPClient")
-    mock_instance = mock_jira.return_value.__aenter__.return_value
+    mock_instance = shared_jira
     mock_instance.get_project_metadata = AsyncMock(
         return_value={"issue_types": [], "priorities": [], "users": []}
     )
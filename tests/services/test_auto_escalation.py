@@ -185,10 +185,14 @@ def test_determine_escalation_level(
     assert service._determine_escalation_level(10, escalation_prefs) == 3
 
 
-def test_get_active_insights(
-    db_session, sample_user, mock_slack_client, mock_github_client
+def test_count_active_insights(
+    db_session,
+    sample_user,
+    user_notification_prefs,
+    mock_slack_client,
+    mock_github_client,
 ):
-    """Test fetching active insights."""
+    """Test counting active insights."""
     # Create insights with different states
     active1 = create_insight(db_session, sample_user.id, 3)
     active2 = create_insight(db_session, sample_user.id, 5)
@@ -205,31 +209,25 @@ def test_get_active_insights(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    active_insights = service._get_active_insights()
+    # Only non-dismissed, non-acted-on insights count
+    assert service._count_active_insights() == (2, 2, 2)
 
-    # Should only return non-dismissed, non-acted-on insights
-    assert len(active_insights) == 2
-    insight_ids = [i.id for i in active_insights]
-    assert active1.id in insight_ids
-    assert active2.id in insight_ids
-    assert dismissed.id not in insight_ids
-    assert acted_on.id not in insight_ids
+    candidates = [c[0].id for c in service._get_escalation_candidates()]
+    assert candidates == [active2.id, active1.id]
 
 
 def test_skip_insight_no_preferences(
     db_session, sample_user, mock_slack_client, mock_github_client
 ):
     """Test that insight is skipped when user has no UserNotificationPreferences."""
-    insight = create_insight(db_session, sample_user.id, 5)
+    create_insight(db_session, sample_user.id, 5)
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is False
-    assert (
-        result["skipped_reason"] == "disabled"
-    )  # Changed from "no_prefs" to match new behavior
+    assert stats["escalations_performed"] == 0
+    assert stats["skipped_no_prefs"] == 1
     mock_slack_client.chat_postMessage.assert_not_called()
 
 
@@ -246,14 +244,14 @@ def test_skip_insight_auto_escalation_disabled(
     user_notification_prefs.enable_escalations = False
     db_session.commit()
 
-    insight = create_insight(db_session, sample_user.id, 5)
+    create_insight(db_session, sample_user.id, 5)
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is False
-    assert result["skipped_reason"] == "disabled"
+    assert stats["escalations_performed"] == 0
+    assert stats["skipped_disabled"] == 1
     mock_slack_client.chat_postMessage.assert_not_called()
 
 
@@ -262,14 +260,14 @@ def test_skip_insight_not_ready_for_escalation(
 ):
     """Test that insight is skipped when not old enough."""
     # 2 days old - threshold is 3 days for DM
-    insight = create_insight(db_session, sample_user.id, 2)
+    create_insight(db_session, sample_user.id, 2)
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is False
-    assert result.get("skipped_reason") is None
+    assert stats["escalations_performed"] == 0
+    assert stats["errors"] == 0
     mock_slack_client.chat_postMessage.assert_not_called()
 
 
@@ -278,13 +276,13 @@ def test_skip_insight_already_escalated_to_level(
 ):
     """Test that insight is skipped if already escalated to target level."""
     # 5 days old = level 2, but already at level 2
-    insight = create_insight(db_session, sample_user.id, 5, escalation_level=2)
+    create_insight(db_session, sample_user.id, 5, escalation_level=2)
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is False
+    assert stats["escalations_performed"] == 0
     mock_slack_client.chat_postMessage.assert_not_called()
 
 
@@ -294,7 +292,7 @@ def test_skip_insight_rate_limited(
     """Test that insight is skipped if escalated within last 24 hours."""
     # Escalated 12 hours ago
     last_escalated = datetime.now(timezone.utc) - timedelta(hours=12)
-    insight = create_insight(
+    create_insight(
         db_session,
         sample_user.id,
         5,
@@ -304,9 +302,9 @@ def test_skip_insight_rate_limited(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is False
+    assert stats["escalations_performed"] == 0
     mock_slack_client.chat_postMessage.assert_not_called()
 
 
@@ -324,10 +322,10 @@ def test_send_dm_escalation_success(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is True
-    assert result["dm_sent"] == 1
+    assert stats["escalations_performed"] == 1
+    assert stats["dm_sent"] == 1
     mock_slack_client.chat_postMessage.assert_called_once()
 
     # Check DM was sent to correct user
@@ -359,11 +357,11 @@ def test_send_channel_escalation_success(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is True
-    assert result["dm_sent"] == 1  # Also sends DM
-    assert result["channel_posts"] == 1
+    assert stats["escalations_performed"] == 1
+    assert stats["dm_sent"] == 1  # Also sends DM
+    assert stats["channel_posts"] == 1
 
     # Should be called twice (once for DM, once for channel)
     assert mock_slack_client.chat_postMessage.call_count == 2
@@ -399,12 +397,12 @@ def test_send_github_escalation_success(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is True
-    assert result["dm_sent"] == 1
-    assert result["channel_posts"] == 1
-    assert result["github_comments"] == 1
+    assert stats["escalations_performed"] == 1
+    assert stats["dm_sent"] == 1
+    assert stats["channel_posts"] == 1
+    assert stats["github_comments"] == 1
     mock_github_client.add_pr_comment.assert_called_once()
 
     # Check comment was added to correct PR
@@ -431,12 +429,12 @@ def test_channel_escalation_no_safe_channels(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
     # Should still escalate DM but not channel
-    assert result["escalated"] is True
-    assert result["dm_sent"] == 1
-    assert result["channel_posts"] == 0
+    assert stats["escalations_performed"] == 1
+    assert stats["dm_sent"] == 1
+    assert stats["channel_posts"] == 0
 
     # DM still sent, so chat_postMessage called once (for DM only)
     assert mock_slack_client.chat_postMessage.call_count == 1
@@ -470,13 +468,13 @@ def test_github_escalation_no_pr_url(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
     # Should still escalate DM and channel but not GitHub
-    assert result["escalated"] is True
-    assert result["dm_sent"] == 1
-    assert result["channel_posts"] == 1
-    assert result["github_comments"] == 0
+    assert stats["escalations_performed"] == 1
+    assert stats["dm_sent"] == 1
+    assert stats["channel_posts"] == 1
+    assert stats["github_comments"] == 0
     mock_github_client.add_pr_comment.assert_not_called()
 
     # Check failure recorded in history
@@ -504,15 +502,15 @@ def test_escalation_respects_user_preferences_dm_disabled(
     db_session.commit()
 
     # 5 days old = level 2 (should include DM + channel)
-    insight = create_insight(db_session, sample_user.id, 5)
+    create_insight(db_session, sample_user.id, 5)
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is True
-    assert result["dm_sent"] == 0  # DM disabled
-    assert result["channel_posts"] == 1  # But channel still sent
+    assert stats["escalations_performed"] == 1
+    assert stats["dm_sent"] == 0  # DM disabled
+    assert stats["channel_posts"] == 1  # But channel still sent
 
     # Channel message still sent, so chat_postMessage called once (for channel only)
     assert mock_slack_client.chat_postMessage.call_count == 1
@@ -538,9 +536,9 @@ def test_insight_tracking_updated_after_escalation(
 
     service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
 
-    result = service._process_insight_escalation(insight)
+    stats = service.run_escalation_check()
 
-    assert result["escalated"] is True
+    assert stats["escalations_performed"] == 1
 
     # Refresh insight from DB
     db_session.refresh(insight)
@@ -688,3 +686,129 @@ def test_github_comment_format(
     assert "**7 days**" in comment
     assert insight.description in comment
     assert "Level 3/3" in comment
+
+
+def test_run_escalation_check_is_set_based(
+    db_session,
+    db_statements,
+    sample_user,
+    escalation_prefs,
+    sample_project,
+    mock_slack_client,
+    mock_github_client,
+):
+    """Test that query and commit counts don't grow with the number of insights."""
+    from sqlalchemy import event
+
+    for days_old in range(3, 13):
+        create_insight(db_session, sample_user.id, days_old)
+
+    service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
+
+    commits = []
+    event.listen(db_session, "after_commit", lambda session: commits.append(1))
+    db_statements.clear()
+
+    stats = service.run_escalation_check()
+    selects = [s for s in db_statements if s.lstrip().upper().startswith("SELECT")]
+
+    assert stats["escalations_performed"] == 10
+    assert stats["errors"] == 0
+    # Two counts, the candidate query and the (cached) safe-channel lookup
+    assert len(selects) <= 4
+    # One UPDATE claims every escalation, one INSERT writes the audit trail
+    updates = [s for s in db_statements if s.lstrip().upper().startswith("UPDATE")]
+    inserts = [s for s in db_statements if "INTO escalation_history" in s]
+    assert len(updates) == 1
+    assert len(inserts) == 1
+    assert len(commits) == 2
+    assert db_session.query(EscalationHistory).count() == 10 + 8 + 6
+
+
+def test_failure_mid_run_keeps_earlier_escalations(
+    db_session,
+    sample_user,
+    escalation_prefs,
+    sample_project,
+    mock_slack_client,
+    mock_github_client,
+):
+    """Test a later failure doesn't roll back sent escalations (no re-sends)."""
+    create_insight(db_session, sample_user.id, 3)
+    failing = create_insight(db_session, sample_user.id, 4)
+
+    service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
+    real_execute = service._execute_escalation
+
+    def execute(insight, *args, **kwargs):
+        if insight.id == failing.id:
+            raise RuntimeError("database went away")
+        return real_execute(insight, *args, **kwargs)
+
+    with patch.object(service, "_execute_escalation", side_effect=execute):
+        stats = service.run_escalation_check()
+
+    assert stats["escalations_performed"] == 1
+    assert stats["errors"] == 1
+    assert db_session.query(EscalationHistory).count() == 1
+    assert mock_slack_client.chat_postMessage.call_count == 1
+
+    # The next run finds nothing left to send
+    mock_slack_client.chat_postMessage.reset_mock()
+    stats = AutoEscalationService(
+        db_session, mock_slack_client, mock_github_client
+    ).run_escalation_check()
+    assert stats["escalations_performed"] == 0
+    mock_slack_client.chat_postMessage.assert_not_called()
+
+
+def test_run_escalation_check_skips_disabled_and_defaults_prefs(
+    db_session, sample_user, sample_project, mock_slack_client, mock_github_client
+):
+    """Test candidate selection honours opt-in and fills in default timing."""
+    from src.models import UserNotificationPreferences
+
+    other_user = User(
+        id=2,
+        email="other@example.com",
+        name="Other User",
+        google_id="google_other_456",
+        slack_user_id="U987654321",
+    )
+    db_session.add_all(
+        [
+            other_user,
+            UserNotificationPreferences(
+                user_id=sample_user.id, enable_escalations=True
+            ),
+            UserNotificationPreferences(user_id=2, enable_escalations=False),
+        ]
+    )
+    db_session.commit()
+
+    db_session.add(
+        User(
+            id=3,
+            email="noprefs@example.com",
+            name="No Prefs",
+            google_id="google_noprefs_789",
+        )
+    )
+    db_session.commit()
+
+    enabled = create_insight(db_session, sample_user.id, 3)
+    create_insight(db_session, 2, 4)
+    create_insight(db_session, 3, 5)
+
+    service = AutoEscalationService(db_session, mock_slack_client, mock_github_client)
+    stats = service.run_escalation_check()
+
+    assert stats["total_checked"] == 3
+    assert stats["skipped_disabled"] == 1
+    assert stats["skipped_no_prefs"] == 1
+    assert stats["escalations_performed"] == 1
+
+    db_session.refresh(enabled)
+    assert enabled.escalation_level == 1
+    prefs = db_session.query(EscalationPreferences).filter_by(user_id=1).one()
+    assert prefs.dm_threshold_days == 3
@@ -0,0 +1,157 @@
+"""Tests for streamed ContextSummarizer responses."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.context_search import SearchResult
+from src.services.context_summarizer import ContextSummarizer
+
+ANSWER_CHUNKS = [
+    "Checkout moved ",
+    'to Stripe [1] "we ship Friday". ',
+    "Owner: Ana [2].",
+]
+ANSWER = "".join(ANSWER_CHUNKS)
+
+RESULTS = [
+    SearchResult(
+        source="slack",
+        title="#subs",
+        content="we ship Friday",
+        date=datetime(2025, 3, 1),
+        author="Ana",
+    ),
+    SearchResult(
+        source="jira",
+        title="SUBS-1",
+        content="Stripe migration",
+        date=datetime(2025, 3, 2),
+    ),
+]
+
+
+def openai_client():
+    async def stream():
+        for text in ANSWER_CHUNKS:
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+            )
+        yield SimpleNamespace(choices=[])  # usage-only chunk
+
+    async def create(**params):
+        if params.get("stream"):
+            return stream()
+        message = SimpleNamespace(content=ANSWER)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=create)
+    return client
+
+
+def anthropic_client():
+    class Stream:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        @property
+        async def text_stream(self):
+            for text in ANSWER_CHUNKS:
+                yield text
+
+    client = MagicMock()
+    client.messages.stream = MagicMock(return_value=Stream())
+    return client
+
+
+@pytest.fixture(autouse=True)
+def response_cache(mocker):
+    """In-memory LLM response cache (starts empty for every test)."""
+    store = {}
+    cache = MagicMock()
+    cache.get.side_effect = lambda prefix, **kw: store.get(prefix)
+    cache.set.side_effect = lambda data, prefix, ttl, **kw: store.__setitem__(
+        prefix, {"data": data}
+    )
+    mocker.patch("src.utils.cache_manager.get_cache_manager", return_value=cache)
+    return store
+
+
+def summarizer_for(mocker, client, provider, model):
+    summarizer = ContextSummarizer()
+    mocker.patch.object(
+        summarizer, "_get_fresh_client", return_value=(client, model, provider)
+    )
+    return summarizer
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_matches_blocking_result(mocker, response_cache):
+    client = openai_client()
+    summarizer = summarizer_for(mocker, client, "openai", "gpt-4o")
+
+    tokens = []
+    streamed = await summarizer.summarize("checkout", RESULTS, on_token=tokens.append)
+    response_cache.clear()
+    blocking = await summarizer.summarize("checkout", RESULTS)
+
+    assert tokens == ANSWER_CHUNKS
+    assert streamed == blocking
+    assert streamed.summary == ANSWER
+    assert streamed.citations[0].key_quote == "we ship Friday"
+    first, second = client.chat.completions.create.await_args_list
+    assert first.kwargs["stream"] is True
+    assert "stream" not in second.kwargs
+
+
+@pytest.mark.asyncio
+async def test_reasoning_models_fall_back_to_one_chunk(mocker):
+    client = openai_client()
+    summarizer = summarizer_for(mocker, client, "openai", "gpt-5-mini")
+
+    tokens = []
+    result = await summarizer.summarize("checkout", RESULTS, on_token=tokens.append)
+
+    assert tokens == [ANSWER]
+    assert result.summary == ANSWER
+    assert "stream" not in client.chat.completions.create.await_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_anthropic_stream_with_async_and_failing_callbacks(mocker):
+    summarizer = summarizer_for(
+        mocker, anthropic_client(), "anthropic", "claude-sonnet-4-5"
+    )
+
+    tokens = []
+
+    async def on_token(text):
+        tokens.append(text)
+        if len(tokens) == 2:
+            raise RuntimeError("client went away")
+
+    result = await summarizer.summarize("checkout", RESULTS, on_token=on_token)
+
+    assert tokens == ANSWER_CHUNKS
+    assert result.summary == ANSWER
+    assert result.confidence == "medium"
+
+
+@pytest.mark.asyncio
+async def test_cached_summary_is_delivered_as_one_chunk(mocker):
+    client = openai_client()
+    summarizer = summarizer_for(mocker, client, "openai", "gpt-4o")
+    first = await summarizer.summarize("checkout", RESULTS)
+
+    tokens = []
+    cached = await summarizer.summarize("checkout", RESULTS, on_token=tokens.append)
+
+    assert client.chat.completions.create.await_count == 1
+    assert tokens == [ANSWER]
+    assert cached == first
@@ -0,0 +1,152 @@
+"""Tests for the single-query epic budget summary and its cache."""
+
+import fnmatch
+from datetime import date
+
+import pytest
+from src.models import EpicBudget, EpicHours
+from src.services import epic_budget_summary
+from src.services.epic_budget_summary import (
+    build_project_budget_summary,
+    get_project_budget_summary,
+    invalidate_project_budget_summary,
+)
+
+
+class FakeCacheManager:
+    """Dict-backed stand-in for CacheManager keyed like the real one."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, prefix, user_id=None, **params):
+        key = f"api_cache:{prefix}"
+        return {"data": self.store[key]} if key in self.store else None
+
+    def set(self, data, prefix, ttl, user_id=None, **params):
+        self.store[f"api_cache:{prefix}"] = data
+        return True
+
+    def invalidate(self, pattern):
+        keys = fnmatch.filter(self.store, pattern)
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+@pytest.fixture(autouse=True)
+def budgets(db_session):
+    db_session.add_all(
+        [
+            EpicBudget(
+                project_key="SUBS",
+                epic_key="SUBS-1",
+                epic_summary="Checkout",
+                estimated_hours=100,
+            ),
+            EpicBudget(
+                project_key="SUBS",
+                epic_key="SUBS-2",
+                epic_summary="Search",
+                estimated_hours=40,
+            ),
+            EpicBudget(
+                project_key="BEAU",
+                epic_key="BEAU-1",
+                epic_summary="Other project",
+                estimated_hours=10,
+            ),
+        ]
+    )
+    for epic_key, month, team, hours in [
+        ("SUBS-1", date(2025, 1, 1), "FE Devs", 10.0),
+        ("SUBS-1", date(2025, 1, 1), "BE Devs", 5.5),
+        ("SUBS-1", date(2025, 2, 1), "FE Devs", 4.5),
+        ("SUBS-9", date(2025, 2, 1), "PMs", 3.0),
+    ]:
+        db_session.add(
+            EpicHours(
+                project_key="SUBS",
+                epic_key=epic_key,
+                epic_category="UI Dev" if epic_key == "SUBS-1" else None,
+                month=month,
+                team=team,
+                hours=hours,
+            )
+        )
+    db_session.commit()
+
+
+@pytest.fixture
+def cache(mocker):
+    cache = FakeCacheManager()
+    mocker.patch.object(epic_budget_summary, "get_cache_manager", return_value=cache)
+    return cache
+
+
+def test_summary_combines_budgets_and_actuals(db_session, db_statements):
+    db_statements.clear()
+    epics = {e["epic_key"]: e for e in build_project_budget_summary(db_session, "SUBS")}
+
+    assert len(db_statements) == 1
+    assert sorted(epics) == ["SUBS-1", "SUBS-2", "SUBS-9"]
+
+    checkout = epics["SUBS-1"]
+    assert checkout["is_budgeted"] is True
+    assert checkout["epic_category"] == "UI Dev"
+    assert checkout["actuals_by_month"] == {"2025-01": 15.5, "2025-02": 4.5}
+    assert checkout["total_actual"] == 20.0
+    assert checkout["remaining"] == 80.0
+    assert checkout["pct_complete"] == 20.0
+
+    search = epics["SUBS-2"]
+    assert search["actuals_by_month"] == {}
+    assert search["total_actual"] == 0
+    assert search["pct_complete"] == 0.0
+
+    unbudgeted = epics["SUBS-9"]
+    assert unbudgeted["is_budgeted"] is False
+    assert unbudgeted["id"] is None
+    assert unbudgeted["epic_summary"] == "SUBS-9"
+    assert unbudgeted["estimated_hours"] == 0.0
+    assert unbudgeted["pct_complete"] == 100.0
+
+
+def test_cached_summary_skips_the_database(db_session, db_statements, cache):
+    first = get_project_budget_summary(db_session, "SUBS")
+    db_statements.clear()
+
+    assert get_project_budget_summary(db_session, "SUBS") == first
+    assert db_statements == []
+
+
+def test_invalidation_drops_only_the_requested_project(db_session, cache):
+    get_project_budget_summary(db_session, "SUBS")
+    get_project_budget_summary(db_session, "BEAU")
+
+    assert invalidate_project_budget_summary("SUBS") == 1
+    assert list(cache.store) == ["api_cache:epic_budgets:BEAU"]
+    assert invalidate_project_budget_summary() == 1
+    assert cache.store == {}
+
+
+def test_category_change_invalidates_affected_projects(mocker, db_session, cache):
+    from flask import Flask
+
+    from src.api import epic_categories
+    from src.models import EpicCategory
+
+    db_session.add(EpicCategory(name="Backend", display_order=1))
+    db_session.commit()
+    get_project_budget_summary(db_session, "SUBS")
+    get_project_budget_summary(db_session, "BEAU")
+    mocker.patch.object(epic_categories, "get_session", return_value=db_session)
+    app = Flask(__name__)
+    app.register_blueprint(epic_categories.epic_categories_bp)
+
+    response = app.test_client().put(
+        "/api/epic-categories/mappings/SUBS-1", json={"category": "Backend"}
+    )
+
+    assert response.get_json()["epic_hours_updated"] == 3
+    assert list(cache.store) == ["api_cache:epic_budgets:BEAU"]
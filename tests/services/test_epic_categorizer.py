@@ -0,0 +1,142 @@
+"""Tests for batched epic categorization and the epic name memo."""
+
+import json
+import re
+import threading
+from types import SimpleNamespace
+
+import pytest
+from src.models import EpicCategory, EpicCategoryMapping, EpicNameCategory
+from src.services.epic_categorizer import EpicCategorizer, normalize_epic_name
+
+ANSWERS = {
+    "order sync": "Integrations",
+    "scholarships": "Customizations",
+    "mega menu": "UI Dev",
+    "product finder": "Customizations",
+}
+
+
+class FakeLLM:
+    """Answers batch prompts from ANSWERS and records every call."""
+
+    def __init__(self, skip=()):
+        self.skip = set(skip)
+        self.batch_calls = []
+        self.single_calls = []
+        self._lock = threading.Lock()
+
+    def invoke(self, messages):
+        prompt = messages[-1].content
+        if prompt.startswith("Epics:"):
+            names = re.findall(r"^\d+\. (.+)$", prompt, re.MULTILINE)
+            with self._lock:
+                self.batch_calls.append(names)
+            assignments = [
+                {"index": i, "category": ANSWERS.get(name, "Not A Category")}
+                for i, name in enumerate(names, 1)
+                if name not in self.skip
+            ]
+            return SimpleNamespace(content=json.dumps({"assignments": assignments}))
+
+        with self._lock:
+            self.single_calls.append(prompt)
+        return SimpleNamespace(content="Uncategorized")
+
+
+@pytest.fixture(autouse=True)
+def categories(db_session):
+    for order, name in enumerate(
+        ["Project Oversight", "UI Dev", "Customizations", "Integrations"]
+    ):
+        db_session.add(EpicCategory(name=name, display_order=order))
+    db_session.commit()
+
+
+def make_categorizer(session, mocker, llm):
+    mocker.patch.object(EpicCategorizer, "_create_llm", return_value=llm)
+    return EpicCategorizer(session)
+
+
+def test_normalize_epic_name():
+    assert normalize_epic_name("  Order   SYNC ") == "order sync"
+    assert normalize_epic_name("SUBS-123") is None
+    assert normalize_epic_name("") is None
+
+
+def test_batch_packs_names_into_few_prompts(db_session, mocker):
+    db_session.add(EpicCategoryMapping(epic_key="A-1", category="Project Oversight"))
+    db_session.commit()
+    llm = FakeLLM()
+    categorizer = make_categorizer(db_session, mocker, llm)
+
+    results = categorizer.categorize_batch(
+        [
+            ("A-1", "Already mapped"),
+            ("A-2", "Order Sync"),
+            ("B-7", "order  sync"),  # same normalized name as A-2
+            ("A-3", "Scholarships"),
+            ("A-4", "Mega Menu"),
+            ("A-5", "UI Dev polish"),  # fuzzy match, no AI
+            ("A-6", "Product Finder"),
+        ],
+        batch_size=2,
+    )
+
+    assert results == {
+        "A-1": "Project Oversight",
+        "A-2": "Integrations",
+        "B-7": "Integrations",
+        "A-3": "Customizations",
+        "A-4": "UI Dev",
+        "A-5": "UI Dev",
+        "A-6": "Customizations",
+    }
+    assert sorted(len(batch) for batch in llm.batch_calls) == [2, 2]
+    assert llm.single_calls == []
+
+    mappings = dict(
+        db_session.query(EpicCategoryMapping.epic_key, EpicCategoryMapping.category)
+    )
+    assert mappings == results
+    memo = dict(
+        db_session.query(EpicNameCategory.normalized_name, EpicNameCategory.category)
+    )
+    assert memo == ANSWERS
+
+
+def test_memoized_names_skip_the_llm(db_session, mocker):
+    make_categorizer(db_session, mocker, FakeLLM()).categorize_batch(
+        [("A-2", "Order Sync"), ("A-3", "Scholarships")]
+    )
+
+    llm = FakeLLM()
+    results = make_categorizer(db_session, mocker, llm).categorize_batch(
+        [("NEW-1", "ORDER SYNC"), ("NEW-2", " scholarships ")]
+    )
+
+    assert results == {"NEW-1": "Integrations", "NEW-2": "Customizations"}
+    assert llm.batch_calls == []
+    assert llm.single_calls == []
+
+
+def test_missing_or_invalid_answers_fall_back_and_are_not_memoized(db_session, mocker):
+    llm = FakeLLM(skip={"mega menu"})
+    categorizer = make_categorizer(db_session, mocker, llm)
+
+    results = categorizer.categorize_batch(
+        [("A-1", "Mega Menu"), ("A-2", "Something Odd"), ("A-3", "Order Sync")]
+    )
+
+    # "mega menu" was omitted and "something odd" got an invalid category
+    assert results == {
+        "A-1": "Uncategorized",
+        "A-2": "Uncategorized",
+        "A-3": "Integrations",
+    }
+    assert len(llm.batch_calls) == 1
+    assert sorted(llm.single_calls) == ["Epic: mega menu", "Epic: something odd"]
+    memo = dict(
+        db_session.query(EpicNameCategory.normalized_name, EpicNameCategory.category)
+    )
+    assert memo == {"order sync": "Integrations"}
@@ -0,0 +1,139 @@
+"""Tests for materialized forecasting baseline snapshots."""
+
+from datetime import date
+
+import pytest
+from src.models import (
+    EpicHours,
+    ForecastingBaselineSnapshot,
+    ProjectCharacteristics,
+    ProjectForecastingConfig,
+)
+from src.services import forecasting_baselines as module
+from src.services.forecasting_baselines import (
+    compute_baselines,
+    get_baseline_snapshot,
+    get_fallback_baselines,
+    rebuild_baseline_snapshot,
+)
+from src.services.forecasting_service import ForecastingService
+
+
+@pytest.fixture(autouse=True)
+def reset_cache(monkeypatch):
+    monkeypatch.setattr(module, "_snapshot_cache", None)
+
+
+def add_project(session, key, be_integrations, team_hours):
+    session.add(
+        ProjectCharacteristics(
+            project_key=key,
+            be_integrations=be_integrations,
+            custom_theme=3,
+            custom_designs=3,
+            ux_research=3,
+            extensive_customizations=3,
+            project_oversight=3,
+        )
+    )
+    session.add(
+        ProjectForecastingConfig(
+            project_key=key,
+            forecasting_start_date=date(2024, 1, 1),
+            forecasting_end_date=date(2024, 6, 30),
+        )
+    )
+    for team, hours in team_hours.items():
+        session.add(
+            EpicHours(
+                project_key=key,
+                epic_key=f"{key}-1",
+                month=date(2024, 2, 1),
+                team=team,
+                hours=hours,
+            )
+        )
+        # Outside the forecasting window, so excluded
+        session.add(
+            EpicHours(
+                project_key=key,
+                epic_key=f"{key}-1",
+                month=date(2024, 9, 1),
+                team=team,
+                hours=1000.0,
+            )
+        )
+
+
+def test_compute_baselines_splits_by_integration_level(db_session):
+    add_project(db_session, "LOW", 1, {"FE Devs": 800.0, "BE Devs": 40.0})
+    add_project(db_session, "MID", 3, {"FE Devs": 600.0, "BE Devs": 400.0})
+    add_project(db_session, "HIGH", 5, {"FE Devs": 500.0, "BE Devs": 800.0})
+    db_session.commit()
+
+    baselines, project_count = compute_baselines(db_session)
+
+    assert project_count == 3
+    # Medium projects contribute to both sets
+    assert baselines["no_integration"]["FE Devs"] == 700.0
+    assert baselines["no_integration"]["BE Devs"] == 220.0
+    assert baselines["with_integration"]["FE Devs"] == 550.0
+    assert baselines["with_integration"]["BE Devs"] == 600.0
+    # Teams without history use the fallback estimates
+    assert baselines["no_integration"]["UX"] == 62.0
+    assert baselines["with_integration"]["Data"] == 100.0
+
+
+def test_forecasts_read_snapshot_without_baseline_queries(db_session, db_statements):
+    add_project(db_session, "HIGH", 5, {"BE Devs": 800.0})
+    db_session.commit()
+    result = rebuild_baseline_snapshot(db_session)
+    assert result == {"version": 1, "project_count": 1}
+
+    db_statements.clear()
+    for _ in range(3):
+        service = ForecastingService(session=db_session)
+        assert service.baselines["with_integration"]["BE Devs"] == 800.0
+        assert service.get_lifecycle_info("UX")["ramp_up"] == 57.0
+
+    assert db_statements == []
+
+
+def test_cache_reloads_only_when_version_changes(db_session, db_statements):
+    rebuild_baseline_snapshot(db_session)
+    cache = module.get_snapshot_cache()
+    assert get_baseline_snapshot(db_session).version == 1
+
+    # Another process stores a new version; this process sees it after the
+    # version check interval
+    db_session.add(
+        ForecastingBaselineSnapshot(
+            baselines={"no_integration": {"UX": 1.0}, "with_integration": {}},
+            lifecycle_percentages={},
+        )
+    )
+    db_session.commit()
+    assert get_baseline_snapshot(db_session).version == 1
+
+    cache.invalidate()
+    db_statements.clear()
+    snapshot = get_baseline_snapshot(db_session)
+    assert snapshot.version == 2
+    assert snapshot.baselines["no_integration"] == {"UX": 1.0}
+
+    cache.invalidate()
+    db_statements.clear()
+    assert get_baseline_snapshot(db_session) is snapshot
+    assert len(db_statements) == 1  # version check only
+
+
+def test_no_snapshot_computes_once_in_process(db_session, db_statements):
+    snapshot = get_baseline_snapshot(db_session)
+
+    assert snapshot.version is None
+    assert snapshot.baselines == get_fallback_baselines()
+
+    module.get_snapshot_cache().invalidate()
+    db_statements.clear()
+    assert get_baseline_snapshot(db_session) is snapshot
+    assert len(db_statements) == 1
@@ -0,0 +1,126 @@
+"""Tests for the aggregate insight stats query and its per-user cache."""
+
+import fnmatch
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models import ProactiveInsight, User, UserWatchedProject
+from src.services import insight_stats
+from src.services.insight_stats import (
+    build_insight_stats,
+    get_insight_stats,
+    invalidate_insight_stats,
+)
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+class FakeCacheManager:
+    """Dict-backed stand-in for CacheManager keyed like the real one."""
+
+    def __init__(self):
+        self.store = {}
+
+    def _key(self, prefix, user_id, params):
+        return f"api_cache:{prefix}:user:{user_id}:params:{json.dumps(params)}"
+
+    def get(self, prefix, user_id=None, **params):
+        key = self._key(prefix, user_id, params)
+        return {"data": self.store[key]} if key in self.store else None
+
+    def set(self, data, prefix, ttl, user_id=None, **params):
+        self.store[self._key(prefix, user_id, params)] = data
+        return True
+
+    def invalidate(self, pattern):
+        keys = fnmatch.filter(self.store, pattern)
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+def insight(user_id, project_key, insight_type, severity, dismissed=False, acted=False):
+    return ProactiveInsight(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        project_key=project_key,
+        insight_type=insight_type,
+        title="t",
+        description="d",
+        severity=severity,
+        dismissed_at=NOW if dismissed else None,
+        acted_on_at=NOW if acted else None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def insights(db_session):
+    """Two users' insights; user 1 watches SUBS and BEAU."""
+    for user_id in (1, 2):
+        db_session.add(
+            User(
+                id=user_id,
+                email=f"u{user_id}@example.com",
+                name=f"User {user_id}",
+                google_id=f"g{user_id}",
+            )
+        )
+    db_session.add_all(
+        [
+            UserWatchedProject(user_id=1, project_key="SUBS"),
+            UserWatchedProject(user_id=1, project_key="BEAU"),
+            insight(1, "SUBS", "stale_pr", "warning"),
+            insight(1, "SUBS", "stale_pr", "critical", acted=True),
+            insight(1, "BEAU", "budget_alert", "critical"),
+            insight(1, "BEAU", "budget_alert", "info", dismissed=True, acted=True),
+            insight(1, "SUBS", "anomaly", "info", dismissed=True),
+            insight(1, "RNWL", "stale_pr", "info"),  # not watched
+            insight(2, "SUBS", "stale_pr", "warning"),  # other user
+        ]
+    )
+    db_session.commit()
+
+
+def test_stats_for_watched_projects_in_one_query(db_session, db_statements):
+    db_statements.clear()
+
+    stats = build_insight_stats(db_session, 1)
+
+    assert stats == {
+        "total_insights": 3,
+        "by_severity": {"critical": 2, "warning": 1, "info": 0},
+        "by_type": {"stale_pr": 2, "budget_alert": 1},
+        "dismissed_count": 2,
+        "acted_on_count": 2,
+    }
+    assert len(db_statements) == 1
+
+
+def test_all_projects_and_no_watched_projects(db_session):
+    stats = build_insight_stats(db_session, 1, all_projects=True)
+    assert stats["total_insights"] == 4
+    assert stats["by_type"] == {"stale_pr": 3, "budget_alert": 1}
+    assert stats["by_severity"]["info"] == 1
+
+    # User 2 watches nothing, so only the admin view sees their insight
+    assert build_insight_stats(db_session, 2)["total_insights"] == 0
+    assert build_insight_stats(db_session, 2, all_projects=True)["total_insights"] == 1
+
+
+def test_stats_cached_per_user_until_invalidated(mocker, db_session):
+    cache = FakeCacheManager()
+    mocker.patch.object(insight_stats, "get_cache_manager", return_value=cache)
+
+    assert get_insight_stats(db_session, 1)["total_insights"] == 3
+    get_insight_stats(db_session, 2)
+
+    db_session.add(insight(1, "SUBS", "stale_pr", "info"))
+    db_session.commit()
+    assert get_insight_stats(db_session, 1)["total_insights"] == 3  # cached
+
+    assert invalidate_insight_stats([1]) == 1
+    assert len(cache.store) == 1  # user 2 untouched
+    assert get_insight_stats(db_session, 1)["total_insights"] == 4
@@ -0,0 +1,200 @@
+"""Tests for the cached Jira metadata layer and its shared client."""
+
+import asyncio
+import fnmatch
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services import jira_metadata_cache as module
+from src.services.jira_metadata_cache import JiraClientRunner, JiraMetadataCache
+
+
+class FakeCacheManager:
+    """In-memory stand-in for CacheManager (keys mirror the real format)."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.locks = set()
+
+    def get(self, prefix, user_id=None):
+        data = self.store.get(f"api_cache:{prefix}")
+        return None if data is None else {"data": data}
+
+    def set(self, data, prefix, ttl, user_id=None):
+        key = f"api_cache:{prefix}"
+        self.store[key] = data
+        self.ttls[key] = ttl
+        return True
+
+    def invalidate(self, pattern):
+        keys = [k for k in self.store if fnmatch.fnmatchcase(k, pattern)]
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+    def acquire_lock(self, name, ttl):
+        if name in self.locks:
+            return False
+        self.locks.add(name)
+        return True
+
+    def release_lock(self, name):
+        self.locks.discard(name)
+
+
+@pytest.fixture
+def cache_manager(mocker):
+    cache = FakeCacheManager()
+    mocker.patch.object(module, "get_cache_manager", return_value=cache)
+    return cache
+
+
+@pytest.fixture
+def jira_client(mocker):
+    jira_class = mocker.patch.object(module, "JiraMCPClient")
+    return jira_class
+
+
+@pytest.fixture
+def metadata_cache(cache_manager, jira_client):
+    metadata_cache = JiraMetadataCache(runner=JiraClientRunner())
+    yield metadata_cache
+    metadata_cache.runner.close()
+
+
+def test_second_read_is_served_from_cache(metadata_cache, cache_manager, jira_client):
+    client = jira_client.return_value
+    client.get_priorities = AsyncMock(return_value=[{"id": "1", "name": "High"}])
+
+    for _ in range(3):
+        priorities = metadata_cache.get("priorities", lambda c: c.get_priorities())
+
+    assert priorities == [{"id": "1", "name": "High"}]
+    assert client.get_priorities.await_count == 1
+    assert list(cache_manager.ttls.values()) == [module.RESOURCE_TTLS["priorities"]]
+
+
+def test_shared_client_is_created_once(metadata_cache, jira_client):
+    client = jira_client.return_value
+    client.get_issue_types = AsyncMock(return_value=[{"name": "Task"}])
+
+    for project in ("A", "B", "C"):
+        metadata_cache.get(
+            "issue_types",
+            lambda c, p=project: c.get_issue_types(p),
+            project_key=project,
+        )
+
+    assert jira_client.call_count == 1
+    assert client.get_issue_types.await_count == 3
+
+
+def test_concurrent_misses_fetch_once(metadata_cache, jira_client):
+    started = threading.Event()
+    release = threading.Event()
+
+    async def slow_fetch(project_key):
+        started.set()
+        await asyncio.get_running_loop().run_in_executor(None, release.wait, 5)
+        return [{"name": "Done"}]
+
+    client = jira_client.return_value
+    client.get_statuses = AsyncMock(side_effect=slow_fetch)
+
+    results = []
+
+    def read():
+        results.append(
+            metadata_cache.get(
+                "statuses", lambda c: c.get_statuses("SUBS"), project_key="SUBS"
+            )
+        )
+
+    threads = [threading.Thread(target=read) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [[{"name": "Done"}]] * 5
+    assert client.get_statuses.await_count == 1
+
+
+def test_follower_waits_for_other_worker(
+    metadata_cache, cache_manager, jira_client, mocker
+):
+    mocker.patch.object(module, "REFRESH_POLL_INTERVAL", 0.01)
+    client = jira_client.return_value
+    client.get_users = AsyncMock(return_value=[{"accountId": "live"}])
+
+    # Another worker holds the refresh lock and fills the cache meanwhile
+    original_acquire = cache_manager.acquire_lock
+
+    def acquire_held_elsewhere(name, ttl):
+        cache_manager.set(
+            [{"accountId": "from-other-worker"}],
+            metadata_cache._cache_key("users", "SUBS", {"max_results": 200}),
+            900,
+        )
+        return False
+
+    cache_manager.acquire_lock = acquire_held_elsewhere
+    users = metadata_cache.get(
+        "users", lambda c: c.get_users("SUBS", 200), project_key="SUBS", max_results=200
+    )
+    cache_manager.acquire_lock = original_acquire
+
+    assert users == [{"accountId": "from-other-worker"}]
+    client.get_users.assert_not_awaited()
+
+
+def test_empty_results_are_not_cached(metadata_cache, cache_manager, jira_client):
+    client = jira_client.return_value
+    client.get_issue_types = AsyncMock(return_value=[])
+
+    assert metadata_cache.get("issue_types", lambda c: c.get_issue_types("A")) == []
+    assert cache_manager.store == {}
+
+
+def test_invalidate_drops_only_matching_project(
+    metadata_cache, cache_manager, jira_client
+):
+    client = jira_client.return_value
+    client.search_tickets = AsyncMock(return_value=[{"key": "X-1"}])
+    for project in ("SUBS", "SUBS2"):
+        metadata_cache.get(
+            "epics", lambda c: c.search_tickets("jql"), project_key=project
+        )
+
+    assert metadata_cache.invalidate("epics", "SUBS") == 1
+    assert [k for k in cache_manager.store] == ["api_cache:jira_meta:epics:SUBS2"]
+
+    metadata_cache.get("epics", lambda c: c.search_tickets("jql"), project_key="SUBS")
+    assert client.search_tickets.await_count == 3
+
+
+def test_user_searches_are_keyed_by_full_digest(
+    metadata_cache, cache_manager, jira_client
+):
+    client = jira_client.return_value
+    client.search_users = AsyncMock(side_effect=lambda q, p, n: [{"name": q}])
+
+    for query in ("ann", "bob", "ann"):
+        users = metadata_cache.get(
+            "user_search",
+            lambda c, q=query: c.search_users(q, "SUBS", 20),
+            project_key="SUBS",
+            query=query,
+            max_results=20,
+        )
+        assert users == [{"name": query}]
+
+    assert client.search_users.await_count == 2
+    digests = [key.rsplit(":", 1)[-1] for key in cache_manager.store]
+    assert len(digests) == 2
+    assert all(len(digest) == 64 for digest in digests)
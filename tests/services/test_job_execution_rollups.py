@@ -0,0 +1,129 @@
+"""Tests for hourly job execution rollups and the queries that read them."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from src.models import JobExecution, JobExecutionRollup
+from src.services.job_execution_tracker import (
+    JobExecutionTracker,
+    get_average_duration,
+    get_job_success_rate,
+    record_execution_rollup,
+    rollup_hour,
+)
+from src.services.job_monitoring_digest import JobMonitoringDigestService
+
+JOB = "cleanup-old-jobs"  # expected duration 120s, category maintenance
+
+
+def run_job(session, duration, fail=False, task_id=None):
+    """Track one execution that ran for roughly ``duration`` seconds."""
+    tracker = JobExecutionTracker(session, job_name=JOB, task_id=task_id)
+    tracker.start()
+    tracker.execution.started_at = datetime.now(timezone.utc) - timedelta(
+        seconds=duration
+    )
+    if fail:
+        tracker.fail(error=RuntimeError("boom"))
+    else:
+        tracker.complete(result_data={"ok": True})
+    return tracker.execution
+
+
+def test_rollup_counts_and_percentiles(db_session):
+    hour = rollup_hour(datetime.now(timezone.utc))
+    outcomes = [
+        ("success", 40),
+        ("success", 10),
+        ("timeout", 900),
+        ("success", 30),
+        ("success", 20),
+    ]
+    for minute, (status, duration) in enumerate(outcomes):
+        execution = JobExecution(
+            job_name=JOB,
+            job_category="maintenance",
+            status=status,
+            started_at=hour + timedelta(minutes=minute),
+            duration_seconds=duration,
+        )
+        db_session.add(execution)
+        record_execution_rollup(db_session, execution)
+    db_session.commit()
+
+    rollup = db_session.query(JobExecutionRollup).one()
+    assert rollup.execution_count == 5
+    assert rollup.success_count == 4
+    assert rollup.failure_count == 1
+    assert rollup.durations == [10, 20, 30, 40]
+    assert rollup.total_duration_seconds == 100
+    assert rollup.max_duration_seconds == 40
+    assert rollup.p50_duration_seconds == pytest.approx(25.0)
+    assert rollup.p95_duration_seconds == pytest.approx(38.5)
+
+
+def test_success_rate_and_duration_survive_pruning(db_session):
+    run_job(db_session, 30)
+    run_job(db_session, 50)
+    run_job(db_session, 5, fail=True)
+
+    # Raw rows are pruned; the rollups still answer the queries
+    db_session.query(JobExecution).delete()
+    db_session.commit()
+
+    assert get_job_success_rate(db_session, JOB) == pytest.approx(200 / 3)
+    assert get_average_duration(db_session, JOB) == pytest.approx(40, abs=1)
+    assert get_job_success_rate(db_session, "unknown-job") == 0.0
+    assert get_average_duration(db_session, "unknown-job") is None
+
+
+def test_retried_execution_replaces_previous_outcome(db_session):
+    run_job(db_session, 5, fail=True, task_id="task-1")
+    run_job(db_session, 5, task_id="task-1")  # Celery retry reuses the record
+
+    rollups = db_session.query(JobExecutionRollup).all()
+    assert sum(r.execution_count for r in rollups) == 1
+    assert sum(r.success_count for r in rollups) == 1
+    assert sum(r.failure_count for r in rollups) == 0
+
+
+def test_digest_reads_rollups_and_loads_only_needed_rows(db_session, db_statements):
+    run_job(db_session, 30)
+    run_job(db_session, 400)  # slower than 1.5x the expected 120s
+    run_job(db_session, 5, fail=True)
+    db_session.add(
+        JobExecution(
+            job_name="ingest-slack-daily",
+            job_category="vector_ingestion",
+            status="running",
+            started_at=datetime.now(timezone.utc),
+        )
+    )
+    db_session.commit()
+
+    db_statements.clear()
+
+    digest = JobMonitoringDigestService(db_session).generate_daily_digest()
+
+    summary = digest["summary"]
+    assert summary["total_executions"] == 4
+    assert summary["successful"] == 2
+    assert summary["failed"] == 1
+    assert summary["running"] == 1
+    assert digest["by_category"]["maintenance"]["total"] == 3
+    assert digest["by_category"]["vector_ingestion"]["running"] == 1
+
+    assert [f["status"] for f in digest["failures"]] == ["failed"]
+    assert [s["actual_duration"] for s in digest["slow_jobs"]] == [400]
+
+    [job] = digest["all_jobs"]
+    assert job["job_name"] == JOB
+    assert job["executions"] == 3
+    assert job["failed"] == 1
+    assert job["status"] == "failed"
+
+    # Rollup aggregate, running count, failures, slow-job candidates
+    selects = [s for s in db_statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 4
+
+    assert "×3" in JobMonitoringDigestService(db_session).format_slack_message(digest)
@@ -0,0 +1,163 @@
+"""Tests for the shared LLM gateway response cache."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.services import llm_gateway
+from src.services.llm_gateway import (
+    acomplete,
+    cache_key,
+    complete,
+    get_stats,
+    invoke_chat_model,
+)
+
+MESSAGES = [{"role": "user", "content": "Forecast 400 hours for SUBS"}]
+
+
+class FakeCache:
+    """In-memory stand-in for CacheManager."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.counters = {}
+
+    def get(self, prefix, user_id=None, **kwargs):
+        return self.store.get(prefix)
+
+    def set(self, data, prefix, ttl, user_id=None, **kwargs):
+        self.store[prefix] = {"data": data}
+        self.ttls[prefix] = ttl
+        return True
+
+    def increment(self, name, field, amount=1):
+        key = (name, field)
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def get_counters(self, name):
+        return {
+            field: value for (n, field), value in self.counters.items() if n == name
+        }
+
+
+@pytest.fixture
+def cache(mocker):
+    cache = FakeCache()
+    mocker.patch("src.utils.cache_manager.get_cache_manager", return_value=cache)
+    return cache
+
+
+@pytest.fixture
+def settings(mocker):
+    """Prompt settings seen by the gateway."""
+    values = {}
+    prompt_manager = MagicMock()
+    prompt_manager.get_setting.side_effect = lambda key, default=None: values.get(
+        key, default
+    )
+    mocker.patch(
+        "src.utils.prompt_manager.get_prompt_manager", return_value=prompt_manager
+    )
+    return values
+
+
+def test_identical_requests_are_served_from_cache(cache, settings):
+    call = MagicMock(return_value="SUBS: 3 months")
+
+    first = complete("ai_forecast", "openai", "gpt-4o", MESSAGES, call, {"t": 0})
+    second = complete("ai_forecast", "openai", "gpt-4o", MESSAGES, call, {"t": 0})
+    other = complete("ai_forecast", "openai", "gpt-4o", MESSAGES, call, {"t": 1})
+
+    assert first == second == other == "SUBS: 3 months"
+    assert call.call_count == 2  # different params are a different request
+    assert set(cache.ttls.values()) == {llm_gateway.CALL_SITE_TTLS["ai_forecast"]}
+    assert get_stats() == {
+        "ai_forecast": {"hits": 1, "misses": 2, "bypassed": 0, "hit_rate": 0.333}
+    }
+    assert cache_key("openai", "gpt-4o", MESSAGES) != cache_key(
+        "anthropic", "gpt-4o", MESSAGES
+    )
+
+
+def test_call_sites_can_opt_out(cache, settings):
+    settings["llm_cache_ttls"] = {"ai_forecast": 0}
+    call = MagicMock(return_value="SUBS: 3 months")
+
+    for _ in range(2):
+        complete("ai_forecast", "openai", "gpt-4o", MESSAGES, call)
+    complete("search_rerank", "openai", "gpt-4o", MESSAGES, call, ttl=0)
+
+    assert call.call_count == 3
+    assert cache.store == {}
+    assert get_stats()["ai_forecast"]["bypassed"] == 2
+    assert get_stats()["ai_forecast"]["hit_rate"] is None
+
+
+@pytest.mark.asyncio
+async def test_async_errors_and_empty_responses_are_not_cached(cache, settings):
+    async def failing():
+        raise RuntimeError("rate limited")
+
+    async def empty():
+        return ""
+
+    with pytest.raises(RuntimeError):
+        await acomplete("search_rerank", "openai", "gpt-4o", MESSAGES, failing)
+    assert await acomplete("search_rerank", "openai", "gpt-4o", MESSAGES, empty) == ""
+
+    assert cache.store == {}
+
+
+def test_chat_model_responses_are_cached_per_model_settings(cache, settings):
+    llm = MagicMock(spec=["invoke", "model_name", "temperature"])
+    llm.model_name = "gpt-4o"
+    llm.temperature = 0.1
+    llm.invoke.return_value = SimpleNamespace(content="UI Dev")
+    messages = [SystemMessage(content="Categorize"), HumanMessage(content="Epic: PDP")]
+
+    invoke_chat_model("epic_categorization", llm, messages)
+    cached = invoke_chat_model("epic_categorization", llm, messages)
+    llm.temperature = 0.7
+    invoke_chat_model("epic_categorization", llm, messages)
+
+    assert cached.content == "UI Dev"
+    assert llm.invoke.call_count == 2
+
+
+def test_responses_failing_validation_are_not_cached(cache, settings):
+    import json
+
+    answers = iter(['{"teams": [', '{"teams": []}'])
+    call = MagicMock(side_effect=lambda: next(answers))
+
+    truncated = complete(
+        "ai_forecast", "openai", "gpt-4o", MESSAGES, call, validate=json.loads
+    )
+    retried = complete(
+        "ai_forecast", "openai", "gpt-4o", MESSAGES, call, validate=json.loads
+    )
+    cached = complete(
+        "ai_forecast", "openai", "gpt-4o", MESSAGES, call, validate=json.loads
+    )
+
+    assert truncated == '{"teams": ['  # still returned to the caller once
+    assert retried == cached == '{"teams": []}'
+    assert call.call_count == 2
+
+    # An entry the parser no longer accepts is fetched again, not replayed
+    call.side_effect = None
+    call.return_value = '{"teams": ["UX"]}'
+    refreshed = complete(
+        "ai_forecast", "openai", "gpt-4o", MESSAGES, call, validate=lambda t: "UX" in t
+    )
+    assert refreshed == '{"teams": ["UX"]}'
+    assert get_stats()["ai_forecast"] == {
+        "hits": 1,
+        "misses": 3,
+        "bypassed": 0,
+        "hit_rate": 0.25,
+    }
@@ -0,0 +1,143 @@
+"""Tests for compute-once, fan-out meeting prep digest delivery."""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from src.models import (
+    Project,
+    User,
+    UserNotificationPreferences,
+    UserWatchedProject,
+)
+from src.services import meeting_prep_service
+from src.services.meeting_prep_service import MeetingPrepDeliveryService
+
+TODAY = datetime.now(timezone.utc).strftime("%A").lower()
+
+
+@pytest.fixture(autouse=True)
+def watchers(db_session):
+    """Projects meeting today, their watchers and one earlier delivery."""
+    db_session.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS meeting_prep_deliveries (
+                id VARCHAR(36) PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                project_key VARCHAR(50) NOT NULL,
+                delivered_at DATETIME NOT NULL,
+                delivered_via_slack BOOLEAN,
+                delivered_via_email BOOLEAN,
+                digest_cache_id VARCHAR(36)
+            )
+        """
+        )
+    )
+    for key in ["SUBS", "BEAU"]:
+        db_session.add(
+            Project(key=key, name=f"{key} Project", weekly_meeting_day=TODAY)
+        )
+    db_session.add(Project(key="IDLE", name="No meeting", weekly_meeting_day="never"))
+
+    watching = {1: ["SUBS", "BEAU"], 2: ["SUBS"], 3: ["SUBS"], 4: ["BEAU", "IDLE"]}
+    for user_id, project_keys in watching.items():
+        db_session.add(
+            User(
+                id=user_id,
+                email=f"user{user_id}@example.com",
+                name=f"User {user_id}",
+                google_id=f"g{user_id}",
+                slack_user_id=f"U{user_id}",
+            )
+        )
+        db_session.add(
+            UserNotificationPreferences(
+                user_id=user_id,
+                enable_meeting_prep=True,
+                meeting_analysis_slack=True,
+                meeting_analysis_email=user_id == 1,
+            )
+        )
+        for project_key in project_keys:
+            db_session.add(UserWatchedProject(user_id=user_id, project_key=project_key))
+    db_session.commit()
+
+    # User 3 already got today's SUBS digest
+    db_session.execute(
+        text(
+            "INSERT INTO meeting_prep_deliveries (id, user_id, project_key, delivered_at) "
+            "VALUES (:id, 3, 'SUBS', :now)"
+        ),
+        {"id": str(uuid.uuid4()), "now": datetime.now(timezone.utc)},
+    )
+    db_session.commit()
+
+
+@pytest.fixture
+def service(db_session, mocker):
+    mocker.patch.object(meeting_prep_service, "NotificationManager")
+    mocker.patch.object(meeting_prep_service, "ProjectActivityAggregator")
+    service = MeetingPrepDeliveryService(db_session)
+    service.aggregator.aggregate_project_activity = AsyncMock(return_value=object())
+    service.aggregator.format_client_agenda = MagicMock(
+        side_effect=lambda activity, project_name: f"## {project_name}\n* Item"
+    )
+    service.notification_manager._send_slack_dm = AsyncMock(
+        return_value={"success": True}
+    )
+    mocker.patch.object(service, "_send_email", return_value=True)
+    return service
+
+
+def test_digest_generated_once_per_project_and_fanned_out(
+    db_session, db_statements, service
+):
+    db_statements.clear()
+
+    stats = service.send_meeting_prep_digests()
+    db_session.commit()
+
+    assert sorted(stats["projects_with_meetings_today"]) == ["BEAU", "SUBS"]
+    assert stats["errors"] == []
+    assert service.aggregator.aggregate_project_activity.await_count == 2
+    assert service.aggregator.format_client_agenda.call_count == 2
+
+    dms = service.notification_manager._send_slack_dm.await_args_list
+    assert sorted(call.args[0] for call in dms) == ["U1", "U1", "U2", "U4"]
+    assert stats["digests_sent_slack"] == 4
+    assert stats["digests_sent_email"] == 2
+    assert stats["total_users_notified"] == 3
+
+    # Preferences and delivery state are each read once, not per watcher
+    prefs = [s for s in db_statements if "FROM user_notification_preferences" in s]
+    checks = [s for s in db_statements if "SELECT DISTINCT user_id" in s]
+    assert len(prefs) == 1
+    assert len(checks) == 1
+
+    recorded = db_session.execute(
+        text("SELECT user_id, project_key FROM meeting_prep_deliveries")
+    ).fetchall()
+    assert sorted(recorded) == [
+        (1, "BEAU"),
+        (1, "SUBS"),
+        (2, "SUBS"),
+        (3, "SUBS"),
+        (4, "BEAU"),
+    ]
+
+
+def test_rerun_same_day_skips_generation(db_session, service):
+    service.send_meeting_prep_digests()
+    db_session.commit()
+    service.aggregator.aggregate_project_activity.reset_mock()
+    service.notification_manager._send_slack_dm.reset_mock()
+
+    stats = service.send_meeting_prep_digests()
+
+    assert service.aggregator.aggregate_project_activity.await_count == 0
+    assert service.notification_manager._send_slack_dm.await_count == 0
+    assert stats["total_users_notified"] == 0
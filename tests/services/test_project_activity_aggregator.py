@@ -0,0 +1,66 @@
+"""Tests for project keyword matching in ProjectActivityAggregator."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.models import ProcessedMeeting
+from src.services.project_activity_aggregator import ProjectActivityAggregator
+from src.services.project_keyword_matcher import ProjectKeywordMatcher
+
+NOW = datetime(2025, 6, 10, 12, 0)
+
+
+@pytest.fixture
+def aggregator(mocker, db_session):
+    mocker.patch(
+        "src.services.project_keyword_matcher.get_project_keyword_matcher",
+        return_value=ProjectKeywordMatcher(
+            {"SUBS": ["subscription", "renewal"], "BEAU": ["beauchamp"]}
+        ),
+    )
+    # No live Fireflies meetings
+    mocker.patch("src.integrations.fireflies.FirefliesClient", side_effect=RuntimeError)
+    aggregator = ProjectActivityAggregator.__new__(ProjectActivityAggregator)
+    aggregator.session = db_session
+    return aggregator
+
+
+def meeting(meeting_id, title, summary=None):
+    return ProcessedMeeting(
+        id=meeting_id,
+        title=title,
+        summary=summary,
+        date=NOW - timedelta(days=1),
+        analyzed_at=NOW,
+    )
+
+
+def collect(aggregator, project_key):
+    activity = SimpleNamespace(project_key=project_key, meetings=None)
+    asyncio.run(
+        aggregator._collect_meeting_data(
+            activity, NOW - timedelta(days=7), NOW + timedelta(days=1)
+        )
+    )
+    return sorted(m["id"] for m in activity.meetings)
+
+
+def test_meetings_match_keyword_substrings_or_project_key(aggregator, db_session):
+    db_session.add_all(
+        [
+            meeting("m1", "Subscriptions weekly"),
+            meeting("m2", "Standup", "Talked through RENEWAL dates"),
+            meeting("m3", "Beauchamp sync"),
+            meeting("m4", "RNWL planning"),
+            meeting("m5", "Unrelated"),
+        ]
+    )
+    db_session.commit()
+
+    assert collect(aggregator, "SUBS") == ["m1", "m2"]
+    assert collect(aggregator, "BEAU") == ["m3"]
+    # No keywords configured: fall back to the project key
+    assert collect(aggregator, "RNWL") == ["m4"]
@@ -0,0 +1,163 @@
+"""Unit tests for the compiled project keyword matcher."""
+
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from src.models import ProjectKeyword
+from src.services import project_keyword_matcher
+from src.services.project_keyword_matcher import (
+    KEYWORD_BLACKLIST,
+    AhoCorasickAutomaton,
+    ProjectKeywordMatcher,
+    ProjectKeywordMatcherService,
+    invalidate_project_keyword_matcher,
+)
+
+
+@pytest.fixture
+def matcher():
+    return ProjectKeywordMatcher(
+        {
+            "BC": ["Beauchamp", "bc cart"],
+            "SUBS": ["subscriptions", "syatt"],
+            "PROJ": ["project"],
+        }
+    )
+
+
+class TestAhoCorasickAutomaton:
+    """Tests for the automaton itself."""
+
+    def test_finds_overlapping_keywords(self):
+        automaton = AhoCorasickAutomaton(["he", "she", "hers"])
+        matches = set(automaton.iter_matches("ushers", word_boundaries=False))
+        assert matches == {(1, "she"), (2, "he"), (2, "hers")}
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Project projections and sub-project",
+            "c++ project_x (project) project.",
+            "PROJECT: the projected project's",
+        ],
+    )
+    def test_word_boundaries_match_regex(self, text):
+        keywords = ["project", "c++", "project_x"]
+        automaton = AhoCorasickAutomaton(keywords)
+
+        expected = {
+            (m.start(), keyword)
+            for keyword in keywords
+            for m in re.finditer(r"(?=\b" + re.escape(keyword) + r"\b)", text.lower())
+        }
+        assert set(automaton.iter_matches(text)) == expected
+
+
+class TestProjectKeywordMatcher:
+    """Tests for project-level matching."""
+
+    def test_match_orders_projects_by_position(self, matcher):
+        matches = matcher.match("Subscriptions sync, then the BC cart for Beauchamp")
+        assert list(matches) == ["SUBS", "BC"]
+        assert matches["BC"] == ["bc cart", "beauchamp"]
+
+    def test_word_boundaries_prevent_false_positives(self, matcher):
+        assert matcher.match_projects("Projections review") == []
+        assert matcher.match_projects("Projections review", word_boundaries=False) == [
+            "PROJ"
+        ]
+
+    def test_ignore_keywords(self, matcher):
+        assert matcher.match_projects("Syatt all-hands") == ["SUBS"]
+        assert (
+            matcher.match_projects("Syatt all-hands", ignore_keywords=KEYWORD_BLACKLIST)
+            == []
+        )
+
+    def test_first_match_respects_project_order(self, matcher):
+        projects = [{"key": "PROJ"}, {"key": "BC"}]
+        project, keyword = matcher.first_match("Beauchamp project sync", projects)
+        assert project == {"key": "PROJ"}
+        assert keyword == "project"
+
+    def test_from_projects(self):
+        matcher = ProjectKeywordMatcher.from_projects(
+            [{"key": "A", "keywords": ["Alpha"]}, {"key": "B", "keywords": None}]
+        )
+        assert matcher.keywords_for("A") == ["alpha"]
+        assert matcher.keywords_for("B") == []
+        assert matcher.matches_project("alpha launch", "A")
+
+
+class FakeCache:
+    """Dict-backed stand-in for CacheManager get/set."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, prefix, user_id=None, **kwargs):
+        return self.store.get(prefix)
+
+    def set(self, data, prefix, ttl, user_id=None, **kwargs):
+        self.store[prefix] = {"data": data}
+        return True
+
+
+class TestProjectKeywordMatcherService:
+    """Tests for rebuild-on-change behaviour of the shared matcher."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        cache = FakeCache()
+        with patch("src.utils.cache_manager.get_cache_manager", return_value=cache):
+            yield cache
+
+    @pytest.fixture
+    def db(self, db_session):
+        """Seed one keyword and point the service at the test transaction."""
+        db_session.add(ProjectKeyword(project_key="BC", keyword="beauchamp"))
+        db_session.flush()
+        engine = MagicMock()
+        engine.connect.return_value.__enter__.return_value = db_session.connection()
+        with patch("src.utils.database.get_engine", return_value=engine):
+            yield db_session
+
+    def test_rebuilds_only_when_table_changes(self, db):
+        service = ProjectKeywordMatcherService(check_interval=0)
+
+        first = service.get_matcher()
+        assert first.match_projects("beauchamp") == ["BC"]
+        assert service.get_matcher() is first
+
+        db.add(ProjectKeyword(project_key="SUBS", keyword="subscriptions"))
+        db.flush()
+
+        second = service.get_matcher()
+        assert second is not first
+        assert second.match_projects("subscriptions") == ["SUBS"]
+
+    def test_check_interval_skips_fingerprint_query(self, db):
+        service = ProjectKeywordMatcherService(check_interval=3600)
+        first = service.get_matcher()
+
+        db.execute(text("DELETE FROM project_keywords"))
+
+        assert service.get_matcher() is first
+        service.invalidate()
+        assert service.get_matcher().match_projects("beauchamp") == []
+
+    def test_keyword_update_in_another_process_triggers_rebuild(self, db):
+        service = ProjectKeywordMatcherService(check_interval=0)
+        first = service.get_matcher()
+
+        # Same row count and max id, so only the shared version reveals it
+        db.execute(text("UPDATE project_keywords SET keyword = 'bc cart'"))
+        assert service.get_matcher() is first
+
+        with patch.object(project_keyword_matcher, "_matcher_service", None):
+            invalidate_project_keyword_matcher()  # e.g. from the web process
+
+        assert service.get_matcher().match_projects("bc cart sync") == ["BC"]
@@ -0,0 +1,188 @@
+"""Tests for single-pass Jira change polling in ProjectMonitor."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+
+from src.integrations.jira_mcp import JiraMCPClient
+from src.models import ProjectChange, ProjectChangePollState
+from src.services import project_monitor
+from src.services.project_monitor import MAX_LOOKBACK, ProjectMonitor
+from tests.integrations.fake_jira import FakeJiraServer
+
+SINCE = datetime(2025, 6, 1, 9, 0)
+
+
+def jira_time(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def status_change(moment, old, new):
+    return {
+        "created": jira_time(moment),
+        "author": {"displayName": "Dana"},
+        "items": [{"field": "status", "fromString": old, "toString": new}],
+    }
+
+
+def issue_fields(project_key, created):
+    return {
+        "summary": "Ticket",
+        "created": jira_time(created),
+        "project": {"key": project_key, "name": project_key},
+        "status": {"name": "In Progress"},
+    }
+
+
+def make_monitor(server):
+    monitor = ProjectMonitor()
+    monitor.jira_client = JiraMCPClient(
+        jira_url="https://fake.atlassian.net",
+        username="bot@example.com",
+        api_token="token",
+    )
+    monitor.jira_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(server)
+    )
+    return monitor
+
+
+def test_one_paginated_search_per_project():
+    server = FakeJiraServer()
+    old = SINCE - timedelta(days=30)
+    for n in range(1, 131):
+        server.add_issue(
+            f"SUBS-{n}",
+            issue_fields("SUBS", old),
+            [
+                status_change(SINCE - timedelta(hours=1), "To Do", "Open"),
+                status_change(SINCE + timedelta(minutes=n), "Open", "Done"),
+            ],
+        )
+    server.add_issue("BEAU-1", issue_fields("BEAU", SINCE + timedelta(hours=2)))
+
+    changes = asyncio.run(
+        make_monitor(server).poll_project_changes(["SUBS", "BEAU"], SINCE)
+    )
+
+    by_ticket = {c["ticket_key"]: c for c in changes}
+    assert len(by_ticket) == 131  # nothing dropped past 100 results
+    assert by_ticket["SUBS-130"]["new_value"] == "Status: Open → Done"
+    assert by_ticket["BEAU-1"]["change_type"] == "created"
+    # Two pages for SUBS, one for BEAU, no per-ticket changelog requests
+    assert server.calls_to("/rest/api/3/search/jql") == 3
+    assert len(server.requests) == 3
+
+
+def test_truncated_changelog_is_paged_back_to_since():
+    server = FakeJiraServer()
+    old = [
+        status_change(SINCE - timedelta(days=30, minutes=-n), "Open", "To Do")
+        for n in range(250)
+    ]
+    recent = [
+        status_change(SINCE + timedelta(minutes=n), "To Do", "Done")
+        for n in range(1, 121)
+    ]
+    server.add_issue(
+        "SUBS-1", issue_fields("SUBS", SINCE - timedelta(days=60)), old + recent
+    )
+
+    changes, _ = asyncio.run(make_monitor(server)._poll_projects({"SUBS": SINCE}))
+
+    assert len(changes) == 120  # none lost past the 100 embedded histories
+    # Newest two pages cover everything since SINCE; older pages are skipped
+    changelog = [r for r in server.requests if r.url.path.endswith("/changelog")]
+    assert [int(r.url.params["startAt"]) for r in changelog] == [270, 170]
+
+
+def test_failed_changelog_keeps_the_project(caplog):
+    server = FakeJiraServer(embedded_changelog_limit=1, failing_changelogs=["SUBS-1"])
+    history = [
+        status_change(SINCE + timedelta(hours=1), "To Do", "Open"),
+        status_change(SINCE + timedelta(hours=2), "Open", "Done"),
+    ]
+    server.add_issue("SUBS-1", issue_fields("SUBS", SINCE - timedelta(days=3)), history)
+    server.add_issue("SUBS-2", issue_fields("SUBS", SINCE - timedelta(days=3)), history)
+    monitor = make_monitor(server)
+
+    changes, completed = asyncio.run(monitor._poll_projects({"SUBS": SINCE}))
+
+    assert completed == ["SUBS"]
+    by_ticket = {}
+    for change in changes:
+        by_ticket.setdefault(change["ticket_key"], []).append(change["new_value"])
+    assert by_ticket["SUBS-1"] == ["Open"]  # embedded part only
+    assert len(by_ticket["SUBS-2"]) == 2
+    assert "Keeping truncated changelog for SUBS-1" in caplog.text
+
+
+def test_failed_project_is_not_marked_complete(mocker):
+    server = FakeJiraServer()
+    server.add_issue("SUBS-1", issue_fields("SUBS", SINCE + timedelta(hours=1)))
+    monitor = make_monitor(server)
+    search = monitor.jira_client.search_tickets_with_changelog
+
+    async def flaky_search(jql, **kwargs):
+        if "BEAU" in jql:
+            return None
+        return await search(jql, **kwargs)
+
+    mocker.patch.object(
+        monitor.jira_client, "search_tickets_with_changelog", flaky_search
+    )
+
+    changes, completed = asyncio.run(
+        monitor._poll_projects({"SUBS": SINCE, "BEAU": SINCE})
+    )
+
+    assert [c["ticket_key"] for c in changes] == ["SUBS-1"]
+    assert completed == ["SUBS"]
+
+
+def test_high_water_marks_round_trip(mocker, db_session):
+    mocker.patch("src.utils.database.get_session", return_value=db_session)
+    monitor = ProjectMonitor()
+
+    now = datetime(2025, 6, 10, 12, 0)
+    monitor._save_high_water_marks(["SUBS"], now - timedelta(hours=3))
+    monitor._save_high_water_marks(["SUBS"], now - timedelta(hours=1))
+    monitor._save_high_water_marks(["OLD"], now - timedelta(days=60))
+
+    since = monitor._load_high_water_marks(["SUBS", "OLD", "NEW"], now)
+
+    assert since == {
+        "SUBS": now - timedelta(hours=1),
+        "OLD": now - MAX_LOOKBACK,
+        "NEW": now - timedelta(hours=24),
+    }
+    assert db_session.query(ProjectChangePollState).count() == 2
+
+
+def test_save_changes_is_batched_and_idempotent(mocker, db_session, db_statements):
+    engine = mocker.MagicMock()
+    engine.dialect.name = "sqlite"
+    engine.begin.return_value.__enter__.return_value = db_session.connection()
+    mocker.patch("src.utils.database.get_engine", return_value=engine)
+    mocker.patch.object(project_monitor, "SAVE_BATCH_SIZE", 4)
+    db_statements.clear()
+
+    monitor = ProjectMonitor()
+    ticket = {"key": "SUBS-1", "fields": issue_fields("SUBS", SINCE)}
+    changes = [
+        monitor._format_change("SUBS", "created", ticket, SINCE + timedelta(minutes=n))
+        for n in range(10)
+    ]
+
+    assert asyncio.run(monitor.save_changes_to_db(changes))
+    assert len(db_statements) == 3  # one INSERT per batch of 4
+
+    # A later poll overlapping the same window only adds the new change
+    rerun = [
+        monitor._format_change("SUBS", "created", ticket, SINCE + timedelta(minutes=n))
+        for n in range(5, 11)
+    ]
+    assert asyncio.run(monitor.save_changes_to_db(rerun))
+
+    assert db_session.query(ProjectChange).count() == 11
@@ -0,0 +1,148 @@
+"""Tests for the external resource directory behind the typeahead routes."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from src.models import ExternalResource
+from src.services import resource_directory
+from src.services.resource_directory import (
+    PRUNE_AFTER,
+    refresh_directory,
+    search_resources,
+    store_resources,
+)
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def entry(resource_id, name, search_text=None, **attributes):
+    return resource_directory._entry(resource_id, name, search_text, **attributes)
+
+
+@pytest.fixture
+def engine(db_session):
+    """Engine stand-in whose transactions run inside the test transaction."""
+    engine = MagicMock()
+    engine.dialect.name = "sqlite"
+    engine.begin.return_value.__enter__.return_value = db_session.connection()
+    return engine
+
+
+def test_store_resources_upserts_and_prunes_stale_rows(engine, db_session):
+    store_resources(
+        engine,
+        "slack",
+        [entry("C1", "general"), entry("C2", "old-channel")],
+        NOW - PRUNE_AFTER - timedelta(hours=1),
+    )
+    store_resources(engine, "github", [entry("api", "api")], NOW - PRUNE_AFTER * 2)
+
+    stored = store_resources(
+        engine,
+        "slack",
+        [
+            entry("C1", "General-Renamed", num_members=5),
+            entry("C1", "General-Renamed", num_members=5),  # listed twice
+            entry("C3", "proj-subs"),
+        ],
+        NOW,
+    )
+
+    assert stored == 2
+    rows = {
+        (r.provider, r.resource_id): r
+        for r in db_session.scalars(select(ExternalResource))
+    }
+    assert set(rows) == {("slack", "C1"), ("slack", "C3"), ("github", "api")}
+    assert rows[("slack", "C1")].name == "General-Renamed"
+    assert rows[("slack", "C1")].search_text == "general-renamed"
+    assert rows[("slack", "C1")].attributes == {"num_members": 5}
+
+
+def test_search_is_one_query_with_prefix_matches_first(
+    engine, db_session, db_statements
+):
+    store_resources(
+        engine,
+        "jira",
+        [
+            entry("SUBS", "Subscriptions", search_text="SUBS Subscriptions"),
+            entry("BEAU", "Beauchamp subs", search_text="BEAU Beauchamp subs"),
+            entry("RNWL", "Renewals", search_text="RNWL Renewals"),
+        ],
+        NOW,
+    )
+    store_resources(engine, "slack", [entry("C1", "subs_team")], NOW)
+    db_session.add(
+        ExternalResource(
+            provider="slack",
+            resource_id="C2",
+            name="subsXteam",
+            search_text="subsxteam",
+        )
+    )
+    db_session.commit()
+
+    db_statements.clear()
+
+    jira = search_resources(db_session, "jira", " Subs ")
+    assert [r.resource_id for r in jira] == ["SUBS", "BEAU"]
+    assert len(db_statements) == 1
+
+    # LIKE wildcards in the query are matched literally
+    assert [r.resource_id for r in search_resources(db_session, "slack", "subs_")] == [
+        "C1"
+    ]
+    assert [
+        r.resource_id for r in search_resources(db_session, "jira", "", limit=2)
+    ] == [
+        "BEAU",
+        "RNWL",
+    ]
+
+
+def test_refresh_skips_unconfigured_and_failed_providers(mocker, engine, db_session):
+    store_resources(engine, "notion", [entry("p1", "Roadmap")], NOW)
+
+    def failing():
+        raise RuntimeError("Notion is down")
+
+    mocker.patch.dict(
+        resource_directory.FETCHERS,
+        {
+            "slack": lambda: [entry("C1", "general")],
+            "notion": failing,
+            "github": lambda: None,
+        },
+    )
+
+    counts = refresh_directory(["slack", "notion", "github", "teams"], engine=engine)
+
+    assert counts == {"slack": 1, "notion": None, "github": None, "teams": None}
+    assert [r.name for r in search_resources(db_session, "notion")] == ["Roadmap"]
+
+
+def test_slack_fetcher_reads_the_shared_directory(mocker):
+    directory = MagicMock()
+    directory.list_channels.return_value = [
+        {"id": "C1", "name": "general", "type": "public_channel", "num_members": 3},
+        {"id": "G1", "name": "leads", "type": "private_channel", "num_members": 2},
+        {"id": "C2", "name": "random", "type": "public_channel"},
+    ]
+    mocker.patch(
+        "src.services.slack_directory.get_slack_directory", return_value=directory
+    )
+
+    entries = resource_directory._fetch_slack_channels()
+
+    assert [e["resource_id"] for e in entries] == ["C1", "C2"]
+    assert entries[0]["attributes"] == {"is_private": False, "num_members": 3}
+
+
+def test_slack_fetcher_without_token(mocker):
+    mocker.patch("src.services.slack_directory.get_slack_directory", return_value=None)
+
+    assert resource_directory._fetch_slack_channels() is None
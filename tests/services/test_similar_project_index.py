@@ -0,0 +1,137 @@
+"""Tests for the precomputed similar-project index."""
+
+from datetime import date
+
+import pytest
+from src.models import (
+    EpicHours,
+    ProjectCharacteristics,
+    ProjectForecastingConfig,
+)
+from src.services import similar_project_index as module
+from src.services.intelligent_forecasting_service import (
+    IntelligentForecastingService,
+)
+from src.services.similar_project_index import (
+    SimilarProjectIndex,
+    get_similar_project_index,
+    invalidate_similar_project_index,
+)
+
+BASE = {
+    "be_integrations": 3,
+    "custom_theme": 3,
+    "custom_designs": 3,
+    "ux_research": 3,
+    "extensive_customizations": 3,
+    "project_oversight": 3,
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_index(monkeypatch):
+    monkeypatch.setattr(module, "_index_service", None)
+
+
+def add_project(session, key, include=True, **characteristics):
+    session.add(ProjectCharacteristics(project_key=key, **{**BASE, **characteristics}))
+    session.add(
+        ProjectForecastingConfig(
+            project_key=key,
+            forecasting_start_date=date(2024, 1, 1),
+            forecasting_end_date=date(2024, 12, 31),
+            include_in_forecasting=include,
+        )
+    )
+
+
+def add_hours(session, key, epic, month, team, hours, category=None):
+    session.add(
+        EpicHours(
+            project_key=key,
+            epic_key=epic,
+            epic_category=category,
+            month=month,
+            team=team,
+            hours=hours,
+        )
+    )
+
+
+def test_nearest_orders_by_distance():
+    index = SimilarProjectIndex(
+        {
+            "FAR": {**BASE, "be_integrations": 5, "custom_theme": 1},
+            "SAME": dict(BASE),
+            "NEAR": {**BASE, "ux_research": 4},
+            "TIE": {**BASE, "project_oversight": 2},
+        }
+    )
+
+    assert index.nearest(BASE, limit=3) == [
+        ("SAME", 1.0),
+        ("NEAR", 0.898),
+        ("TIE", 0.898),
+    ]
+    assert index.nearest(BASE, limit=10)[-1] == ("FAR", 0.711)
+    assert SimilarProjectIndex({}).nearest(BASE) == []
+
+
+def test_find_similar_projects_uses_one_breakdown_query(db_session, db_statements):
+    add_project(db_session, "SUBS", custom_designs=4)
+    add_project(db_session, "BEAU")
+    add_project(db_session, "OLD", include=False)
+    jan, feb = date(2024, 1, 1), date(2024, 2, 1)
+    add_hours(db_session, "SUBS", "SUBS-1", jan, "FE Devs", 10.0, "FE Dev")
+    add_hours(db_session, "SUBS", "SUBS-2", jan, "FE Devs", 5.0)
+    add_hours(db_session, "SUBS", "SUBS-1", feb, "BE Devs", 7.5, "FE Dev")
+    add_hours(db_session, "SUBS", "SUBS-3", feb, "PMs", 2.0, "Project Oversight")
+    add_hours(db_session, "OLD", "OLD-1", jan, "FE Devs", 99.0)
+    db_session.commit()
+
+    service = IntelligentForecastingService(db_session)
+    service._find_similar_projects(BASE)  # warm the index
+
+    db_statements.clear()
+    projects = service._find_similar_projects(BASE, limit=5)
+
+    assert len(db_statements) == 1
+    assert [p["project_key"] for p in projects] == ["BEAU", "SUBS"]
+    assert projects[0]["total_hours"] == 0
+    assert projects[0]["date_range"] == {"start": "N/A", "end": "N/A"}
+
+    subs = projects[1]
+    assert subs["similarity_score"] == 0.898
+    assert subs["characteristics"]["custom_designs"] == 4
+    assert subs["total_hours"] == 24.5
+    assert subs["team_hours"] == {"FE Devs": 15.0, "BE Devs": 7.5, "PMs": 2.0}
+    assert subs["monthly_distribution"] == [
+        {"month": "2024-01-01", "team": "FE Devs", "hours": 15.0},
+        {"month": "2024-02-01", "team": "BE Devs", "hours": 7.5},
+        {"month": "2024-02-01", "team": "PMs", "hours": 2.0},
+    ]
+    assert subs["epic_breakdown"] == {"FE Dev": 17.5, "Project Oversight": 2.0}
+    assert subs["date_range"] == {"start": "2024-01-01", "end": "2024-02-01"}
+
+
+def test_index_rebuilds_on_change_or_invalidation(db_session, monkeypatch):
+    add_project(db_session, "SUBS")
+    db_session.commit()
+    assert get_similar_project_index(db_session).project_keys == ["SUBS"]
+
+    # Within the check interval the cached index is returned as-is
+    add_project(db_session, "BEAU")
+    db_session.commit()
+    assert get_similar_project_index(db_session).project_keys == ["SUBS"]
+
+    invalidate_similar_project_index()
+    assert get_similar_project_index(db_session).project_keys == ["SUBS", "BEAU"]
+
+    # Once the interval lapses, a changed fingerprint triggers a rebuild
+    monkeypatch.setattr(module._index_service, "check_interval", 0)
+    characteristics = db_session.query(ProjectCharacteristics).filter_by(
+        project_key="BEAU"
+    )
+    db_session.delete(characteristics.one())
+    db_session.commit()
+    assert get_similar_project_index(db_session).project_keys == ["SUBS"]
@@ -0,0 +1,244 @@
+"""Unit tests for the shared Slack directory cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services import slack_directory
+from src.services.slack_directory import SlackDirectory, SlackUserDirectory
+
+
+def _channel(channel_id, name, is_private=False):
+    return {"id": channel_id, "name": name, "is_private": is_private}
+
+
+@pytest.fixture
+def slack_client():
+    """WebClient mock with two pages of channels and one page of users."""
+    client = MagicMock()
+    client.token = "xoxb-test"
+
+    def conversations_list(limit, cursor=None, **kwargs):
+        if cursor is None:
+            return {
+                "channels": [_channel("C00000001", "general")],
+                "response_metadata": {"next_cursor": "page2"},
+            }
+        return {
+            "channels": [_channel("C00000002", "project-x", is_private=True)],
+            "response_metadata": {"next_cursor": ""},
+        }
+
+    client.conversations_list.side_effect = conversations_list
+    client.users_list.return_value = {
+        "members": [
+            {
+                "id": "U00000001",
+                "name": "jdoe",
+                "real_name": "Jane Doe",
+                "profile": {"display_name": "jane"},
+            }
+        ],
+        "response_metadata": {"next_cursor": ""},
+    }
+    return client
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands the directory uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    def exists(self, key):
+        return int(key in self.store)
+
+    def pipeline(self, transaction=False):
+        redis = self
+
+        class Pipeline:
+            def setex(self, key, ttl, value):
+                redis.setex(key, ttl, value)
+
+            def execute(self):
+                return []
+
+        return Pipeline()
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_clients():
+    """Forget the per-process Redis connections between tests."""
+    slack_directory._redis_clients.clear()
+    yield
+    slack_directory._redis_clients.clear()
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch(
+        "src.services.slack_directory.redis.from_url", return_value=redis
+    ) as from_url:
+        redis.from_url = from_url
+        yield redis
+
+
+@pytest.fixture
+def directory(slack_client, fake_redis):
+    return SlackDirectory(slack_client)
+
+
+class TestChannelResolution:
+    """Tests for channel loading and lookup."""
+
+    def test_resolves_names_from_every_page(self, directory, slack_client):
+        assert directory.resolve_channel("#general") == "C00000001"
+        assert directory.resolve_channel("project-x") == "C00000002"
+        # Both pages fetched once, then served from cache
+        assert slack_client.conversations_list.call_count == 2
+
+    def test_channel_id_passthrough_makes_no_api_call(self, directory, slack_client):
+        assert directory.resolve_channel("C0123456789") == "C0123456789"
+        slack_client.conversations_list.assert_not_called()
+
+    def test_miss_refresh_is_rate_limited(self, directory, slack_client):
+        assert directory.resolve_channel("#missing") is None
+        assert directory.resolve_channel("#missing") is None
+        # Initial load only - the miss doesn't trigger a refresh right after loading
+        assert slack_client.conversations_list.call_count == 2
+
+    def test_list_channels_reports_type(self, directory):
+        channels = {c["name"]: c for c in directory.list_channels()}
+        assert channels["general"]["type"] == "public_channel"
+        assert channels["project-x"]["type"] == "private_channel"
+
+
+class TestSharedChannels:
+    """Tests for the channel list shared between processes through Redis."""
+
+    def test_other_processes_read_the_shared_copy(self, slack_client, fake_redis):
+        SlackDirectory(slack_client).refresh_channels()
+        slack_client.conversations_list.reset_mock()
+
+        other_process = SlackDirectory(slack_client)
+
+        assert other_process.resolve_channel("#project-x") == "C00000002"
+        slack_client.conversations_list.assert_not_called()
+        # One connection (and ping) per process, not per directory
+        assert fake_redis.from_url.call_count == 1
+
+    def test_channel_events_update_the_shared_copy(self, directory, slack_client):
+        directory.list_channels()
+        directory.add_channel(_channel("C00000003", "new-channel"))
+
+        other_process = SlackDirectory(slack_client)
+
+        assert other_process.resolve_channel("#new-channel") == "C00000003"
+        assert slack_client.conversations_list.call_count == 2
+
+    def test_get_slack_directory_starts_no_refresh_thread(self, fake_redis, mocker):
+        mocker.patch.dict(slack_directory._directories, clear=True)
+        threads = mocker.patch("src.services.slack_directory.threading.Thread")
+
+        assert slack_directory.get_slack_directory("xoxb-test") is not None
+        threads.assert_not_called()
+
+
+class TestChannelEvents:
+    """Tests for incremental updates from Slack events."""
+
+    def test_add_channel(self, directory, slack_client):
+        directory.list_channels()
+        directory.add_channel(_channel("C00000003", "new-channel"))
+
+        assert directory.resolve_channel("#new-channel") == "C00000003"
+        assert slack_client.conversations_list.call_count == 2
+
+    def test_rename_via_add_channel(self, directory):
+        directory.list_channels()
+        directory.add_channel(_channel("C00000001", "announcements"))
+
+        assert directory.resolve_channel("#announcements") == "C00000001"
+        assert directory.get_channel("C00000001")["name"] == "announcements"
+
+    def test_remove_channel(self, directory):
+        directory.list_channels()
+        directory.remove_channel("C00000001")
+
+        assert directory.get_channel("C00000001") is None
+        assert directory.resolve_channel("#general") is None
+
+
+class TestUsers:
+    """Tests for user lookups."""
+
+    def test_display_name(self, directory, slack_client):
+        assert directory.get_user_display_name("U00000001") == "jane"
+        assert directory.get_user_display_name("U00000001") == "jane"
+        assert slack_client.users_list.call_count == 1
+
+    def test_unknown_user_falls_back_to_id(self, directory, slack_client):
+        slack_client.users_info.return_value = {"ok": False}
+
+        assert directory.get_user_display_name("U99999999") == "U99999999"
+        assert directory.get_user_display_name("U99999999") == "U99999999"
+        # Negative result is remembered
+        assert slack_client.users_info.call_count == 1
+
+
+class TestUserDirectory:
+    """Tests for the Redis-backed bulk user directory."""
+
+    def test_bulk_load_persists_entries_with_ttl(self, slack_client, fake_redis):
+        users = SlackUserDirectory(slack_client, ttl=120)
+        users.refresh()
+
+        user_keys = [k for k in fake_redis.store if k.endswith("U00000001")]
+        assert len(user_keys) == 1
+        assert fake_redis.ttls[user_keys[0]] == 120
+
+    def test_second_worker_reads_from_redis(self, slack_client, fake_redis):
+        SlackUserDirectory(slack_client).refresh()
+        slack_client.users_list.reset_mock()
+
+        other_worker = SlackUserDirectory(slack_client)
+
+        assert other_worker.get_display_name("U00000001") == "jane"
+        slack_client.users_list.assert_not_called()
+        slack_client.users_info.assert_not_called()
+
+    def test_replace_mentions_uses_one_lookup(self, slack_client, fake_redis):
+        users = SlackUserDirectory(slack_client)
+        text = "<@U00000001> please review, cc <@U00000001|jdoe>"
+
+        assert users.replace_mentions(text) == "@jane please review, cc @jane"
+        assert users.replace_mentions(text, prefix="") == (
+            "jane please review, cc jane"
+        )
+        assert slack_client.users_list.call_count == 1
+        slack_client.users_info.assert_not_called()
+
+    def test_works_without_redis(self, slack_client):
+        with patch(
+            "src.services.slack_directory.redis.from_url",
+            side_effect=ConnectionError("Redis unavailable"),
+        ):
+            users = SlackUserDirectory(slack_client)
+
+        assert users.get_email("U00000001") is None
+        assert users.get_display_name("U00000001") == "jane"
@@ -296,6 +296,7 @@ class TestCeleryConfiguration:
             "src.tasks.backfill_tasks",
             "src.tasks.template_import_tasks",
             "src.tasks.cleanup_tasks",
+            "src.tasks.directory_tasks",
             "src.webhooks.fireflies_webhook",
         ]
         assert celery_app.conf.include == expected_includes
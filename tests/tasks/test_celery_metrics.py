@@ -0,0 +1,177 @@
+"""Tests for signal-driven Celery queue metrics and the health check."""
+
+import fnmatch
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.tasks import celery_metrics
+from src.tasks.celery_metrics import CeleryMetricsCollector
+from src.tasks.celery_monitoring import check_queue_health
+
+
+class FakeRedis:
+    """Just enough of the redis client API for the collector."""
+
+    def __init__(self):
+        self.data = {}
+
+    def ping(self):
+        return True
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    def get(self, key):
+        value = self.data.get(key)
+        return None if value is None else str(value)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def expire(self, key, ttl):
+        return key in self.data
+
+    def hincrby(self, key, field, amount):
+        bucket = self.data.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+        return bucket[field]
+
+    def hget(self, key, field):
+        value = self.data.get(key, {}).get(field)
+        return None if value is None else str(value)
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    def hgetall(self, key):
+        return {f: str(v) for f, v in self.data.get(key, {}).items()}
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        zset = self.data.get(key, {})
+        return sum(1 for member in members if zset.pop(member, None) is not None)
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.data.get(key, {})
+        stale = [member for member, score in zset.items() if score <= high]
+        for member in stale:
+            del zset[member]
+        return len(stale)
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def scan_iter(self, match=None, count=None):
+        return [k for k in list(self.data) if fnmatch.fnmatchcase(k, match)]
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.client, n)(*a, **k) for n, a, k in self.calls]
+
+
+@pytest.fixture
+def collector():
+    with patch.object(celery_metrics.redis, "from_url", return_value=FakeRedis()):
+        collector = CeleryMetricsCollector(redis_url="redis://fake")
+    with patch.object(celery_metrics, "_collector", collector):
+        yield collector
+
+
+def task(name, queue="celery", hostname="worker1@host"):
+    request = SimpleNamespace(delivery_info={"routing_key": queue}, hostname=hostname)
+    return SimpleNamespace(name=name, request=request)
+
+
+def test_signals_build_queue_and_task_metrics(collector):
+    sync = task("sync_tempo")
+    with patch.object(celery_metrics.time, "time", return_value=1000.0):
+        for task_id in ("t1", "t2", "t3"):
+            celery_metrics.metrics_after_publish_handler(
+                sender="sync_tempo", headers={"id": task_id}, routing_key="celery"
+            )
+    collector.heartbeat("worker1@host")
+
+    with patch.object(celery_metrics.time, "time", return_value=1004.0):
+        celery_metrics.metrics_prerun_handler(task_id="t1", task=sync)
+        celery_metrics.metrics_prerun_handler(task_id="t2", task=sync)
+    with patch.object(celery_metrics.time, "time", return_value=1010.0):
+        celery_metrics.metrics_postrun_handler(task_id="t1", task=sync)
+        celery_metrics.metrics_failure_handler(sender=sync)
+        celery_metrics.metrics_postrun_handler(task_id="t2", task=sync)
+        celery_metrics.metrics_prerun_handler(task_id="t3", task=sync)
+
+    with patch.object(celery_metrics.time, "time", return_value=1020.0):
+        metrics = collector.get_metrics(window_minutes=5)
+
+    assert metrics["workers"] == ["worker1@host"]
+    assert metrics["queued_tasks"] == 0
+    assert metrics["active_tasks"] == 1
+    assert metrics["completed_tasks"] == 2
+    assert metrics["failed_tasks"] == 1
+    assert metrics["failure_rate"] == 0.5
+    assert metrics["avg_runtime_seconds"] == 6.0
+    assert metrics["avg_queue_wait_seconds"] == 6.0  # waits of 4s, 4s and 10s
+    assert metrics["failing_tasks"] == {"sync_tempo": {"failed": 1, "completed": 2}}
+
+
+def test_health_check_reads_counters_without_broadcasting(collector, monkeypatch):
+    monkeypatch.setenv("CELERY_ALERT_QUEUE_DEPTH", "2")
+    collector.heartbeat("worker1@host")
+    for task_id in ("a", "b", "c"):
+        collector.record_published(task_id, "celery")
+
+    with patch("src.tasks.celery_app.celery_app.control.inspect") as inspect:
+        health = check_queue_health()
+
+    inspect.assert_not_called()
+    assert health["source"] == "metrics"
+    assert health["workers_available"] is True
+    assert health["queued_tasks"] == 3
+    assert health["healthy"] is False
+    assert health["warnings"] == ["3 tasks queued (threshold 2)"]
+
+
+def test_no_worker_heartbeat_is_unhealthy(collector):
+    health = check_queue_health()
+
+    assert health["workers_available"] is False
+    assert health["healthy"] is False
+
+
+def test_queue_depth_does_not_drift(collector):
+    with patch.object(celery_metrics.time, "time", return_value=1000.0):
+        collector.record_published("lost", "celery")  # revoked, never starts
+    with patch.object(celery_metrics.time, "time", return_value=5000.0):
+        collector.record_published("t1", "celery")
+        collector.record_published("t2", "reports")
+        collector.record_started("t1", "sync_tempo", "celery", "worker1@host")
+        # Redelivery of an already-started task doesn't go below zero
+        collector.record_started("t1", "sync_tempo", "celery", "worker1@host")
+
+    with patch.object(celery_metrics.time, "time", return_value=6000.0):
+        assert collector.get_metrics()["queue_depth"] == {"celery": 1, "reports": 1}
+
+    later = 1000.0 + celery_metrics.QUEUED_MAX_AGE_SECONDS + 1
+    with patch.object(celery_metrics.time, "time", return_value=later):
+        metrics = collector.get_metrics()
+    assert metrics["queue_depth"] == {"celery": 0, "reports": 1}
+    assert metrics["queued_tasks"] == 1
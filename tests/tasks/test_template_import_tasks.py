@@ -0,0 +1,108 @@
+"""Tests for the Jira template import task using the fake Jira server."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from src.integrations.jira_mcp import JiraMCPClient
+from src.models import TemplateEpic, TemplateTicket
+from src.tasks.template_import_tasks import import_jira_templates_task
+from tests.integrations.fake_jira import FakeJiraServer
+
+
+@pytest.fixture(autouse=True)
+def template_epics(db_session):
+    """Two template epics in the test database."""
+    db_session.add_all(
+        [
+            TemplateEpic(id=1, epic_name="Discovery", sort_order=1),
+            TemplateEpic(id=2, epic_name="Build", sort_order=2),
+        ]
+    )
+    db_session.add_all(
+        TemplateTicket(
+            template_epic_id=1, issue_type="Task", summary=f"Discover {i}", sort_order=i
+        )
+        for i in range(60)
+    )
+    db_session.add_all(
+        [
+            TemplateTicket(template_epic_id=2, issue_type="Story", summary="Build it"),
+            TemplateTicket(template_epic_id=2, issue_type="Unknown", summary="Broken"),
+        ]
+    )
+    db_session.commit()
+
+
+def run_import(db_session, server, **kwargs):
+    """Run the task synchronously against the fake server."""
+
+    def make_client(**client_kwargs):
+        client = JiraMCPClient(
+            jira_url="https://fake.atlassian.net", username="bot", api_token="token"
+        )
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+        return client
+
+    progress = []
+    with patch(
+        "src.tasks.template_import_tasks.get_session", return_value=db_session
+    ), patch(
+        "src.tasks.template_import_tasks.JiraMCPClient", side_effect=make_client
+    ), patch.object(
+        import_jira_templates_task,
+        "update_state",
+        side_effect=lambda state, meta: progress.append(meta),
+    ):
+        result = import_jira_templates_task.run("SUBS", [1, 2], **kwargs)
+    return result, progress
+
+
+def test_import_uses_bulk_create_per_chunk(db_session):
+    server = FakeJiraServer()
+
+    result, progress = run_import(db_session, server)
+
+    assert result["success"] is True
+    assert result["imported"] == {"epics": 2, "tickets": 61}
+    # One request for the epics, two for the 62 tickets
+    assert server.calls_to("/rest/api/3/issue/bulk") == 3
+    assert server.calls_to("/rest/api/3/issue") == 0
+
+    # Initial report plus one per chunk
+    assert len(progress) == 4
+    assert progress[-1]["current"] == progress[-1]["total"] == 64
+    assert progress[-1]["tickets_created"] == 61
+
+    build = next(d for d in result["details"] if d["epic_name"] == "Build")
+    assert build["tickets_created"] == 1
+    assert build["ticket_errors"][0]["summary"] == "Broken"
+
+    # Tickets are linked to the epic created for their template epic
+    discovery_key = next(
+        d["epic_key"] for d in result["details"] if d["epic_name"] == "Discovery"
+    )
+    linked = [
+        issue
+        for issue in server.issues.values()
+        if issue["fields"].get("parent", {}).get("key") == discovery_key
+    ]
+    assert len(linked) == 60
+
+
+def test_import_without_tickets(db_session):
+    server = FakeJiraServer()
+
+    result, _ = run_import(db_session, server, import_tickets=False)
+
+    assert result["imported"] == {"epics": 2, "tickets": 0}
+    assert server.calls_to("/rest/api/3/issue/bulk") == 1
+
+
+def test_import_survives_rate_limiting(db_session):
+    server = FakeJiraServer(rate_limit_responses=1, retry_after="0")
+
+    result, _ = run_import(db_session, server)
+
+    assert result["imported"] == {"epics": 2, "tickets": 61}
+    assert result["errors"] == []
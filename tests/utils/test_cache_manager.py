@@ -257,6 +257,51 @@ class TestCacheInvalidation:
         mock_redis.keys.assert_called_once_with("api_cache:*")
 
 
+class TestCacheLocks:
+    """Test short-lived cross-process locks."""
+
+    def test_acquire_and_release(self, cache_manager_with_redis, mock_redis):
+        """Test lock uses SET NX with expiry and is released by delete."""
+        manager = cache_manager_with_redis
+
+        mock_redis.set.return_value = True
+        assert manager.acquire_lock("refresh:x", ttl=30) is True
+        mock_redis.set.assert_called_once_with(
+            "api_cache_lock:refresh:x", "1", nx=True, ex=30
+        )
+
+        mock_redis.set.return_value = None
+        assert manager.acquire_lock("refresh:x", ttl=30) is False
+
+        manager.release_lock("refresh:x")
+        mock_redis.delete.assert_called_once_with("api_cache_lock:refresh:x")
+
+    def test_acquire_with_no_redis(self, cache_manager_no_redis):
+        """Test locks are always granted when Redis is unavailable."""
+        assert cache_manager_no_redis.acquire_lock("refresh:x", ttl=30) is True
+
+
+class TestCacheCounters:
+    """Test stats counters kept alongside the cache."""
+
+    def test_increment_and_read(self, cache_manager_with_redis, mock_redis):
+        """Test counters are a hash outside the api_cache namespace."""
+        manager = cache_manager_with_redis
+
+        manager.increment("llm", "search_rerank:hit")
+        mock_redis.hincrby.assert_called_once_with(
+            "api_cache_stats:llm", "search_rerank:hit", 1
+        )
+
+        mock_redis.hgetall.return_value = {"search_rerank:hit": "4"}
+        assert manager.get_counters("llm") == {"search_rerank:hit": 4}
+
+    def test_counters_with_no_redis(self, cache_manager_no_redis):
+        """Test counters are empty when Redis is unavailable."""
+        cache_manager_no_redis.increment("llm", "search_rerank:hit")
+        assert cache_manager_no_redis.get_counters("llm") == {}
+
+
 class TestCachedEndpointDecorator:
     """Test the @cached_endpoint decorator."""
 
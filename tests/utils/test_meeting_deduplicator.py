@@ -0,0 +1,89 @@
+"""Tests for MeetingDeduplicator fuzzy matching with title/date blocking."""
+
+import random
+from datetime import datetime, timezone
+
+from src.utils.meeting_deduplicator import MeetingDeduplicator
+
+BASE_MS = 1_717_200_000_000
+
+
+def meeting(id, title, offset_seconds, duration=1800.0, sentences=0, **extra):
+    return {
+        "id": id,
+        "title": title,
+        "date": BASE_MS + offset_seconds * 1000,
+        "duration": duration,
+        "sentences": [{}] * sentences,
+        **extra,
+    }
+
+
+def all_pairs(deduplicator, meetings):
+    """Reference: compare every meeting with every later one."""
+    processed, kept = set(), []
+    for i, m in enumerate(meetings):
+        if i in processed:
+            continue
+        group = [m]
+        processed.add(i)
+        for j in range(i + 1, len(meetings)):
+            if j not in processed and deduplicator._are_meetings_similar(
+                m, meetings[j]
+            ):
+                group.append(meetings[j])
+                processed.add(j)
+        kept.append(deduplicator._select_best_meeting(group))
+    return [m["id"] for m in kept]
+
+
+def test_fuzzy_duplicates_within_window_are_merged():
+    meetings = [
+        meeting("a", "SUBS Standup", 0, sentences=5),
+        meeting("b", "  subs   STANDUP ", 300, sentences=20),  # edge of window
+        meeting("c", "SUBS Standup", 601),  # outside the window of a and b
+        meeting("d", "SUBS Standup", 120, duration=3600.0),  # duration too different
+        meeting("e", "BEAU Standup", 10),
+        meeting("f", "SUBS Standup", 0),
+    ]
+    meetings[5]["date"] = None
+
+    deduplicator = MeetingDeduplicator()
+    result = deduplicator.deduplicate(meetings)
+
+    assert [m["id"] for m in result] == ["b", "c", "d", "e", "f"]
+    assert deduplicator.get_stats()["fuzzy_duplicates_removed"] == 1
+
+
+def test_mixed_datetime_and_millisecond_dates():
+    at = datetime.fromtimestamp(BASE_MS / 1000, tz=timezone.utc)
+    meetings = [
+        {"id": "a", "title": "Retro", "date": at, "duration": 600},
+        meeting("b", "retro", 60, duration=620, sentences=3),
+    ]
+
+    result = MeetingDeduplicator().deduplicate(meetings)
+
+    assert [m["id"] for m in result] == ["b"]
+
+
+def test_blocking_matches_all_pairs_comparison():
+    rng = random.Random(3)
+    meetings = []
+    for n in range(600):
+        title = rng.choice(["Sync", "sync ", "Planning", "Design Review", "1:1"])
+        meetings.append(
+            meeting(
+                f"m{n}",
+                title,
+                rng.randrange(0, 6 * 3600, 30),
+                duration=rng.choice([1800.0, 1850.0, 2100.0, None]),
+                sentences=rng.randint(0, 5),
+            )
+        )
+
+    deduplicator = MeetingDeduplicator()
+    blocked = [m["id"] for m in deduplicator._remove_fuzzy_duplicates(meetings)]
+
+    assert blocked == all_pairs(deduplicator, meetings)
+    assert len(blocked) < len(meetings)